@@ -0,0 +1,86 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Startup time of the lightweight ullai.py commands, as a user runs them: a
+# fresh interpreter per run, best of --repeat. Each command is also run once
+# under -X importtime to list the heavy packages it loaded; exits 1 when a
+# command goes over --limit seconds or loads one of HEAVY.
+
+HEAVY = ('tensorflow', 'pandas', 'matplotlib')
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def commands(tmp):
+    return [
+        ['--help'],
+        ['inspect'],
+        ['cost', 'quantized_model.tflite'],
+        ['export', '--out-dir', tmp],
+        ['ingest', '--help'],
+        ['import', '--help'],
+        ['soak', '--help'],
+        ['simulate', '--help'],
+        ['emulate', '--help'],
+        ['train', '--help'],
+        ['eval', '--help'],
+    ]
+
+
+def run(args, extra=()):
+    return subprocess.run([sys.executable, *extra, 'ullai.py', *args], cwd=HERE, capture_output=True, text=True,
+                          check=True)
+
+
+def best_of(args, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run(args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def heavy_imports(args):
+    """Top-level names of HEAVY packages imported by one run"""
+    log = run(args, ('-X', 'importtime')).stderr
+    names = {line.split('|')[-1].strip().split('.')[0] for line in log.splitlines() if line.startswith('import time:')}
+    return sorted(names.intersection(HEAVY))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the startup of lightweight ullai.py commands')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--limit', type=float, default=0.5, help='Seconds allowed per command')
+    parser.add_argument('--with-tensorflow', action='store_true',
+                        help='Also time a bare `import tensorflow` for comparison')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    interpreter = time.perf_counter() - t0
+    print(f"{'command':<44} {'best s':>7}  heavy imports")
+    print(f"{'(python -c pass)':<44} {interpreter:>7.3f}")
+    if args.with_tensorflow:
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'import tensorflow'], check=True, capture_output=True)
+        print(f"{'(import tensorflow)':<44} {time.perf_counter() - t0:>7.3f}")
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for command in commands(tmp):
+            seconds = best_of(command, args.repeat)
+            heavy = heavy_imports(command)
+            label = ' '.join(a if a != tmp else '<tmp>' for a in command)
+            print(f"{label:<44} {seconds:>7.3f}  {', '.join(heavy) or '-'}")
+            if seconds > args.limit or heavy:
+                ok = False
+    print('OK' if ok else f"FAIL: a command took over {args.limit} s or loaded {', '.join(HEAVY)}")
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,54 @@
+import argparse
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from int8_reference import ReferenceMLP
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def import_seconds(module):
+    """Cold import time of `module` in a fresh interpreter"""
+    code = f"import time; t0 = time.perf_counter(); import {module}; print(time.perf_counter() - t0)"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return float(out.stdout.split()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Throughput of int8_reference vs tf.lite.Interpreter')
+    parser.add_argument('--model', default='quantized_model.tflite')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--batch', type=int, default=4096)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-tf', action='store_true', help='Skip the TensorFlow comparison')
+    args = parser.parse_args()
+
+    reference = ReferenceMLP(args.model)
+    x = np.random.default_rng(0).normal(0, 1, size=(args.rows, reference.model.input.shape[-1]))
+    q = reference.quantize(x)
+
+    results = [('int8_reference', import_seconds('int8_reference'), best_of(lambda: reference.run(q), args.repeat))]
+    if not args.no_tf:
+        from evaluate_models import BatchedTFLiteModel
+        interpreter = BatchedTFLiteModel(args.model, args.batch)
+        results.append((f'tf.lite batch={args.batch}', import_seconds('tensorflow'),
+                        best_of(lambda: interpreter.predict(x), args.repeat)))
+
+    print(f"{args.rows:,} rows, model {args.model}")
+    print(f"{'engine':>22} {'import s':>9} {'run s':>8} {'rows/s':>14}")
+    for name, imported, seconds in results:
+        print(f"{name:>22} {imported:>9.2f} {seconds:>8.3f} {args.rows / seconds:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import os
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')  # Use non-display backend
+import matplotlib.pyplot as plt
+
+from sensor_simulator import generate_scenario_data, visualize_scenario
+
+
+def visualize_scenario_reference(df, scenario, path):
+    """Former visualize_scenario: full-resolution traces and one axvline per anomalous row per subplot"""
+    fig, axs = plt.subplots(5, 1, figsize=(15, 20), sharex=True)
+    fig.suptitle(f'Sensor Data Simulation: {scenario} Scenario', fontsize=16)
+    for ax, column, style in zip(axs, ['light_v', 'temp_c', 'humidity_pct', 'tvoc_ppb', 'co2eq_ppm'],
+                                 ['b-', 'r-', 'g-', 'm-', 'c-']):
+        ax.plot(df['timestamp'], df[column], style)
+        ax.grid(True)
+    anomalies = df[df['anomaly_flag'] > 0]
+    for _, row in anomalies.iterrows():
+        color = {1: 'red', 2: 'orange', 3: 'purple'}.get(row['anomaly_flag'], 'gray')
+        for ax in axs:
+            ax.axvline(x=row['timestamp'], color=color, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(path, dpi=150)
+    plt.close()
+
+
+def time_render(render, df, scenario, path, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        render(df, scenario, path)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark visualize_scenario against the former implementation')
+    parser.add_argument('--scenario', default='poor_air')
+    parser.add_argument('--duration', type=int, default=3600, help='Seconds of data (default 1 hour)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per case, best time is reported')
+    parser.add_argument('--skip-reference', action='store_true', help='Only time the current function')
+    args = parser.parse_args()
+
+    df = generate_scenario_data(args.scenario, duration_sec=args.duration, seed=0)
+    n_anomalous = int((df['anomaly_flag'] > 0).sum())
+    print(f"{args.scenario}: {len(df)} samples, {n_anomalous} anomalous rows")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        current = time_render(visualize_scenario, df, args.scenario,
+                              os.path.join(tmp, 'current.png'), args.repeat)
+        print(f"visualize_scenario:  {current:8.3f} s")
+        if not args.skip_reference:
+            reference = time_render(visualize_scenario_reference, df, args.scenario,
+                                    os.path.join(tmp, 'reference.png'), args.repeat)
+            print(f"former (iterrows):   {reference:8.3f} s  ({reference / current:.1f}x slower)")
+
+
+if __name__ == '__main__':
+    main()
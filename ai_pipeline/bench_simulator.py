@@ -0,0 +1,44 @@
+import argparse
+import time
+
+from sensor_simulator import generate_scenario_data
+
+# Simulated durations: 5 minutes, 1 hour, 24 hours
+DURATIONS = {'5min': 300, '1h': 3600, '24h': 86400}
+SCENARIOS = ['normal', 'high_temp', 'high_humidity', 'poor_air', 'rapid_change']
+
+
+def bench_generation(duration_sec, sample_rate=10, repeat=3, seed=0):
+    """Best-of-`repeat` wall time per scenario; returns {scenario: seconds}"""
+    results = {}
+    for scenario in SCENARIOS:
+        best = float('inf')
+        for r in range(repeat):
+            t0 = time.perf_counter()
+            generate_scenario_data(scenario, duration_sec=duration_sec,
+                                   sample_rate=sample_rate, seed=seed + r)
+            best = min(best, time.perf_counter() - t0)
+        results[scenario] = best
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sensor_simulator generation throughput')
+    parser.add_argument('--sample-rate', type=int, default=10, help='Samples per second (Hz)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case, best time is reported')
+    parser.add_argument('--durations', nargs='+', default=list(DURATIONS), choices=list(DURATIONS))
+    args = parser.parse_args()
+
+    print(f"{'duration':>8} {'scenario':>14} {'samples':>10} {'time_s':>9} {'samples/s':>12}")
+    for label in args.durations:
+        n_samples = DURATIONS[label] * args.sample_rate
+        times = bench_generation(DURATIONS[label], args.sample_rate, args.repeat)
+        for scenario, seconds in times.items():
+            print(f"{label:>8} {scenario:>14} {n_samples:>10} {seconds:>9.4f} {n_samples / seconds:>12,.0f}")
+        total = sum(times.values())
+        print(f"{label:>8} {'(all)':>14} {n_samples * len(times):>10} {total:>9.4f} "
+              f"{n_samples * len(times) / total:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+import argparse
+import contextlib
+import datetime
+import fnmatch
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from bench_simulator import DURATIONS, SCENARIOS
+from bench_telemetry import make_records, text_capture
+
+# Regression suite over the pipeline's hot paths: simulator generation,
+# plotting, serial-line parsing (logger and bulk import), scaler statistics,
+# int8 inference and int8 .tflite export. Inputs are synthetic with fixed
+# seeds, at 5 min / 1 h / 24 h of device time (simulator frames at 10 Hz,
+# serial lines at the firmware's loop rate). Each case is run once to warm
+# up, timed best of --repeat, then run once more under tracemalloc for its
+# peak Python/numpy memory (TensorFlow's own allocations are not traced).
+#
+# --save FILE writes the results as a baseline; --baseline FILE compares
+# against one and exits 1 when a case got slower or bigger than the
+# thresholds allow. Baselines only compare on the machine that wrote them.
+
+SEED = 0
+SAMPLE_RATE = 10                     # simulator Hz, as sensor_simulator.py
+LOOP_MS = 1007                       # firmware loop: delay(1000) + sensing/inference, as bench_telemetry
+START_TIME = datetime.datetime(2024, 1, 1)
+BASELINE_VERSION = 1
+
+
+def simulated_frame(seconds, scenario='poor_air'):
+    from sensor_simulator import generate_scenario_data
+    return generate_scenario_data(scenario, duration_sec=seconds, sample_rate=SAMPLE_RATE, seed=SEED,
+                                  start_time=START_TIME)
+
+
+def feature_frame(seconds):
+    """The simulated frame under the model's feature names"""
+    from features import FEATURE_COLUMNS
+    from shard_dataset import ALIASES
+    return simulated_frame(seconds).rename(columns=ALIASES)[FEATURE_COLUMNS]
+
+
+# Each case builds its input (untimed) and returns (run, items, unit)
+
+def case_generate(seconds, tmp):
+    from sensor_simulator import generate_scenario_data
+
+    def run():
+        for scenario in SCENARIOS:
+            generate_scenario_data(scenario, duration_sec=seconds, sample_rate=SAMPLE_RATE, seed=SEED,
+                                   start_time=START_TIME)
+    return run, seconds * SAMPLE_RATE * len(SCENARIOS), 'samples'
+
+
+def case_plot(seconds, tmp):
+    from sensor_simulator import visualize_scenario
+    df = simulated_frame(seconds)
+    return lambda: visualize_scenario(df, 'poor_air', os.path.join(tmp, 'plot.png')), len(df), 'samples'
+
+
+def case_parse_lines(seconds, tmp):
+    from serial_ingest import parse_lines
+    text = text_capture(make_records(seconds * 1000 // LOOP_MS, SEED)).decode()
+    return lambda: parse_lines(text), len(text), 'bytes'
+
+
+def case_capture_import(seconds, tmp):
+    from capture_import import import_capture
+    path = os.path.join(tmp, 'capture.log')
+    with open(path, 'wb') as f:
+        f.write(text_capture(make_records(seconds * 1000 // LOOP_MS, SEED)))
+    return lambda: import_capture(path, path + '.d'), os.path.getsize(path), 'bytes'
+
+
+def case_scaler(seconds, tmp):
+    from scaler_stats import scaler_from_stats, stats_from_frame
+    df = feature_frame(seconds)
+    return lambda: scaler_from_stats(stats_from_frame(df)), len(df), 'rows'
+
+
+def case_int8(seconds, tmp):
+    from features import load_scaler, normalize_features
+    from int8_reference import ReferenceMLP
+    reference = ReferenceMLP('quantized_model.tflite')
+    x = normalize_features(feature_frame(seconds), load_scaler('scaler.json'))
+    return lambda: reference.predict(x), len(x), 'rows'
+
+
+def case_export(seconds, tmp):
+    import tensorflow as tf
+    from features import load_scaler, normalize_features
+    from train_model import convert_int8
+    model = tf.keras.models.load_model('model_float.h5', compile=False)
+    x = normalize_features(feature_frame(seconds), load_scaler('scaler.json'))
+
+    def run():
+        np.random.seed(SEED)          # the calibration rows convert_int8 draws
+        with contextlib.redirect_stdout(io.StringIO()):  # SavedModel export chatter
+            convert_int8(model, x)
+    return run, 1, 'models'
+
+
+# name: (case, sizes, needs TensorFlow); the export does not depend on the input size
+CASES = {
+    'generate': (case_generate, list(DURATIONS), False),
+    'plot': (case_plot, list(DURATIONS), False),
+    'parse_lines': (case_parse_lines, list(DURATIONS), False),
+    'capture_import': (case_capture_import, list(DURATIONS), False),
+    'scaler': (case_scaler, list(DURATIONS), False),
+    'int8': (case_int8, list(DURATIONS), False),
+    'export_tflite': (case_export, ['5min'], True),
+}
+
+
+def measure(run, repeat):
+    """(best wall seconds, tracemalloc peak bytes)"""
+    run()
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def machine():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {'host': platform.node(), 'machine': platform.machine(), 'cpus': os.cpu_count(),
+            'python': platform.python_version(), 'numpy': np.__version__, 'commit': commit}
+
+
+def run_suite(patterns=('*',), repeat=3, with_tf=True):
+    """{case/size: result} for the cases matching any of the fnmatch patterns"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (case, sizes, needs_tf) in CASES.items():
+            if needs_tf and not with_tf:
+                continue
+            for size in sizes:
+                key = f"{name}/{size}"
+                if not any(fnmatch.fnmatch(key, p) for p in patterns):
+                    continue
+                run, items, unit = case(DURATIONS[size], tmp)
+                seconds, peak = measure(run, repeat)
+                results[key] = {'seconds': seconds, 'items': items, 'unit': unit,
+                                'per_second': items / seconds, 'peak_bytes': peak}
+                print(f"{key:<24} {seconds:>9.4f} {items / seconds:>14,.0f} {unit + '/s':<10} "
+                      f"{peak / 2**20:>9.1f}", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold, memory_threshold, min_seconds):
+    """Regressions of results against a baseline's; prints one line per case"""
+    regressions = []
+    print(f"\n{'case':<24} {'base s':>9} {'now s':>9} {'time':>7} {'base MiB':>9} {'now MiB':>9} {'memory':>7}")
+    for key, now in results.items():
+        base = baseline['results'].get(key)
+        if base is None:
+            print(f"{key:<24} {'(new)':>9}")
+            continue
+        time_change = now['seconds'] / base['seconds'] - 1
+        memory_change = now['peak_bytes'] / max(base['peak_bytes'], 1) - 1
+        flags = []
+        if time_change > threshold and now['seconds'] - base['seconds'] > min_seconds:
+            flags.append('SLOWER')
+        if memory_change > memory_threshold and now['peak_bytes'] - base['peak_bytes'] > 2**20:
+            flags.append('BIGGER')
+        print(f"{key:<24} {base['seconds']:>9.4f} {now['seconds']:>9.4f} {time_change:>+7.1%} "
+              f"{base['peak_bytes'] / 2**20:>9.1f} {now['peak_bytes'] / 2**20:>9.1f} {memory_change:>+7.1%} "
+              f"{' '.join(flags)}".rstrip())
+        if flags:
+            regressions.append((key, flags))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the pipeline hot paths and check for regressions')
+    parser.add_argument('cases', nargs='*', default=['*'],
+                        help=f"fnmatch patterns over case/size, e.g. 'int8/*' '*/24h' (cases: {', '.join(CASES)})")
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case, the best is kept')
+    parser.add_argument('--baseline', help='Compare with this baseline file, exit 1 on a regression')
+    parser.add_argument('--save', help='Write the results to this file (a new baseline)')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed wall time increase over the baseline (0.25 = 25%%)')
+    parser.add_argument('--memory-threshold', type=float, default=0.25, help='Allowed peak memory increase')
+    parser.add_argument('--min-seconds', type=float, default=0.02,
+                        help='Time increases below this many seconds never count as a regression')
+    parser.add_argument('--no-tf', action='store_true', help='Skip the cases that need TensorFlow')
+    args = parser.parse_args()
+
+    # Model and scaler paths are relative to this directory, as in the other scripts
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    print(f"{'case':<24} {'best s':>9} {'throughput':>14} {'':<10} {'peak MiB':>9}")
+    results = run_suite(args.cases, args.repeat, with_tf=not args.no_tf)
+    report = {'version': BASELINE_VERSION, 'created': datetime.datetime.now().isoformat(timespec='seconds'),
+              'machine': machine(), 'repeat': args.repeat, 'seed': SEED, 'results': results}
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.save}")
+    if not args.baseline:
+        return True
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        print(f"FAIL: {args.baseline} is baseline version {baseline.get('version')}, expected {BASELINE_VERSION}")
+        return False
+    ours, theirs = report['machine'], baseline['machine']
+    if any(ours[k] != theirs.get(k) for k in ('host', 'machine', 'cpus', 'python')):
+        print(f"WARNING: baseline from {theirs.get('host')} ({theirs.get('machine')}, {theirs.get('cpus')} CPUs, "
+              f"Python {theirs.get('python')}), timings are not comparable")
+    regressions = compare(results, baseline, args.threshold, args.memory_threshold, args.min_seconds)
+    if regressions:
+        print(f"FAIL: {len(regressions)} regressions against {args.baseline} (commit {theirs.get('commit')}): "
+              + ', '.join(f"{key} {'/'.join(flags)}" for key, flags in regressions))
+        return False
+    print(f"OK: no regression against {args.baseline} (commit {theirs.get('commit')})")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
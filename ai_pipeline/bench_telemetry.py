@@ -0,0 +1,68 @@
+import argparse
+import time
+
+import numpy as np
+
+import telemetry
+from serial_ingest import parse_lines
+
+BAUD = 115200
+BYTES_PER_SECOND = BAUD / 10  # 8N1: 10 bits on the wire per byte
+
+
+def make_records(n, seed=0):
+    rng = np.random.default_rng(seed)
+    records = np.zeros(n, dtype=telemetry.RECORD_DTYPE)
+    records['millis'] = 3230 + np.arange(n) * 1007
+    records['ldr_v'] = rng.uniform(0, 0.2, n)
+    records['temp_c'] = rng.normal(23, 2, n)
+    records['hum_pct'] = rng.normal(50, 5, n)
+    records['tvoc_ppb'] = 60
+    records['eco2_ppm'] = 450
+    records['prob_pct'] = [42, 31, 27]
+    records['latency_us'] = rng.integers(780, 900, n)
+    records['free_heap'] = 251234
+    return records
+
+
+def text_capture(records):
+    """The same samples as main.cpp's printf lines"""
+    rows = telemetry.format_rows(records)
+    return ''.join(f"{','.join(r[:-1])},AI_latency_us:{r[-1]}\n" for r in rows).encode()
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare binary telemetry frames with the text log format')
+    parser.add_argument('--samples', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_records(args.samples)
+    text = text_capture(records)
+    binary = telemetry.encode_records(records)
+
+    def parse_text():
+        rows, _, _ = parse_lines(text.decode())
+        return np.array(rows, dtype=np.float64)
+
+    text_s = best_of(parse_text, args.repeat)
+    binary_s = best_of(lambda: telemetry.decode_frames(binary), args.repeat)
+
+    print(f"{'format':>8} {'bytes/sample':>13} {'max Hz @115200':>15} {'parse s':>9} {'samples/s':>12}")
+    for name, size, seconds in (('text', len(text), text_s), ('binary', len(binary), binary_s)):
+        per_sample = size / args.samples
+        print(f"{name:>8} {per_sample:>13.1f} {BYTES_PER_SECOND / per_sample:>15.0f} "
+              f"{seconds:>9.3f} {args.samples / seconds:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
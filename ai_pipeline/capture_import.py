@@ -0,0 +1,516 @@
+import argparse
+import io
+import json
+import os
+import time
+
+import numpy as np
+
+from serial_ingest import LATENCY_PREFIX, TEXT_LINES
+
+# Offline bulk import of a raw serial capture of main.cpp (e.g. the bytes of a
+# 24-hour soak saved by a terminal, or firmware_emulator.py --capture). The
+# capture is memory-mapped and cut into windows at line ends; within a window
+# lines are found and classified with whole-array byte operations, the data
+# lines are compacted without their AI_latency_us: prefix and the fields are
+# parsed by pyarrow's C CSV reader into typed columns, so no Python code runs
+# per line. A window the reader rejects is checked byte by byte to set its
+# malformed lines aside. Output is a directory of .npy tables:
+#   records/   one row per data line (AI_latency_us: prefix stripped)
+#   heap/      one row per "Free heap" line, with the millis of the last record
+#   malformed/ byte offset, length and reason of every line that did not parse
+#   index/     (boot, millis) sort keys and row order for time-range queries
+# plus summary.json with the counters. Boots are counted from millis going
+# backwards (a reset or power cycle restarts millis()).
+
+WINDOW_BYTES = 16 << 20
+NPY_HEADER_BYTES = 128
+N_FIELDS = 10                   # millis, 5 sensors, 3 probabilities, latency
+MAX_LATENCY_DIGITS = 10         # %lu of a 32-bit unsigned long
+RECORD_COLUMNS = {
+    'offset': '<i8',            # byte offset of the line in the capture
+    'boot': '<u4',
+    'millis': '<u4',
+    'ldr_v': '<f4',
+    'temp_c': '<f4',
+    'hum_pct': '<f4',
+    'tvoc_ppb': '<f4',
+    'eco2_ppm': '<f4',
+    'prob0': '<f4',
+    'prob1': '<f4',
+    'prob2': '<f4',
+    'latency_us': '<u4',
+}
+FIELD_COLUMNS = list(RECORD_COLUMNS)[2:]
+INTEGER_FIELDS = np.array([c in ('millis', 'latency_us') for c in FIELD_COLUMNS])
+HEAP_COLUMNS = {'offset': '<i8', 'boot': '<u4', 'last_millis': '<i8', 'free_heap': '<u4'}
+MALFORMED_COLUMNS = {'offset': '<i8', 'length': '<u4', 'reason': 'u1'}
+MALFORMED_REASONS = ['partial', 'field_count', 'bad_number', 'unrecognized']
+HEAP_PREFIX = b'Free heap:'
+HEAP_SUFFIX = b' bytes'
+# Other lines main.cpp prints (serial_ingest.TEXT_LINES): counted, not stored
+TEXT_LINES = {name: [prefix.encode() for prefix in prefixes] for name, prefixes in TEXT_LINES.items()}
+# Byte classes of the number grammar
+OTHER, DIGIT, COMMA, DOT, MINUS, NEWLINE = range(6)
+CHAR_CLASS = np.full(256, OTHER, dtype=np.uint8)
+CHAR_CLASS[ord('0'):ord('9') + 1] = DIGIT
+CHAR_CLASS[ord(',')] = COMMA
+CHAR_CLASS[ord('.')] = DOT
+CHAR_CLASS[ord('-')] = MINUS
+CHAR_CLASS[ord('\n')] = NEWLINE
+
+
+class NpyAppender:
+    """Append rows to a 1-D .npy file; the shape in the header is patched on close"""
+
+    def __init__(self, path, dtype):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.rows = 0
+        self._file = open(path, 'wb')
+        self._file.write(b'\0' * NPY_HEADER_BYTES)
+
+    def write(self, values):
+        self._file.write(np.ascontiguousarray(values, dtype=self.dtype).tobytes())
+        self.rows += len(values)
+
+    def close(self):
+        header = repr({'descr': np.lib.format.dtype_to_descr(self.dtype), 'fortran_order': False,
+                       'shape': (self.rows,)})
+        header = header.ljust(NPY_HEADER_BYTES - 10 - 1) + '\n'
+        self._file.seek(0)
+        self._file.write(b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header.encode('latin1'))
+        self._file.close()
+
+
+class TableWriter:
+    """One NpyAppender per column in out_dir/name/"""
+
+    def __init__(self, out_dir, name, columns):
+        path = os.path.join(out_dir, name)
+        os.makedirs(path, exist_ok=True)
+        self.columns = {c: NpyAppender(os.path.join(path, f"{c}.npy"), d) for c, d in columns.items()}
+
+    @property
+    def rows(self):
+        return next(iter(self.columns.values())).rows
+
+    def write(self, table):
+        for name, column in self.columns.items():
+            column.write(table[name])
+
+    def close(self):
+        for column in self.columns.values():
+            column.close()
+
+
+def starts_with(buf, starts, ends, prefix):
+    """Lines [starts, ends) of buf that begin with the bytes prefix"""
+    match = ends - starts >= len(prefix)
+    candidates = np.flatnonzero(match)
+    for k, byte in enumerate(prefix):
+        candidates = candidates[buf[starts[candidates] + k] == byte]
+    match[:] = False
+    match[candidates] = True
+    return match
+
+
+def ends_with(buf, starts, ends, suffix):
+    """Lines [starts, ends) of buf that end with the bytes suffix"""
+    match = ends - starts >= len(suffix)
+    candidates = np.flatnonzero(match)
+    for k, byte in enumerate(suffix):
+        candidates = candidates[buf[ends[candidates] - len(suffix) + k] == byte]
+    match[:] = False
+    match[candidates] = True
+    return match
+
+
+def find_all(buf, needle):
+    """Start positions of every occurrence of needle in buf"""
+    positions = np.flatnonzero(buf[:len(buf) - len(needle) + 1] == needle[0])
+    for k in range(1, len(needle)):
+        positions = positions[buf[positions + k] == needle[k]]
+    return positions
+
+
+def compact(buf, ranges):
+    """Concatenate the byte ranges [(starts, ends), ...] of buf in buffer order (ranges must not overlap)"""
+    starts = np.concatenate([r[0] for r in ranges])
+    ends = np.concatenate([r[1] for r in ranges])
+    total = int((ends - starts).sum())
+    if total < len(buf) // 16:
+        # A few short ranges (heap lines): gather their bytes
+        order = np.argsort(starts, kind='stable')
+        starts, lengths = starts[order], (ends - starts)[order]
+        shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return buf[shift + np.arange(total)]
+    toggle = np.zeros(len(buf) + 1, dtype=bool)
+    for starts, ends in ranges:
+        toggle[starts] ^= True
+        toggle[ends] ^= True
+    return buf[np.logical_xor.accumulate(toggle[:-1])]
+
+
+def numeric_bytes_only(data):
+    """Only digits, ',', '.', '-' and '\n': the bytes the number grammar needs"""
+    shifted = data - np.uint8(ord(','))          # ',' '-' '.' '/' '0'..'9' -> 0..13
+    return not (((shifted >= 14) | (shifted == ord('/') - ord(','))) & (data != ord('\n'))).any()
+
+
+def check_fields(data, n_fields):
+    """
+    Find the lines of data that are not n_fields comma-separated numbers
+    -?(digits(.digits?)?|.digits), the grammar pyarrow's CSV reader accepts
+    over these bytes. Returns the newline positions and per line a wrong
+    field count and a bad number mask.
+    """
+    newlines = np.flatnonzero(data == ord('\n'))
+    cls = CHAR_CLASS[data]
+    prev = np.r_[NEWLINE, cls[:-1]]
+    after = np.r_[cls[1:], NEWLINE]
+    field_start = (prev == COMMA) | (prev == NEWLINE)
+    bad = cls == OTHER
+    bad |= field_start & ((cls == COMMA) | (cls == NEWLINE))        # empty field
+    bad |= (cls == MINUS) & (~field_start | ((after != DIGIT) & (after != DOT)))
+    bad |= (cls == DOT) & (prev != DIGIT) & (after != DIGIT)
+    separators = np.flatnonzero((cls == COMMA) | (cls == DOT) | (cls == NEWLINE))
+    kinds = cls[separators]
+    dots = kinds == DOT
+    bad[separators[1:][dots[1:] & dots[:-1]]] = True                # two dots in one field
+    is_comma = (kinds == COMMA).astype(np.int64)
+    commas_before = np.cumsum(is_comma) - is_comma
+    n_commas = np.diff(commas_before[kinds == NEWLINE], prepend=0)
+    field_count = n_commas != n_fields - 1
+    bad_number = np.zeros(len(newlines), dtype=bool)
+    bad_number[np.searchsorted(newlines, np.flatnonzero(bad))] = True
+    return newlines, field_count, bad_number & ~field_count
+
+
+def parse_csv(data, n_fields):
+    """
+    float64 (rows, n_fields) of newline-terminated numeric CSV lines with
+    pyarrow's C reader (np.loadtxt without pyarrow); ValueError on a bad line.
+    """
+    if not len(data):
+        return np.zeros((0, n_fields))
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return np.loadtxt(io.BytesIO(data.tobytes()), delimiter=',', dtype=np.float64, ndmin=2)
+    names = [f"f{j}" for j in range(n_fields)]
+    table = pa_csv.read_csv(
+        pa.py_buffer(data), read_options=pa_csv.ReadOptions(column_names=names),
+        parse_options=pa_csv.ParseOptions(quote_char=False, ignore_empty_lines=False),
+        convert_options=pa_csv.ConvertOptions(column_types={n: pa.float64() for n in names},
+                                              null_values=[], strings_can_be_null=False))
+    return np.column_stack([table.column(n).to_numpy() for n in names])
+
+
+def parse_lines(buf, ranges, newlines, n_fields):
+    """
+    Parse one line per entry of newlines made of the byte ranges to keep
+    (e.g. all but a prefix). Returns the float64 values of the good lines and
+    the good, field_count and bad_number masks over all lines. Clean windows
+    go straight to the C parser; the byte checks only run to sort out a
+    window it rejects.
+    """
+    none = np.zeros(len(newlines), dtype=bool)
+    if not len(newlines):
+        return np.zeros((0, n_fields)), none, none, none
+    data = compact(buf, ranges + [(newlines, newlines + 1)])
+    if numeric_bytes_only(data):
+        try:
+            return parse_csv(data, n_fields), ~none, none, none.copy()
+        except ValueError:
+            pass
+    line_ends, field_count, bad_number = check_fields(data, n_fields)
+    good = ~(field_count | bad_number)
+    if not good.all():
+        line_starts = np.r_[0, line_ends[:-1] + 1]
+        data = compact(data, [(line_starts[good], line_ends[good] + 1)])
+    return parse_csv(data, n_fields), good, field_count, bad_number
+
+
+class CaptureImporter:
+    """
+    Import a raw text capture window by window. State that crosses windows
+    (boot count, last millis, pending partial line) is kept here, so the result
+    does not depend on window_bytes.
+    """
+
+    def __init__(self, out_dir, window_bytes=WINDOW_BYTES):
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.window_bytes = window_bytes
+        self.records = TableWriter(out_dir, 'records', RECORD_COLUMNS)
+        self.heap = TableWriter(out_dir, 'heap', HEAP_COLUMNS)
+        self.malformed = TableWriter(out_dir, 'malformed', MALFORMED_COLUMNS)
+        self.counts = {'bytes': 0, 'lines': 0, 'records': 0, 'heap': 0, 'blank': 0,
+                       **{kind: 0 for kind in TEXT_LINES}, **{reason: 0 for reason in MALFORMED_REASONS}}
+        self.boot = 0
+        self.last_millis = -1
+        self.boots = []
+
+    def import_file(self, path):
+        capture = np.memmap(path, dtype=np.uint8, mode='r') if os.path.getsize(path) else np.zeros(0, np.uint8)
+        position = 0
+        while position < len(capture):
+            end = min(position + self.window_bytes, len(capture))
+            window = np.asarray(capture[position:end])
+            newlines = np.flatnonzero(window == ord('\n'))
+            while not len(newlines) and end < len(capture):
+                # A line longer than the window: grow it to the next newline
+                end = min(end + self.window_bytes, len(capture))
+                window = np.asarray(capture[position:end])
+                newlines = np.flatnonzero(window == ord('\n'))
+            cut = int(newlines[-1]) + 1 if len(newlines) else 0
+            if cut:
+                self._window(window[:cut], newlines, position)
+            if end == len(capture) and cut < len(window):
+                self._add_malformed([position + cut], [len(window) - cut], 'partial')
+                cut = len(window)
+            self.counts['bytes'] += cut
+            position += cut
+        return self
+
+    def _add_malformed(self, offsets, lengths, reason):
+        self.malformed.write({'offset': offsets, 'length': lengths,
+                              'reason': np.full(len(offsets), MALFORMED_REASONS.index(reason))})
+        self.counts[reason] += len(offsets)
+
+    def _window(self, buf, newlines, base):
+        starts = np.r_[0, newlines[:-1] + 1]
+        ends = newlines - ((newlines > starts) & (buf[np.maximum(newlines - 1, 0)] == ord('\r')))
+        n = len(starts)
+        self.counts['lines'] += n
+        kind = np.full(n, -1, dtype=np.int8)   # -1 unrecognized, 0 data, 1 heap, 2 text, 3 blank
+
+        prefix = np.frombuffer(LATENCY_PREFIX.encode(), dtype=np.uint8)
+        found = find_all(buf, prefix)
+        prefix_line = np.searchsorted(newlines, found)
+        prefixes = np.bincount(prefix_line, minlength=n)
+        kind[prefixes > 0] = 0
+        kind[(kind < 0) & starts_with(buf, starts, ends, HEAP_PREFIX)] = 1
+        for name, prefixes_of_kind in TEXT_LINES.items():
+            for text in prefixes_of_kind:
+                match = (kind < 0) & starts_with(buf, starts, ends, text)
+                kind[match] = 2
+                self.counts[name] += int(match.sum())
+        blank = (kind < 0) & (ends == starts)
+        kind[blank] = 3
+        self.counts['blank'] += int(blank.sum())
+        unrecognized = np.flatnonzero(kind < 0)
+        self._add_malformed(base + starts[unrecognized], ends[unrecognized] - starts[unrecognized], 'unrecognized')
+
+        before = (self.boot, self.last_millis)
+        records = self._data_lines(buf, starts, ends, np.flatnonzero(kind == 0), newlines, found, prefix_line, base)
+        self._heap_lines(buf, starts, ends, newlines, np.flatnonzero(kind == 1), base, before, records)
+
+    def _data_lines(self, buf, starts, ends, lines, newlines, found, prefix_line, base):
+        """Parse and store the data lines; returns (offsets, boot, millis) of the stored records"""
+        none = (np.zeros(0, dtype=np.int64),) * 3
+        if not len(lines):
+            return none
+        # Exactly one "AI_latency_us:"; its bytes are dropped before the fields are parsed
+        single = np.bincount(prefix_line, minlength=len(starts))[lines] == 1
+        self._add_malformed(base + starts[lines[~single]], ends[lines[~single]] - starts[lines[~single]],
+                            'field_count')
+        lines = lines[single]
+        at = found[np.searchsorted(prefix_line, lines)]
+        line_starts, line_ends = starts[lines], ends[lines]
+        # The prefix closes the 9th field and the latency is 1-10 digits:
+        # "...,%.0f,AI_latency_us:%lu" -> "...,%.0f,%lu"
+        latency_start = at + len(LATENCY_PREFIX)
+        length = line_ends - latency_start
+        field_count = buf[np.maximum(at - 1, 0)] != ord(',')
+        bad_number = (length < 1) | (length > MAX_LATENCY_DIGITS)
+        for k in range(MAX_LATENCY_DIGITS):
+            byte = buf[np.minimum(latency_start + k, len(buf) - 1)]
+            inside = k < length
+            field_count |= inside & (byte == ord(','))
+            bad_number |= inside & ((byte < ord('0')) | (byte > ord('9')))
+        bad_number &= ~field_count
+        shaped = np.flatnonzero(~(field_count | bad_number))
+        values, parsed, wrong_count, wrong_number = parse_lines(
+            buf, [(line_starts[shaped], at[shaped]), (latency_start[shaped], line_ends[shaped])],
+            newlines[lines[shaped]], N_FIELDS)
+        field_count[shaped[wrong_count]] = True
+        bad_number[shaped[wrong_number]] = True
+        good = np.zeros(len(lines), dtype=bool)
+        good[shaped[parsed]] = True
+        integer = values[:, INTEGER_FIELDS]
+        in_range = ((integer == np.floor(integer)) & (integer >= 0) & (integer <= 0xFFFFFFFF)).all(axis=1)
+        bad_number[np.flatnonzero(good)[~in_range]] = True
+        good[bad_number] = False
+        values = values[in_range]
+        for mask, reason in ((field_count, 'field_count'), (bad_number, 'bad_number')):
+            self._add_malformed(base + line_starts[mask], line_ends[mask] - line_starts[mask], reason)
+        if not len(values):
+            return none
+        millis = values[:, 0].astype(np.int64)
+
+        boot = self._boots(millis)
+        table = {'offset': base + line_starts[good], 'boot': boot}
+        for j, name in enumerate(FIELD_COLUMNS):
+            table[name] = values[:, j]
+        self.records.write(table)
+        self.counts['records'] += len(values)
+        return table['offset'], boot, millis
+
+    def _boots(self, millis):
+        """Boot number of each record: a new boot whenever millis goes backwards"""
+        previous = np.r_[self.last_millis, millis[:-1]]
+        restart = millis < previous
+        boot = self.boot + np.cumsum(restart)
+        if not self.boots:
+            self.boots.append({'boot': 0, 'first_millis': int(millis[0]), 'records': 0})
+        for i in np.flatnonzero(restart):
+            self.boots[-1]['last_millis'] = int(previous[i])
+            self.boots.append({'boot': int(boot[i]), 'first_millis': int(millis[i]), 'records': 0})
+        counts = np.bincount(boot - self.boot)
+        for k, c in enumerate(counts):
+            self.boots[len(self.boots) - len(counts) + k]['records'] += int(c)
+        self.boots[-1]['last_millis'] = int(millis[-1])
+        self.boot = int(boot[-1])
+        self.last_millis = int(millis[-1])
+        return boot
+
+    def _heap_lines(self, buf, starts, ends, newlines, lines, base, before, records):
+        if not len(lines):
+            return
+        # "Free heap: %u bytes"
+        s, e = starts[lines] + len(HEAP_PREFIX) + 1, ends[lines] - len(HEAP_SUFFIX)
+        shape_ok = (e > s) & (buf[s - 1] == ord(' ')) & ends_with(buf, starts[lines], ends[lines], HEAP_SUFFIX)
+        values, good, _, _ = parse_lines(buf, [(s[shape_ok], e[shape_ok])], newlines[lines[shape_ok]], 1)
+        ok = np.zeros(len(lines), dtype=bool)
+        ok[np.flatnonzero(shape_ok)[good]] = True
+        heap = values[:, 0]
+        in_range = (heap == np.floor(heap)) & (heap >= 0) & (heap <= 0xFFFFFFFF)
+        ok[np.flatnonzero(ok)[~in_range]] = False
+        values = heap[in_range]
+        self._add_malformed(base + starts[lines[~ok]], ends[lines[~ok]] - starts[lines[~ok]], 'bad_number')
+        offsets = base + starts[lines[ok]]
+        # Tag each heap line with the last record before it (main.cpp prints it after that loop's data line)
+        last_boot, last_millis = before
+        record_offsets, record_boot, record_millis = records
+        boot = np.full(len(offsets), last_boot, dtype=np.int64)
+        millis = np.full(len(offsets), last_millis, dtype=np.int64)
+        # The window may have heap lines but no record (e.g. right after boot)
+        i = np.searchsorted(record_offsets, offsets) - 1
+        after = i >= 0
+        boot[after] = record_boot[i[after]]
+        millis[after] = record_millis[i[after]]
+        self.heap.write({'offset': offsets, 'free_heap': values, 'boot': boot, 'last_millis': millis})
+        self.counts['heap'] += len(offsets)
+
+    def close(self, seconds=None):
+        for table in (self.records, self.heap, self.malformed):
+            table.close()
+        build_index(self.out_dir)
+        summary = {'counts': self.counts, 'boots': self.boots, 'window_bytes': self.window_bytes,
+                   'malformed_reasons': MALFORMED_REASONS}
+        if seconds is not None:
+            summary['seconds'] = seconds
+            summary['mb_per_s'] = self.counts['bytes'] / 1e6 / max(seconds, 1e-9)
+        with open(os.path.join(self.out_dir, 'summary.json'), 'w') as f:
+            json.dump(summary, f, indent=1)
+        return summary
+
+
+def build_index(out_dir):
+    """index/key.npy: sorted (boot << 32 | millis); index/order.npy: record row of each key"""
+    path = os.path.join(out_dir, 'index')
+    os.makedirs(path, exist_ok=True)
+    boot = np.load(os.path.join(out_dir, 'records', 'boot.npy'), mmap_mode='r')
+    millis = np.load(os.path.join(out_dir, 'records', 'millis.npy'), mmap_mode='r')
+    key = (boot.astype(np.int64) << 32) | millis.astype(np.int64)
+    # Captures are almost always in order already
+    order = np.arange(len(key)) if not len(key) or (np.diff(key) >= 0).all() else np.argsort(key, kind='stable')
+    np.save(os.path.join(path, 'key.npy'), key[order])
+    np.save(os.path.join(path, 'order.npy'), order)
+
+
+def import_capture(path, out_dir, window_bytes=WINDOW_BYTES):
+    t0 = time.perf_counter()
+    importer = CaptureImporter(out_dir, window_bytes).import_file(path)
+    return importer.close(time.perf_counter() - t0)
+
+
+class Capture:
+    """Memory-mapped tables of an imported capture with time-range queries"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        with open(os.path.join(out_dir, 'summary.json')) as f:
+            self.summary = json.load(f)
+        self.records = self._table('records', RECORD_COLUMNS)
+        self.heap = self._table('heap', HEAP_COLUMNS)
+        self.malformed = self._table('malformed', MALFORMED_COLUMNS)
+        self.key = np.load(os.path.join(out_dir, 'index', 'key.npy'), mmap_mode='r')
+        self.order = np.load(os.path.join(out_dir, 'index', 'order.npy'), mmap_mode='r')
+
+    def _table(self, name, columns):
+        return {c: np.load(os.path.join(self.out_dir, name, f"{c}.npy"), mmap_mode='r') for c in columns}
+
+    def rows_between(self, start_ms, end_ms, boot=0):
+        """Record rows with start_ms <= millis < end_ms in one boot, in millis order"""
+        lo, hi = np.searchsorted(self.key, [(boot << 32) + max(start_ms, 0), (boot << 32) + min(end_ms, 1 << 32)])
+        return np.asarray(self.order[lo:hi])
+
+    def between(self, start_ms, end_ms, boot=0):
+        rows = self.rows_between(start_ms, end_ms, boot)
+        return {c: np.asarray(v[rows]) for c, v in self.records.items()}
+
+    def hour(self, hour, boot=0):
+        return self.between(int(hour * 3_600_000), int((hour + 1) * 3_600_000), boot)
+
+
+def print_summary(summary):
+    c = summary['counts']
+    rate = f" in {summary['seconds']:.2f} s ({summary['mb_per_s']:.0f} MB/s)" if 'seconds' in summary else ''
+    print(f"{c['bytes'] / 1e6:.1f} MB, {c['lines']} lines{rate}")
+    print(f"  records {c['records']}, heap {c['heap']}, DHT failures {c['dht_failure']}, "
+          f"debug {c['debug']}, boot {c['boot']}, blank {c['blank']}")
+    print("  malformed: " + ', '.join(f"{r} {c[r]}" for r in summary['malformed_reasons']))
+    for b in summary['boots']:
+        print(f"  boot {b['boot']}: {b['records']} records, millis {b['first_millis']}-{b['last_millis']} "
+              f"({(b['last_millis'] - b['first_millis']) / 3.6e6:.2f} h)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bulk import a raw serial capture into typed, indexed tables')
+    parser.add_argument('capture', nargs='?', help='Raw capture file (main.cpp text output)')
+    parser.add_argument('--out', help='Output directory (default: <capture>.d)')
+    parser.add_argument('--window-mb', type=float, default=WINDOW_BYTES / (1 << 20))
+    parser.add_argument('--open', metavar='DIR', help='Query a directory imported before instead')
+    parser.add_argument('--hour', type=float, help='Print the records of this hour of device time')
+    parser.add_argument('--boot', type=int, default=0)
+    parser.add_argument('--show-malformed', type=int, default=0, metavar='N', help='Print the first N malformed lines')
+    args = parser.parse_args(argv)
+    if not (args.capture or args.open):
+        parser.error('give a capture to import or --open DIR')
+
+    out_dir = args.open or args.out or args.capture + '.d'
+    if not args.open:
+        print_summary(import_capture(args.capture, out_dir, int(args.window_mb * (1 << 20))))
+    capture = Capture(out_dir)
+    if args.open:
+        print_summary(capture.summary)
+    if args.show_malformed and args.capture:
+        with open(args.capture, 'rb') as f:
+            for offset, length, reason in list(zip(*capture.malformed.values()))[:args.show_malformed]:
+                f.seek(int(offset))
+                print(f"  @{offset} {MALFORMED_REASONS[reason]}: {f.read(min(int(length), 200))!r}")
+    if args.hour is not None:
+        rows = capture.hour(args.hour, args.boot)
+        print(f"hour {args.hour:g} of boot {args.boot}: {len(rows['millis'])} records")
+        for i in range(min(len(rows['millis']), 5)):
+            values = (np.format_float_positional(rows[c][i], trim='-') if rows[c].dtype.kind == 'f'
+                      else rows[c][i] for c in FIELD_COLUMNS)
+            print('  ' + ', '.join(f"{c} {v}" for c, v in zip(FIELD_COLUMNS, values)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from capture_import import FIELD_COLUMNS, HEAP_COLUMNS, MALFORMED_COLUMNS, RECORD_COLUMNS, Capture, import_capture
+from firmware_emulator import FirmwareEmulator
+from serial_ingest import parse_lines
+
+# The bulk importer against serial_ingest.parse_lines on an emulated capture
+# with two boots, heap and DHT failure lines: same records and heap values.
+# Then the same capture with damaged lines: exactly those lines are reported
+# malformed, with the right reason, and the tables do not depend on the
+# window size. Heap lines in a window without any data record (right after
+# boot, after a malformed data line, tiny windows) keep the boot and millis
+# before them. Time-range queries match a boolean mask, and the import is
+# timed against parse_lines on a data-only capture.
+
+LOOPS = (3000, 1500)
+SMALL_WINDOW = 64 << 10
+TINY_WINDOW = 256
+
+
+def emulated_capture(debug=True, loops=LOOPS):
+    """Boot text + loop output of one emulator per boot (millis restart at each)"""
+    lines = []
+    for boot, n in enumerate(loops):
+        emulator = FirmwareEmulator(seed=boot, dht_fail_rate=0.02, heap_leak_per_hour=2000, debug=debug)
+        lines += emulator.boot_text.encode().splitlines(keepends=True)
+        lines += b''.join(emulator.chunk(n)).splitlines(keepends=True)
+    return lines
+
+
+def import_bytes(tmp, name, data, window_bytes=None):
+    path = os.path.join(tmp, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    kwargs = {'window_bytes': window_bytes} if window_bytes else {}
+    summary = import_capture(path, path + '.d', **kwargs)
+    return summary, Capture(path + '.d')
+
+
+def expected_records(data):
+    rows, heap, malformed = parse_lines(data.decode())
+    return np.array(rows, dtype=np.float64), np.array(heap, dtype=np.int64), malformed
+
+
+def same_records(capture, rows):
+    return len(capture.records['millis']) == len(rows) and all(
+        np.array_equal(capture.records[c], rows[:, j].astype(capture.records[c].dtype))
+        for j, c in enumerate(FIELD_COLUMNS))
+
+
+def damage(lines):
+    """Damage some data and heap lines; returns (lines, data-line ordinals lost, malformed reasons)"""
+    lines = list(lines)
+    data_lines = [i for i, line in enumerate(lines) if b'AI_latency_us:' in line]
+    lost, reasons = set(), []
+
+    def ordinal(i):
+        return data_lines.index(i)
+
+    i = data_lines[10]                                  # a non-numeric field
+    lines[i] = lines[i].replace(b',', b',x', 1)
+    lost.add(ordinal(i))
+    reasons.append('bad_number')
+    i = data_lines[20]                                  # a dropped field
+    fields = lines[i].split(b',')
+    lines[i] = b','.join(fields[:3] + fields[4:])
+    lost.add(ordinal(i))
+    reasons.append('field_count')
+    # Two consecutive data lines merged by a lost newline (a dropped byte)
+    i = next(d for d in data_lines[30:] if d + 1 in data_lines)
+    lines[i] = lines[i][:len(lines[i]) // 2]
+    lost.update({ordinal(i), ordinal(i + 1)})
+    reasons.append('field_count')
+    i = data_lines[40]                                  # the prefix in the wrong place
+    fields = lines[i].replace(b'AI_latency_us:', b'').split(b',')
+    lines[i] = b','.join(fields[:8] + [b'AI_latency_us:' + fields[8]] + fields[9:])
+    lost.add(ordinal(i))
+    reasons.append('field_count')
+    i = data_lines[50]                                  # a latency that is not an integer
+    lines[i] = lines[i].rstrip(b'\n') + b'.5\n'
+    lost.add(ordinal(i))
+    reasons.append('bad_number')
+    i = data_lines[60]                                  # a negative millis
+    lines[i] = b'-' + lines[i]
+    lost.add(ordinal(i))
+    reasons.append('bad_number')
+    lines.insert(data_lines[70], b'\x00\xff\xfe garbage after a glitch\n')
+    reasons.append('unrecognized')
+    heap = [i for i, line in enumerate(lines) if line.startswith(b'Free heap')]
+    lines[heap[1]] = b'Free heap: 12x bytes\n'
+    reasons.append('bad_number')
+    lines.append(b'123456,0.81,24.')                  # capture stopped mid-line
+    reasons.append('partial')
+    return lines, lost, reasons, heap[1]
+
+
+def check_clean(tmp):
+    data = b''.join(emulated_capture())
+    summary, capture = import_bytes(tmp, 'clean.log', data)
+    rows, heap, malformed = expected_records(data)
+    boots = [(b['records'], b['first_millis'] < 10_000) for b in summary['boots']]
+    print(f"clean: {summary['counts']['records']} records, {summary['counts']['heap']} heap lines, "
+          f"boots {boots}, DHT failures {summary['counts']['dht_failure']}")
+    ok = True
+    if not same_records(capture, rows) or malformed:
+        print("FAIL: records differ from serial_ingest.parse_lines")
+        ok = False
+    if not np.array_equal(capture.heap['free_heap'], heap) or not len(heap):
+        print("FAIL: heap values differ from serial_ingest.parse_lines")
+        ok = False
+    # Each heap line carries the millis of the data line printed before it
+    before = np.searchsorted(capture.records['offset'], capture.heap['offset']) - 1
+    if not np.array_equal(capture.heap['last_millis'], capture.records['millis'][before]) \
+            or not np.array_equal(capture.heap['boot'], capture.records['boot'][before]):
+        print("FAIL: heap lines are not tagged with the preceding record")
+        ok = False
+    if len(summary['boots']) != len(LOOPS) or sum(summary['counts'][r] for r in summary['malformed_reasons']):
+        print(f"FAIL: expected {len(LOOPS)} boots and no malformed lines")
+        ok = False
+
+    # Time ranges: index lookup == boolean mask, across a boot boundary too
+    rng = np.random.default_rng(0)
+    boot, millis = np.asarray(capture.records['boot']), np.asarray(capture.records['millis'])
+    for _ in range(50):
+        b = int(rng.integers(len(LOOPS)))
+        start = int(rng.integers(0, millis.max()))
+        end = start + int(rng.integers(0, 600_000))
+        want = np.flatnonzero((boot == b) & (millis >= start) & (millis < end))
+        if not np.array_equal(capture.rows_between(start, end, b), want):
+            print(f"FAIL: rows_between({start}, {end}, {b}) differs from the mask")
+            return False
+    first_hour = capture.hour(0, boot=1)
+    if not np.array_equal(first_hour['millis'], millis[(boot == 1) & (millis < 3_600_000)]):
+        print("FAIL: hour(0, boot=1)")
+        ok = False
+    return ok
+
+
+def check_damaged(tmp):
+    clean = emulated_capture(debug=False)
+    lines, lost, reasons, bad_heap = damage(clean)
+    data = b''.join(lines)
+    summary, capture = import_bytes(tmp, 'damaged.log', data)
+    rows, heap, _ = expected_records(b''.join(clean))
+    keep = np.setdiff1d(np.arange(len(rows)), sorted(lost))
+    counts = {r: summary['counts'][r] for r in summary['malformed_reasons']}
+    want = {r: reasons.count(r) for r in summary['malformed_reasons']}
+    print(f"damaged: {summary['counts']['records']} records, malformed {counts}")
+    ok = True
+    if counts != want:
+        print(f"FAIL: expected malformed {want}")
+        ok = False
+    if not same_records(capture, rows[keep]):
+        print("FAIL: records other than the damaged lines changed")
+        ok = False
+    if len(capture.heap['free_heap']) != len(heap) - 1:
+        print("FAIL: the damaged heap line was not set aside")
+        ok = False
+    # Offsets point at the lines in the capture
+    offsets = np.cumsum([0] + [len(line) for line in lines])
+    malformed_lines = set(np.searchsorted(offsets, capture.malformed['offset']))
+    if bad_heap not in malformed_lines or not set(np.searchsorted(offsets, capture.records['offset'])) \
+            .isdisjoint(malformed_lines):
+        print("FAIL: malformed offsets do not point at the damaged lines")
+        ok = False
+
+    # Small windows: lines cross window edges, tables must not change
+    _, small = import_bytes(tmp, 'damaged_small.log', data, SMALL_WINDOW)
+    for name, columns in (('records', RECORD_COLUMNS), ('heap', HEAP_COLUMNS), ('malformed', MALFORMED_COLUMNS)):
+        a, b = getattr(capture, name), getattr(small, name)
+        if not all(np.array_equal(a[c], b[c]) for c in columns):
+            print(f"FAIL: {name} depends on the window size")
+            ok = False
+    return ok
+
+
+def check_heap_without_records(tmp):
+    ok = True
+    cases = {
+        'boot then heap': (b"Setup done!\r\nFree heap: 290000 bytes\n", [(0, -1)]),
+        'malformed record then heap': (b"1000,0.1,25.0\nFree heap: 290000 bytes\n", [(0, -1)]),
+    }
+    for name, (data, want) in cases.items():
+        _, capture = import_bytes(tmp, 'heap_only.log', data)
+        got = list(zip(capture.heap['boot'].tolist(), capture.heap['last_millis'].tolist()))
+        print(f"{name}: heap lines tagged {got}")
+        if got != want:
+            print(f"FAIL: expected {want}")
+            ok = False
+
+    # Windows of a few lines: many hold a heap line and no record
+    data = b''.join(emulated_capture(loops=(300, 200)))
+    _, whole = import_bytes(tmp, 'tiny.log', data)
+    _, tiny = import_bytes(tmp, 'tiny_window.log', data, TINY_WINDOW)
+    for name, columns in (('records', RECORD_COLUMNS), ('heap', HEAP_COLUMNS)):
+        a, b = getattr(whole, name), getattr(tiny, name)
+        if not all(np.array_equal(a[c], b[c]) for c in columns):
+            print(f"FAIL: {name} differ with {TINY_WINDOW}-byte windows")
+            ok = False
+    return ok
+
+
+def check_throughput(tmp):
+    data = b''.join(emulated_capture(debug=False, loops=(40000,)))
+    summary, capture = import_bytes(tmp, 'soak.log', data)
+    t0 = time.perf_counter()
+    rows, _, _ = expected_records(data)
+    baseline = len(data) / 1e6 / (time.perf_counter() - t0)
+    print(f"throughput: {len(data) / 1e6:.1f} MB, bulk import {summary['mb_per_s']:.0f} MB/s, "
+          f"parse_lines + float array {baseline:.0f} MB/s")
+    if not same_records(capture, rows) or summary['mb_per_s'] < baseline:
+        print("FAIL: bulk import wrong or slower than the line parser")
+        return False
+    return True
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = check_clean(tmp)
+        ok = check_damaged(tmp) and ok
+        ok = check_heap_without_records(tmp) and ok
+        ok = check_throughput(tmp) and ok
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,59 @@
+import sys
+
+import pandas as pd
+
+from drift_monitor import DriftMonitor, frame_values, load_reference
+from firmware_emulator import FirmwareEmulator
+from serial_ingest import LOG_HEADER, parse_lines
+
+# The training data scored against its own reference must not drift; the
+# result must not depend on how the stream is chunked; and emulated firmware
+# output with the real SGP30 and failing DHT reads must raise those alerts.
+
+
+def emulated_log(loops, **kwargs):
+    emulator = FirmwareEmulator(debug=False, **kwargs)
+    rows, _, _ = parse_lines(b''.join(emulator.chunk(loops)).decode())
+    return pd.DataFrame(rows, columns=LOG_HEADER)
+
+
+def main():
+    ok = True
+    reference = load_reference()
+    df = pd.read_csv('data/dataset_real_clean.csv')
+    values, _ = frame_values(df)
+
+    whole = DriftMonitor(reference, window=len(values))
+    whole.update(values)
+    total = whole.report()['total']
+    worst = max(s['psi'] for s in total['features'].values())
+    drift = [a for a in total['alerts'] if not a.startswith('DHT')]
+    print(f"training data vs reference: max PSI {worst:.4f}, DHT failures {total['dht_failure_rate']:.1%}, "
+          f"drift alerts {drift}")
+    if worst > 1e-3 or drift:
+        ok = False
+
+    one_shot, chunked = DriftMonitor(reference, window=100), DriftMonitor(reference, window=100)
+    one_shot.update(values)
+    for start in range(0, len(values), 37):
+        chunked.update(values[start:start + 37])
+    if one_shot.windows != chunked.windows:
+        print("FAIL: windows depend on the chunking")
+        ok = False
+
+    monitor = DriftMonitor(reference)
+    monitor.update(*frame_values(emulated_log(3000, sgp30=True, dht_fail_rate=0.05)))
+    monitor.finish()
+    alerts = ' '.join(a for w in monitor.windows for a in w['alerts'])
+    rate = monitor.report()['total']['dht_failure_rate']
+    print(f"emulated log: {len(monitor.windows)} windows, DHT failure rate {rate:.1%}")
+    if not ('tvoc_ppb' in alerts and 'eco2_ppm' in alerts and 'DHT failures' in alerts) or not 0.03 < rate < 0.07:
+        print(f"FAIL: expected SGP30 drift and DHT failure alerts, got {alerts[:200]}")
+        ok = False
+
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,125 @@
+import csv
+import glob
+import os
+import re
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import telemetry
+from firmware_emulator import HEAP_LOG_INTERVAL_MS, FirmwareEmulator, stream
+from pty_serial import FakeSerialPort
+from serial_ingest import IngestionService, parse_lines
+
+# Feed serial_ingest from the firmware emulator over a pty at a rate far above
+# the board's 1 Hz, in text and binary telemetry mode, and check that every
+# loop() arrives with its heap lines and DHT failures, and that both modes
+# carry the same measurements. The boot text must end each line the way the
+# firmware prints it: println sends \r\n, printf only its own \n.
+
+LOOPS = 20000
+RATE = 5000.0
+FIRMWARE_SRC = '../firmware/src'
+
+
+def wait_for(condition, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.02)
+
+
+def ingest(emulator, tmp, binary=False):
+    with FakeSerialPort(link=os.path.join(tmp, 'ttyEMU')) as board:
+        service = IngestionService([board.port], out_dir=tmp, flush_interval=0.1, binary=binary)
+        service.start()
+        wait_for(lambda: service.readers[0].stats.connected)
+        sent, n_bytes, elapsed = stream(emulator, board.write, LOOPS, RATE)
+        reader = service.readers[0]
+        wait_for(lambda: reader.stats.rows >= LOOPS)
+        service.stop()
+    with open(reader.log_path) as f:
+        rows = list(csv.reader(f))[1:]
+    print(f"{'binary' if binary else 'text'}: {sent} loops, {n_bytes / 1e6:.1f} MB in {elapsed:.2f} s "
+          f"({sent / elapsed:,.0f} loops/s), {reader.stats.heap_lines} heap lines, "
+          f"{reader.stats.malformed} malformed")
+    return rows, reader.stats
+
+
+def firmware_line_ending(line, source):
+    """How the firmware ends `line`: println gives CRLF, a printf format its LF; None if not printed"""
+    if f'Serial.println("{line}");' in source:
+        return '\r\n'
+    if re.search(r'Serial\.printf\("' + re.escape(line.split(' (')[0]) + r'[^"]*\\n"', source):
+        return '\n'
+    return None
+
+
+def check_boot_text():
+    source = ''
+    for path in sorted(glob.glob(os.path.join(FIRMWARE_SRC, '*.cpp'))):
+        with open(path) as f:
+            source += f.read()
+    lines = FirmwareEmulator().boot_text.splitlines(keepends=True)
+    wrong = [line for line in lines if firmware_line_ending(line.rstrip('\r\n'), source)
+             != line[len(line.rstrip('\r\n')):]]
+    if wrong:
+        print(f"FAIL: boot lines not ended as the firmware prints them: {wrong}")
+    return not wrong
+
+
+def main():
+    ok = check_boot_text()
+    with tempfile.TemporaryDirectory() as tmp:
+        text_rows, text_stats = ingest(FirmwareEmulator(seed=1, dht_fail_rate=0.01), tmp)
+        binary_rows, _ = ingest(FirmwareEmulator(seed=1, dht_fail_rate=0.01, binary=True), tmp, binary=True)
+
+    if len(text_rows) != LOOPS or len(binary_rows) != LOOPS:
+        print(f"FAIL: {len(text_rows)} text / {len(binary_rows)} binary rows, expected {LOOPS}")
+        ok = False
+    millis = np.array([int(r[0]) for r in text_rows])
+    expected_heap, last = 0, 0
+    for m in millis.tolist():
+        if m - last > HEAP_LOG_INTERVAL_MS:
+            expected_heap, last = expected_heap + 1, m
+    if text_stats.heap_lines != expected_heap or text_stats.malformed:
+        print(f"FAIL: {text_stats.heap_lines} heap lines ({expected_heap} expected), "
+              f"{text_stats.malformed} malformed")
+        ok = False
+    failed = sum(r[2] == '-1.00' and r[3] == '-1.00' for r in text_rows)
+    if not 0.005 * LOOPS < failed < 0.02 * LOOPS:
+        print(f"FAIL: {failed} DHT failures at a 1% failure rate")
+        ok = False
+    # Binary frames round probabilities with lroundf, text with %.0f: allow 1 point on exact halves
+    sensors_equal = all(t[:6] == b[:6] and t[9] == b[9] for t, b in zip(text_rows, binary_rows))
+    prob_diff = max(abs(int(t[i]) - int(b[i])) for t, b in zip(text_rows, binary_rows) for i in (6, 7, 8))
+    if not sensors_equal or prob_diff > 1:
+        print(f"FAIL: text and binary modes disagree (sensors equal: {sensors_equal}, prob diff {prob_diff})")
+        ok = False
+
+    # One loop in isolation: the exact lines main.cpp prints
+    emulator = FirmwareEmulator(seed=2, dht_fail_rate=1.0)
+    lines = emulator.chunk(1)[0].decode().split('\r\n')
+    if lines[0] != 'Failed to read from DHT sensor!' or not lines[1].startswith('Input int8: ') \
+            or not lines[2].startswith('Output logits: '):
+        print(f"FAIL: unexpected loop output {lines}")
+        ok = False
+    rows, _, malformed = parse_lines('\r\n'.join(lines))
+    if len(rows) != 1 or malformed or rows[0][2:4] != ['-1.00', '-1.00']:
+        print(f"FAIL: loop line does not parse: {rows}")
+        ok = False
+    frames = FirmwareEmulator(seed=2, dht_fail_rate=1.0, binary=True).chunk(1)
+    records, _, _ = telemetry.decode_frames(frames[0])
+    if len(records) != 1 or records['temp_c'][0] != -1:
+        print(f"FAIL: binary frame {records}")
+        ok = False
+
+    print('OK' if ok else 'FAILED')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
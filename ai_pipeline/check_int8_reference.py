@@ -0,0 +1,268 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from evaluate_models import BatchedTFLiteModel
+from features import load_dataset
+from int8_reference import FIRMWARE_ROUNDING, ROUNDING_MODES, ReferenceMLP
+
+# Parity of int8_reference.ReferenceMLP with the TFLite kernels, bit for bit on
+# the int8 outputs of the real dataset plus random int8 inputs.
+#
+# tf.lite.Interpreter only covers the requantization its wheel was built with
+# (TFLITE_SINGLE_ROUNDING for recent ones), not the firmware's. So the check
+# also builds KERNEL: the reference FULLY_CONNECTED loop and QuantizeMultiplier
+# of TFLM, with MultiplyByQuantizedMultiplier from common.h in both variants.
+# The double rounding calls gemmlowp's own fixedpoint.h, shipped in the
+# tensorflow wheel's include directory. The single-rounding build must equal
+# tf.lite, which checks the port; ReferenceMLP(FIRMWARE_ROUNDING) must then
+# equal the build with the firmware's rounding.
+
+KERNEL = r'''
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <cstdio>
+#include <vector>
+#include "fixedpoint/fixedpoint.h"
+
+struct Layer
+{
+    int32_t n_in, n_out, input_offset, filter_offset, output_offset, act_min, act_max;
+    std::vector<int8_t> weights;
+    std::vector<int32_t> bias, multiplier, shift;
+};
+
+// tensorflow/lite/kernels/internal/quantization_util.cc
+static void QuantizeMultiplier(double double_multiplier, int32_t *quantized_multiplier, int *shift)
+{
+    if (double_multiplier == 0.)
+    {
+        *quantized_multiplier = 0;
+        *shift = 0;
+        return;
+    }
+    const double q = std::frexp(double_multiplier, shift);
+    auto q_fixed = static_cast<int64_t>(std::round(q * (1LL << 31)));
+    if (q_fixed == (1LL << 31))
+    {
+        q_fixed /= 2;
+        ++*shift;
+    }
+    if (*shift < -31)
+    {
+        *shift = 0;
+        q_fixed = 0;
+    }
+    *quantized_multiplier = static_cast<int32_t>(q_fixed);
+}
+
+// tensorflow/lite/kernels/internal/common.h
+static int32_t MultiplyByQuantizedMultiplier(int32_t x, int32_t quantized_multiplier, int shift)
+{
+#ifdef SINGLE_ROUNDING
+    const int64_t total_shift = 31 - shift;
+    const int64_t round = static_cast<int64_t>(1) << (total_shift - 1);
+    int64_t result = x * static_cast<int64_t>(quantized_multiplier) + round;
+    result = result >> total_shift;
+    return static_cast<int32_t>(result);
+#else
+    using gemmlowp::RoundingDivideByPOT;
+    using gemmlowp::SaturatingRoundingDoublingHighMul;
+    int left_shift = shift > 0 ? shift : 0;
+    int right_shift = shift > 0 ? 0 : -shift;
+    return RoundingDivideByPOT(SaturatingRoundingDoublingHighMul(x * (1 << left_shift), quantized_multiplier),
+                               right_shift);
+#endif
+}
+
+template <typename T>
+static bool read(T *data, size_t n)
+{
+    return fread(data, sizeof(T), n, stdin) == n;
+}
+
+// Layers: int32 n_in, n_out, input/filter/output zero points, activation (0 none, 1 RELU, 2 RELU6);
+// float32 input and output scale, n_out filter scales; int8 weights (n_out, n_in); int32 bias.
+// Then int8 input rows until EOF.
+int main()
+{
+    int32_t n_layers;
+    if (!read(&n_layers, 1))
+        return 1;
+    std::vector<Layer> layers(n_layers);
+    for (Layer &l : layers)
+    {
+        int32_t header[6];
+        float scales[2];
+        if (!read(header, 6) || !read(scales, 2))
+            return 1;
+        l.n_in = header[0];
+        l.n_out = header[1];
+        l.input_offset = -header[2];
+        l.filter_offset = -header[3];
+        l.output_offset = header[4];
+        std::vector<float> filter_scale(l.n_out);
+        l.weights.resize(static_cast<size_t>(l.n_out) * l.n_in);
+        l.bias.resize(l.n_out);
+        if (!read(filter_scale.data(), l.n_out) || !read(l.weights.data(), l.weights.size()) ||
+            !read(l.bias.data(), l.n_out))
+            return 1;
+        for (int32_t c = 0; c < l.n_out; ++c)
+        {
+            int32_t multiplier;
+            int shift;
+            QuantizeMultiplier(static_cast<double>(scales[0]) * static_cast<double>(filter_scale[c]) /
+                                   static_cast<double>(scales[1]),
+                               &multiplier, &shift);
+            l.multiplier.push_back(multiplier);
+            l.shift.push_back(shift);
+        }
+        // CalculateActivationRangeQuantized()
+        l.act_min = -128;
+        l.act_max = 127;
+        if (header[5] != 0)
+            l.act_min = std::max(l.act_min, l.output_offset);
+        if (header[5] == 2)
+            l.act_max = std::min(l.act_max, l.output_offset + static_cast<int32_t>(std::round(6.0f / scales[1])));
+    }
+
+    // reference_integer_ops::FullyConnected()
+    std::vector<int8_t> x(layers.front().n_in);
+    while (read(x.data(), x.size()))
+    {
+        for (const Layer &l : layers)
+        {
+            std::vector<int8_t> y(l.n_out);
+            for (int32_t c = 0; c < l.n_out; ++c)
+            {
+                int32_t acc = 0;
+                for (int32_t d = 0; d < l.n_in; ++d)
+                    acc += (l.weights[c * l.n_in + d] + l.filter_offset) * (x[d] + l.input_offset);
+                acc += l.bias[c];
+                acc = MultiplyByQuantizedMultiplier(acc, l.multiplier[c], l.shift[c]);
+                acc += l.output_offset;
+                acc = std::max(acc, l.act_min);
+                acc = std::min(acc, l.act_max);
+                y[c] = static_cast<int8_t>(acc);
+            }
+            x = y;
+        }
+        fwrite(x.data(), 1, x.size(), stdout);
+    }
+    return 0;
+}
+'''
+
+ACTIVATIONS = {None: 0, 'NONE': 0, 'RELU': 1, 'RELU6': 2}
+
+
+def kernel_input(model):
+    """The layers of a TFLiteModel in KERNEL's stdin layout"""
+    chunks = [np.int32(len(model.operators)).tobytes()]
+    for op in model.operators:
+        inp, weights, bias = (model.tensors[i] for i in op.inputs)
+        out = model.tensors[op.outputs[0]]
+        n_out, n_in = weights.data.shape
+        chunks += [
+            np.array([n_in, n_out, inp.zero_point[0], weights.zero_point[0], out.zero_point[0],
+                      ACTIVATIONS[op.activation]], dtype='<i4').tobytes(),
+            np.array([inp.scale[0], out.scale[0]], dtype='<f4').tobytes(),
+            np.broadcast_to(weights.scale, (n_out,)).astype('<f4').tobytes(),
+            weights.data.astype(np.int8).tobytes(),
+            bias.data.astype('<i4').tobytes(),
+        ]
+    return b''.join(chunks)
+
+
+def kernel_run(model, x, rounding):
+    """Int8 outputs of KERNEL built with one of ROUNDING_MODES"""
+    import tensorflow as tf
+    cxx = shutil.which('c++') or shutil.which('g++')
+    gemmlowp = os.path.join(tf.sysconfig.get_include(), 'external', 'gemmlowp')
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'kernel.cc')
+        with open(source, 'w') as f:
+            f.write(KERNEL)
+        exe = os.path.join(tmp, 'kernel')
+        subprocess.run([cxx, '-std=c++14', '-Wall', '-Wextra', '-Werror', '-O2', '-I', gemmlowp,
+                        *(['-DSINGLE_ROUNDING'] if rounding == 'single' else []), source, '-o', exe], check=True)
+        out = subprocess.run([exe], input=kernel_input(model) + x.tobytes(), check=True, capture_output=True).stdout
+    return np.frombuffer(out, dtype=np.int8).reshape(len(x), -1)
+
+
+def tflite_run(path, x, op_resolver_type):
+    import tensorflow as tf
+    interpreter = tf.lite.Interpreter(model_path=path, experimental_op_resolver_type=op_resolver_type)
+    inp = interpreter.get_input_details()[0]
+    interpreter.resize_tensor_input(inp['index'], list(x.shape))
+    interpreter.allocate_tensors()
+    interpreter.set_tensor(interpreter.get_input_details()[0]['index'], x)
+    interpreter.invoke()
+    return interpreter.get_tensor(interpreter.get_output_details()[0]['index'])
+
+
+def rows_differ(a, b):
+    return int((a != b).any(axis=1).sum())
+
+
+def main(path='quantized_model.tflite', n_random=200_000):
+    import tensorflow as tf
+    ok = True
+    model = ReferenceMLP(path)
+    _, x, _, _ = load_dataset()
+    rng = np.random.default_rng(0)
+    inputs = np.concatenate((
+        model.quantize(x),
+        rng.integers(-128, 128, size=(n_random, x.shape[1]), dtype=np.int8),
+        np.array([[-128], [127]], dtype=np.int8).repeat(x.shape[1], axis=1),
+    ))
+    resolvers = tf.lite.experimental.OpResolverType
+    reference = tflite_run(path, inputs, resolvers.BUILTIN_REF)
+    optimized = tflite_run(path, inputs, resolvers.BUILTIN)
+    print(f"tf.lite reference vs optimized kernels: {rows_differ(reference, optimized)} of {len(inputs)} rows differ")
+
+    kernels = {rounding: kernel_run(model.model, inputs, rounding) for rounding in ROUNDING_MODES}
+    single_rows = rows_differ(kernels['single'], reference)
+    print(f"TFLM kernel port, single rounding: {single_rows} rows differ from tf.lite; "
+          f"double rounding: {rows_differ(kernels['double'], reference)} rows differ from tf.lite")
+    if single_rows:
+        print("FAIL: the kernel port does not reproduce tf.lite")
+        ok = False
+
+    for rounding in ROUNDING_MODES:
+        model = ReferenceMLP(path, rounding=rounding)
+        ours = model.run(inputs)
+        mismatched = rows_differ(ours, kernels[rounding])
+        firmware = ' (firmware)' if rounding == FIRMWARE_ROUNDING else ''
+        print(f"ReferenceMLP rounding={rounding}{firmware}: {mismatched} of {len(inputs)} rows differ from the "
+              f"kernel with the same rounding")
+        if mismatched:
+            print(f"FAIL: rounding={rounding} is not bit-exact")
+            ok = False
+        # The float64 fast path must equal the plain int64 arithmetic
+        for layer in model.layers:
+            layer._exact_f64 = False
+        int64_rows = rows_differ(model.run(inputs), ours)
+        if int64_rows:
+            print(f"FAIL: rounding={rounding} float64 and int64 paths differ on {int64_rows} rows")
+            ok = False
+    # evaluate_models.py must feed tf.lite the inputs ReferenceMLP and the firmware get, ties included
+    halves = (np.arange(-100, 100) + 0.5)[:, None] * ReferenceMLP(path).input_scale
+    features = np.concatenate((x, halves.repeat(x.shape[1], axis=1)))
+    if (BatchedTFLiteModel(path).quantize(features) != ReferenceMLP(path).quantize(features)).any():
+        print("FAIL: BatchedTFLiteModel.quantize rounds differently from ReferenceMLP.quantize")
+        ok = False
+    if ReferenceMLP(path).layers[0].rounding != FIRMWARE_ROUNDING:
+        print(f"FAIL: ReferenceMLP does not default to the firmware's rounding ({FIRMWARE_ROUNDING})")
+        ok = False
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main(*sys.argv[1:2]) else 1)
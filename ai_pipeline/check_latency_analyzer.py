@@ -0,0 +1,142 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from latency_analyzer import LatencyAnalyzer, LatencyHistogram, analyze_csv, parse_log_lines
+
+# Histogram percentiles against numpy within the bucket resolution, merged
+# histograms equal to one over all the values, and the streaming analyzer:
+# boots, warm-up samples and windows must not depend on how the log is cut
+# into batches, including a batch that ends with a reset. Unreadable rows are
+# skipped and counted the same way by the batch and the --follow parsers.
+
+SAMPLES = 20_000
+RESETS = (5_000, 5_002, 12_000)       # sample indices where the board restarts
+
+
+def synthetic_log(seed=0):
+    """(millis, latency) of a board at ~1 Hz that resets at RESETS, with a slow first inference per boot"""
+    rng = np.random.default_rng(seed)
+    millis = np.empty(SAMPLES, dtype=np.int64)
+    boots = np.split(np.arange(SAMPLES), RESETS)
+    for idx in boots:
+        millis[idx] = 2230 + np.arange(len(idx)) * 1007
+    latency = rng.lognormal(np.log(830), 0.05, SAMPLES).astype(np.int64)
+    latency[rng.integers(0, SAMPLES, 20)] = 2_500
+    latency[[idx[0] for idx in boots]] = 100_864
+    return millis, latency
+
+
+def run(millis, latency, cuts):
+    analyzer = LatencyAnalyzer()
+    cuts = np.asarray(cuts, dtype=np.int64)
+    for lo, hi in zip(np.r_[0, cuts], np.r_[cuts, len(millis)]):
+        analyzer.update(millis[lo:hi], latency[lo:hi])
+    analyzer.finish()
+    return analyzer.report()
+
+
+def check_histogram():
+    rng = np.random.default_rng(1)
+    values = rng.lognormal(np.log(900), 0.5, 200_000).astype(np.int64)
+    h = LatencyHistogram()
+    h.record(values)
+    worst = max(abs(h.percentile(q) - np.percentile(values, q, method='inverted_cdf')) / np.percentile(values, q)
+                for q in (50, 90, 99, 99.9))
+    halves = LatencyHistogram(), LatencyHistogram()
+    halves[0].record(values[:77_777])
+    halves[1].record(values[77_777:])
+    halves[0].merge(halves[1])
+    merged = halves[0].summary() == h.summary() and np.array_equal(halves[0].counts, h.counts)
+    print(f"histogram: worst percentile error {worst:.3%}, merge equal {merged}")
+    if worst > 0.01 or not merged:
+        print("FAIL: percentiles off by more than 1% or merge differs")
+        return False
+    return True
+
+
+def check_boots():
+    ok = True
+    # A batch that ends with a reset whose only sample is warm-up
+    analyzer = LatencyAnalyzer()
+    analyzer.update([1000, 2000, 3000, 4000, 10], [800] * 5)
+    analyzer.update([1010, 2010], [800] * 2)
+    analyzer.finish()
+    report = analyzer.report()
+    print(f"reset at the end of a batch: {report['boots']} boots, windows of boots "
+          f"{sorted({w['boot'] for w in report['windows']})}")
+    if report['boots'] != 2 or {w['boot'] for w in report['windows']} != {0, 1}:
+        print("FAIL: expected 2 boots with their own windows")
+        ok = False
+
+    millis, latency = synthetic_log()
+    whole = run(millis, latency, [])
+    print(f"synthetic log: {whole['boots']} boots, warm-up {whole['warmup']['count']}, "
+          f"steady p99 {whole['steady']['p99']} us, {whole['windows_over_budget']} of {len(whole['windows'])} "
+          f"windows over budget")
+    if whole['boots'] != len(RESETS) + 1 or whole['warmup']['count'] != len(RESETS) + 1 \
+            or whole['warmup']['min'] != 100_864 or whole['steady']['max'] != 2_500:
+        print("FAIL: boots or warm-up samples miscounted")
+        ok = False
+    rng = np.random.default_rng(2)
+    cut_sets = {'at resets': list(RESETS), 'after resets': [r + 1 for r in RESETS],
+                'random': sorted(rng.choice(np.arange(1, SAMPLES), 300, replace=False))}
+    for name, cuts in cut_sets.items():
+        if run(millis, latency, cuts) != whole:
+            print(f"FAIL: batches cut {name} change the report")
+            ok = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ai_log.csv')
+        pd.DataFrame({'millis': millis, 'AI_latency_us': latency}).to_csv(path, index=False)
+        analyzer = LatencyAnalyzer()
+        analyze_csv(path, analyzer, chunksize=4_999)
+        analyzer.finish()
+        if analyzer.report() != whole:
+            print("FAIL: analyze_csv differs from the in-memory log")
+            ok = False
+    return ok
+
+
+def check_unreadable_rows():
+    good = [f"{1000 + i * 1000},0.05,22.90,51.00,60.00,450.00,42,31,27,{800 + i}" for i in range(4)]
+    bad = ['1500,0.05,22.90', '2500,0.05,22.90,51.00,60.00,450.00,42,31,27,AI_latency_us:9',
+           'x,0.05,22.90,51.00,60.00,450.00,42,31,27,800', '3500,0.05,22.90,51.00,60.00,450.00,42,31,27,800,1']
+    lines = [good[0], bad[0], good[1], bad[1], good[2], bad[2], bad[3], good[3]]
+    millis, latency, skipped = parse_log_lines(lines)
+    follow = LatencyAnalyzer()
+    follow.skipped_rows += skipped
+    follow.update(millis, latency)
+    follow.finish()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ai_log.csv')
+        with open(path, 'w') as f:
+            f.write('millis,ldr_voltage,temp,hum,tvoc,eco2,prob0,prob1,prob2,AI_latency_us\n')
+            f.write(''.join(line + '\n' for line in lines[:-2] + lines[-1:]))  # pandas rejects long rows
+        batch = LatencyAnalyzer()
+        analyze_csv(path, batch)
+        batch.finish()
+    print(f"unreadable rows: follow skipped {follow.skipped_rows}, batch skipped {batch.skipped_rows}")
+    expected = LatencyAnalyzer()
+    expected.update([1000, 2000, 3000, 4000], [800, 801, 802, 803])
+    expected.finish()
+    steady = [a.report()['steady'] for a in (follow, batch, expected)]
+    if follow.skipped_rows != 4 or batch.skipped_rows != 3 or not steady[0] == steady[1] == steady[2]:
+        print("FAIL: unreadable rows not skipped and counted")
+        return False
+    return True
+
+
+def main():
+    ok = check_histogram()
+    ok = check_boots() and ok
+    ok = check_unreadable_rows() and ok
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,99 @@
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+from model_cost import (ARENA_ALIGNMENT, ARENA_FLOOR, DEFAULT_COST_TABLE, FLASH_BUDGET, LATENCY_BUDGET_US,
+                        arena_estimate, calibrate, check_budgets, estimate, plan_arena)
+from tflite_reader import TFLiteModel
+
+# model_cost.py on the models in this directory: the arena plan must keep
+# tensors that are live at the same time apart, MACs and weight bytes must add
+# up from the tensor shapes, the arena shipped in model_params.h must be the
+# estimate with its floor, and the default cycle table must still reproduce the
+# latency of data/ai_log.csv it was fitted on.
+
+MODELS = ('quantized_model.tflite', 'model_float.tflite')
+PARAMS_HEADER = '../firmware/src/model_params.h'
+LOG = 'data/ai_log.csv'
+
+
+def check_plan(path):
+    model = TFLiteModel.load(path)
+    plan, peak = plan_arena(model)
+    problems = []
+    for t, (offset, size, first, last) in plan.items():
+        if offset % ARENA_ALIGNMENT or size < model.tensors[t].nbytes:
+            problems.append(f"tensor {t} misaligned or too small")
+        for u, (o, s, f, l) in plan.items():
+            if u != t and first <= l and f <= last and offset < o + s and o < offset + size:
+                problems.append(f"tensors {t} and {u} are live together and overlap")
+    # Each op needs at least its live tensors side by side
+    lower = max(sum(s for o, s, f, l in plan.values() if f <= i <= l) for i in range(len(model.operators)))
+    print(f"{path}: {len(plan)} planned tensors, activation peak {peak} B (live lower bound {lower} B)")
+    if peak < lower or peak != max(o + s for o, s, _, _ in plan.values()):
+        problems.append("peak below the live tensors or not the plan's end")
+    for p in problems:
+        print(f"FAIL: {p}")
+    return not problems
+
+
+def check_counts(path):
+    model = TFLiteModel.load(path)
+    report = estimate(model)
+    macs = sum(int(np.prod(model.tensors[op.inputs[1]].shape)) for op in model.operators)
+    weights = sum(t.nbytes for t in model.tensors if t.data is not None)
+    with open(path, 'rb') as f:
+        size = len(f.read())
+    print(f"{path}: {report['macs']} MACs, {report['weight_bytes']} B of weights, {report['flatbuffer_bytes']} B")
+    if (report['macs'], report['weight_bytes'], report['flatbuffer_bytes']) != (macs, weights, size):
+        print(f"FAIL: expected {macs} MACs, {weights} B of weights, {size} B")
+        return False
+    return True
+
+
+def check_arena(path):
+    model = TFLiteModel.load(path)
+    report = estimate(model)
+    with open(PARAMS_HEADER) as f:
+        shipped = int(re.search(r'#define AI_TENSOR_ARENA_SIZE (\d+)', f.read()).group(1))
+    print(f"arena: estimate {report['arena_estimate_bytes']} B, recommended {report['arena_bytes']} B, "
+          f"model_params.h {shipped} B")
+    ok = report['arena_bytes'] == max(arena_estimate(model), ARENA_FLOOR) == shipped
+    ok = ok and estimate(model, arena_floor=0)['arena_bytes'] == report['arena_estimate_bytes']
+    if not ok:
+        print(f"FAIL: the arena is not max(estimate, {ARENA_FLOOR}) or model_params.h is stale")
+    return ok
+
+
+def check_latency(path):
+    model = TFLiteModel.load(path)
+    measured = float(np.median(pd.read_csv(LOG)['AI_latency_us']))
+    report = estimate(model)
+    recalibrated = estimate(model, calibrate(model, 500.0))
+    print(f"latency: predicted {report['latency_us']:.0f} us, median of {LOG} {measured:.0f} us "
+          f"(debug prints {report['latency_includes_debug_prints']}); recalibrated to 500 us: "
+          f"{recalibrated['latency_us']:.1f} us")
+    ok = abs(report['latency_us'] / measured - 1) < 0.01 and report['latency_includes_debug_prints']
+    ok = ok and abs(recalibrated['latency_us'] - 500.0) < 1.0 and not recalibrated['latency_includes_debug_prints']
+    over = dict(report, flatbuffer_bytes=FLASH_BUDGET, latency_us=LATENCY_BUDGET_US)
+    ok = ok and len(check_budgets(over)) == 2 and DEFAULT_COST_TABLE['debug_prints']
+    if not ok:
+        print("FAIL: the cost table no longer fits its log, calibrate() is off or a budget is not enforced")
+    return ok
+
+
+def main():
+    ok = True
+    for path in MODELS:
+        ok = check_plan(path) and ok
+        ok = check_counts(path) and ok
+    ok = check_arena(MODELS[0]) and ok
+    ok = check_latency(MODELS[0]) and ok
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,111 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from export_model_params import fused_input_coefficients, fused_quantize, render_header
+from features import FEATURE_COLUMNS, VALID_SCENARIOS, load_dataset, load_scaler, normalize_features
+from int8_reference import ReferenceMLP
+from package_model import render_model_header
+from tflite_reader import TFLiteModel
+
+# The fused normalize+quantize of model_params.h must give the same int8 inputs
+# as train_model.py normalization followed by TFLite quantization. Checks that
+# the committed header is up to date, then runs ai_quantize_feature() built for
+# the host against its NumPy emulation and the float64 reference.
+
+FIRMWARE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'firmware')
+N_RANDOM = 1_000_000
+
+DRIVER = r'''
+#include <stdio.h>
+#include "model_params.h"
+
+int main(void)
+{
+    float x[AI_N_INPUTS];
+    while (fread(x, sizeof(float), AI_N_INPUTS, stdin) == AI_N_INPUTS)
+    {
+        int8_t q[AI_N_INPUTS];
+        for (int i = 0; i < AI_N_INPUTS; i++)
+            q[i] = ai_quantize_feature(i, x[i]);
+        fwrite(q, 1, AI_N_INPUTS, stdout);
+    }
+    return 0;
+}
+'''
+
+
+def c_quantize(raw):
+    cc = shutil.which('cc') or shutil.which('gcc')
+    with tempfile.TemporaryDirectory() as tmp:
+        driver = os.path.join(tmp, 'driver.c')
+        with open(driver, 'w') as f:
+            f.write(DRIVER)
+        exe = os.path.join(tmp, 'driver')
+        # No FMA contraction: the ESP32-S3 build multiplies and rounds like the emulation
+        subprocess.run([cc, '-std=c99', '-Wall', '-Werror', '-O2', '-ffp-contract=off',
+                        '-I', os.path.join(FIRMWARE, 'src'), driver, '-o', exe], check=True)
+        out = subprocess.run([exe], input=np.ascontiguousarray(raw, dtype='<f4').tobytes(),
+                             check=True, capture_output=True).stdout
+    return np.frombuffer(out, dtype=np.int8).reshape(-1, len(FEATURE_COLUMNS))
+
+
+def random_readings(n, scaler, seed=0):
+    """Readings over the sensors' ranges, with the constant tvoc/eco2 values mixed in"""
+    rng = np.random.default_rng(seed)
+    raw = np.column_stack((
+        rng.uniform(0, 3.3, n), rng.uniform(-20, 60, n), rng.uniform(0, 100, n),
+        rng.uniform(0, 1000, n), rng.uniform(400, 2000, n)))
+    raw[::2, 3] = scaler['tvoc_min']
+    raw[::2, 4] = scaler['eco2_min']
+    return raw
+
+
+def main(model_path='quantized_model.tflite', scaler_path='scaler.json'):
+    ok = True
+    header = os.path.join(FIRMWARE, 'src', 'model_params.h')
+    with open(header) as f:
+        if f.read() != render_header(TFLiteModel.load(model_path), load_scaler(scaler_path), sorted(VALID_SCENARIOS),
+                                     model_path, scaler_path):
+            print(f"FAIL: {header} is stale, rerun export_model_params.py --out {header}")
+            ok = False
+    packaged = os.path.join(FIRMWARE, 'src', 'model.h')
+    with open(model_path, 'rb') as f, open(packaged) as g:
+        if g.read() != render_model_header(f.read(), os.path.basename(model_path)):
+            print(f"FAIL: {packaged} is stale, rerun package_model.py --out {packaged}")
+            ok = False
+
+    model = ReferenceMLP(model_path)
+    scaler = load_scaler(scaler_path)
+    center, gain = fused_input_coefficients(scaler, model.input_scale)
+    df, x, _, _ = load_dataset(scaler_path=scaler_path)
+    samples = {
+        'dataset': df[FEATURE_COLUMNS].to_numpy(dtype=np.float64),
+        'random': random_readings(N_RANDOM, scaler),
+    }
+    for name, raw in samples.items():
+        # The firmware sees float32 readings
+        raw = raw.astype(np.float32)
+        frame = {c: raw[:, i].astype(np.float64) for i, c in enumerate(FEATURE_COLUMNS)}
+        reference = model.quantize(normalize_features(frame, scaler))
+        fused = fused_quantize(raw, center, gain, model.input_zero_point)
+        from_c = c_quantize(raw)
+        differ = (fused != reference).any(axis=1)
+        max_step = int(np.abs(fused.astype(np.int16) - reference).max())
+        print(f"{name}: {len(raw)} rows, fused vs reference differ on {int(differ.sum())} rows "
+              f"(max {max_step} step), C vs emulation differ on {int((from_c != fused).any(axis=1).sum())}")
+        if not np.array_equal(from_c, fused):
+            ok = False
+        # Only float32 rounding at exact .5 boundaries may differ, and never on recorded data
+        if max_step > 1 or (name == 'dataset' and differ.any()):
+            ok = False
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,128 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from check_model_params import FIRMWARE, random_readings
+from features import FEATURE_COLUMNS, load_dataset, load_scaler, normalize_features
+from int8_reference import ReferenceMLP
+
+# Host build of firmware/src/ai_preprocess.c against the training side:
+# ai_quantize_inputs() vs train_model.py normalization + TFLite quantization,
+# ai_softmax_int8() / ai_softmax_q15() / ai_argmax_int8() vs a float64 softmax
+# of the dequantized logits. Then runs the native micro-benchmark
+# (firmware/bench/bench_preprocess.c, the PlatformIO env:native program).
+
+N_RANDOM = 200_000
+BENCH_ITERATIONS = 2_000_000
+# Q15 rounding plus the table's own rounding: within 2 LSB of the exact softmax
+Q15_TOLERANCE = 2 / 32768
+
+DRIVER = r'''
+#include <stdio.h>
+#include "ai_preprocess.h"
+#include "model_params.h"
+
+int main(void)
+{
+    float input[AI_N_INPUTS];
+    int8_t logits[AI_N_OUTPUTS];
+    while (fread(input, sizeof input, 1, stdin) == 1 && fread(logits, sizeof logits, 1, stdin) == 1)
+    {
+        int8_t q[AI_N_INPUTS];
+        float p[AI_N_OUTPUTS];
+        uint16_t p15[AI_N_OUTPUTS];
+        int32_t best = ai_argmax_int8(logits, AI_N_OUTPUTS);
+        ai_quantize_inputs(input, q);
+        ai_softmax_int8(logits, p, AI_N_OUTPUTS);
+        ai_softmax_q15(logits, p15, AI_N_OUTPUTS);
+        fwrite(q, 1, sizeof q, stdout);
+        fwrite(p, 1, sizeof p, stdout);
+        fwrite(p15, 1, sizeof p15, stdout);
+        fwrite(&best, 1, sizeof best, stdout);
+    }
+    return 0;
+}
+'''
+
+
+def build(sources, exe):
+    cc = shutil.which('cc') or shutil.which('gcc')
+    # No FMA contraction: the ESP32-S3 build multiplies and rounds like the emulation
+    subprocess.run([cc, '-std=c99', '-Wall', '-Wextra', '-Werror', '-O2', '-ffp-contract=off',
+                    '-I', os.path.join(FIRMWARE, 'include'), '-I', os.path.join(FIRMWARE, 'src'),
+                    *sources, '-o', exe, '-lm'], check=True)
+
+
+def run_driver(raw, logits):
+    n_in, n_out = raw.shape[1], logits.shape[1]
+    in_dtype = np.dtype([('input', '<f4', (n_in,)), ('logits', 'i1', (n_out,))])
+    out_dtype = np.dtype([('q', 'i1', (n_in,)), ('p', '<f4', (n_out,)), ('p15', '<u2', (n_out,)),
+                          ('argmax', '<i4')])
+    records = np.zeros(len(raw), dtype=in_dtype)
+    records['input'] = raw
+    records['logits'] = logits
+    with tempfile.TemporaryDirectory() as tmp:
+        driver = os.path.join(tmp, 'driver.c')
+        with open(driver, 'w') as f:
+            f.write(DRIVER)
+        exe = os.path.join(tmp, 'driver')
+        build([driver, os.path.join(FIRMWARE, 'src', 'ai_preprocess.c')], exe)
+        out = subprocess.run([exe], input=records.tobytes(), check=True, capture_output=True).stdout
+    return np.frombuffer(out, dtype=out_dtype)
+
+
+def run_bench(iterations=BENCH_ITERATIONS):
+    with tempfile.TemporaryDirectory() as tmp:
+        exe = os.path.join(tmp, 'bench')
+        build([os.path.join(FIRMWARE, 'src', 'ai_preprocess.c'),
+               os.path.join(FIRMWARE, 'bench', 'bench_preprocess.c')], exe)
+        return subprocess.run([exe, str(iterations)], check=True, capture_output=True, text=True).stdout
+
+
+def main(model_path='quantized_model.tflite', scaler_path='scaler.json'):
+    ok = True
+    model = ReferenceMLP(model_path)
+    scaler = load_scaler(scaler_path)
+    df, _, _, _ = load_dataset(scaler_path=scaler_path)
+    rng = np.random.default_rng(0)
+    samples = {
+        'dataset': df[FEATURE_COLUMNS].to_numpy(dtype=np.float64),
+        'random': random_readings(N_RANDOM, scaler),
+    }
+    for name, raw in samples.items():
+        raw = raw.astype(np.float32)
+        frame = {c: raw[:, i].astype(np.float64) for i, c in enumerate(FEATURE_COLUMNS)}
+        reference_q = model.quantize(normalize_features(frame, scaler))
+        # Model logits on the dataset; random int8 logits cover the whole softmax table
+        logits = model.run(reference_q) if name == 'dataset' else \
+            rng.integers(-128, 128, size=(len(raw), model.model.output.shape[-1])).astype(np.int8)
+        out = run_driver(raw, logits)
+
+        differ = (out['q'] != reference_q).any(axis=1)
+        max_step = int(np.abs(out['q'].astype(np.int16) - reference_q).max())
+        z = (logits.astype(np.float64) - model.output_zero_point) * model.output_scale
+        exact = np.exp(z - z.max(axis=1, keepdims=True))
+        exact /= exact.sum(axis=1, keepdims=True)
+        err_float = float(np.abs(out['p'] - exact).max())
+        err_q15 = float(np.abs(out['p15'] / 32768 - exact).max())
+        argmax_ok = np.array_equal(out['argmax'], logits.argmax(axis=1))
+        print(f"{name}: {len(raw)} rows, quantize differs from training normalization on {int(differ.sum())} rows "
+              f"(max {max_step} step); softmax max error float {err_float:.2g}, Q15 {err_q15:.2g}; "
+              f"argmax {'equal' if argmax_ok else 'DIFFERS'}")
+        # Only float32 rounding at exact .5 boundaries may differ, and never on recorded data
+        if max_step > 1 or (name == 'dataset' and differ.any()):
+            ok = False
+        if err_float > 1e-6 or err_q15 > Q15_TOLERANCE or not argmax_ok:
+            ok = False
+
+    print(run_bench(), end='')
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,107 @@
+import csv
+import os
+import tempfile
+import time
+
+from pty_serial import FakeSerialPort
+from serial_ingest import IngestionService
+
+# Drive the ingestion service with two pty-backed fake boards: a burst of log
+# lines, a heap line, malformed data, heap and unknown lines next to debug
+# text, then a board reset in the middle. The reader must count the malformed
+# lines and keep running. Board 1 then fails once on a write: the error is
+# counted, the port reopened and the rows kept. Failing on every line stops it.
+
+
+def log_line(i):
+    return (f"{1000 + i},0.05,22.90,51.00,60.00,450.00,42,31,27,AI_latency_us:{800 + i % 50}\n")
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.02)
+
+
+def fail_once(reader):
+    """Make the next flush with rows raise, as a full disk would"""
+    flush = reader._flush
+    failed = []
+
+    def failing_flush():
+        if reader._rows and not failed:
+            failed.append(True)
+            raise RuntimeError('injected write failure')
+        flush()
+    reader._flush = failing_flush
+
+
+def main():
+    n_lines = 5000
+    with tempfile.TemporaryDirectory() as tmp:
+        boards = [FakeSerialPort(link=os.path.join(tmp, f'ttyFAKE{i}')) for i in range(2)]
+        service = IngestionService([b.port for b in boards], out_dir=tmp,
+                                   flush_interval=0.1, reconnect_delay=0.05)
+        service.start()
+        wait_for(lambda: all(r.stats.connected for r in service.readers))
+
+        t0 = time.perf_counter()
+        for board in boards:
+            board.write(''.join(log_line(i) for i in range(n_lines // 2)))
+            board.write("Free heap: 251234 bytes\n")
+            board.write("garbage,AI_latency_us:1\n")
+            board.write("Free heap\nFree heap: \r\nFree heap: 12x bytes\n\x07\x13 glitch\n")
+            board.write("Input int8: 12 -3 40 0 0\nOutput logits: 5 -20 11\n\n")
+        wait_for(lambda: all(r.stats.rows >= n_lines // 2 for r in service.readers))
+
+        # Board 0 resets: its port disappears and comes back under the same path
+        boards[0].reopen()
+        wait_for(lambda: service.readers[0].stats.reconnects >= 1 and service.readers[0].stats.connected)
+        for board in boards:
+            board.write(''.join(log_line(i) for i in range(n_lines // 2, n_lines)))
+        wait_for(lambda: all(r.stats.rows >= n_lines for r in service.readers))
+        elapsed = time.perf_counter() - t0
+
+        # Board 1 fails once while writing a batch, then gets the next one
+        failing = service.readers[1]
+        fail_once(failing)
+        boards[1].write(''.join(log_line(i) for i in range(n_lines, n_lines + 50)))
+        wait_for(lambda: failing.stats.errors == 1 and failing.stats.connected)
+        boards[1].write(''.join(log_line(i) for i in range(n_lines + 50, n_lines + 100)))
+        wait_for(lambda: failing.stats.rows >= n_lines + 100)
+        assert failing.is_alive() and 'injected' in failing.stats.last_error
+
+        for line in service.report():
+            print(line)
+
+        # An error on every line: board 1 stops after max_errors instead of vanishing
+        failing.max_errors = 3
+        failing._parse = lambda block: 1 / 0
+        while not failing.stats.stopped:
+            boards[1].write(log_line(0))
+            wait_for(lambda: not failing.stats.connected)
+            time.sleep(0.1)
+        failing.join(timeout=5)
+        assert not failing.is_alive() and failing.stats.errors == 3
+        assert 'STOPPED' in service.report()[1]
+        service.stop()
+        for board in boards:
+            board.__exit__()
+
+        for reader, extra in zip(service.readers, (0, 100)):
+            with open(reader.log_path) as f:
+                rows = list(csv.reader(f))
+            with open(reader.heap_path) as f:
+                heap = list(csv.reader(f))
+            assert rows[0][-1] == 'AI_latency_us' and len(rows) == n_lines + extra + 1, len(rows)
+            assert rows[1] == ['1000', '0.05', '22.90', '51.00', '60.00', '450.00', '42', '31', '27', '800']
+            assert heap[1][1:] == [str(1000 + n_lines // 2 - 1), '251234']
+            assert reader.stats.malformed == 5, reader.stats.malformed
+        print(f"OK: {2 * n_lines} rows from 2 boards in {elapsed:.2f} s "
+              f"({2 * n_lines / elapsed:,.0f} rows/s, including the reset)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+import csv
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+
+from check_firmware_emulator import wait_for
+from features import FEATURE_COLUMNS, clean_scenarios, encode_labels, load_scaler, normalize_features
+from firmware_emulator import FirmwareEmulator, stream
+from pty_serial import FakeSerialPort
+from sensor_simulator import run_simulation
+from serial_ingest import IngestionService
+from shard_dataset import SCENARIOS, ShardedDataset, import_csv
+
+# The three writers of the shard format against their CSV counterparts: the
+# imported training CSV, the simulator's shards vs its CSV for the same seed,
+# and the serial logger's shards vs its CSV. Then the tf.data reader: train
+# and validation splits cover every labelled row exactly once, batches mix
+# shards, and Keras trains from it.
+
+SHARD_ROWS = 200
+LOOPS = 3000
+
+
+def check_import(tmp, scaler):
+    ok = True
+    root = os.path.join(tmp, 'real')
+    import_csv('data/dataset_real_clean.csv', root, 'real', 'device_ms', shard_rows=SHARD_ROWS)
+    data = ShardedDataset(root)
+    df = clean_scenarios(pd.read_csv('data/dataset_real_clean.csv'))
+    blocks = list(data.iter_blocks())
+    columns = {c: np.concatenate([b[c] for b in blocks]) for c in blocks[0]}
+    same = all(np.array_equal(columns[c], df[c].to_numpy(dtype=np.float32)) for c in FEATURE_COLUMNS)
+    labels = [SCENARIOS[c] for c in columns['scenario']]
+    print(f"import: {data.rows} rows in {len(data.shards)} shards, features equal {same}, classes {data.classes()}")
+    if data.rows != len(df) or not same or labels != df['scenario'].tolist() \
+            or not np.array_equal(columns['timestamp'], df['timestamp'].to_numpy()):
+        print("FAIL: imported shards differ from the CSV")
+        ok = False
+
+    # Train + validation: every labelled row exactly once per epoch
+    y_expected, classes = encode_labels(df['scenario'])
+    if classes != data.classes():
+        print(f"FAIL: classes {data.classes()} != {classes}")
+        ok = False
+    x_expected = normalize_features(df, scaler).astype(np.float32)
+    train = data.tf_dataset(scaler, classes, batch_size=64, split='train', seed=0)
+    validation = data.tf_dataset(scaler, classes, batch_size=64, split='validation')
+    xs, ys = [], []
+    for part in (train, validation):
+        for x, y in part.as_numpy_iterator():
+            xs.append(x)
+            ys.append(y)
+    got = np.column_stack([np.concatenate(xs), np.concatenate(ys)])
+    want = np.column_stack([x_expected, y_expected])
+    got, want = got[np.lexsort(got.T[::-1])], want[np.lexsort(want.T[::-1])]
+    n_validation = sum(len(y) for _, y in validation.as_numpy_iterator())
+    print(f"tf.data: {len(got)} rows ({n_validation} validation), same rows as the CSV path "
+          f"{got.shape == want.shape and np.allclose(got, want, atol=1e-6)}")
+    if got.shape != want.shape or not np.allclose(got, want, atol=1e-6) \
+            or not 0.05 * len(want) < n_validation < 0.15 * len(want):
+        print("FAIL: tf.data rows differ from normalize_features() on the CSV")
+        ok = False
+
+    # The CSV is sorted by scenario: a batch drawn across shards mixes classes
+    first = next(train.as_numpy_iterator())[1]
+    print(f"first training batch: {len(np.unique(first))} classes")
+    if len(np.unique(first)) < 2:
+        print("FAIL: the first batch comes from a single shard")
+        ok = False
+
+    model = tf.keras.Sequential([tf.keras.layers.InputLayer(shape=(len(FEATURE_COLUMNS),)),
+                                 tf.keras.layers.Dense(len(classes))])
+    model.compile(optimizer='adam', loss=tf.keras.losses.SparseCategoricalCrossentropy(from_logits=True))
+    history = model.fit(train, validation_data=validation, epochs=2, verbose=0)
+    if len(history.history['val_loss']) != 2:
+        print("FAIL: Keras did not train from the shards")
+        ok = False
+    return ok
+
+
+def check_simulator(tmp):
+    kwargs = dict(duration_sec=60, sample_rate=10, chunk_size=700, seed=7, plot=False,
+                  start_time='2025-01-01T00:00:00')
+    csv_path, _ = run_simulation(fmt='csv', output_dir=os.path.join(tmp, 'sim_csv'), **kwargs)
+    shard_path, _ = run_simulation(fmt='shards', output_dir=os.path.join(tmp, 'sim_shards'), **kwargs)
+    df = pd.read_csv(csv_path, parse_dates=['timestamp'])
+    data = ShardedDataset(shard_path)
+    blocks = list(data.iter_blocks())
+    columns = {c: np.concatenate([b[c] for b in blocks]) for c in blocks[0]}
+    renamed = df.rename(columns={'light_v': 'ldr_v', 'humidity_pct': 'hum_pct', 'co2eq_ppm': 'eco2_ppm'})
+    same = all(np.allclose(columns[c], renamed[c].to_numpy(dtype=np.float32)) for c in FEATURE_COLUMNS) \
+        and np.array_equal(columns['anomaly_flag'], df['anomaly_flag'].to_numpy()) \
+        and [SCENARIOS[c] for c in columns['scenario']] == df['scenario'].tolist() \
+        and np.array_equal(columns['timestamp'], df['timestamp'].to_numpy().astype('datetime64[ms]').astype(np.int64))
+    print(f"simulator: {data.rows} rows in {len(data.shards)} shards, same as the CSV run {same}")
+    if data.rows != len(df) or not same:
+        print("FAIL: simulator shards differ from its CSV")
+        return False
+    return True
+
+
+def check_logger(tmp):
+    root = os.path.join(tmp, 'logged')
+    with FakeSerialPort(link=os.path.join(tmp, 'ttyEMU')) as board:
+        service = IngestionService([board.port], out_dir=tmp, flush_interval=0.1, shard_dir=root, shard_rows=1000)
+        service.start()
+        wait_for(lambda: service.readers[0].stats.connected)
+        stream(FirmwareEmulator(seed=3, dht_fail_rate=0.01, debug=False), board.write, LOOPS, 2000.0)
+        reader = service.readers[0]
+        wait_for(lambda: reader.stats.rows >= LOOPS)
+        service.stop()
+    with open(reader.log_path) as f:
+        rows = np.array(list(csv.reader(f))[1:])
+    data = ShardedDataset(root)
+    blocks = list(data.iter_blocks())
+    columns = {c: np.concatenate([b[c] for b in blocks]) for c in blocks[0]}
+    same = np.array_equal(columns['timestamp'], rows[:, 0].astype(np.int64)) and all(
+        np.array_equal(columns[c], rows[:, 1 + j].astype(np.float32)) for j, c in enumerate(FEATURE_COLUMNS))
+    print(f"logger: {data.rows} rows in {len(data.shards)} shards, same as its CSV {same}, "
+          f"labels {data.scenario_counts()}")
+    if data.rows != len(rows) or not same or set(data.scenario_counts()) != {'unlabeled'}:
+        print("FAIL: logger shards differ from its CSV")
+        return False
+    return True
+
+
+def main():
+    scaler = load_scaler('scaler.json')
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = check_import(tmp, scaler)
+        ok = check_simulator(tmp) and ok
+        ok = check_logger(tmp) and ok
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
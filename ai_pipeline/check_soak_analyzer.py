@@ -0,0 +1,179 @@
+import filecmp
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from capture_import import Capture, import_capture
+from firmware_emulator import LOOP_DELAY_MS, MILLIS_WRAP, FirmwareEmulator, stream
+from serial_ingest import HEAP_HEADER, LOG_HEADER
+from soak_analyzer import LEVELS_S, SERIES, SoakAnalyzer, analyze, capture_batches, capture_heap_batches, \
+    load_rollup
+
+# Emulated soak runs through the analyzer: a leaking board fails on its leak
+# rate, a clean board passes across the 49.7-day millis() wrap, and a board
+# that resets fails on resets while its leak is still measured within each
+# boot. The same run as logger CSVs split over two files gives the same
+# report and rollups, rollups do not depend on the batch size and match a
+# direct aggregation, and memory stays flat when the run gets longer.
+
+LOOPS_PER_HOUR = int(3.6e6 / (LOOP_DELAY_MS + 7))
+
+
+def capture(tmp, name, boots, **kwargs):
+    """Import a capture of one emulator per (hours, start_millis) boot; returns the capture_import directory"""
+    path = os.path.join(tmp, name + '.log')
+    with open(path, 'wb') as f:
+        for seed, (hours, start_millis) in enumerate(boots):
+            emulator = FirmwareEmulator(seed=seed, debug=False, dht_fail_rate=0.002, start_millis=start_millis,
+                                        **kwargs)
+            stream(emulator, f.write, int(hours * LOOPS_PER_HOUR))
+    import_capture(path, path + '.d')
+    return path + '.d'
+
+
+def run(tmp, name, capture_dir, chunksize=None, **options):
+    kwargs = {'chunksize': chunksize} if chunksize else {}
+    analyzer = SoakAnalyzer(name, os.path.join(tmp, 'soak'), **options)
+    data = Capture(capture_dir)
+    for batch in capture_batches(data, **kwargs):
+        analyzer.update(*batch)
+    for batch in capture_heap_batches(data, **kwargs):
+        analyzer.update_heap(*batch)
+    analyzer.finish()
+    return analyzer, analyzer.report()
+
+
+def failed_checks(report):
+    return sorted(c['name'] for c in report['checks'] if not c['pass'])
+
+
+def write_logs(capture_dir, out_dir, cut):
+    """The capture as serial_ingest CSVs, split into two files before record number cut"""
+    data = Capture(capture_dir)
+    records = pd.DataFrame({name: np.asarray(data.records[c]) for name, c in zip(
+        LOG_HEADER, ['millis', 'ldr_v', 'temp_c', 'hum_pct', 'tvoc_ppb', 'eco2_ppm', 'prob0', 'prob1', 'prob2',
+                     'latency_us'])})
+    heap = pd.DataFrame({'host_time': 0.0, 'last_millis': np.asarray(data.heap['last_millis']),
+                         'free_heap_bytes': np.asarray(data.heap['free_heap'])})[HEAP_HEADER]
+    heap_cut = int(np.searchsorted(data.heap['offset'], data.records['offset'][cut]))
+    paths = []
+    for day, (r, h) in enumerate([(records[:cut], heap[:heap_cut]), (records[cut:], heap[heap_cut:])]):
+        os.makedirs(os.path.join(out_dir, f"day{day}"), exist_ok=True)
+        paths.append(os.path.join(out_dir, f"day{day}", 'ai_log_board.csv'))
+        r.to_csv(paths[-1], index=False)
+        h.to_csv(os.path.join(out_dir, f"day{day}", 'heap_log_board.csv'), index=False)
+    return paths
+
+
+def check_boards(tmp):
+    ok = True
+    leak_dir = capture(tmp, 'leak', [(26, 2230)], heap_leak_per_hour=500)
+    _, leak = run(tmp, 'leak', leak_dir)
+    rate = leak['heap']['leak_bytes_per_hour']
+    print(f"leaking board: {leak['verdict']} {failed_checks(leak)}, leak {rate:.1f} B/h")
+    if failed_checks(leak) != ['heap_leak'] or abs(rate - 500) > 5:
+        print("FAIL: expected only the heap leak check to fail, at 500 B/h")
+        ok = False
+
+    wrap_dir = capture(tmp, 'wrap', [(25, MILLIS_WRAP - 3 * 3_600_000)])
+    _, wrap = run(tmp, 'wrap', wrap_dir)
+    print(f"board across the millis wrap: {wrap['verdict']}, {len(wrap['boots'])} boot, "
+          f"{wrap['boots'][0]['wraps']} wrap, {wrap['boots'][0]['hours']:.2f} h")
+    if wrap['verdict'] != 'PASS' or len(wrap['boots']) != 1 or wrap['boots'][0]['wraps'] != 1 \
+            or wrap['counts']['heap_unplaced']:
+        print("FAIL: the millis wrap was taken for a reset")
+        ok = False
+
+    # 4 h, a 2-minute boot with no heap line, then 25 h; the heap comes back at every reset
+    reset_dir = capture(tmp, 'reset', [(4, 2230), (2 / 60, 2230), (25, 2230)], heap_leak_per_hour=300)
+    analyzer, reset = run(tmp, 'reset', reset_dir)
+    rate = reset['heap']['leak_bytes_per_hour']
+    print(f"board with resets: {reset['verdict']} {failed_checks(reset)}, {len(reset['boots'])} boots, "
+          f"pooled leak {rate:.1f} B/h")
+    if failed_checks(reset) != ['heap_leak', 'resets'] or len(reset['boots']) != 3 or abs(rate - 300) > 3 \
+            or reset['counts']['heap_unplaced']:
+        print("FAIL: expected 3 boots, a 300 B/h leak within boots and failed resets/leak checks")
+        ok = False
+
+    # Rollups: the hourly buckets against a direct aggregation of the records
+    data = Capture(reset_dir)
+    millis = np.asarray(data.records['millis'], dtype=np.int64)
+    boot = np.r_[0, np.cumsum(np.diff(millis) < 0)]
+    expected = pd.DataFrame({'boot': boot, 'hour': millis // 3_600_000, 'latency': data.records['latency_us']}) \
+        .groupby(['boot', 'hour'])['latency'].agg(['size', 'sum', 'max'])
+    hourly = load_rollup(analyzer.out_dir, 'records', 3600)
+    got = pd.DataFrame({'boot': hourly['boot'], 'hour': hourly['start_s'] // 3600, 'size': hourly['records'],
+                        'sum': hourly['latency_sum'], 'max': hourly['latency_max']}).set_index(['boot', 'hour'])
+    if not got.astype(np.int64).equals(expected.astype(np.int64)):
+        print("FAIL: hourly rollup differs from a direct aggregation")
+        ok = False
+    for seconds in LEVELS_S:
+        if int(load_rollup(analyzer.out_dir, 'records', seconds)['records'].sum()) != len(millis):
+            print(f"FAIL: the {seconds} s rollup does not add up to the records")
+            ok = False
+    # Other levels: the finest one sets the buckets records are aggregated into
+    fine, _ = run(tmp, 'reset_fine', reset_dir, levels=(30, 300))
+    buckets = len(np.unique(boot * MILLIS_WRAP + millis // 30_000))
+    if len(load_rollup(fine.out_dir, 'records', 30)) != buckets:
+        print(f"FAIL: the 30 s rollup of levels=(30, 300) does not have {buckets} buckets")
+        ok = False
+
+    # Batch size independence
+    small, _ = run(tmp, 'reset_small', reset_dir, chunksize=1000)
+    for series in SERIES:
+        for seconds in LEVELS_S:
+            name = f"{series}_{seconds}s.bin"
+            if not filecmp.cmp(os.path.join(analyzer.out_dir, name), os.path.join(small.out_dir, name),
+                               shallow=False):
+                print(f"FAIL: {name} depends on the batch size")
+                ok = False
+
+    # The same run as logger CSVs, one file per "day": split mid-boot, and
+    # exactly at a reset (the first record of the second file is a new boot)
+    splits = {'mid_boot': int(np.argmax(millis > 3_600_000 * 12)),
+              'at_reset': int(np.flatnonzero(np.diff(millis) < 0)[0] + 1)}
+    for name, cut in splits.items():
+        paths = write_logs(reset_dir, os.path.join(tmp, 'logs_' + name), cut)
+        (from_csv,) = analyze([f"reset_{name}={p}" for p in paths], os.path.join(tmp, 'soak'))
+        csv_report = from_csv.report()
+        same = csv_report['checks'] == reset['checks'] and csv_report['boots'] == reset['boots'] and all(
+            filecmp.cmp(os.path.join(analyzer.out_dir, f"{s}_{n}s.bin"),
+                        os.path.join(from_csv.out_dir, f"{s}_{n}s.bin"), shallow=False)
+            for s in SERIES for n in LEVELS_S)
+        print(f"same board from two logger CSVs split {name}: {len(csv_report['boots'])} boots, "
+              f"same report and rollups {same}")
+        if not same:
+            print(f"FAIL: CSV logs split {name} and the capture disagree")
+            ok = False
+    return ok
+
+
+def check_memory(tmp):
+    peaks = []
+    for hours in (12, 48):
+        capture_dir = capture(tmp, f"mem{hours}", [(hours, 2230)], heap_leak_per_hour=50)
+        tracemalloc.start()
+        run(tmp, f"mem{hours}", capture_dir, chunksize=1 << 14)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    print(f"peak memory: {peaks[0] / 1e6:.2f} MB for 12 h, {peaks[1] / 1e6:.2f} MB for 48 h")
+    if peaks[1] > 1.25 * peaks[0]:
+        print("FAIL: memory grows with the length of the run")
+        return False
+    return True
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = check_boards(tmp)
+        ok = check_memory(tmp) and ok
+    print('OK' if ok else 'FAIL')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,39 @@
+import json
+import os
+import sys
+import tempfile
+
+from int8_reference import ReferenceMLP
+from tflite_reader import TFLiteModel
+
+import sweep
+
+# Smoke run of sweep.py: one width, per-channel and per-tensor, a few epochs.
+# Both candidates must be converted with the weight quantization they ask for
+# (sweep.convert raises otherwise), scored, and the winner written with its
+# model.h and model_params.h.
+
+ARGS = ['--hidden', '8', '--per-channel', 'both', '--representative-samples', '50',
+        '--max-epochs', '3', '--patience', '1', '--workers', '1']
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        sweep.main(ARGS + ['--out-dir', tmp])
+        with open(os.path.join(tmp, 'sweep_results.json')) as f:
+            results = json.load(f)
+        names = sorted(s['name'] for s in results['scores'])
+        print(f"candidates {names}, winner {results['winner']}")
+        ok = names == ['8-pt-r50', '8-r50'] and results['winner'] in names
+        if ok:
+            model = TFLiteModel.load(os.path.join(tmp, 'quantized_model.tflite'))
+            per_channel = any(len(model.tensors[op.inputs[1]].scale) > 1 for op in model.operators)
+            ReferenceMLP(model)
+            ok = per_channel == ('-pt-' not in results['winner'])
+            ok = ok and all(os.path.exists(os.path.join(tmp, name)) for name in ('model.h', 'model_params.h'))
+    print('OK' if ok else 'FAIL: expected both candidates scored and the winner written with its headers')
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
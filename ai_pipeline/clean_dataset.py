@@ -1,15 +1,8 @@
-import pandas as pd
-import numpy as np
+from pipeline import main
 
-df = pd.read_csv('data/dataset_real_clean.csv')
+# Cleaning is the pipeline's `clean` stage (rows with missing values dropped).
+# It builds data/dataset_real_clean.csv from the scenario CSVs instead of
+# overwriting the file in place.
 
-df_clean = df.dropna()
-print('Number of rows with NaN in the scenario:', df['scenario'].isna().sum())
-
-df['scenario'] = df['scenario'].fillna('normal')
-
-print('Unique scenario labels after cleaning:')
-print(df['scenario'].unique())
-
-df_clean.to_csv('data/dataset_real_clean.csv', index=False)
-print(f"Deleted {len(df) - len(df_clean)} rows with NaN, remaining {len(df_clean)} clean rows.")
+if __name__ == '__main__':
+    main(['clean'])
@@ -0,0 +1,250 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from features import FEATURE_COLUMNS
+from scaler_stats import LOG_ALIASES, QUANTILE_RESOLUTION, FeatureStats, iter_csv_chunks
+
+# Feature drift of live readings against the training distribution the scaler
+# was fitted on. The reference (drift_reference.json, a pipeline.py stage built
+# from the same merged statistics as scaler.json) gives each feature quantile
+# bins plus one bin below the training minimum and one above the maximum.
+# Every sample costs one bin increment per feature; each window of samples is
+# scored with PSI and a binned KS distance, and out-of-range, missing and DHT
+# failure (-1 temperature and humidity, sensor_driver.cpp) rates. The -1 rows
+# stay in the histograms: the training set has them too (the anomaly scenario).
+
+REFERENCE_PATH = 'drift_reference.json'
+N_BINS = 10
+WINDOW_SAMPLES = 300            # 5 minutes at the firmware's 1 Hz
+PSI_FLOOR = 1e-4                # empty bins would make PSI infinite
+DHT_FAILURE = -1.0
+DHT_FEATURES = ('temp_c', 'hum_pct')
+# Alert thresholds: PSI > 0.25 is the usual "significant shift"
+PSI_ALERT = 0.25
+KS_ALERT = 0.2
+OUT_OF_RANGE_ALERT = 0.05
+FAILURE_ALERT = 0.01
+
+
+def build_reference(state, n_bins=N_BINS):
+    """drift_reference.json from a FeatureStats state (dict), e.g. the pipeline's 'stats' stage"""
+    stats = FeatureStats.from_dict(state)
+    cuts = np.array([stats.quantile(q) for q in np.arange(1, n_bins) / n_bins])
+    features = {}
+    for j, name in enumerate(stats.columns):
+        lo, hi = float(stats.min[j]), float(stats.max[j])
+        inner = sorted({round(float(c), 6) for c in cuts[:, j] if lo < c <= hi})
+        feature = {'min': lo, 'max': hi, 'cuts': inner}
+        hist = stats.histograms[j]
+        values = np.array(sorted(hist), dtype=np.float64) * QUANTILE_RESOLUTION
+        counts = np.array([hist[b] for b in sorted(hist)], dtype=np.float64)
+        expected = np.bincount(bin_index(values, feature), weights=counts, minlength=len(inner) + 3)
+        feature['expected'] = (expected / expected.sum()).tolist()
+        features[name] = feature
+    return {'count': int(stats.count.max()), 'resolution': QUANTILE_RESOLUTION, 'features': features}
+
+
+def bin_index(values, feature):
+    """0: below the training minimum, 1..k: quantile bins, k + 1: above the maximum"""
+    half = QUANTILE_RESOLUTION / 2     # values are logged with 2 decimals
+    index = 1 + np.searchsorted(np.array(feature['cuts'], dtype=np.float64), values, side='right')
+    index[values < feature['min'] - half] = 0
+    index[values > feature['max'] + half] = len(feature['cuts']) + 2
+    return index
+
+
+def psi(actual, expected):
+    a = np.maximum(actual / actual.sum(), PSI_FLOOR)
+    e = np.maximum(expected, PSI_FLOOR)
+    return float(((a - e) * np.log(a / e)).sum())
+
+
+def ks_distance(actual, expected):
+    return float(np.abs(np.cumsum(actual / actual.sum()) - np.cumsum(expected)).max())
+
+
+class DriftMonitor:
+    """
+    Streaming drift scores per window of `window` samples. Feed (n, 5) float
+    arrays in FEATURE_COLUMNS order (NaN for unparseable cells) with optional
+    millis; finished windows are kept as compact rows.
+    """
+
+    def __init__(self, reference, window=WINDOW_SAMPLES):
+        self.reference = reference
+        self.columns = list(reference['features'])
+        self.features = [reference['features'][c] for c in self.columns]
+        self.expected = [np.array(f['expected']) for f in self.features]
+        self.dht = [self.columns.index(c) for c in DHT_FEATURES]
+        self.window = window
+        self.windows = []
+        self.total = self._empty()
+        self._current = self._empty()
+
+    def _empty(self):
+        return {'rows': 0, 'missing': np.zeros(len(self.columns), dtype=np.int64), 'dht_failures': 0,
+                'counts': [np.zeros(len(e), dtype=np.int64) for e in self.expected], 'millis': [None, None]}
+
+    def update(self, values, millis=None):
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.columns))
+        start = 0
+        while start < len(values):
+            take = min(len(values) - start, self.window - self._current['rows'])
+            part = values[start:start + take]
+            part_millis = None if millis is None else np.asarray(millis)[start:start + take]
+            for acc in (self._current, self.total):
+                self._add(acc, part, part_millis)
+            start += take
+            if self._current['rows'] == self.window:
+                self._close_window()
+
+    def _add(self, acc, values, millis):
+        failed = (values[:, self.dht[0]] == DHT_FAILURE) & (values[:, self.dht[1]] == DHT_FAILURE)
+        acc['rows'] += len(values)
+        acc['dht_failures'] += int(failed.sum())
+        for j, feature in enumerate(self.features):
+            column = values[:, j]
+            valid = np.isfinite(column)
+            acc['missing'][j] += int((~valid).sum())
+            acc['counts'][j] += np.bincount(bin_index(column[valid], feature), minlength=len(acc['counts'][j]))
+        if millis is not None and len(millis):
+            if acc['millis'][0] is None:
+                acc['millis'][0] = int(millis[0])
+            acc['millis'][1] = int(millis[-1])
+
+    def score(self, acc):
+        """Compact report row of an accumulator, with its alerts"""
+        row = {'rows': acc['rows'], 'start_millis': acc['millis'][0], 'end_millis': acc['millis'][1],
+               'dht_failure_rate': acc['dht_failures'] / max(acc['rows'], 1), 'features': {}, 'alerts': []}
+        if row['dht_failure_rate'] > FAILURE_ALERT:
+            row['alerts'].append(f"DHT failures {row['dht_failure_rate']:.1%}")
+        for j, name in enumerate(self.columns):
+            counts = acc['counts'][j]
+            n = int(counts.sum())
+            scores = {'missing_rate': int(acc['missing'][j]) / max(acc['rows'], 1)}
+            if n:
+                scores.update(psi=psi(counts, self.expected[j]), ks=ks_distance(counts, self.expected[j]),
+                              below_range=int(counts[0]) / n, above_range=int(counts[-1]) / n)
+                out = scores['below_range'] + scores['above_range']
+                if scores['psi'] > PSI_ALERT:
+                    row['alerts'].append(f"{name} PSI {scores['psi']:.2f}")
+                if scores['ks'] > KS_ALERT:
+                    row['alerts'].append(f"{name} KS {scores['ks']:.2f}")
+                if out > OUT_OF_RANGE_ALERT:
+                    row['alerts'].append(f"{name} {out:.1%} outside training range "
+                                         f"[{self.features[j]['min']:g}, {self.features[j]['max']:g}]")
+            if scores['missing_rate'] > FAILURE_ALERT:
+                row['alerts'].append(f"{name} missing {scores['missing_rate']:.1%}")
+            row['features'][name] = scores
+        return row
+
+    def _close_window(self):
+        row = self.score(self._current)
+        row['window'] = len(self.windows)
+        self.windows.append(row)
+        self._current = self._empty()
+        return row
+
+    def finish(self):
+        """Close a partial last window"""
+        if self._current['rows']:
+            self._close_window()
+
+    def report(self):
+        return {'window_samples': self.window, 'total': self.score(self.total),
+                'windows_with_alerts': sum(bool(w['alerts']) for w in self.windows), 'windows': self.windows}
+
+
+def frame_values(frame):
+    """(values, millis) of a log or dataset chunk, FEATURE_COLUMNS order"""
+    frame = frame.rename(columns=LOG_ALIASES)
+    values = frame[FEATURE_COLUMNS].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+    millis = pd.to_numeric(frame['millis'], errors='coerce').fillna(-1).to_numpy(dtype=np.int64) \
+        if 'millis' in frame else None
+    return values, millis
+
+
+def format_window(row):
+    parts = [f"window {row.get('window', 'total')}", f"rows {row['rows']}"]
+    if row['start_millis'] is not None:
+        parts.append(f"millis {row['start_millis']}-{row['end_millis']}")
+    parts.append(f"DHT fail {row['dht_failure_rate']:.1%}")
+    for name, s in row['features'].items():
+        if 'psi' in s:
+            parts.append(f"{name} psi {s['psi']:.2f} ks {s['ks']:.2f} out {s['below_range'] + s['above_range']:.0%}")
+        else:
+            parts.append(f"{name} -")
+    return ' | '.join(parts)
+
+
+def print_window(row, jsonl=None):
+    print(format_window(row))
+    for alert in row['alerts']:
+        print(f"  ALERT: {alert}")
+    if jsonl:
+        jsonl.write(json.dumps(row) + '\n')
+        jsonl.flush()
+
+
+def monitor_files(paths, monitor, jsonl=None, follow=False, poll_interval=1.0):
+    """Feed archived logs; with follow, keep tailing the last one (Ctrl+C to stop)"""
+    offsets = {}
+    try:
+        while True:
+            for path in paths:
+                for frame, offsets[path] in iter_csv_chunks(path, offsets.get(path, 0)):
+                    seen = len(monitor.windows)
+                    monitor.update(*frame_values(frame))
+                    for row in monitor.windows[seen:]:
+                        print_window(row, jsonl)
+            if not follow:
+                return
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def load_reference(path=REFERENCE_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Feature drift of sensor logs against the training distribution')
+    parser.add_argument('logs', nargs='*', default=['data/ai_log.csv'])
+    parser.add_argument('--reference', default=REFERENCE_PATH,
+                        help='Training distribution (python pipeline.py drift_reference writes it)')
+    parser.add_argument('--window', type=int, default=WINDOW_SAMPLES, help='Samples per scored window')
+    parser.add_argument('--follow', action='store_true', help='Keep reading logs that are still being written')
+    parser.add_argument('--jsonl', help='Append one JSON row per window to this file')
+    parser.add_argument('--json', help='Write the full report to this file')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.reference):
+        parser.error(f"{args.reference} not found: run python pipeline.py drift_reference")
+    monitor = DriftMonitor(load_reference(args.reference), args.window)
+    jsonl = open(args.jsonl, 'a') if args.jsonl else None
+    try:
+        monitor_files(args.logs, monitor, jsonl, args.follow)
+        seen = len(monitor.windows)
+        monitor.finish()
+        for row in monitor.windows[seen:]:
+            print_window(row, jsonl)
+    finally:
+        if jsonl:
+            jsonl.close()
+    report = monitor.report()
+    print(f"{report['windows_with_alerts']} of {len(report['windows'])} windows with alerts")
+    print_window(report['total'])
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from features import load_dataset
+
+ACCURACY_TARGET = 0.90  # README: accuracy > 90% on scenarios
+
+
+class BatchedTFLiteModel:
+    """
+    A .tflite model loaded once with its input resized to `batch` rows, so the
+    whole dataset runs in a few invokes. int8 models are fed quantized inputs
+    and their logits are dequantized, so both kinds return float logits.
+    """
+
+    def __init__(self, path, batch=4096):
+        import tensorflow as tf
+        self.path = path
+        self.batch = batch
+        self.interpreter = tf.lite.Interpreter(model_path=path)
+        inp = self.interpreter.get_input_details()[0]
+        self.interpreter.resize_tensor_input(inp['index'], [batch, inp['shape'][-1]])
+        self.interpreter.allocate_tensors()
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+        self.quantized = self.input['dtype'] == np.int8
+
+    def quantize(self, x):
+        """Round half away from zero like TFLite and ReferenceMLP.quantize (np.round is half to even)"""
+        scale, zero_point = self.input['quantization']
+        q = np.asarray(x, dtype=np.float64) / scale
+        q = np.sign(q) * np.floor(np.abs(q) + 0.5) + zero_point
+        return np.clip(q, -128, 127).astype(np.int8)
+
+    def predict(self, x):
+        n = len(x)
+        x = self.quantize(x) if self.quantized else x.astype(np.float32)
+        out = np.empty((n, self.output['shape'][-1]), dtype=np.float32)
+        for start in range(0, n, self.batch):
+            block = x[start:start + self.batch]
+            rows = len(block)
+            if rows < self.batch:
+                block = np.concatenate((block, np.zeros((self.batch - rows, x.shape[1]), dtype=x.dtype)))
+            self.interpreter.set_tensor(self.input['index'], block)
+            self.interpreter.invoke()
+            out[start:start + rows] = self.interpreter.get_tensor(self.output['index'])[:rows]
+        if self.quantized:
+            scale, zero_point = self.output['quantization']
+            out = (out - zero_point) * scale
+        return out
+
+
+def timed_predict(model, x, repeat=3):
+    model.predict(x[:model.batch])  # warm-up
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        logits = model.predict(x)
+        best = min(best, time.perf_counter() - t0)
+    return logits, len(x) / best
+
+
+def accuracy(pred, y, rows):
+    """Accuracy over the selected rows, None when there are none"""
+    return float((pred[rows] == y[rows]).mean()) if rows.any() else None
+
+
+def evaluate(float_path='model_float.tflite', int8_path='quantized_model.tflite',
+             csv_path='data/dataset_real_clean.csv', scaler_path='scaler.json', batch=4096, repeat=3):
+    """
+    Accuracy, per-scenario accuracy and throughput of both models, and their
+    agreement. Rows with NaN/Inf logits are left out of every score (argmax
+    of NaN would count as class 0); a score with no rows left is None.
+    """
+    df, x, y, classes = load_dataset(csv_path, scaler_path)
+    scenarios = df['scenario'].to_numpy()
+    report = {'samples': len(x), 'classes': classes, 'models': {}}
+    logits, finite = {}, {}
+    for name, path in (('float', float_path), ('int8', int8_path)):
+        model = BatchedTFLiteModel(path, batch)
+        logits[name], throughput = timed_predict(model, x, repeat)
+        finite[name] = np.isfinite(logits[name]).all(axis=1)
+        pred = logits[name].argmax(axis=1)
+        report['models'][name] = {
+            'path': path,
+            'accuracy': accuracy(pred, y, finite[name]),
+            'per_scenario': {s: accuracy(pred, y, finite[name] & (scenarios == s)) for s in classes},
+            'samples_per_sec': throughput,
+            'non_finite_rows': int((~finite[name]).sum()),
+        }
+    # Agreement and logit error over rows where both models produced finite logits
+    both = finite['float'] & finite['int8']
+    err = np.abs(logits['int8'] - logits['float'])[both]
+    accuracies = [report['models'][name]['accuracy'] for name in ('float', 'int8')]
+    report['int8_vs_float'] = {
+        'agreement': accuracy(logits['int8'].argmax(axis=1), logits['float'].argmax(axis=1), both),
+        'logit_mae': float(err.mean()) if both.any() else None,
+        'logit_max_abs_error': float(err.max()) if both.any() else None,
+        'compared_rows': int(both.sum()),
+        'accuracy_drop': accuracies[0] - accuracies[1] if None not in accuracies else None,
+    }
+    return report
+
+
+def score(value, spec='.3f', width=8):
+    """A score formatted with spec, 'n/a' when it is None"""
+    return f"{format(value, spec) if value is not None else 'n/a':>{width}}"
+
+
+def print_report(report):
+    print(f"{report['samples']} samples, classes {report['classes']}")
+    print(f"{'scenario':>14} {'float':>8} {'int8':>8}")
+    for s in report['classes']:
+        print(f"{s:>14} {score(report['models']['float']['per_scenario'][s])} "
+              f"{score(report['models']['int8']['per_scenario'][s])}")
+    print(f"{'overall':>14} {score(report['models']['float']['accuracy'])} "
+          f"{score(report['models']['int8']['accuracy'])}")
+    print(f"{'samples/s':>14} {report['models']['float']['samples_per_sec']:>8,.0f} "
+          f"{report['models']['int8']['samples_per_sec']:>8,.0f}")
+    for name, m in report['models'].items():
+        if m['non_finite_rows']:
+            print(f"WARNING: {name} model ({m['path']}) gave NaN/Inf logits for {m['non_finite_rows']} of "
+                  f"{report['samples']} rows; they are left out of its accuracy and of the int8 vs float scores")
+    q = report['int8_vs_float']
+    if q['compared_rows']:
+        print(f"int8 vs float: agreement {q['agreement']:.3f}, logit MAE {q['logit_mae']:.4f}, "
+              f"max |error| {q['logit_max_abs_error']:.4f} over {q['compared_rows']} rows, "
+              f"accuracy drop {score(q['accuracy_drop'], '+.3f', 0)}")
+    else:
+        print("int8 vs float: no rows with finite logits from both models")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Evaluate the float and int8 TFLite models on the labelled dataset')
+    parser.add_argument('--float-model', default='model_float.tflite')
+    parser.add_argument('--int8-model', default='quantized_model.tflite')
+    parser.add_argument('--data', default='data/dataset_real_clean.csv')
+    parser.add_argument('--scaler', default='scaler.json')
+    parser.add_argument('--batch', type=int, default=4096)
+    parser.add_argument('--min-accuracy', type=float, default=None,
+                        help=f'Exit with status 1 if int8 accuracy is below this (README target {ACCURACY_TARGET})')
+    parser.add_argument('--json', help='Write the report to this file')
+    args = parser.parse_args(argv)
+
+    report = evaluate(args.float_model, args.int8_model, args.data, args.scaler, args.batch)
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    int8_accuracy = report['models']['int8']['accuracy']
+    if args.min_accuracy is not None and (int8_accuracy is None or int8_accuracy < args.min_accuracy):
+        print(f"FAIL: int8 accuracy {score(int8_accuracy, width=0)} < {args.min_accuracy}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,33 @@
-import tensorflow as tf
+import argparse
 
-model = tf.keras.models.load_model('model_float.h5')
+# Converts the float Keras model train_model.py saves (model_float.h5) to an
+# unquantized .tflite, the reference the int8 model is compared against.
 
-converter = tf.lite.TFLiteConverter.from_keras_model(model)
-converter.optimizations = []
 
-tflite_model_float = converter.convert()
-with open('model_float.tflite', 'wb') as f:
-    f.write(tflite_model_float)
+def export_float(h5_path='model_float.h5', out_path='model_float.tflite'):
+    """Convert a Keras .h5 model to float TFLite; returns the flatbuffer"""
+    import tensorflow as tf
 
-print("Float TFLite model exported: model_float.tflite")
+    model = tf.keras.models.load_model(h5_path)
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = []
+
+    tflite_model_float = converter.convert()
+    with open(out_path, 'wb') as f:
+        f.write(tflite_model_float)
+    return tflite_model_float
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the float Keras model as an unquantized .tflite')
+    parser.add_argument('--model', default='model_float.h5')
+    parser.add_argument('--out', default='model_float.tflite')
+    args = parser.parse_args(argv)
+
+    export_float(args.model, args.out)
+    print(f"Float TFLite model exported: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import argparse
+
+import numpy as np
+
+from features import FEATURE_COLUMNS, VALID_SCENARIOS, load_scaler
+from model_cost import arena_size
+from package_model import model_id, write_if_changed
+from tflite_reader import TFLiteModel
+
+# Generates model_params.h next to model.h: the model's real I/O quantization,
+# the scaler folded into one subtract-multiply per feature, an exp() table for
+# softmax over int8 logits and the tensor arena size from model_cost.py.
+# train_model.py calls write_header() after export.
+#
+# Folding (x - c) / d / input_scale into (x - c) * gain keeps the subtraction
+# first: the constant tvoc/eco2 features have d ~ 1e-8, and x * gain + bias in
+# float32 would lose x == c to cancellation.
+
+# Center and divisor of each FEATURE_COLUMNS entry, as in features.normalize_features
+SCALER_TERMS = {
+    'ldr_v': ('ldr_min', lambda s: s['ldr_max'] - s['ldr_min'] + 1e-8),
+    'temp_c': ('temp_mean', lambda s: s['temp_std'] + 1e-8),
+    'hum_pct': ('hum_mean', lambda s: s['hum_std'] + 1e-8),
+    'tvoc_ppb': ('tvoc_min', lambda s: s['tvoc_max'] - s['tvoc_min'] + 1e-8),
+    'eco2_ppm': ('eco2_min', lambda s: s['eco2_max'] - s['eco2_min'] + 1e-8),
+}
+# |(x - c) * gain| is clamped here before rounding so huge values cannot overflow int
+FUSED_CLAMP = 256.0
+
+HEADER_TEMPLATE = """\
+// Generated by ai_pipeline/export_model_params.py from {scaler_path} and {model_path}.
+// Do not edit: rerun train_model.py or export_model_params.py instead.
+#ifndef MODEL_PARAMS_H
+#define MODEL_PARAMS_H
+
+#include <stdint.h>
+
+#define AI_N_INPUTS {n_inputs}
+#define AI_N_OUTPUTS {n_outputs}
+#define AI_INPUT_SCALE {input_scale}
+#define AI_INPUT_ZERO_POINT {input_zero_point}
+#define AI_OUTPUT_SCALE {output_scale}
+#define AI_OUTPUT_ZERO_POINT {output_zero_point}
+// AI_MODEL_ID of the model.h these parameters belong to
+#define AI_PARAMS_MODEL_ID 0x{model_id:08x}UL
+// TFLM tensor arena from model_cost.py (planned activations + persistent data + headroom, at least ARENA_FLOOR)
+#define AI_TENSOR_ARENA_SIZE {arena_size}
+
+// Class order of the model outputs
+static const char *const AI_CLASS_NAMES[AI_N_OUTPUTS] = {{{class_names}}};
+
+// Normalize + quantize folded per feature ({feature_names}):
+// q = clamp(round((x - AI_INPUT_CENTER[i]) * AI_INPUT_GAIN[i]) + AI_INPUT_ZERO_POINT)
+static const float AI_INPUT_CENTER[AI_N_INPUTS] = {{{centers}}};
+static const float AI_INPUT_GAIN[AI_N_INPUTS] = {{{gains}}};
+
+static inline int8_t ai_quantize_feature(int i, float x)
+{{
+    float v = (x - AI_INPUT_CENTER[i]) * AI_INPUT_GAIN[i];
+    if (v > {clamp}f)
+        v = {clamp}f;
+    if (v < -{clamp}f)
+        v = -{clamp}f;
+    // Round half away from zero, like the TFLite quantizer
+    int q = (v >= 0.0f ? (int)(v + 0.5f) : (int)(v - 0.5f)) + AI_INPUT_ZERO_POINT;
+    return (int8_t)(q > 127 ? 127 : (q < -128 ? -128 : q));
+}}
+
+// Softmax over int8 logits q: exp(logit[i] - logit_max) = AI_SOFTMAX_EXP[q_max - q[i]]
+static const float AI_SOFTMAX_EXP[256] = {{
+{softmax_table}
+}};
+// Same table in Q15 (32768 = 1.0) for the integer-only softmax of ai_preprocess.c
+static const uint16_t AI_SOFTMAX_EXP_Q15[256] = {{
+{softmax_table_q15}
+}};
+
+#endif
+"""
+
+
+def c_float(value):
+    """float32 literal that round-trips exactly"""
+    return f"{np.float32(value)!r}".removeprefix('np.float32(').removesuffix(')') + 'f'
+
+
+def fused_input_coefficients(scaler, input_scale):
+    """Per-feature (center, gain) as float32 arrays, in FEATURE_COLUMNS order"""
+    center = np.array([scaler[SCALER_TERMS[c][0]] for c in FEATURE_COLUMNS], dtype=np.float64)
+    divisor = np.array([SCALER_TERMS[c][1](scaler) for c in FEATURE_COLUMNS], dtype=np.float64)
+    return center.astype(np.float32), (1.0 / (divisor * input_scale)).astype(np.float32)
+
+
+def fused_quantize(raw, center, gain, zero_point):
+    """NumPy float32 emulation of ai_quantize_feature() on (n, 5) raw sensor values"""
+    v = (np.asarray(raw, dtype=np.float32) - center) * gain
+    v = np.clip(v, np.float32(-FUSED_CLAMP), np.float32(FUSED_CLAMP))
+    half = np.float32(0.5)
+    q = np.where(v >= 0, np.trunc(v + half), np.trunc(v - half)).astype(np.int32) + zero_point
+    return np.clip(q, -128, 127).astype(np.int8)
+
+
+def softmax_exp_table(output_scale):
+    return np.exp(-np.arange(256) * np.float64(output_scale)).astype(np.float32)
+
+
+def softmax_exp_table_q15(output_scale):
+    return np.rint(np.exp(-np.arange(256) * np.float64(output_scale)) * 32768).astype(np.uint16)
+
+
+def render_header(model, scaler, classes, model_path='quantized_model.tflite', scaler_path='scaler.json'):
+    inp, out = model.input, model.output
+    center, gain = fused_input_coefficients(scaler, float(inp.scale[0]))
+    table = [c_float(v) for v in softmax_exp_table(float(out.scale[0]))]
+    table_q15 = softmax_exp_table_q15(float(out.scale[0]))
+    return HEADER_TEMPLATE.format(
+        scaler_path=scaler_path, model_path=model_path,
+        n_inputs=inp.shape[-1], n_outputs=out.shape[-1],
+        input_scale=c_float(inp.scale[0]), input_zero_point=int(inp.zero_point[0]),
+        output_scale=c_float(out.scale[0]), output_zero_point=int(out.zero_point[0]),
+        arena_size=arena_size(model), model_id=model_id(model.buf),
+        class_names=', '.join(f'"{c}"' for c in classes),
+        feature_names=', '.join(FEATURE_COLUMNS),
+        centers=', '.join(c_float(v) for v in center),
+        gains=', '.join(c_float(v) for v in gain),
+        clamp=f'{FUSED_CLAMP:.1f}',
+        softmax_table='\n'.join('    ' + ', '.join(table[i:i + 6]) + ',' for i in range(0, 256, 6)),
+        softmax_table_q15='\n'.join('    ' + ', '.join(map(str, table_q15[i:i + 12].tolist())) + ','
+                                     for i in range(0, 256, 12)),
+    )
+
+
+def write_header(path='model_params.h', model_path='quantized_model.tflite', scaler_path='scaler.json',
+                 classes=None):
+    model = TFLiteModel.load(model_path)
+    if classes is None:
+        # train_model.py encodes the labels as sorted categories
+        classes = sorted(VALID_SCENARIOS)
+    if len(classes) != model.output.shape[-1]:
+        raise ValueError(f"{len(classes)} class names for a model with {model.output.shape[-1]} outputs")
+    text = render_header(model, load_scaler(scaler_path), classes, model_path, scaler_path)
+    write_if_changed(path, text)
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate model_params.h for the firmware')
+    parser.add_argument('--model', default='quantized_model.tflite')
+    parser.add_argument('--scaler', default='scaler.json')
+    parser.add_argument('--out', default='model_params.h')
+    args = parser.parse_args(argv)
+    write_header(args.out, args.model, args.scaler)
+    print(f"Wrote {args.out}")
+
+
+if __name__ == '__main__':
+    main()
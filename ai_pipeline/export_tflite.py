@@ -1,15 +1,47 @@
-import tensorflow as tf
+import argparse
 
-interpreter = tf.lite.Interpreter(model_path="quantized_model.tflite")
-interpreter.allocate_tensors()
+import numpy as np
 
-input_details = interpreter.get_input_details()[0]      # just first output sensor
-output_details = interpreter.get_output_details()[0]    # just first output tensor
+from tflite_reader import TFLiteModel
 
-print("Input quantization:", input_details['quantization'])    # tuple (scale, zero_point)
-print("Output quantization:", output_details['quantization'])
+# Prints the input/output quantization of a .tflite model. The parameters are
+# read from the flatbuffer by tflite_reader.py, the same values the TFLite
+# interpreter reports in get_input_details()['quantization'], so inspecting a
+# model does not start TensorFlow.
 
-print("Input scale:", input_details['quantization'])
-print("Input zero point:", input_details['quantization'][1])
-print("Output scale:", output_details['quantization'][0])
-print("Output zero point:", output_details['quantization'][1])
+
+def quantization(tensor):
+    """(scale, zero_point) of a tensor, (0.0, 0) when it is not quantized, like the interpreter's tuple"""
+    if not len(tensor.scale):
+        return 0.0, 0
+    return float(tensor.scale[0]), int(tensor.zero_point[0])
+
+
+def inspect_model(path='quantized_model.tflite'):
+    """Shape, dtype and quantization of the first input and output tensor"""
+    model = TFLiteModel.load(path)
+    return {name: {'name': t.name, 'shape': list(t.shape), 'dtype': np.dtype(t.dtype).name,
+                   'quantization': quantization(t)}
+            for name, t in (('input', model.input), ('output', model.output))}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print the I/O quantization of a .tflite model (no TensorFlow)')
+    parser.add_argument('model', nargs='?', default='quantized_model.tflite')
+    args = parser.parse_args(argv)
+
+    info = inspect_model(args.model)
+    inp, out = info['input'], info['output']
+    print(f"Input: {inp['name']} {inp['shape']} {inp['dtype']}")
+    print(f"Output: {out['name']} {out['shape']} {out['dtype']}")
+    print("Input quantization:", inp['quantization'])    # tuple (scale, zero_point)
+    print("Output quantization:", out['quantization'])
+
+    print("Input scale:", inp['quantization'][0])
+    print("Input zero point:", inp['quantization'][1])
+    print("Output scale:", out['quantization'][0])
+    print("Output zero point:", out['quantization'][1])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import json
+
+import numpy as np
+
+# Model input order, as normalized by train_model.py
+FEATURE_COLUMNS = ['ldr_v', 'temp_c', 'hum_pct', 'tvoc_ppb', 'eco2_ppm']
+VALID_SCENARIOS = ['normal', 'high_temp', 'high_humidity', 'low_light', 'anomaly']
+
+
+def load_scaler(path='scaler.json'):
+    with open(path) as f:
+        return json.load(f)
+
+
+def clean_scenarios(df):
+    """Replace empty/redundant scenario labels and keep the known scenarios"""
+    df = df.copy()
+    df['scenario'] = df['scenario'].fillna('normal')
+    df.loc[df['scenario'] == '', 'scenario'] = 'normal'
+    return df[df['scenario'].isin(VALID_SCENARIOS)]
+
+
+def normalize_features(df, scaler):
+    """Min/max for light and air quality, z-score for temperature and humidity -> (n, 5) float array"""
+    return np.stack([
+        (df['ldr_v'] - scaler['ldr_min']) / (scaler['ldr_max'] - scaler['ldr_min'] + 1e-8),
+        (df['temp_c'] - scaler['temp_mean']) / (scaler['temp_std'] + 1e-8),
+        (df['hum_pct'] - scaler['hum_mean']) / (scaler['hum_std'] + 1e-8),
+        (df['tvoc_ppb'] - scaler['tvoc_min']) / (scaler['tvoc_max'] - scaler['tvoc_min'] + 1e-8),
+        (df['eco2_ppm'] - scaler['eco2_min']) / (scaler['eco2_max'] - scaler['eco2_min'] + 1e-8)
+    ], axis=1)
+
+
+def encode_labels(scenarios):
+    """Class codes as trained: categories of the present labels in sorted order"""
+    import pandas as pd
+    categories = pd.Series(scenarios).astype('category')
+    return categories.cat.codes.to_numpy(), list(categories.cat.categories)
+
+
+def load_dataset(csv_path='data/dataset_real_clean.csv', scaler_path='scaler.json'):
+    """Cleaned frame, normalized x, label codes y and class names, exactly as train_model.py builds them"""
+    import pandas as pd
+    df = clean_scenarios(pd.read_csv(csv_path))
+    x = normalize_features(df, load_scaler(scaler_path))
+    y, classes = encode_labels(df['scenario'])
+    return df, x, y, classes
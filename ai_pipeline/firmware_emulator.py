@@ -0,0 +1,241 @@
+import argparse
+import itertools
+import time
+
+import numpy as np
+
+import telemetry
+from export_model_params import fused_input_coefficients, fused_quantize, softmax_exp_table
+from features import load_scaler
+from int8_reference import ReferenceMLP
+from model_cost import estimate
+from package_model import model_id
+from pty_serial import FakeSerialPort
+from sensor_simulator import SCENARIO_BASE_VALUES, SENSOR_COLUMNS, ScenarioStream
+from tflite_reader import TFLiteModel
+
+# Host stand-in for the ESP32-S3 running firmware/src/main.cpp: sensor frames
+# from sensor_simulator go through sensor_driver.cpp's reads, the fused
+# quantize of model_params.h, the int8 model (int8_reference) and the table
+# softmax of ai_predict_proba(), and come out as the firmware's serial bytes
+# (Serial.println ends lines with \r\n, Serial.printf lines with \n) on a pty.
+# The device clock advances one loop() per line whatever the host rate, so a
+# 24-hour soak replays in minutes.
+
+N_OUTPUTS = 3                   # main.cpp: probabilities of the first 3 classes
+LOOP_DELAY_MS = 1000            # delay(1000) at the end of loop()
+SENSOR_READ_MS = 6              # analogRead + DHT22 read, from the millis steps of data/ai_log.csv
+BOOT_MS = 2230                  # delay(2000) in setup() + sensor/model init
+HEAP_LOG_INTERVAL_MS = 300000   # "Free heap" line every 5 min
+MILLIS_WRAP = 1 << 32           # millis() is a 32-bit unsigned long: it wraps after 49.7 days
+FREE_HEAP = 290000
+ADC_MAX = 4095
+ADC_VREF = 3.3
+SGP30_STUB = (60.0, 450.0)      # sensor_driver.cpp: SGP30 reads are commented out
+BOOT_TEXT = ("Beginning setup...\r\n"
+             "Init DHT...\r\n"
+             "Init I2C...\r\n"
+             "Init done.\r\n"
+             "Model initialized OK (id {model_id:08x}, {size} bytes)\n"  # printf, not println
+             "Setup done!\r\n")
+CHUNK_LOOPS = 4096
+
+
+class FirmwareEmulator:
+    """
+    Produces the serial output of main.cpp one loop() at a time, in chunks.
+
+    Scenarios cycle for scenario_sec device seconds each. dht_fail_rate is the
+    chance a loop's DHT22 read fails (temp/hum reported as -1); with
+    sgp30=False tvoc/eco2 are the stub values of sensor_driver.cpp.
+    start_millis sets the uptime the first loop starts at, e.g. just before
+    the millis() wrap; free heap falls by heap_leak_per_hour of uptime.
+    """
+
+    def __init__(self, model_path='quantized_model.tflite', scaler_path='scaler.json', scenarios=None,
+                 scenario_sec=300, seed=0, sgp30=False, dht_fail_rate=0.001, free_heap=FREE_HEAP,
+                 heap_leak_per_hour=0, latency_us=None, latency_jitter_us=10.0, debug=True, binary=False,
+                 start_millis=BOOT_MS):
+        with open(model_path, 'rb') as f:
+            flatbuffer = f.read()
+        model = TFLiteModel(flatbuffer)
+        self.reference = ReferenceMLP(model)
+        self.center, self.gain = fused_input_coefficients(load_scaler(scaler_path), self.reference.input_scale)
+        self.softmax_table = softmax_exp_table(self.reference.output_scale)
+        self.boot_text = BOOT_TEXT.format(model_id=model_id(flatbuffer), size=len(flatbuffer))
+        self.scenarios = list(scenarios or SCENARIO_BASE_VALUES)
+        self.scenario_sec = scenario_sec
+        self.rng = np.random.default_rng(seed)
+        self.sgp30 = sgp30
+        self.dht_fail_rate = dht_fail_rate
+        self.free_heap = free_heap
+        self.heap_leak_per_ms = heap_leak_per_hour / 3.6e6
+        self.latency_us = estimate(model)['latency_us'] if latency_us is None else latency_us
+        self.latency_jitter_us = latency_jitter_us
+        self.debug = debug
+        self.binary = binary
+        self.millis = float(start_millis)
+        self.last_mem_log = 0
+        self.loops = 0
+        self._streams = self._scenario_streams()
+        self._stream = next(self._streams)
+
+    def _scenario_streams(self):
+        for scenario in itertools.cycle(self.scenarios):
+            yield ScenarioStream(scenario, self.scenario_sec, sample_rate=1, rng=self.rng.spawn(1)[0],
+                                 start_time=np.datetime64(0, 's'))
+
+    def _sensor_frames(self, n):
+        parts = []
+        while n:
+            if self._stream.done:
+                self._stream = next(self._streams)
+            chunk = self._stream.next_chunk(n)
+            parts.append(np.column_stack([chunk[c] for c in SENSOR_COLUMNS]))
+            n -= len(parts[-1])
+        return np.concatenate(parts)
+
+    def read_sensors(self, n):
+        """What read_sensors() hands to loop(): float32 (n, 5) and the DHT failure mask"""
+        frames = self._sensor_frames(n)
+        adc = np.clip(np.rint(frames[:, 0] / ADC_VREF * ADC_MAX), 0, ADC_MAX)
+        values = np.empty((n, 5), dtype=np.float32)
+        values[:, 0] = (adc.astype(np.float32) / np.float32(ADC_MAX)) * np.float32(ADC_VREF)
+        values[:, 1:3] = np.round(frames[:, 1:3], 1)    # DHT22: 0.1 resolution
+        failed = self.rng.random(n) < self.dht_fail_rate
+        values[failed, 1:3] = -1
+        values[:, 3:5] = frames[:, 3:5] if self.sgp30 else SGP30_STUB
+        values[:, 3] = np.where(values[:, 3] < 0, 60.0, values[:, 3])
+        values[:, 4] = np.where(values[:, 4] < 0, 450.0, values[:, 4])
+        return values, failed
+
+    def infer(self, values):
+        """(int8 inputs, int8 logits, float32 probabilities) as ai_predict_proba() computes them"""
+        q_in = fused_quantize(values, self.center, self.gain, self.reference.input_zero_point)
+        logits = self.reference.run(q_in)
+        first = logits[:, :N_OUTPUTS].astype(np.int32)
+        exp = self.softmax_table[first.max(axis=1, keepdims=True) - first]
+        total = np.zeros(len(exp), dtype=np.float32)
+        for i in range(N_OUTPUTS):        # float32 sum in the firmware's order
+            total += exp[:, i]
+        return q_in, logits, exp / total[:, None]
+
+    def chunk(self, n=CHUNK_LOOPS):
+        """Serial bytes of the next n loop() iterations, one bytes object per loop"""
+        values, failed = self.read_sensors(n)
+        q_in, logits, proba = self.infer(values)
+        latency = np.maximum(self.rng.normal(self.latency_us, self.latency_jitter_us, n), 1).astype(np.int64)
+
+        # Device clock: millis() is printed right after the inference
+        step = SENSOR_READ_MS + latency / 1000.0
+        millis = self.millis + np.cumsum(step + LOOP_DELAY_MS) - LOOP_DELAY_MS
+        self.millis = millis[-1] + LOOP_DELAY_MS
+        uptime = millis.astype(np.int64)
+        heap = (self.free_heap - self.heap_leak_per_ms * uptime).astype(np.int64)
+        millis = uptime % MILLIS_WRAP
+        self.loops += n
+        if self.binary:
+            return self._frames(values, proba, latency, millis, heap)
+
+        pct = proba * np.float32(100)
+        out = []
+        scale, zp = np.float32(self.reference.output_scale), self.reference.output_zero_point
+        for i, (v, p, m, u) in enumerate(zip(values.tolist(), pct.tolist(), millis.tolist(), uptime.tolist())):
+            lines = []
+            if failed[i]:
+                lines.append("Failed to read from DHT sensor!\r\n")
+            if self.debug:
+                lines.append("Input int8: " + ''.join(f"{x} " for x in q_in[i].tolist()) + "\r\n")
+                deq = (logits[i].astype(np.float32) - zp) * scale
+                lines.append("Output logits: " + ''.join(f"{x:.5f} " for x in deq.tolist()) + "\r\n")
+            lines.append(f"{m},{v[0]:.2f},{v[1]:.2f},{v[2]:.2f},{v[3]:.2f},{v[4]:.2f},"
+                         f"{p[0]:.0f},{p[1]:.0f},{p[2]:.0f},AI_latency_us:{latency[i]}\n")
+            if u - self.last_mem_log > HEAP_LOG_INTERVAL_MS:
+                lines.append(f"Free heap: {heap[i]} bytes\n")
+                self.last_mem_log = u
+            out.append(''.join(lines).encode())
+        return out
+
+    def _frames(self, values, proba, latency, millis, heap):
+        records = np.zeros(len(values), dtype=telemetry.RECORD_DTYPE)
+        records['millis'] = millis
+        for j, name in enumerate(('ldr_v', 'temp_c', 'hum_pct', 'tvoc_ppb', 'eco2_ppm')):
+            records[name] = values[:, j]
+        records['prob_pct'] = np.floor(proba * np.float32(100) + np.float32(0.5))    # lroundf
+        records['latency_us'] = latency
+        records['free_heap'] = heap
+        data = telemetry.encode_records(records)
+        return [data[i:i + telemetry.FRAME_LEN] for i in range(0, len(data), telemetry.FRAME_LEN)]
+
+
+def stream(emulator, write, loops, rate=0.0):
+    """
+    write() the boot text, then `loops` loop() outputs at `rate` loops per second
+    of host time (0: as fast as possible). Returns (loops, bytes, seconds).
+    """
+    boot = emulator.boot_text.encode()
+    write(boot)
+    sent, n_bytes = 0, len(boot)
+    t0 = time.perf_counter()
+    # Pace in ~10 ms batches so kHz rates do not cost one syscall per line
+    batch = max(1, int(rate / 100)) if rate else CHUNK_LOOPS
+    while sent < loops:
+        out = emulator.chunk(min(CHUNK_LOOPS, loops - sent))
+        for start in range(0, len(out), batch):
+            block = b''.join(out[start:start + batch])
+            if rate:
+                delay = t0 + sent / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            write(block)
+            n_bytes += len(block)
+            sent += len(out[start:start + batch])
+    return sent, n_bytes, time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Emulate the ULLAI firmware serial output on a pseudo-terminal')
+    parser.add_argument('--link', default='/tmp/ttyULLAI', help='Symlink to the pty (open it like /dev/ttyACM0)')
+    parser.add_argument('--rate', type=float, default=1.0, help='loop() iterations per host second (0: unpaced)')
+    parser.add_argument('--device-hours', type=float, default=24.0, help='Device time to emulate')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIO_BASE_VALUES))
+    parser.add_argument('--scenario-sec', type=int, default=300, help='Device seconds per scenario (>= 300)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--sgp30', action='store_true', help='Use simulated TVOC/eCO2 instead of the 60/450 stub')
+    parser.add_argument('--dht-fail-rate', type=float, default=0.001)
+    parser.add_argument('--heap-leak', type=float, default=0.0, help='Free heap lost per device hour (bytes)')
+    parser.add_argument('--latency-us', type=float, help='Mean AI latency (default: model_cost.py estimate)')
+    parser.add_argument('--no-debug', action='store_false', dest='debug',
+                        help='Firmware built with ULLAI_INFERENCE_DEBUG=0 (no "Input int8"/"Output logits" lines)')
+    parser.add_argument('--binary', action='store_true', help='Firmware built with ULLAI_BINARY_TELEMETRY=1')
+    parser.add_argument('--model', default='quantized_model.tflite')
+    parser.add_argument('--scaler', default='scaler.json')
+    parser.add_argument('--capture', metavar='FILE',
+                        help='Write the raw serial bytes to FILE, unpaced, instead of a pty (capture_import.py input)')
+    args = parser.parse_args(argv)
+    if args.scenario_sec < 300:
+        parser.error('--scenario-sec must be at least 300 (sensor_simulator anomaly plan)')
+
+    emulator = FirmwareEmulator(args.model, args.scaler, args.scenarios, args.scenario_sec, args.seed, args.sgp30,
+                                args.dht_fail_rate, heap_leak_per_hour=args.heap_leak, latency_us=args.latency_us,
+                                debug=args.debug, binary=args.binary)
+    loops = int(args.device_hours * 3.6e6 / (LOOP_DELAY_MS + SENSOR_READ_MS + emulator.latency_us / 1000))
+    if args.capture:
+        with open(args.capture, 'wb') as f:
+            sent, n_bytes, elapsed = stream(emulator, f.write, loops)
+        print(f"{sent} loops ({args.device_hours:g} device hours), {n_bytes / 1e6:.1f} MB to {args.capture} "
+              f"in {elapsed:.1f} s")
+        return
+    with FakeSerialPort(link=args.link) as port:
+        print(f"Emulating {loops} loops ({args.device_hours:g} device hours) on {port.port} "
+              f"at {args.rate or 'max'} loops/s")
+        try:
+            sent, n_bytes, elapsed = stream(emulator, port.write, loops, args.rate)
+        except KeyboardInterrupt:
+            return
+        print(f"{sent} loops, {n_bytes / 1e6:.1f} MB in {elapsed:.1f} s")
+        time.sleep(1.0)     # let the reader drain the pty before it goes away
+
+
+if __name__ == '__main__':
+    main()
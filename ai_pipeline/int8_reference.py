@@ -0,0 +1,183 @@
+import math
+
+import numpy as np
+
+from tflite_reader import TFLiteModel
+
+# Integer-only reference of the ULLAI Dense MLP, bit-exact with the TFLite Micro
+# reference FULLY_CONNECTED kernel (tensorflow/lite/kernels/internal/reference/
+# integer_ops/fully_connected.h and common.h). NumPy only: no TensorFlow import.
+# CHUNK_ROWS keeps each layer's intermediates cache-sized.
+#
+# common.h has two requantization variants: the gemmlowp double rounding used by
+# the TFLM bundled with EloquentTinyML (the default here), and the single rounding
+# of builds with TFLITE_SINGLE_ROUNDING, such as recent tensorflow pip wheels.
+ROUNDING_MODES = ('double', 'single')
+FIRMWARE_ROUNDING = 'double'
+
+CHUNK_ROWS = 4096
+
+
+def quantize_multiplier(real_multiplier):
+    """QuantizeMultiplier(): real multiplier -> (Q31 multiplier, shift), as computed in TFLite"""
+    if real_multiplier == 0.0:
+        return 0, 0
+    q, shift = math.frexp(real_multiplier)
+    q_fixed = int(math.floor(abs(q) * (1 << 31) + 0.5)) * (1 if q >= 0 else -1)  # TfLiteRound
+    if q_fixed == (1 << 31):
+        q_fixed //= 2
+        shift += 1
+    if shift < -31:
+        shift, q_fixed = 0, 0
+    return q_fixed, shift
+
+
+def multiply_by_quantized_multiplier(x, multiplier, shift, rounding=FIRMWARE_ROUNDING):
+    """
+    MultiplyByQuantizedMultiplier() on int64 arrays; multiplier/shift may be
+    per-channel. 'double' is gemmlowp's SaturatingRoundingDoublingHighMul then
+    RoundingDivideByPOT, both round-half-away-from-zero, computed on magnitudes.
+    QuantizeMultiplier() never yields INT32_MIN, so the saturating case is unreachable.
+    """
+    multiplier = np.asarray(multiplier, dtype=np.int64)
+    shift = np.asarray(shift, dtype=np.int64)
+    if rounding == 'single':
+        total_shift = 31 - shift
+        return (x * multiplier + (np.int64(1) << (total_shift - 1))) >> total_shift
+    right = np.maximum(-shift, 0)
+    ab = (x << np.maximum(shift, 0)) * multiplier
+    negative = ab < 0
+    mag = np.abs(ab)
+    mag += (1 << 30) - negative.astype(np.int64)  # high mul: nudge 2**30, or 2**30 - 1 below zero
+    mag >>= 31
+    mag += (np.int64(1) << right) >> 1
+    mag >>= right
+    return np.where(negative, -mag, mag)
+
+
+class QuantizedDense:
+    """One int8 FULLY_CONNECTED layer with its precomputed requantization parameters"""
+
+    def __init__(self, model, op, rounding=FIRMWARE_ROUNDING):
+        inp, weights, bias = (model.tensors[i] if i >= 0 else None for i in op.inputs)
+        out = model.tensors[op.outputs[0]]
+        self.rounding = rounding
+        self.weights = weights.data.astype(np.int64)  # (units, inputs)
+        self.bias = bias.data.astype(np.int64) if bias is not None else np.zeros(len(self.weights), np.int64)
+        self.input_offset = -int(inp.zero_point[0])
+        self.output_offset = int(out.zero_point[0])
+        # Per-tensor or per-channel weight scales
+        filter_scale = np.broadcast_to(weights.scale.astype(np.float64), (len(self.weights),))
+        real = float(inp.scale[0]) * filter_scale / float(out.scale[0])
+        params = [quantize_multiplier(float(m)) for m in real]
+        self.multiplier = np.array([p[0] for p in params], dtype=np.int64)
+        self.shift = np.array([p[1] for p in params], dtype=np.int64)
+        self.act_min, self.act_max = -128, 127
+        if op.activation == 'RELU':
+            self.act_min = max(self.act_min, self.output_offset)
+        elif op.activation == 'RELU6':
+            self.act_min = max(self.act_min, self.output_offset)
+            self.act_max = min(self.act_max, self.output_offset + int(round(6.0 / float(out.scale[0]))))
+        # Every intermediate is an integer. While |acc * multiplier| stays below
+        # 2**52 float64 holds them all exactly, so BLAS and float rounding give
+        # the same bits as the int64 path at a fraction of the cost.
+        left = np.maximum(self.shift, 0)
+        acc_bound = 255 * np.abs(self.weights).sum(axis=1) + np.abs(self.bias)
+        self._exact_f64 = bool(((acc_bound << left) * self.multiplier < (1 << 52)).all()
+                               and (31 - self.shift).max() < 52)
+        self._wt_f64 = self.weights.T.astype(np.float64)
+        self._bias_f64 = self.bias.astype(np.float64)
+        if rounding == 'single':
+            self._scale_f64 = self.multiplier * np.exp2(self.shift - 31.0)
+        else:
+            self._scale_f64 = self.multiplier * np.exp2(left - 31.0)
+            self._pot_f64 = np.exp2(-np.maximum(-self.shift, 0).astype(np.float64))
+
+    def __call__(self, x):
+        if not self._exact_f64:
+            acc = (x.astype(np.int64) + self.input_offset) @ self.weights.T + self.bias
+            acc = multiply_by_quantized_multiplier(acc, self.multiplier, self.shift, self.rounding)
+            return np.clip(acc + self.output_offset, self.act_min, self.act_max).astype(np.int8)
+        acc = (x.astype(np.float64) + self.input_offset) @ self._wt_f64
+        acc += self._bias_f64
+        # Both roundings of the high multiply are floor(v + 0.5)
+        acc *= self._scale_f64
+        acc += 0.5
+        np.floor(acc, out=acc)
+        if self.rounding == 'double':
+            # RoundingDivideByPOT: round half away from zero
+            acc *= self._pot_f64
+            acc += np.copysign(0.5, acc)
+            np.trunc(acc, out=acc)
+        acc += self.output_offset
+        np.clip(acc, self.act_min, self.act_max, out=acc)
+        return acc.astype(np.int8)
+
+
+class FloatDense:
+    """float32 FULLY_CONNECTED, for the float export of the same network"""
+
+    def __init__(self, model, op, rounding=None):
+        _, weights, bias = (model.tensors[i] if i >= 0 else None for i in op.inputs)
+        self.weights_t = weights.data.T.astype(np.float32)
+        self.bias = bias.data.astype(np.float32) if bias is not None else 0.0
+        self.activation = op.activation
+
+    def __call__(self, x):
+        y = x.astype(np.float32) @ self.weights_t + self.bias
+        if self.activation == 'RELU':
+            y = np.maximum(y, 0)
+        elif self.activation == 'RELU6':
+            y = np.clip(y, 0, 6)
+        return y
+
+
+class ReferenceMLP:
+    """
+    Runs a chain of FULLY_CONNECTED ops read from a .tflite file over many rows
+    at once. For int8 models run() does exact integer arithmetic and matches
+    TFLite Micro bit for bit (FIRMWARE_ROUNDING; 'single' matches TFLITE_SINGLE_ROUNDING builds);
+    predict() adds input quantization and output dequantization.
+    """
+
+    def __init__(self, model, rounding=FIRMWARE_ROUNDING):
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"rounding must be one of {ROUNDING_MODES}")
+        if not isinstance(model, TFLiteModel):
+            model = TFLiteModel.load(model) if isinstance(model, str) else TFLiteModel(model)
+        self.model = model
+        unsupported = {op.op for op in model.operators} - {'FULLY_CONNECTED'}
+        if unsupported:
+            raise ValueError(f"Unsupported ops for the reference MLP: {sorted(unsupported)}")
+        self.quantized = model.input.dtype == np.int8
+        layer = QuantizedDense if self.quantized else FloatDense
+        self.layers = [layer(model, op, rounding) for op in model.operators]
+        if self.quantized:
+            self.input_scale = float(model.input.scale[0])
+            self.input_zero_point = int(model.input.zero_point[0])
+            self.output_scale = float(model.output.scale[0])
+            self.output_zero_point = int(model.output.zero_point[0])
+
+    def run(self, x):
+        """Raw model I/O: int8 in -> int8 out (float in -> float out for float models)"""
+        x = np.asarray(x)
+        out = []
+        for start in range(0, len(x), CHUNK_ROWS):
+            y = x[start:start + CHUNK_ROWS]
+            for layer in self.layers:
+                y = layer(y)
+            out.append(y)
+        return np.concatenate(out) if out else np.zeros((0, self.model.output.shape[-1]))
+
+    def quantize(self, x):
+        """Normalized float features -> int8 model input (round half away from zero, like TFLite)"""
+        q = np.asarray(x, dtype=np.float64) / self.input_scale
+        q = np.sign(q) * np.floor(np.abs(q) + 0.5) + self.input_zero_point
+        return np.clip(q, -128, 127).astype(np.int8)
+
+    def predict(self, x):
+        """Normalized float features -> float logits"""
+        if not self.quantized:
+            return self.run(x)
+        y = self.run(self.quantize(x))
+        return (y.astype(np.float32) - self.output_zero_point) * np.float32(self.output_scale)
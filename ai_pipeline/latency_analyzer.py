@@ -0,0 +1,295 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+# README benchmark targets
+INFERENCE_BUDGET_US = 1000     # AI inference < 1 ms
+SENSOR_TO_AI_BUDGET_US = 5000  # sensor -> AI < 5 ms
+PERCENTILES = (50, 90, 99, 99.9)
+LOG_FIELDS = 10  # serial_ingest.LOG_HEADER: millis first, AI_latency_us last
+
+SUB_BUCKET_BITS = 7  # 128 linear sub-buckets per power of two: < 1% relative error
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS // 2
+MAX_VALUE_BITS = 32  # latencies up to ~71 minutes in µs
+N_BUCKETS = SUB_BUCKETS + (MAX_VALUE_BITS - SUB_BUCKET_BITS) * HALF_BUCKETS
+
+
+def bucket_index(values):
+    """HDR-style log-linear bucket of each non-negative integer value"""
+    values = np.minimum(np.asarray(values, dtype=np.int64), (1 << MAX_VALUE_BITS) - 1)
+    bits = np.frexp(values.astype(np.float64))[1]  # bit length
+    shift = np.maximum(bits - SUB_BUCKET_BITS, 0)
+    return np.where(
+        shift == 0, values,
+        SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + (values >> shift) - HALF_BUCKETS
+    )
+
+
+def bucket_value(index):
+    """Midpoint of the value range covered by each bucket index"""
+    index = np.asarray(index, dtype=np.int64)
+    shift = np.where(index < SUB_BUCKETS, 0, (index - SUB_BUCKETS) // HALF_BUCKETS + 1)
+    mantissa = np.where(index < SUB_BUCKETS, index, (index - SUB_BUCKETS) % HALF_BUCKETS + HALF_BUCKETS)
+    return (mantissa << shift) + ((1 << shift) >> 1)
+
+
+class LatencyHistogram:
+    """Fixed-size, mergeable latency histogram (µs); memory does not grow with samples"""
+
+    def __init__(self):
+        self.counts = np.zeros(N_BUCKETS, dtype=np.int64)
+        self.total = 0
+        self.max = 0
+        self.min = None
+        self.sum = 0
+
+    def record(self, values):
+        values = np.asarray(values, dtype=np.int64)
+        if not len(values):
+            return
+        self.counts += np.bincount(bucket_index(values), minlength=N_BUCKETS)
+        self.total += len(values)
+        self.sum += int(values.sum())
+        self.max = max(self.max, int(values.max()))
+        low = int(values.min())
+        self.min = low if self.min is None else min(self.min, low)
+
+    def merge(self, other):
+        self.counts += other.counts
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+
+    def percentile(self, q):
+        if not self.total:
+            return None
+        rank = max(1, int(np.ceil(q / 100 * self.total)))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(int(bucket_value(index)), self.max)
+
+    def summary(self):
+        if not self.total:
+            return {'count': 0}
+        out = {'count': self.total, 'mean': round(self.sum / self.total, 1), 'min': self.min}
+        for q in PERCENTILES:
+            out[f'p{q:g}'.replace('.', '')] = self.percentile(q)
+        out['max'] = self.max
+        return out
+
+    def to_compact(self):
+        """Non-empty buckets only, for persisting next to the summary"""
+        nz = np.flatnonzero(self.counts)
+        return {'index': nz.tolist(), 'count': self.counts[nz].tolist(),
+                'max': self.max, 'min': self.min, 'sum': self.sum}
+
+    @classmethod
+    def from_compact(cls, data):
+        h = cls()
+        h.counts[data['index']] = data['count']
+        h.total = int(h.counts.sum())
+        h.max, h.min, h.sum = data['max'], data['min'], data['sum']
+        return h
+
+
+class LatencyAnalyzer:
+    """
+    Streaming analysis of AI_latency_us. Feed (millis, latency) batches from live
+    ingestion or archived logs; only the current window's histogram and one
+    summary row per finished window are kept.
+
+    A board reset (millis going backwards) starts a new boot; the first
+    `warmup_samples` inferences of every boot (the cold-start outlier in
+    ai_log.csv) go to a separate warm-up histogram and are kept out of the
+    steady-state windows. Log rows that cannot be read are only counted in
+    `skipped_rows`.
+    """
+
+    def __init__(self, window_sec=60, warmup_samples=1, budget_us=INFERENCE_BUDGET_US,
+                 total_budget_us=SENSOR_TO_AI_BUDGET_US, budget_percentile=99):
+        self.window_ms = int(window_sec * 1000)
+        self.warmup_samples = warmup_samples
+        self.budget_us = budget_us
+        self.total_budget_us = total_budget_us
+        self.budget_percentile = budget_percentile
+        self.warmup = LatencyHistogram()
+        self.steady = LatencyHistogram()
+        self.windows = []
+        self.skipped_rows = 0
+        self.boot = 0
+        self.boot_samples = 0
+        self.last_millis = None
+        self._window_key = None
+        self._window = None
+        self._window_span = None
+
+    def update(self, millis, latency):
+        millis = np.asarray(millis, dtype=np.int64)
+        latency = np.asarray(latency, dtype=np.int64)
+        if not len(millis):
+            return
+        # Boot id per sample: millis going backwards means the board restarted
+        previous = np.concatenate(([self.last_millis if self.last_millis is not None else millis[0]], millis[:-1]))
+        resets = np.cumsum(millis < previous)
+        boot = self.boot + resets
+        # Position of every sample within its boot, to split off the warm-up
+        first_of_boot = np.flatnonzero(np.diff(resets, prepend=0) > 0)
+        position = np.arange(len(millis)) + self.boot_samples
+        for start in first_of_boot:
+            position[start:] = np.arange(len(millis) - start)
+        warm = position < self.warmup_samples
+        self.warmup.record(latency[warm])
+
+        steady = ~warm
+        boot, millis_s, latency_s = boot[steady], millis[steady], latency[steady]
+        self.steady.record(latency_s)
+        window = millis_s // self.window_ms
+        # Consecutive runs of the same (boot, window) key
+        change = np.flatnonzero((np.diff(boot) != 0) | (np.diff(window) != 0)) + 1
+        for lo, hi in zip(np.concatenate(([0], change)), np.concatenate((change, [len(boot)]))):
+            if lo == hi:
+                continue
+            key = (int(boot[lo]), int(window[lo]))
+            if key != self._window_key:
+                self._close_window()
+                self._window_key, self._window = key, LatencyHistogram()
+                self._window_span = [int(millis_s[lo]), int(millis_s[lo])]
+            self._window.record(latency_s[lo:hi])
+            self._window_span[1] = int(millis_s[hi - 1])
+
+        self.boot += int(resets[-1])
+        self.boot_samples = int(position[-1]) + 1
+        self.last_millis = int(millis[-1])
+
+    def _close_window(self):
+        if self._window is None:
+            return
+        row = {'boot': self._window_key[0], 'start_millis': self._window_span[0],
+               'end_millis': self._window_span[1]}
+        row.update(self._window.summary())
+        tail = self._window.percentile(self.budget_percentile)
+        violations = []
+        if tail > self.budget_us:
+            violations.append(f'inference p{self.budget_percentile:g} {tail} us > {self.budget_us} us')
+        if self._window.max > self.total_budget_us:
+            violations.append(f'max {self._window.max} us > sensor-to-AI {self.total_budget_us} us')
+        row['violations'] = violations
+        self.windows.append(row)
+        self._window = self._window_key = None
+
+    def finish(self):
+        self._close_window()
+
+    def report(self):
+        return {
+            'window_sec': self.window_ms / 1000,
+            'budgets_us': {'inference': self.budget_us, 'sensor_to_ai': self.total_budget_us,
+                           'percentile': self.budget_percentile},
+            'boots': self.boot + 1,
+            'skipped_rows': self.skipped_rows,
+            'warmup': self.warmup.summary(),
+            'steady': self.steady.summary(),
+            'windows_over_budget': sum(bool(w['violations']) for w in self.windows),
+            'windows': self.windows,
+            'steady_histogram': self.steady.to_compact(),
+        }
+
+
+def analyze_csv(path, analyzer, chunksize=100_000):
+    """Feed an archived log (log_serial_to_csv.py layout) through the analyzer in chunks"""
+    import pandas as pd
+    for chunk in pd.read_csv(path, usecols=['millis', 'AI_latency_us'], chunksize=chunksize):
+        chunk = chunk.apply(pd.to_numeric, errors='coerce')
+        valid = chunk.notna().all(axis=1).to_numpy()
+        analyzer.skipped_rows += int((~valid).sum())
+        analyzer.update(chunk['millis'].to_numpy()[valid], chunk['AI_latency_us'].to_numpy()[valid])
+
+
+def parse_log_lines(lines):
+    """(millis, latency, skipped) of raw CSV log lines; short, long or non-numeric rows are skipped"""
+    millis, latency = [], []
+    for line in lines:
+        fields = line.split(',')
+        if len(fields) != LOG_FIELDS:
+            continue
+        try:
+            m, lat = int(fields[0]), int(fields[-1])
+        except ValueError:
+            continue
+        millis.append(m)
+        latency.append(lat)
+    return millis, latency, len(lines) - len(millis)
+
+
+def follow_csv(path, analyzer, poll_interval=1.0, report_every=60.0):
+    """Tail a log the ingestion service is still writing; Ctrl+C prints the final report"""
+    last_report = time.monotonic()
+    with open(path) as f:
+        f.readline()  # header
+        pending = ''
+        try:
+            while True:
+                pending += f.read()
+                cut = pending.rfind('\n') + 1
+                if cut:
+                    millis, latency, skipped = parse_log_lines([line for line in pending[:cut].splitlines() if line])
+                    pending = pending[cut:]
+                    analyzer.skipped_rows += skipped
+                    analyzer.update(millis, latency)
+                if time.monotonic() - last_report >= report_every:
+                    print_summary(analyzer.report(), last_windows=1)
+                    last_report = time.monotonic()
+                time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            pass
+
+
+def print_summary(report, last_windows=None):
+    cols = ['count', 'p50', 'p90', 'p99', 'p999', 'max']
+    print(f"{'':>10} " + ' '.join(f'{c:>8}' for c in cols))
+    for name in ('warmup', 'steady'):
+        s = report[name]
+        print(f"{name:>10} " + ' '.join(f"{s.get(c, '-'):>8}" for c in cols))
+    windows = report['windows'] if last_windows is None else report['windows'][-last_windows:]
+    over = [w for w in windows if w['violations']]
+    print(f"{report['windows_over_budget']} of {len(report['windows'])} windows over budget")
+    if report['skipped_rows']:
+        print(f"{report['skipped_rows']} unreadable log rows skipped")
+    for w in over:
+        print(f"  boot {w['boot']} millis {w['start_millis']}-{w['end_millis']}: {'; '.join(w['violations'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Latency percentiles and budget check for AI_latency_us logs')
+    parser.add_argument('log', nargs='?', default='data/ai_log.csv')
+    parser.add_argument('--window', type=float, default=60, help='Window length in seconds')
+    parser.add_argument('--warmup-samples', type=int, default=1, help='Inferences per boot treated as warm-up')
+    parser.add_argument('--budget-us', type=int, default=INFERENCE_BUDGET_US)
+    parser.add_argument('--total-budget-us', type=int, default=SENSOR_TO_AI_BUDGET_US)
+    parser.add_argument('--percentile', type=float, default=99, help='Window percentile checked against --budget-us')
+    parser.add_argument('--follow', action='store_true', help='Keep reading a log that is still being written')
+    parser.add_argument('--json', help='Write the compact summary to this file')
+    args = parser.parse_args(argv)
+
+    analyzer = LatencyAnalyzer(args.window, args.warmup_samples, args.budget_us,
+                               args.total_budget_us, args.percentile)
+    if args.follow:
+        follow_csv(args.log, analyzer)
+    else:
+        analyze_csv(args.log, analyzer)
+    analyzer.finish()
+    report = analyzer.report()
+    print_summary(report)
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or '.', exist_ok=True)
+        with open(args.json, 'w') as f:
+            json.dump(report, f)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,8 @@
-import pandas as pd
+from pipeline import main
 
-csv_files = ['normal.csv', 'high_temp.csv', 'low_light.csv', 'high_humidity.csv', 'anomaly.csv']
+# Merging is the pipeline's `merge` stage: every scenario CSV in data/ is parsed
+# once into the cache and data/dataset_real.csv is rewritten only when it changes.
+# Run from ai_pipeline/.
 
-dfs = [pd.read_csv(f) for f in csv_files]
-df_combined = pd.concat(dfs, ignore_index=True)
-
-df_combined.to_csv('dataset_real.csv', index=False)
-print("Combined CSV saved as dataset_real.csv")
+if __name__ == '__main__':
+    main(['merge'])
@@ -0,0 +1,233 @@
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from tflite_reader import TFLiteModel
+
+# Static cost of a .tflite model on the ESP32-S3 without TensorFlow: per-op MACs
+# and weight bytes, activation memory as TFLM's greedy arena planner lays it out,
+# a right-sized tensor arena and a latency prediction from a per-op cycle table.
+
+CPU_MHZ = 240
+FLASH_BUDGET = 20 * 1024        # README: model size (quantized) < 20KB
+LATENCY_BUDGET_US = 1000.0      # README: inference < 1ms
+
+# Cycles per multiply-accumulate, per output element (requantize/activation),
+# per op (kernel dispatch) and per invoke. Scaled so the deployed 5-32-24-5 model
+# predicts the 821 us median AI_latency_us of data/ai_log.csv. That log is from
+# the default text build, whose ULLAI_INFERENCE_DEBUG prints are inside the timed
+# region, so 'debug_prints' marks the table and predictions are pessimistic until
+# recalibrated on the binary telemetry build (no debug prints).
+DEFAULT_COST_TABLE = {
+    'debug_prints': True,
+    'invoke': 104500,
+    'ops': {
+        'FULLY_CONNECTED': {'mac': 31, 'element': 210, 'op': 15700},
+        'CONV_2D': {'mac': 31, 'element': 210, 'op': 15700},
+        'DEPTHWISE_CONV_2D': {'mac': 40, 'element': 210, 'op': 15700},
+        'default': {'mac': 0, 'element': 60, 'op': 15700},
+    },
+}
+
+# TFLM arena planning: 16-byte buffer alignment; persistent allocations per
+# tensor (TfLiteTensor + dims), per op (node, registration, op data) and per
+# quantized output channel (int32 multiplier + shift), plus the allocator's own.
+# The persistent sizes are estimates, not yet checked against the arena_used_bytes()
+# of the interpreter on the board, so the arena never goes below ARENA_FLOOR, the
+# 16 KB the firmware ran with before (--arena-floor 0 once they are calibrated).
+ARENA_ALIGNMENT = 16
+PERSISTENT_PER_TENSOR = 64
+PERSISTENT_PER_OP = 96
+PERSISTENT_PER_CHANNEL = 8
+PERSISTENT_FIXED = 1024
+ARENA_HEADROOM = 1.25
+ARENA_ROUND = 256
+ARENA_FLOOR = 16 * 1024
+
+
+def align(n, to=ARENA_ALIGNMENT):
+    return (n + to - 1) // to * to
+
+
+def op_macs(model, op):
+    out = model.tensors[op.outputs[0]]
+    if op.op == 'FULLY_CONNECTED':
+        weights = model.tensors[op.inputs[1]].shape
+        return int(np.prod(out.shape[:-1])) * int(np.prod(weights))
+    if op.op == 'CONV_2D':
+        _, kh, kw, cin = model.tensors[op.inputs[1]].shape
+        return int(np.prod(out.shape)) * kh * kw * cin
+    if op.op == 'DEPTHWISE_CONV_2D':
+        _, kh, kw, _ = model.tensors[op.inputs[1]].shape
+        return int(np.prod(out.shape)) * kh * kw
+    return 0
+
+
+def plan_arena(model):
+    """
+    Offsets of the non-constant tensors as GreedyMemoryPlanner places them:
+    largest first, each at the lowest offset not overlapping a tensor whose
+    lifetime (first to last op using it) intersects its own. Returns (plan, peak).
+    """
+    n_ops = len(model.operators)
+    first, last = {}, {}
+    for t in model.inputs:
+        first[t], last[t] = 0, 0
+    for i, op in enumerate(model.operators):
+        for t in op.inputs:
+            if t >= 0 and model.tensors[t].data is None:
+                first.setdefault(t, i)
+                last[t] = i
+        for t in op.outputs:
+            first.setdefault(t, i)
+            last[t] = max(last.get(t, i), i)
+    for t in model.outputs:
+        last[t] = n_ops - 1
+
+    order = sorted(first, key=lambda t: (-model.tensors[t].nbytes, first[t]))
+    placed = []   # (offset, size, first, last, tensor)
+    for t in order:
+        size = align(model.tensors[t].nbytes)
+        live = sorted((o, s) for o, s, f, l, _ in placed if f <= last[t] and first[t] <= l)
+        offset = 0
+        for o, s in live:
+            if offset + size <= o:
+                break
+            offset = max(offset, o + s)
+        placed.append((offset, size, first[t], last[t], t))
+    peak = max((o + s for o, s, *_ in placed), default=0)
+    return {t: (o, s, f, l) for o, s, f, l, t in placed}, peak
+
+
+def persistent_bytes(model):
+    channels = sum(len(model.tensors[op.outputs[0]].scale) if len(model.tensors[op.inputs[1]].scale) > 1 else 0
+                   for op in model.operators if op.op in ('FULLY_CONNECTED', 'CONV_2D', 'DEPTHWISE_CONV_2D'))
+    return (PERSISTENT_FIXED + PERSISTENT_PER_TENSOR * len(model.tensors) + PERSISTENT_PER_OP * len(model.operators)
+            + PERSISTENT_PER_CHANNEL * channels)
+
+
+def arena_estimate(model):
+    """Planned activations + persistent data, with headroom, rounded up to ARENA_ROUND"""
+    _, peak = plan_arena(model)
+    need = (peak + persistent_bytes(model)) * ARENA_HEADROOM
+    return int(-(-need // ARENA_ROUND) * ARENA_ROUND)
+
+
+def arena_size(model, floor=ARENA_FLOOR):
+    """Recommended TENSOR_ARENA_SIZE: the estimate, but not below floor"""
+    return max(arena_estimate(model), floor)
+
+
+def estimate(model, cost_table=DEFAULT_COST_TABLE, cpu_mhz=CPU_MHZ, arena_floor=ARENA_FLOOR):
+    """Per-op and total cost report of a TFLiteModel"""
+    if not isinstance(model, TFLiteModel):
+        model = TFLiteModel.load(model) if isinstance(model, str) else TFLiteModel(model)
+    ops = []
+    for i, op in enumerate(model.operators):
+        costs = cost_table['ops'].get(op.op, cost_table['ops']['default'])
+        macs = op_macs(model, op)
+        elements = int(np.prod(model.tensors[op.outputs[0]].shape))
+        weights = sum(model.tensors[t].nbytes for t in op.inputs if t >= 0 and model.tensors[t].data is not None)
+        cycles = costs['mac'] * macs + costs['element'] * elements + costs['op']
+        ops.append({'index': i, 'op': op.op, 'activation': op.activation, 'macs': macs,
+                    'output_elements': elements, 'weight_bytes': weights, 'latency_us': cycles / cpu_mhz})
+    _, peak = plan_arena(model)
+    return {
+        'flatbuffer_bytes': model.size,
+        'weight_bytes': sum(o['weight_bytes'] for o in ops),
+        'macs': sum(o['macs'] for o in ops),
+        'activation_peak_bytes': peak,
+        'persistent_bytes': persistent_bytes(model),
+        'arena_estimate_bytes': arena_estimate(model),
+        'arena_bytes': arena_size(model, arena_floor),
+        'latency_us': cost_table['invoke'] / cpu_mhz + sum(o['latency_us'] for o in ops),
+        'latency_includes_debug_prints': bool(cost_table.get('debug_prints', False)),
+        'ops': ops,
+    }
+
+
+def check_budgets(report, flash_budget=FLASH_BUDGET, latency_budget_us=LATENCY_BUDGET_US):
+    """Messages for every README budget the model goes over (empty when it fits)"""
+    problems = []
+    if report['flatbuffer_bytes'] >= flash_budget:
+        problems.append(f"model size {report['flatbuffer_bytes']} B >= {flash_budget} B")
+    if report['latency_us'] >= latency_budget_us:
+        problems.append(f"predicted latency {report['latency_us']:.0f} us >= {latency_budget_us:.0f} us")
+    return problems
+
+
+def calibrate(model, measured_us, cost_table=DEFAULT_COST_TABLE, cpu_mhz=CPU_MHZ, debug_prints=False):
+    """
+    Cost table scaled so `model` predicts `measured_us` (e.g. median AI_latency_us);
+    debug_prints tells whether that build had ULLAI_INFERENCE_DEBUG on.
+    """
+    scale = measured_us / estimate(model, cost_table, cpu_mhz)['latency_us']
+    return {
+        'debug_prints': debug_prints,
+        'invoke': round(cost_table['invoke'] * scale),
+        'ops': {name: {k: round(v * scale, 2) for k, v in c.items()} for name, c in cost_table['ops'].items()},
+    }
+
+
+def print_report(report):
+    print(f"{'#':>3} {'op':>18} {'act':>5} {'MACs':>7} {'out':>6} {'weights B':>10} {'est us':>8}")
+    for o in report['ops']:
+        print(f"{o['index']:>3} {o['op']:>18} {o['activation'] or '-':>5} {o['macs']:>7} {o['output_elements']:>6} "
+              f"{o['weight_bytes']:>10} {o['latency_us']:>8.1f}")
+    print(f"flatbuffer {report['flatbuffer_bytes']} B, weights {report['weight_bytes']} B, {report['macs']} MACs")
+    print(f"arena: activations {report['activation_peak_bytes']} B + persistent ~{report['persistent_bytes']} B "
+          f"-> estimate {report['arena_estimate_bytes']} B, TENSOR_ARENA_SIZE {report['arena_bytes']}")
+    print(f"predicted latency {report['latency_us']:.0f} us @ {CPU_MHZ} MHz"
+          + (" (table fitted with the debug prints in the timed region)"
+             if report['latency_includes_debug_prints'] else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Static MACs / memory / latency estimate of a .tflite model')
+    parser.add_argument('model', nargs='?', default='quantized_model.tflite')
+    parser.add_argument('--cost-table', help='JSON cycle table (default: built-in, calibrated on ai_log.csv)')
+    parser.add_argument('--calibrate-us', type=float,
+                        help='Measured median AI_latency_us of this model on the board, from the binary telemetry '
+                             'build (no debug prints); writes the scaled table to --write-table')
+    parser.add_argument('--debug-build', action='store_true',
+                        help='The --calibrate-us latency was measured with ULLAI_INFERENCE_DEBUG on')
+    parser.add_argument('--write-table', default='cost_table.json')
+    parser.add_argument('--arena-floor', type=int, default=ARENA_FLOOR,
+                        help='Smallest TENSOR_ARENA_SIZE to recommend (default %(default)s, until the persistent '
+                             'sizes are calibrated)')
+    parser.add_argument('--arena-header', help='Write a header with #define TENSOR_ARENA_SIZE')
+    parser.add_argument('--json', help='Write the report to this file')
+    parser.add_argument('--no-fail', action='store_true', help='Exit 0 even when a budget is exceeded')
+    args = parser.parse_args(argv)
+
+    table = DEFAULT_COST_TABLE
+    if args.cost_table:
+        with open(args.cost_table) as f:
+            table = json.load(f)
+    model = TFLiteModel.load(args.model)
+    if args.calibrate_us:
+        table = calibrate(model, args.calibrate_us, table, debug_prints=args.debug_build)
+        with open(args.write_table, 'w') as f:
+            json.dump(table, f, indent=2)
+        print(f"Calibrated cost table written to {args.write_table}")
+
+    report = estimate(model, table, arena_floor=args.arena_floor)
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.arena_header:
+        with open(args.arena_header, 'w') as f:
+            f.write(f"// Generated by ai_pipeline/model_cost.py for {args.model}\n"
+                    f"#define TENSOR_ARENA_SIZE {report['arena_bytes']}\n")
+    problems = check_budgets(report)
+    for p in problems:
+        print(f"OVER BUDGET: {p}")
+    if problems and not args.no_fail:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+import argparse
+import hashlib
+import os
+import sys
+
+import numpy as np
+
+from tflite_reader import TFLiteModel
+
+# Packages a .tflite flatbuffer as model.h without `xxd -i`: a 16-byte aligned
+# const array (kept in flash) plus the model's size, SHA-256, tensor shapes and
+# quantization. The output depends only on the flatbuffer bytes and the given
+# source name, and is not rewritten when unchanged so the firmware does not
+# rebuild for nothing.
+
+MODEL_ALIGNMENT = 16    # TFLM reads the flatbuffer in place and needs aligned buffers
+BYTES_PER_LINE = 12
+
+HEADER_TEMPLATE = """\
+// Generated by ai_pipeline/package_model.py from {source}.
+// Do not edit: rerun train_model.py or package_model.py instead.
+#ifndef MODEL_H
+#define MODEL_H
+
+#include <stdint.h>
+
+#define AI_MODEL_SIZE {size}
+#define AI_MODEL_SHA256 "{sha256}"
+// First 4 bytes of the SHA-256; model_params.h records the id it was generated for
+#define AI_MODEL_ID 0x{model_id:08x}UL
+// FNV-1a of the array, cheap enough for ai_init() to check the flash copy
+#define AI_MODEL_FNV1A 0x{fnv1a:08x}UL
+
+// Tensors: index name type shape [scale zero_point]
+{tensors}
+
+#define AI_MODEL_INPUT_SHAPE {{{input_shape}}}
+#define AI_MODEL_OUTPUT_SHAPE {{{output_shape}}}
+
+// const: stays in flash; aligned for TFLM
+const unsigned char model_tflite[AI_MODEL_SIZE] __attribute__((aligned({alignment}))) = {{
+{array}
+}};
+const unsigned int model_tflite_len = AI_MODEL_SIZE;
+
+#endif
+"""
+
+
+def model_sha256(flatbuffer):
+    return hashlib.sha256(flatbuffer).hexdigest()
+
+
+def model_id(flatbuffer):
+    """32-bit model identity: the first 4 bytes of the SHA-256"""
+    return int(model_sha256(flatbuffer)[:8], 16)
+
+
+def fnv1a(data):
+    h = 0x811c9dc5
+    for b in data:
+        h = ((h ^ b) * 0x01000193) & 0xffffffff
+    return h
+
+
+def describe_tensor(t):
+    line = f"//   {t.index:>3} {t.name}: {np.dtype(t.dtype).name} {list(t.shape)}"
+    if len(t.scale) == 1:
+        line += f" [{float(t.scale[0]):.9g} {int(t.zero_point[0])}]"
+    elif len(t.scale) > 1:
+        line += f" [per-channel x{len(t.scale)} on dim {t.quantized_dimension}]"
+    return line
+
+
+def render_model_header(flatbuffer, source='quantized_model.tflite'):
+    flatbuffer = bytes(flatbuffer)
+    model = TFLiteModel(flatbuffer)
+    rows = [', '.join(f'0x{b:02x}' for b in flatbuffer[i:i + BYTES_PER_LINE])
+            for i in range(0, len(flatbuffer), BYTES_PER_LINE)]
+    return HEADER_TEMPLATE.format(
+        source=source, size=len(flatbuffer), sha256=model_sha256(flatbuffer), model_id=model_id(flatbuffer),
+        fnv1a=fnv1a(flatbuffer),
+        tensors='\n'.join(describe_tensor(t) for t in model.tensors),
+        input_shape=', '.join(str(int(d)) for d in model.input.shape),
+        output_shape=', '.join(str(int(d)) for d in model.output.shape),
+        alignment=MODEL_ALIGNMENT,
+        array='\n'.join(f'    {row},' for row in rows),
+    )
+
+
+def write_if_changed(path, text):
+    """Write text to path unless it already holds exactly that; True when written"""
+    data = text.encode()
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def write_model_header(path='model.h', flatbuffer=None, model_path='quantized_model.tflite'):
+    if flatbuffer is None:
+        with open(model_path, 'rb') as f:
+            flatbuffer = f.read()
+    return write_if_changed(path, render_model_header(flatbuffer, os.path.basename(model_path)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Package a .tflite model as a C header')
+    parser.add_argument('--model', default='quantized_model.tflite')
+    parser.add_argument('--out', default='model.h')
+    parser.add_argument('--check', action='store_true', help='Exit 1 if --out is not up to date, write nothing')
+    args = parser.parse_args(argv)
+
+    with open(args.model, 'rb') as f:
+        flatbuffer = f.read()
+    if args.check:
+        text = render_model_header(flatbuffer, os.path.basename(args.model))
+        current = open(args.out, 'rb').read() if os.path.exists(args.out) else None
+        if current != text.encode():
+            print(f"{args.out} is stale, rerun package_model.py --out {args.out}")
+            sys.exit(1)
+        print(f"{args.out} is up to date ({model_sha256(flatbuffer)})")
+        return
+    written = write_model_header(args.out, flatbuffer, args.model)
+    print(f"{'Wrote' if written else 'Unchanged'} {args.out}: {len(flatbuffer)} B, sha256 {model_sha256(flatbuffer)}")
+
+
+if __name__ == '__main__':
+    main()
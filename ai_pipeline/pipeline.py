@@ -0,0 +1,409 @@
+import argparse
+import glob
+import hashlib
+import inspect
+import io
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from drift_monitor import REFERENCE_PATH, build_reference
+from scaler_stats import FeatureStats, scaler_from_stats, stats_from_frame
+
+# Data pipeline as stages with declared inputs and outputs. Each stage result is
+# stored once in a content-addressed cache (Parquet for frames, JSON for dicts)
+# under the hash of its code and inputs; a stage whose key is already cached is
+# skipped, and downstream keys use the *content* hash of upstream results, so a
+# change that leaves e.g. the clean dataset identical stops there. Every scenario
+# CSV is parsed by its own stage: adding one CSV parses only that file.
+#
+#   load:<csv> -> merge -> clean ---------------------> train
+#              \-> stats:<csv> -> stats -> scaler ----/
+#                                         \-> drift_reference
+#   report: merge, clean, stats
+#
+# Scaler statistics are kept per CSV (scaler_stats.FeatureStats) and merged, so
+# a new CSV adds its own partial instead of recomputing over the whole dataset.
+#
+# The legacy scripts (merge_csv.py, clean_dataset.py, ...) run pipeline targets.
+
+CACHE_DIR = '.cache'
+# Merge order of merge_csv.py; other scenario CSVs follow in name order
+LEGACY_ORDER = ['normal.csv', 'high_temp.csv', 'low_light.csv', 'high_humidity.csv', 'anomaly.csv']
+# Files the legacy scripts read, in the data directory (scaler.json in the working directory)
+DATA_EXPORTS = {'merge': 'dataset_real.csv', 'clean': 'dataset_real_clean.csv'}
+SCALER_PATH = 'scaler.json'
+SCHEMA = {
+    'timestamp': 'Int64', 'ldr_v': 'float64', 'temp_c': 'float64', 'hum_pct': 'float64',
+    'tvoc_ppb': 'float64', 'eco2_ppm': 'float64', 'scenario': 'object',
+}
+# Source files hashed into stage keys, relative to this directory. Every stage also
+# hashes pipeline.py, since stage functions call its helpers (parse_rows, ...).
+PIPELINE_CODE = ['pipeline.py']
+STATS_CODE = ['scaler_stats.py']
+DRIFT_CODE = STATS_CODE + ['drift_monitor.py']
+TRAIN_CODE = ['train_model.py', 'features.py', 'export_model_params.py', 'shard_dataset.py', 'package_model.py',
+              'model_cost.py', 'tflite_reader.py']
+TRAIN_OUTPUTS = ['quantized_model.tflite', 'model.h', 'model_params.h', 'model_float.h5']
+
+
+def digest_bytes(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def digest_file(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def digest_value(value):
+    """Content hash of a stage result, independent of how it is stored"""
+    if isinstance(value, pd.DataFrame):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(json.dumps([list(value.columns), [str(t) for t in value.dtypes]]).encode())
+        h.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+        return h.hexdigest()
+    if isinstance(value, dict) and all(isinstance(v, bytes) for v in value.values()):
+        return digest_bytes(b''.join(k.encode() + b'\0' + digest_bytes(v).encode() for k, v in sorted(value.items())))
+    return digest_bytes(json.dumps(value, sort_keys=True).encode())
+
+
+def apply_schema(df):
+    return df.astype({c: t for c, t in SCHEMA.items() if c in df.columns})
+
+
+# ---------------------------------------------------------------------------
+# Stage functions
+# ---------------------------------------------------------------------------
+
+def parse_rows(df):
+    """Typed SCHEMA columns of a loaded or merged frame; unparsable cells become missing"""
+    df = df.copy()
+    for column, dtype in SCHEMA.items():
+        if dtype != 'object' and column in df and not pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+    if 'timestamp' in df:
+        # Float timestamps come from truncated lines; they are not valid sample times
+        ts = df['timestamp']
+        df['timestamp'] = ts.where(ts == np.floor(ts))
+    return apply_schema(df)
+
+
+def load_source(path):
+    """One scenario CSV as read: a column with damaged lines stays text, so the merge keeps them as they are"""
+    return pd.read_csv(path)
+
+
+def merge_sources(*frames):
+    """The scenario CSVs end to end (merge_csv.py); parsing is left to the stages that need numbers"""
+    merged = pd.concat(frames, ignore_index=True)
+    # A column that is text in one file and numeric in another is stored as text
+    for column in merged.columns[merged.dtypes == object]:
+        merged[column] = merged[column].map(lambda v: v if isinstance(v, str) or pd.isna(v) else str(v))
+    return merged
+
+
+def clean_rows(df):
+    """Drop malformed rows, those with a missing or unparsable value (clean_dataset.py)"""
+    return parse_rows(df).dropna().reset_index(drop=True)
+
+
+def source_stats(df):
+    """Mergeable scaler statistics of one scenario CSV (scaler_stats.FeatureStats state)"""
+    return stats_from_frame(parse_rows(df)).to_dict()
+
+
+def merge_stats(*states):
+    stats = FeatureStats()
+    for state in states:
+        stats.merge(FeatureStats.from_dict(state))
+    return stats.to_dict()
+
+
+def compute_scaler(state, allow_degenerate=False):
+    """scaler.json from the merged statistics (preprocess_scaler.py); refuses constant features unless allowed"""
+    try:
+        return scaler_from_stats(FeatureStats.from_dict(state), allow_degenerate)
+    except ValueError as e:
+        raise ValueError(f"Not writing {SCALER_PATH}: {e} (--allow-degenerate to write it anyway)") from e
+
+
+def quality_report(merged, clean, state):
+    """check_dataset.py and check_data_quality.py in one pass"""
+    numeric = clean.select_dtypes('number')
+    stats = FeatureStats.from_dict(state)
+    parsed = parse_rows(merged)
+    return {
+        'raw_rows': len(merged),
+        'clean_rows': len(clean),
+        'dropped_rows': len(merged) - len(clean),
+        'raw_scenarios': merged['scenario'].value_counts(dropna=False).rename(str).to_dict(),
+        'missing_per_column': parsed.isna().sum().to_dict(),
+        'inf_values': int(np.isinf(numeric.to_numpy(dtype=np.float64)).sum()),
+        'describe': json.loads(clean.describe().to_json()),
+        'degenerate_features': stats.degenerate(),
+    }
+
+
+def train_model(clean, scaler, csv_path, scaler_path):
+    """train_model.train on the clean dataset and scaler as exported to csv_path and scaler_path; returns its files"""
+    from train_model import train
+    problems = train(csv_path=csv_path, scaler_path=scaler_path)
+    if problems:
+        raise ValueError("Model over budget: " + "; ".join(problems))
+    outputs = {}
+    for name in TRAIN_OUTPUTS:
+        with open(name, 'rb') as f:
+            outputs[name] = f.read()
+    return outputs
+
+
+# ---------------------------------------------------------------------------
+# Cache and runner
+# ---------------------------------------------------------------------------
+
+class ArtifactCache:
+    """Stage results stored by content digest, plus stage key -> digest index"""
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.index_path = os.path.join(root, 'index.json')
+        try:
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.index = {}
+        self.index.setdefault('stages', {})
+        self.index.setdefault('exports', {})
+
+    def _path(self, digest, kind):
+        return os.path.join(self.root, digest + {'frame': '.parquet', 'json': '.json', 'files': ''}[kind])
+
+    def lookup(self, key):
+        """Digest and kind of a cached stage result, if its artifact still exists"""
+        entry = self.index['stages'].get(key)
+        if entry and os.path.exists(self._path(entry['digest'], entry['kind'])):
+            return entry['digest'], entry['kind']
+        return None
+
+    def store(self, key, value, kind):
+        digest = digest_value(value)
+        path = self._path(digest, kind)
+        if not os.path.exists(path):
+            tmp = path + '.tmp'
+            if kind == 'frame':
+                try:
+                    value.to_parquet(tmp, index=False)
+                except ImportError as e:
+                    raise ImportError("The pipeline cache needs pyarrow: pip install pyarrow") from e
+            elif kind == 'json':
+                with open(tmp, 'w') as f:
+                    json.dump(value, f)
+            else:
+                os.makedirs(tmp, exist_ok=True)
+                for name, data in value.items():
+                    with open(os.path.join(tmp, name), 'wb') as f:
+                        f.write(data)
+            os.replace(tmp, path)
+        self.index['stages'][key] = {'digest': digest, 'kind': kind}
+        return digest
+
+    def load(self, digest, kind):
+        path = self._path(digest, kind)
+        if kind == 'frame':
+            return pd.read_parquet(path)
+        if kind == 'json':
+            with open(path) as f:
+                return json.load(f)
+        out = {}
+        for name in sorted(os.listdir(path)):
+            with open(os.path.join(path, name), 'rb') as f:
+                out[name] = f.read()
+        return out
+
+    def save(self):
+        tmp = self.index_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.index, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.index_path)
+
+
+class Stage:
+    """
+    A pipeline step: `func` is called with the results of `deps` (stage names)
+    after `files` (paths, passed as is), then `options` as keywords. `code` lists
+    source files hashed into the key besides the function and pipeline.py;
+    `export` is where the result is written. Options are part of the key.
+    """
+
+    def __init__(self, name, func, kind, deps=(), files=(), code=(), export=None, options=None):
+        self.name = name
+        self.func = func
+        self.kind = kind
+        self.deps = list(deps)
+        self.files = list(files)
+        self.code = PIPELINE_CODE + list(code)
+        self.export = export
+        self.options = options or {}
+
+    def code_digest(self):
+        here = os.path.dirname(os.path.abspath(__file__))
+        source = inspect.getsource(self.func).encode() + json.dumps(SCHEMA).encode()
+        return digest_bytes(source + b''.join(digest_file(os.path.join(here, p)).encode() for p in self.code))
+
+
+def discover_sources(data_dir='data'):
+    """Scenario CSVs in data_dir: files with a 'scenario' column that the pipeline did not write"""
+    outputs = set(DATA_EXPORTS.values())
+    found = []
+    for path in glob.glob(os.path.join(data_dir, '*.csv')):
+        name = os.path.basename(path)
+        with open(path) as f:
+            header = f.readline().strip().split(',')
+        if name not in outputs and 'scenario' in header:
+            found.append(name)
+    order = {name: i for i, name in enumerate(LEGACY_ORDER)}
+    found.sort(key=lambda n: (order.get(n, len(order)), n))
+    return [os.path.join(data_dir, n) for n in found]
+
+
+def build_stages(sources, data_dir='data', allow_degenerate=False):
+    loads = [Stage(f'load:{os.path.basename(p)}', load_source, 'frame', files=[p]) for p in sources]
+    stats = [Stage(f'stats:{os.path.basename(p)}', source_stats, 'json', deps=[s.name], code=STATS_CODE)
+             for p, s in zip(sources, loads)]
+    return loads + stats + [
+        Stage('merge', merge_sources, 'frame', deps=[s.name for s in loads],
+              export=os.path.join(data_dir, DATA_EXPORTS['merge'])),
+        Stage('clean', clean_rows, 'frame', deps=['merge'], export=os.path.join(data_dir, DATA_EXPORTS['clean'])),
+        Stage('stats', merge_stats, 'json', deps=[s.name for s in stats], code=STATS_CODE),
+        Stage('scaler', compute_scaler, 'json', deps=['stats'], code=STATS_CODE, export=SCALER_PATH,
+              options={'allow_degenerate': allow_degenerate}),
+        Stage('drift_reference', build_reference, 'json', deps=['stats'], code=DRIFT_CODE, export=REFERENCE_PATH),
+        Stage('report', quality_report, 'json', deps=['merge', 'clean', 'stats'], code=STATS_CODE),
+        Stage('train', train_model, 'files', deps=['clean', 'scaler'], code=TRAIN_CODE,
+              options={'csv_path': os.path.join(data_dir, DATA_EXPORTS['clean']), 'scaler_path': SCALER_PATH}),
+    ]
+
+
+def export_bytes(value, kind):
+    if kind == 'frame':
+        buf = io.StringIO()
+        value.to_csv(buf, index=False)
+        return buf.getvalue().encode()
+    return json.dumps(value).encode()
+
+
+class Pipeline:
+    def __init__(self, stages, cache):
+        self.stages = {s.name: s for s in stages}
+        self.cache = cache
+        self.results = {}   # stage name -> (digest, kind)
+        self.log = []       # (stage, 'cached' | 'ran', seconds)
+
+    def required(self, targets):
+        needed, todo = set(), list(targets)
+        while todo:
+            name = todo.pop()
+            if name not in needed:
+                needed.add(name)
+                todo.extend(self.stages[name].deps)
+        return [s for s in self.stages if s in needed]
+
+    def value(self, name):
+        return self.cache.load(*self.results[name])
+
+    def run(self, targets, force=()):
+        for name in self.required(targets):
+            stage = self.stages[name]
+            t0 = time.perf_counter()
+            key = digest_bytes(json.dumps([
+                name, stage.code_digest(),
+                [digest_file(p) for p in stage.files],
+                [self.results[d][0] for d in stage.deps],
+                stage.options,
+            ], sort_keys=True).encode())
+            hit = None if name in force else self.cache.lookup(key)
+            if hit is None:
+                value = stage.func(*stage.files, *(self.value(d) for d in stage.deps), **stage.options)
+                self.results[name] = (self.cache.store(key, value, stage.kind), stage.kind)
+                self.cache.save()
+            else:
+                value = None
+                self.results[name] = hit
+            self._export(stage, value)
+            self.log.append((name, 'cached' if hit else 'ran', time.perf_counter() - t0))
+        return self.results
+
+    def _export(self, stage, value):
+        """Write the stage result where the legacy scripts expect it, unless it is already there"""
+        digest, kind = self.results[stage.name]
+        targets = [stage.export] if stage.export else (TRAIN_OUTPUTS if kind == 'files' else [])
+        for path in targets:
+            recorded = self.cache.index['exports'].get(path)
+            if recorded and recorded['artifact'] == digest and os.path.exists(path) \
+                    and digest_file(path) == recorded['file']:
+                continue
+            if value is None:
+                value = self.cache.load(digest, kind)
+            data = value[path] if kind == 'files' else export_bytes(value, kind)
+            with open(path, 'wb') as f:
+                f.write(data)
+            self.cache.index['exports'][path] = {'artifact': digest, 'file': digest_bytes(data)}
+        self.cache.save()
+
+
+def print_report(report):
+    print(f"{report['raw_rows']} raw rows, {report['clean_rows']} clean, {report['dropped_rows']} dropped")
+    print("Samples per scenario (raw):")
+    for scenario, count in report['raw_scenarios'].items():
+        print(f"  {scenario:>14} {count}")
+    print("Missing values per column (raw):", report['missing_per_column'])
+    print("Inf values (clean):", report['inf_values'])
+    for feature, reason in report['degenerate_features'].items():
+        print(f"WARNING: degenerate feature {feature}: {reason}")
+    print(pd.DataFrame(report['describe']).to_string())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the cached ULLAI data pipeline')
+    parser.add_argument('targets', nargs='*', default=['scaler', 'drift_reference', 'report'],
+                        help="Stages to bring up to date: merge, clean, stats, scaler, drift_reference, report, train")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--cache-dir', default=None, help=f'Default {CACHE_DIR} under the data directory')
+    parser.add_argument('--force', nargs='*', default=[], help='Re-run these stages even if cached')
+    parser.add_argument('--allow-degenerate', action='store_true',
+                        help='Write the scaler even if a feature is constant')
+    args = parser.parse_args(argv)
+
+    cache = ArtifactCache(args.cache_dir or os.path.join(args.data_dir, CACHE_DIR))
+    pipeline = Pipeline(build_stages(discover_sources(args.data_dir), args.data_dir, args.allow_degenerate), cache)
+    unknown = set(args.targets + args.force) - set(pipeline.stages)
+    if unknown:
+        parser.error(f"unknown stages: {sorted(unknown)}")
+    try:
+        pipeline.run(args.targets, set(args.force))
+        error = None
+    except ValueError as e:
+        error = e
+    for name, status, seconds in pipeline.log:
+        print(f"{name:>24} {status:>7} {seconds * 1000:8.1f} ms")
+    if error:
+        print(error)
+        sys.exit(1)
+    if 'report' in args.targets:
+        print_report(pipeline.value('report'))
+    elif 'scaler' in pipeline.results:
+        for feature, reason in FeatureStats.from_dict(pipeline.value('stats')).degenerate().items():
+            print(f"WARNING: degenerate feature {feature} written to {SCALER_PATH}: {reason}")
+
+
+if __name__ == '__main__':
+    main()
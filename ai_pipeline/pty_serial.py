@@ -0,0 +1,57 @@
+import os
+import pty
+import tty
+
+
+class FakeSerialPort:
+    """
+    Pseudo-terminal standing in for an ESP32-S3 USB CDC port.
+
+    Open `port` with pyserial as if it were /dev/ttyACM0 and feed it with write().
+    With `link`, the port is also reachable through a symlink, and reopen()
+    swaps in a fresh pty behind the same path, which is what a board reset
+    looks like to the host.
+    """
+
+    def __init__(self, link=None):
+        self.link = link
+        self.master = self.slave = None
+        self.reopen()
+
+    @property
+    def port(self):
+        return self.link or self.slave_name
+
+    def reopen(self):
+        self.close()
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)  # no echo / newline translation
+        self.slave_name = os.ttyname(self.slave)
+        if self.link:
+            tmp = f"{self.link}.tmp"
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+            os.symlink(self.slave_name, tmp)
+            os.replace(tmp, self.link)
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.master, view):]
+
+    def close(self):
+        """Close both ends; readers see an I/O error like an unplugged board"""
+        for fd in (self.master, self.slave):
+            if fd is not None:
+                os.close(fd)
+        self.master = self.slave = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.link and os.path.lexists(self.link):
+            os.remove(self.link)
@@ -1,38 +1,56 @@
-import tensorflow as tf
-import numpy as np
 import os
 
-# 1. Create a simple model for demonstration
-model = tf.keras.Sequential([
-    tf.keras.layers.InputLayer(input_shape=(5,)),
-    tf.keras.layers.Dense(32, activation='relu'),
-    tf.keras.layers.Dense(24, activation='relu'),
-    tf.keras.layers.Dense(3)  # Linear,  not softmax
-])
-
-model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
-x = np.random.rand(1000, 5).astype(np.float32)
-y = np.random.randint(0, 3, (1000,))
-model.fit(x, y, epochs=10)
-
-# 2. Convert using ONLY post-training quantization
-converter = tf.lite.TFLiteConverter.from_keras_model(model)
-converter.optimizations = [tf.lite.Optimize.DEFAULT]
-converter.target_spec.supported_ops = [
-    tf.lite.OpsSet.TFLITE_BUILTINS_INT8, tf.lite.OpsSet.TFLITE_BUILTINS
-]
-def representative_dataset():
-    for _ in range(100):
-        yield [np.random.rand(1, 5).astype(np.float32)]
-converter.representative_dataset = representative_dataset
-converter.inference_input_type = tf.int8
-converter.inference_output_type = tf.int8
-
-if os.path.exists("quantized_model.tflite"):
-    os.remove("quantized_model.tflite")
-tflite_model = converter.convert()
-with open("quantized_model.tflite", "wb") as f:
-    f.write(tflite_model)
-os.system("xxd -i quantized_model.tflite > model.h")
-print("Exported model.h using post-training quantization, NOT using tfmot/qat.")
+import numpy as np
+
+
+def build_demo_model(epochs=10):
+    """1. Create a simple model for demonstration, trained on random data"""
+    import tensorflow as tf
+
+    model = tf.keras.Sequential([
+        tf.keras.layers.InputLayer(input_shape=(5,)),
+        tf.keras.layers.Dense(32, activation='relu'),
+        tf.keras.layers.Dense(24, activation='relu'),
+        tf.keras.layers.Dense(3)  # Linear,  not softmax
+    ])
+
+    model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    x = np.random.rand(1000, 5).astype(np.float32)
+    y = np.random.randint(0, 3, (1000,))
+    model.fit(x, y, epochs=epochs)
+    return model
+
+
+def quantize(model, out_path='quantized_model.tflite'):
+    """2. Convert using ONLY post-training quantization; returns the flatbuffer"""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_ops = [
+        tf.lite.OpsSet.TFLITE_BUILTINS_INT8, tf.lite.OpsSet.TFLITE_BUILTINS
+    ]
+    def representative_dataset():
+        for _ in range(100):
+            yield [np.random.rand(1, 5).astype(np.float32)]
+    converter.representative_dataset = representative_dataset
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+
+    if os.path.exists(out_path):
+        os.remove(out_path)
+    tflite_model = converter.convert()
+    with open(out_path, "wb") as f:
+        f.write(tflite_model)
+    return tflite_model
+
+
+def main():
+    tflite_model = quantize(build_demo_model())
+    from package_model import write_model_header
+    write_model_header("model.h", tflite_model)
+    print("Exported model.h using post-training quantization, NOT using tfmot/qat.")
+
 
+if __name__ == '__main__':
+    main()
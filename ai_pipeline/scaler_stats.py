@@ -0,0 +1,295 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from features import FEATURE_COLUMNS
+
+# Streaming, mergeable statistics for the scaler: count, Welford/Chan mean and
+# M2, min/max and a sparse histogram on each feature's sensor resolution for
+# quantiles. States merge across workers and files and persist as JSON, so new
+# log bytes are folded in without rereading what was already counted.
+
+# Column names of ai_log.csv (serial_ingest.LOG_HEADER) for the model features
+LOG_ALIASES = {'ldr_voltage': 'ldr_v', 'temp': 'temp_c', 'hum': 'hum_pct', 'tvoc': 'tvoc_ppb', 'eco2': 'eco2_ppm'}
+# Histogram bin width per feature: the 2-decimal resolution of the logs
+QUANTILE_RESOLUTION = 0.01
+# std below this (or a single value) makes a feature useless for the model
+DEGENERATE_STD = 1e-5
+CHUNK_BYTES = 16 << 20
+
+
+class FeatureStats:
+    """Per-feature running statistics over rows of FEATURE_COLUMNS"""
+
+    def __init__(self, columns=FEATURE_COLUMNS, quantiles=True):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.count = np.zeros(k, dtype=np.int64)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+        self.histograms = [{} for _ in self.columns] if quantiles else None
+
+    def update(self, values):
+        """Fold an (n, k) array in; NaN cells are skipped per feature"""
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.columns))
+        for j in range(len(self.columns)):
+            column = values[:, j]
+            column = column[np.isfinite(column)]
+            if len(column):
+                self._merge_moments(j, len(column), column.mean(), ((column - column.mean()) ** 2).sum(),
+                                    column.min(), column.max())
+                if self.histograms is not None:
+                    bins, counts = np.unique(np.round(column / QUANTILE_RESOLUTION).astype(np.int64),
+                                             return_counts=True)
+                    hist = self.histograms[j]
+                    for b, c in zip(bins.tolist(), counts.tolist()):
+                        hist[b] = hist.get(b, 0) + c
+        return self
+
+    def _merge_moments(self, j, n, mean, m2, lo, hi):
+        # Chan et al. pairwise combination of (count, mean, M2)
+        total = self.count[j] + n
+        delta = mean - self.mean[j]
+        self.mean[j] += delta * n / total
+        self.m2[j] += m2 + delta * delta * self.count[j] * n / total
+        self.count[j] = total
+        self.min[j] = min(self.min[j], lo)
+        self.max[j] = max(self.max[j], hi)
+
+    def merge(self, other):
+        if other.columns != self.columns:
+            raise ValueError(f"Cannot merge stats over {other.columns} into {self.columns}")
+        for j in range(len(self.columns)):
+            if other.count[j]:
+                self._merge_moments(j, other.count[j], other.mean[j], other.m2[j], other.min[j], other.max[j])
+        if self.histograms is not None:
+            if other.histograms is None:
+                self.histograms = None
+            else:
+                for hist, more in zip(self.histograms, other.histograms):
+                    for b, c in more.items():
+                        hist[b] = hist.get(b, 0) + c
+        return self
+
+    def std(self, ddof=1):
+        """Sample standard deviation (ddof=1, like pandas)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.sqrt(self.m2 / (self.count - ddof))
+
+    def quantile(self, q):
+        """Quantiles per feature from the histograms, to QUANTILE_RESOLUTION"""
+        if self.histograms is None:
+            raise ValueError('Quantiles were not tracked')
+        out = np.full(len(self.columns), np.nan)
+        for j, hist in enumerate(self.histograms):
+            if hist:
+                bins = np.array(sorted(hist))
+                cumulative = np.cumsum([hist[b] for b in bins])
+                rank = q * (cumulative[-1] - 1)
+                out[j] = bins[np.searchsorted(cumulative, rank, side='right')] * QUANTILE_RESOLUTION
+        return out
+
+    def degenerate(self):
+        """{feature: reason} for features a scaler cannot normalize"""
+        std = self.std()
+        flags = {}
+        for j, c in enumerate(self.columns):
+            if self.count[j] < 2:
+                flags[c] = f'{self.count[j]} samples'
+            elif self.max[j] == self.min[j]:
+                flags[c] = f'constant {self.min[j]:g}'
+            elif std[j] <= DEGENERATE_STD:
+                flags[c] = f'std {std[j]:.2g}'
+        return flags
+
+    def to_dict(self):
+        return {
+            'columns': self.columns,
+            'count': self.count.tolist(), 'mean': self.mean.tolist(), 'm2': self.m2.tolist(),
+            'min': self.min.tolist(), 'max': self.max.tolist(),
+            'histograms': None if self.histograms is None else [
+                {str(b): c for b, c in sorted(h.items())} for h in self.histograms],
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        stats = cls(state['columns'], quantiles=state['histograms'] is not None)
+        stats.count = np.array(state['count'], dtype=np.int64)
+        for name in ('mean', 'm2', 'min', 'max'):
+            setattr(stats, name, np.array(state[name], dtype=np.float64))
+        if state['histograms'] is not None:
+            stats.histograms = [{int(b): c for b, c in h.items()} for h in state['histograms']]
+        return stats
+
+
+def scaler_from_stats(stats, allow_degenerate=True):
+    """scaler.json dict, same keys and std fallback as preprocess_scaler.py"""
+    flags = stats.degenerate()
+    if flags and not allow_degenerate:
+        raise ValueError('Degenerate features: ' + ', '.join(f'{c} ({r})' for c, r in flags.items()))
+    col = {c: j for j, c in enumerate(stats.columns)}
+    std = stats.std()
+
+    def safe_std(c):
+        s = std[col[c]]
+        return float(s) if s > DEGENERATE_STD else 1.0   # Avoid zero std to prevent division by zero
+
+    return {
+        'ldr_min': float(stats.min[col['ldr_v']]),
+        'ldr_max': float(stats.max[col['ldr_v']]),
+        'tvoc_min': float(stats.min[col['tvoc_ppb']]),
+        'tvoc_max': float(stats.max[col['tvoc_ppb']]),
+        'eco2_min': float(stats.min[col['eco2_ppm']]),
+        'eco2_max': float(stats.max[col['eco2_ppm']]),
+        'temp_mean': float(stats.mean[col['temp_c']]),
+        'temp_std': safe_std('temp_c'),
+        'hum_mean': float(stats.mean[col['hum_pct']]),
+        'hum_std': safe_std('hum_pct'),
+    }
+
+
+def stats_from_frame(df, quantiles=True):
+    """Stats over the rows of a frame with no missing value, as the clean dataset keeps them"""
+    df = df.rename(columns=LOG_ALIASES)
+    numeric = [c for c in df.columns if c != 'scenario']
+    df[numeric] = df[numeric].apply(pd.to_numeric, errors='coerce')
+    return FeatureStats(quantiles=quantiles).update(df.dropna()[FEATURE_COLUMNS].to_numpy(dtype=np.float64))
+
+
+def iter_csv_chunks(path, offset=0, chunk_bytes=CHUNK_BYTES):
+    """
+    (frame, end_offset) for complete lines from byte `offset` on; a trailing
+    partial line (a log still being written) is left for the next call.
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+        offset = max(offset, f.tell())
+        f.seek(offset)
+        names = header.decode().strip().split(',')
+        tail = b''
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                return
+            data = tail + block
+            cut = data.rfind(b'\n') + 1
+            tail = data[cut:]
+            if cut:
+                frame = pd.read_csv(io.BytesIO(data[:cut]), header=None, names=names,
+                                    on_bad_lines='skip', encoding_errors='replace')
+                offset += cut
+                yield frame, offset
+
+
+def head_digest(path, length):
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(min(length, 1 << 16)), digest_size=16).hexdigest()
+
+
+def fold_file(path, offset=0, quantiles=True):
+    """(stats over the new complete lines of path, new offset)"""
+    stats = FeatureStats(quantiles=quantiles)
+    for frame, offset in iter_csv_chunks(path, offset):
+        stats.merge(stats_from_frame(frame, quantiles))
+    return stats, offset
+
+
+class StatsState:
+    """FeatureStats plus, per source file, how many bytes are already counted"""
+
+    def __init__(self, stats=None, sources=None):
+        self.stats = stats or FeatureStats()
+        self.sources = sources or {}
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls()
+        with open(path) as f:
+            state = json.load(f)
+        return cls(FeatureStats.from_dict(state['stats']), state['sources'])
+
+    def save(self, path):
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({'stats': self.stats.to_dict(), 'sources': self.sources}, f)
+        os.replace(tmp, path)
+
+    def fold(self, paths, workers=1):
+        """Fold the unread bytes of each file in, in parallel when workers > 1"""
+        jobs = []
+        for path in paths:
+            key = os.path.abspath(path)
+            seen = self.sources.get(key)
+            offset = 0
+            if seen:
+                if os.path.getsize(path) < seen['offset'] or head_digest(path, seen['offset']) != seen['head']:
+                    raise ValueError(f"{path} was rewritten since it was folded in; rebuild the state")
+                offset = seen['offset']
+            jobs.append((path, offset))
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                results = list(pool.map(fold_file, *zip(*jobs)))
+        else:
+            results = [fold_file(path, offset) for path, offset in jobs]
+        rows = {}
+        for (path, _), (stats, offset) in zip(jobs, results):
+            self.stats.merge(stats)
+            self.sources[os.path.abspath(path)] = {'offset': offset, 'head': head_digest(path, offset)}
+            rows[path] = int(stats.count.max())
+        return rows
+
+
+def print_stats(stats):
+    std = stats.std()
+    percentiles = [stats.quantile(q) for q in (0.01, 0.5, 0.99)] if stats.histograms is not None else None
+    print(f"{'feature':>10} {'count':>8} {'min':>9} {'max':>9} {'mean':>10} {'std':>9}"
+          + (f" {'p1':>8} {'p50':>8} {'p99':>8}" if percentiles else ''))
+    for j, c in enumerate(stats.columns):
+        line = (f"{c:>10} {stats.count[j]:>8} {stats.min[j]:>9.3f} {stats.max[j]:>9.3f} "
+                f"{stats.mean[j]:>10.4f} {std[j]:>9.4f}")
+        if percentiles:
+            line += ''.join(f" {q[j]:>8.2f}" for q in percentiles)
+        print(line)
+    for c, reason in stats.degenerate().items():
+        print(f"WARNING: degenerate feature {c}: {reason}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Incremental scaler statistics over CSV logs')
+    parser.add_argument('csv', nargs='+', help='Scenario CSVs or ai_log.csv captures')
+    parser.add_argument('--state', default='data/scaler_state.json', help='Persisted accumulator state')
+    parser.add_argument('--rebuild', action='store_true', help='Start from an empty state')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--scaler', help='Also write this scaler.json')
+    parser.add_argument('--allow-degenerate', action='store_true',
+                        help='Write the scaler even if a feature is constant')
+    args = parser.parse_args(argv)
+
+    state = StatsState() if args.rebuild else StatsState.load(args.state)
+    for path, rows in state.fold(args.csv, args.workers).items():
+        print(f"{path}: {rows} new rows")
+    state.save(args.state)
+    print_stats(state.stats)
+    if args.scaler:
+        try:
+            scaler = scaler_from_stats(state.stats, args.allow_degenerate)
+        except ValueError as e:
+            print(f"Not writing {args.scaler}: {e} (--allow-degenerate to write it anyway)")
+            sys.exit(1)
+        with open(args.scaler, 'w') as f:
+            json.dump(scaler, f)
+        print(f"Wrote {args.scaler}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,8 @@
 import numpy as np
-import pandas as pd
-import matplotlib
-matplotlib.use('Agg')  # Use non-display backend
-import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import os
+import shutil
 
 # =============================================================================
 # 1. ADVANCED SIMULATION CONFIGURATION FOR EACH SENSOR
@@ -20,7 +17,7 @@ class SensorProfiler:
         'max_v': 2.7,       # Maximum voltage (1000 lux)
         'response_time': 0.015,  # 15ms
         'dark_current': 0.18,
-        'noise_profile': lambda: random.gauss(0, 0.03)
+        'noise_std': 0.03   # Gaussian measurement noise (V)
     }
     
     DHT22 = {
@@ -38,124 +35,209 @@ class SensorProfiler:
         'noise_factor': 0.05
     }
 
+# Base operating point of every scenario
+SCENARIO_BASE_VALUES = {
+    'normal': {'light': 1.2, 'temp': 25.0, 'humidity': 45.0, 'tvoc': 60.0, 'co2': 450.0},
+    'high_temp': {'light': 1.5, 'temp': 38.0, 'humidity': 25.0, 'tvoc': 70.0, 'co2': 500.0},
+    'high_humidity': {'light': 0.9, 'temp': 28.0, 'humidity': 85.0, 'tvoc': 120.0, 'co2': 600.0},
+    'poor_air': {'light': 1.0, 'temp': 26.0, 'humidity': 50.0, 'tvoc': 300.0, 'co2': 1200.0},
+    'rapid_change': {'light': 1.2, 'temp': 25.0, 'humidity': 45.0, 'tvoc': 60.0, 'co2': 450.0}
+}
+
 # =============================================================================
-# 2. DATA MODELING BY SCENARIO
+# 2. DATA MODELING BY SCENARIO - CHUNKED STREAM
 # =============================================================================
 
-def generate_scenario_data(scenario, duration_sec=300, sample_rate=10):
+DEFAULT_CHUNK_SIZE = 100_000  # Samples per streamed chunk
+
+COLUMNS = ['timestamp', 'scenario', 'light_v', 'temp_c', 'humidity_pct',
+           'tvoc_ppb', 'co2eq_ppm', 'anomaly_flag']
+SENSOR_COLUMNS = ['light_v', 'temp_c', 'humidity_pct', 'tvoc_ppb', 'co2eq_ppm']
+
+def ramp(idx, stop, n_samples):
+    """np.linspace(0, stop, n_samples) evaluated at the global sample indices idx"""
+    return idx * (stop / max(n_samples - 1, 1))
+
+def sample_and_hold_index(idx, update_interval):
     """
-    Generate sensor data for each scenario
-    - duration_sec: Sample duration (seconds) - SHORTENED TO 5 MINUTES FOR TESTING
-    - sample_rate: Samples per second (Hz)
+    Source index for the DHT22 2 s refresh: from the first update on, every sample
+    repeats the value read at the start of its interval. The first interval is
+    left untouched (the sensor has not produced a held reading yet).
+    """
+    held = (idx // update_interval) * update_interval
+    return np.where(idx >= update_interval, held, idx)
+
+class ScenarioStream:
+    """
+    Generator state for one scenario, produced in fixed-size chunks.
+
+    Each random source (light, temperature, humidity, TVOC and CO2 noise, anomaly
+    plan) draws from its own child Generator, and every trend is evaluated on the
+    global sample index, so concatenated chunks are identical whatever the chunk
+    size. State carried between chunks: the NSL 19M51 filter window, the DHT22
+    held reading, and the readings preceding the SGP30 failure window. The SGP30
+    baseline drift is a function of the global index and needs no extra state.
     """
-    n_samples = duration_sec * sample_rate
-    timestamps = [datetime.now() + timedelta(seconds=i/sample_rate) 
-                 for i in range(n_samples)]
-    
-    # Initialize data structure with float type
-    data = {
-        'timestamp': timestamps,
-        'scenario': [scenario] * n_samples,
-        'light_v': np.zeros(n_samples, dtype=np.float64),
-        'temp_c': np.zeros(n_samples, dtype=np.float64),
-        'humidity_pct': np.zeros(n_samples, dtype=np.float64),
-        'tvoc_ppb': np.zeros(n_samples, dtype=np.float64),
-        'co2eq_ppm': np.zeros(n_samples, dtype=np.float64),
-        'anomaly_flag': np.zeros(n_samples, dtype=np.int32)
-    }
     
-    # Generate base data
-    base_values = {
-        'normal': {'light': 1.2, 'temp': 25.0, 'humidity': 45.0, 'tvoc': 60.0, 'co2': 450.0},
-        'high_temp': {'light': 1.5, 'temp': 38.0, 'humidity': 25.0, 'tvoc': 70.0, 'co2': 500.0},
-        'high_humidity': {'light': 0.9, 'temp': 28.0, 'humidity': 85.0, 'tvoc': 120.0, 'co2': 600.0},
-        'poor_air': {'light': 1.0, 'temp': 26.0, 'humidity': 50.0, 'tvoc': 300.0, 'co2': 1200.0},
-        'rapid_change': {'light': 1.2, 'temp': 25.0, 'humidity': 45.0, 'tvoc': 60.0, 'co2': 450.0}
-    }[scenario]
-    
-    # Apply sensor profile
-    data['light_v'] = simulate_nsl19m51(base_values['light'], n_samples, sample_rate)
-    data['temp_c'], data['humidity_pct'] = simulate_dht22(
-        base_values['temp'], base_values['humidity'], n_samples, sample_rate
-    )
-    data['tvoc_ppb'], data['co2eq_ppm'] = simulate_sgp30(
-        base_values['tvoc'], base_values['co2'], n_samples, sample_rate
-    )
+    def __init__(self, scenario, duration_sec=300, sample_rate=10, seed=None, rng=None,
+                 start_time=None):
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        self.scenario = scenario
+        self.sample_rate = sample_rate
+        self.n_samples = int(duration_sec * sample_rate)
+        self.base = SCENARIO_BASE_VALUES[scenario]
+        self.position = 0
+        
+        self.rng_light, self.rng_temp, self.rng_hum, self.rng_tvoc, self.rng_co2, rng_anomaly = rng.spawn(6)
+        
+        self.start_time = np.datetime64(start_time if start_time is not None else datetime.now(), 'ns')
+        self.step_ns = np.int64(round(1e9 / sample_rate))
+        
+        # NSL 19M51: raw samples kept for the 5-tap response filter (2 behind, 2 ahead)
+        p = SensorProfiler.NSL_19M51
+        self.light_filter = np.exp(-np.arange(0, 5) / (p['response_time'] * sample_rate))
+        self.light_filter /= self.light_filter.sum()
+        self.light_raw = np.zeros(0, dtype=np.float64)
+        self.light_raw_start = 0
+        
+        # DHT22: reading held since the last 2 s update
+        self.hold_interval = 2 * sample_rate
+        self.held_temp = 0.0
+        self.held_hum = 0.0
+        
+        plan_anomalies(self, rng_anomaly)
     
-    # Add special events and noise
-    apply_scenario_effects(data, scenario, sample_rate)
-    inject_anomalies(data, scenario)
+    @property
+    def done(self):
+        return self.position >= self.n_samples
     
-    return pd.DataFrame(data)
+    def next_chunk(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Return the next chunk as a dict of column arrays, or None when finished"""
+        if self.done:
+            return None
+        start = self.position
+        end = min(start + chunk_size, self.n_samples)
+        idx = np.arange(start, end, dtype=np.int64)
+        
+        data = {
+            'timestamp': self.start_time + (idx * self.step_ns).astype('timedelta64[ns]'),
+            'scenario': np.full(len(idx), self.scenario, dtype=object),
+            'anomaly_flag': np.zeros(len(idx), dtype=np.int32)
+        }
+        
+        # Apply sensor profile
+        data['light_v'] = simulate_nsl19m51(self, start, end)
+        data['temp_c'], data['humidity_pct'] = simulate_dht22(self, idx)
+        data['tvoc_ppb'], data['co2eq_ppm'] = simulate_sgp30(self, idx)
+        
+        # Add special events and noise
+        apply_scenario_effects(data, self.scenario, self.sample_rate, idx, self.n_samples)
+        inject_anomalies(data, self, start, end)
+        
+        self.position = end
+        return {name: data[name] for name in COLUMNS}
+
+def iter_scenario_chunks(scenario, duration_sec=300, sample_rate=10, chunk_size=DEFAULT_CHUNK_SIZE,
+                         seed=None, rng=None, start_time=None):
+    """Yield the scenario as DataFrames of at most chunk_size rows"""
+    import pandas as pd
+    stream = ScenarioStream(scenario, duration_sec, sample_rate, seed=seed, rng=rng,
+                            start_time=start_time)
+    while not stream.done:
+        yield pd.DataFrame(stream.next_chunk(chunk_size))
+
+def generate_scenario_data(scenario, duration_sec=300, sample_rate=10, seed=None, rng=None,
+                           start_time=None):
+    """
+    Generate sensor data for each scenario
+    - duration_sec: Sample duration (seconds) - SHORTENED TO 5 MINUTES FOR TESTING
+    - sample_rate: Samples per second (Hz)
+    - seed / rng: Explicit seed or numpy Generator; same seed gives the same data
+    - start_time: First timestamp (defaults to now)
+    """
+    import pandas as pd
+    stream = ScenarioStream(scenario, duration_sec, sample_rate, seed=seed, rng=rng,
+                            start_time=start_time)
+    return pd.DataFrame(stream.next_chunk(stream.n_samples))
 
 # =============================================================================
-# 3. ADVANCED SENSOR SIMULATION - BUG FIXED
+# 3. ADVANCED SENSOR SIMULATION - VECTORIZED, SEEDED
 # =============================================================================
 
-def simulate_nsl19m51(base_voltage, n_samples, sample_rate):
+def simulate_nsl19m51(stream, start, end):
     """Simulate NSL 19M51 with real physical characteristics"""
     p = SensorProfiler.NSL_19M51
-    data = np.full(n_samples, base_voltage, dtype=np.float64)
+    n_samples = stream.n_samples
     
-    # Add measurement noise
-    noise = np.array([p['noise_profile']() for _ in range(n_samples)], dtype=np.float64)
-    data += noise
+    # Add measurement noise; draw two samples ahead for the response filter
+    drawn = stream.light_raw_start + len(stream.light_raw)
+    needed = min(end + 2, n_samples)
+    if needed > drawn:
+        fresh = stream.base['light'] + stream.rng_light.normal(0, p['noise_std'], needed - drawn)
+        stream.light_raw = np.concatenate((stream.light_raw, fresh))
     
-    # Simulate response time
-    response_filter = np.exp(-np.arange(0, 5) / (p['response_time'] * sample_rate))
-    response_filter /= response_filter.sum()
-    data = np.convolve(data, response_filter, mode='same')
+    # Simulate response time (same as np.convolve(..., mode='same') over the whole run)
+    window = np.pad(stream.light_raw[:needed - stream.light_raw_start],
+                    (max(0, 2 - start), end + 2 - needed))
+    data = np.convolve(window, stream.light_filter, mode='valid')
+    
+    keep_from = max(0, end - 2)
+    stream.light_raw = stream.light_raw[keep_from - stream.light_raw_start:]
+    stream.light_raw_start = keep_from
     
     return np.clip(data, p['min_v'], p['max_v'])
 
-def simulate_dht22(base_temp, base_humidity, n_samples, sample_rate):
-    """Simulate DHT22 with characteristic delay (BUG FIXED)"""
+def simulate_dht22(stream, idx):
+    """Simulate DHT22 with characteristic delay"""
     p = SensorProfiler.DHT22
-    temp = np.full(n_samples, base_temp, dtype=np.float64)
-    humidity = np.full(n_samples, base_humidity, dtype=np.float64)
+    base_temp, base_humidity = stream.base['temp'], stream.base['humidity']
     
     # Natural temperature variation
-    temp_variation = 0.5 * np.sin(np.linspace(0, 20*np.pi, n_samples))
-    temp += temp_variation
+    temp = base_temp + 0.5 * np.sin(ramp(idx, 20*np.pi, stream.n_samples))
     
     # Temperature-humidity relationship
-    humidity = humidity * (1 - 0.002 * (temp - base_temp))
+    humidity = base_humidity * (1 - 0.002 * (temp - base_temp))
     
     # Add noise
-    temp += np.random.normal(0, 0.2, n_samples).astype(np.float64)
-    humidity += np.random.normal(0, 0.5, n_samples).astype(np.float64)
+    temp += stream.rng_temp.normal(0, 0.2, len(idx))
+    humidity += stream.rng_hum.normal(0, 0.5, len(idx))
+    
+    # Simulate measurement delay: hold value steady for 2 seconds
+    start = idx[0]
+    source = sample_and_hold_index(idx, stream.hold_interval) - start
+    from_previous = source < 0
+    source[from_previous] = 0
+    held_temp, held_hum = temp[source], humidity[source]
+    held_temp[from_previous] = stream.held_temp
+    held_hum[from_previous] = stream.held_hum
     
-    # Simulate measurement delay
-    update_interval = 2 * sample_rate  # Update every 2 seconds
-    for i in range(update_interval, n_samples, update_interval):
-        # Hold value steady for 2 seconds
-        temp[i:i+update_interval] = temp[i]
-        humidity[i:i+update_interval] = humidity[i]
+    last_update = (idx[-1] // stream.hold_interval) * stream.hold_interval
+    if last_update >= start:
+        stream.held_temp = temp[last_update - start]
+        stream.held_hum = humidity[last_update - start]
     
     return (
-        np.clip(temp, *p['temp_range']),
-        np.clip(humidity, *p['humidity_range'])
+        np.clip(held_temp, *p['temp_range']),
+        np.clip(held_hum, *p['humidity_range'])
     )
 
-def simulate_sgp30(base_tvoc, base_co2, n_samples, sample_rate):
+def simulate_sgp30(stream, idx):
     """Simulate SGP30 with baseline drift phenomenon"""
     p = SensorProfiler.SGP30
-    tvoc = np.full(n_samples, base_tvoc, dtype=np.float64)
-    co2 = np.full(n_samples, base_co2, dtype=np.float64)
+    base_tvoc, base_co2 = stream.base['tvoc'], stream.base['co2']
     
     # Baseline drift over time
-    drift = np.linspace(0, p['baseline_drift'], n_samples, dtype=np.float64)
-    tvoc *= (1 + drift)
-    co2 *= (1 + drift * 0.8)
+    drift = ramp(idx, p['baseline_drift'], stream.n_samples)
+    tvoc = base_tvoc * (1 + drift)
+    co2 = base_co2 * (1 + drift * 0.8)
     
     # TVOC-CO2 correlation
     co2 = co2 + 0.2 * (tvoc - base_tvoc)
     
     # Add noise
-    noise_tvoc = np.random.normal(0, p['noise_factor'], n_samples)
-    noise_co2 = np.random.normal(0, p['noise_factor'], n_samples)
-    tvoc *= (1 + noise_tvoc)
-    co2 *= (1 + noise_co2)
+    tvoc *= 1 + stream.rng_tvoc.normal(0, p['noise_factor'], len(idx))
+    co2 *= 1 + stream.rng_co2.normal(0, p['noise_factor'], len(idx))
     
     return (
         np.clip(tvoc, *p['tvoc_range']),
@@ -163,34 +245,29 @@ def simulate_sgp30(base_tvoc, base_co2, n_samples, sample_rate):
     )
 
 # =============================================================================
-# 4. SCENARIO EFFECTS & ANOMALIES - PERFORMANCE OPTIMIZED
+# 4. SCENARIO EFFECTS & ANOMALIES - VECTORIZED
 # =============================================================================
 
-def apply_scenario_effects(data, scenario, sample_rate):
-    """Apply characteristic effects for each scenario"""
-    n_samples = len(data['temp_c'])
-    
+def apply_scenario_effects(data, scenario, sample_rate, idx, n_samples):
+    """Apply characteristic effects for each scenario (idx: global sample indices of the chunk)"""
     if scenario == 'high_temp':
         # Linear temperature increase + oscillation
-        linear_increase = np.linspace(0, 10, n_samples, dtype=np.float64)
-        oscillation = 2 * np.sin(np.linspace(0, 8*np.pi, n_samples))
+        linear_increase = ramp(idx, 10, n_samples)
+        oscillation = 2 * np.sin(ramp(idx, 8*np.pi, n_samples))
         data['temp_c'] += linear_increase + oscillation
         
     elif scenario == 'high_humidity':
-        # Exponential increase in humidity
-        ramp = np.geomspace(1, 3, n_samples//2, dtype=np.float64)
-        reversed_ramp = ramp[::-1]
-        data['humidity_pct'] = np.concatenate((
-            data['humidity_pct'][:n_samples//2] * ramp,
-            data['humidity_pct'][n_samples//2:] * reversed_ramp
-        ))
+        # Exponential increase in humidity up to x3 at mid-run, then back down
+        half = n_samples // 2
+        step = np.where(idx < half, idx, (half - 1) - (idx - half))
+        data['humidity_pct'] *= 3.0 ** (step / max(half - 1, 1))
         
     elif scenario == 'poor_air':
-        # Periodic TVOC/CO2 spikes
-        for start in range(200, n_samples, 300):
-            end = min(start + 20, n_samples)
-            data['tvoc_ppb'][start:end] *= 3.0
-            data['co2eq_ppm'][start:end] *= 1.8
+        # Periodic TVOC/CO2 spikes: 20 samples every 300, starting at 200
+        offset = idx - 200
+        spike = (offset >= 0) & (offset % 300 < 20)
+        data['tvoc_ppb'][spike] *= 3.0
+        data['co2eq_ppm'][spike] *= 1.8
             
     elif scenario == 'rapid_change':
         # Sudden changes in all three parameters
@@ -201,155 +278,551 @@ def apply_scenario_effects(data, scenario, sample_rate):
         ]
         
         for frame, changes in transitions:
-            idx = frame * sample_rate
-            if idx < n_samples:
-                data['light_v'][idx:] += changes['light']
-                data['temp_c'][idx:] += changes['temp']
-                data['humidity_pct'][idx:] += changes['humidity']
-
-def inject_anomalies(data, scenario):
-    """Inject real-world anomalies into the data"""
-    n_samples = len(data['temp_c'])
+            after = idx >= frame * sample_rate
+            data['light_v'][after] += changes['light']
+            data['temp_c'][after] += changes['temp']
+            data['humidity_pct'][after] += changes['humidity']
+
+SHORT_ANOMALY_SENSORS = ('light_v', 'temp_c', 'humidity_pct')
+SHORT_ANOMALY_FACTORS = np.array([0.1, 2.0, 5.0])
+LONG_ANOMALY_SENSORS = ('tvoc_ppb', 'co2eq_ppm')
+LONG_ANOMALY_FACTORS = np.array([0.2, 0.5, 1.5])
+
+FAILURE_HISTORY = 100  # Samples averaged for the stuck value (failures start at sample >= 100)
+
+# Decay multipliers per decay length (3-5 samples), padded with NaN to 5 columns
+DECAY_TABLE = np.array([
+    np.pad(np.linspace(1.0, 0.1, length), (0, 5 - length), constant_values=np.nan)
+    for length in range(3, 6)
+])
+
+def plan_anomalies(stream, rng):
+    """Draw every anomaly of the run up front so chunks only have to apply them"""
+    n_samples = stream.n_samples
     anomaly_prob = 0.002  # 0.2% chance of anomaly
     
-    # Short anomaly - Noise spike
+    # Short anomaly - Noise spike followed by a 3-5 sample decay
     short_anomalies = max(1, int(n_samples * anomaly_prob))
-    for _ in range(short_anomalies):
-        idx = random.randint(10, n_samples-10)
-        sensor = random.choice(['light_v', 'temp_c', 'humidity_pct'])
+    idx = rng.integers(10, n_samples - 10, size=short_anomalies, endpoint=True)
+    sensor = rng.integers(0, len(SHORT_ANOMALY_SENSORS), size=short_anomalies)
+    factor = SHORT_ANOMALY_FACTORS[rng.integers(0, len(SHORT_ANOMALY_FACTORS), size=short_anomalies)]
+    decay_length = rng.integers(3, 5, size=short_anomalies, endpoint=True)
+    
+    order = np.argsort(idx, kind='stable')
+    stream.spike_idx = idx[order]
+    stream.spike_sensor = sensor[order]
+    stream.spike_factor = factor[order]
+    stream.spike_decay = DECAY_TABLE[decay_length[order] - 3][:, 1:]
+    stream.spike_peak = np.full(short_anomalies, np.nan)
+    
+    # Long anomaly - Sensor failure
+    stream.failure = None
+    if stream.scenario != 'rapid_change':
+        long_duration = int(rng.integers(50, 200, endpoint=True))  # 5-20 seconds
+        start_idx = int(rng.integers(100, n_samples - long_duration, endpoint=True))
+        affected_sensor = LONG_ANOMALY_SENSORS[rng.integers(0, len(LONG_ANOMALY_SENSORS))]
+        stream.failure = (start_idx, long_duration, affected_sensor, rng.choice(LONG_ANOMALY_FACTORS))
+        stream.failure_history = np.zeros(FAILURE_HISTORY, dtype=np.float64)
+        stream.failure_value = None
+
+def inject_anomalies(data, stream, start, end):
+    """Inject real-world anomalies into the chunk [start, end)"""
+    n_samples = stream.n_samples
+    first, last = np.searchsorted(stream.spike_idx, [start, end])
+    first_decay = np.searchsorted(stream.spike_idx, start - 4)
+    
+    # Spikes whose decay (up to 4 samples) may reach into this chunk
+    idx = stream.spike_idx[first_decay:last]
+    sensor = stream.spike_sensor[first_decay:last]
+    decay = stream.spike_decay[first_decay:last]
+    decay_pos = idx[:, None] + np.arange(1, 5)
+    in_decay = ~np.isnan(decay) & (decay_pos >= start) & (decay_pos < min(end, n_samples))
+    in_chunk = np.arange(first_decay, last) >= first
+    
+    for s, name in enumerate(SHORT_ANOMALY_SENSORS):
+        column = data[name]
         
         # Create noise spike
-        anomaly_factor = random.choice([0.1, 2.0, 5.0])
-        data[sensor][idx] *= anomaly_factor
-        data['anomaly_flag'][idx] = 1
+        spikes = np.flatnonzero(in_chunk & (sensor == s))
+        peak = column[idx[spikes] - start] * stream.spike_factor[first_decay + spikes]
+        column[idx[spikes] - start] = peak
+        stream.spike_peak[first_decay + spikes] = peak
         
         # Decay effect
-        decay_length = random.randint(3, 5)
-        decay = np.linspace(1.0, 0.1, decay_length)
-        for i in range(1, decay_length):
-            if idx+i < n_samples:
-                data[sensor][idx+i] = data[sensor][idx] * decay[i]
-                data['anomaly_flag'][idx+i] = 2
-
-    # Long anomaly - Sensor failure
-    if scenario != 'rapid_change':
-        long_duration = random.randint(50, 200)  # 5-20 seconds
-        start_idx = random.randint(100, n_samples-long_duration)
-        affected_sensor = random.choice(['tvoc_ppb', 'co2eq_ppm'])
-        
-        # Static value error
-        static_value = np.mean(data[affected_sensor]) * random.choice([0.2, 0.5, 1.5])
-        data[affected_sensor][start_idx:start_idx+long_duration] = static_value
-        data['anomaly_flag'][start_idx:start_idx+long_duration] = 3
+        mine = sensor == s
+        rows = in_decay[mine]
+        values = stream.spike_peak[first_decay:last][mine][:, None] * decay[mine]
+        column[decay_pos[mine][rows] - start] = values[rows]
+    
+    data['anomaly_flag'][decay_pos[in_decay] - start] = 2
+    data['anomaly_flag'][idx[in_chunk] - start] = 1
+    
+    # Long anomaly - Sensor failure, stuck at a multiple of the level read just before it
+    if stream.failure is None:
+        return
+    fail_start, fail_duration, affected_sensor, fail_factor = stream.failure
+    fail_end = fail_start + fail_duration
+    column = data[affected_sensor]
+    history_start = fail_start - FAILURE_HISTORY
+    lo, hi = max(history_start, start), min(fail_start, end)
+    if lo < hi:
+        stream.failure_history[lo - history_start:hi - history_start] = column[lo - start:hi - start]
+    if start < fail_end and end > fail_start:
+        if stream.failure_value is None:
+            stream.failure_value = stream.failure_history.mean() * fail_factor
+        lo, hi = max(fail_start, start) - start, min(fail_end, end) - start
+        column[lo:hi] = stream.failure_value
+        data['anomaly_flag'][lo:hi] = 3
 
 # =============================================================================
 # 5. DATA PROCESSING & VISUALIZATION - OPTIMIZED
 # =============================================================================
 
-def visualize_scenario(df, scenario):
-    """Visualize sensor data for the scenario"""
+PLOT_DPI = 150
+PLOT_FIGSIZE = (15, 20)
+ANOMALY_COLORS = {1: 'red', 2: 'orange', 3: 'purple'}
+
+PLOT_TRACES = [
+    ('light_v', 'b-', 'Light (V)'),          # Light Sensor
+    ('temp_c', 'r-', 'Temp (°C)'),           # Temperature
+    ('humidity_pct', 'g-', 'Humidity (%)'),  # Humidity
+    ('tvoc_ppb', 'm-', 'TVOC (ppb)'),        # Air Quality
+    ('co2eq_ppm', 'c-', 'CO2eq (ppm)')
+]
+
+def minmax_buckets(values, size, lead=0):
+    """
+    Indices of the first-occurring of the min and max of each bucket of `size`
+    samples, then the other. The first bucket is `lead` samples short, for a
+    bucket that started in the previous chunk.
+    """
+    n_samples = len(values)
+    n_buckets = -(-(n_samples + lead) // size)  # ceil
+    padded = np.pad(values, (lead, n_buckets * size - n_samples - lead), mode='edge').reshape(n_buckets, size)
+    offset = np.arange(n_buckets) * size - lead
+    i_min = offset + padded.argmin(axis=1)
+    i_max = offset + padded.argmax(axis=1)
+    idx = np.column_stack((np.minimum(i_min, i_max), np.maximum(i_min, i_max))).ravel()
+    return np.clip(idx, 0, n_samples - 1)
+
+def minmax_decimate(n_samples, values, n_buckets):
+    """
+    Indices of a shape-preserving min/max downsample: the first-occurring of the
+    min and max of each bucket, then the other, so spikes survive at any zoom.
+    Returns all indices when there are fewer than 2 samples per bucket.
+    """
+    if n_samples <= 2 * n_buckets:
+        return np.arange(n_samples)
+    return minmax_buckets(values, -(-n_samples // n_buckets))
+
+def anomaly_runs(flags, flag):
+    """(start, end) sample index pairs, end exclusive, of contiguous runs of one anomaly flag"""
+    edges = np.diff((flags == flag).astype(np.int8), prepend=0, append=0)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+class PlotDecimator:
+    """
+    What visualize_scenario draws of a scenario, fed chunk by chunk: each trace
+    min/max-decimated into buckets over the global sample index (n_buckets
+    over n_samples expected samples), and the anomaly runs as (first, last)
+    timestamps, joined across chunk boundaries. Memory stays at about two
+    points per bucket whatever the run length.
+    """
+
+    def __init__(self, n_samples, n_buckets):
+        self.size = -(-n_samples // n_buckets) if n_samples > 2 * n_buckets else 1
+        self.n = 0
+        self.first = self.last = None
+        self.points = {column: ([], []) for column, _, _ in PLOT_TRACES}
+        self.runs = {flag: [] for flag in ANOMALY_COLORS}
+        self.last_flag = 0
+
+    def add(self, df):
+        n = len(df)
+        if not n:
+            return
+        t = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        lead = self.n % self.size
+        for column, (times, values) in self.points.items():
+            v = df[column].to_numpy()
+            idx = minmax_buckets(v, self.size, lead) if self.size > 1 else slice(None)
+            times.append(t[idx])
+            values.append(v[idx])
+        flags = df['anomaly_flag'].to_numpy()
+        for flag, runs in self.runs.items():
+            starts, ends = anomaly_runs(flags, flag)
+            for start, end in zip(starts, ends):
+                if start == 0 and self.last_flag == flag:
+                    runs[-1][1] = t[end - 1]  # continues the previous chunk's run
+                else:
+                    runs.append([t[start], t[end - 1]])
+        self.last_flag = flags[-1]
+        self.first = t[0] if self.first is None else self.first
+        self.last = t[-1]
+        self.n += n
+
+    def trace(self, column):
+        times, values = self.points[column]
+        if not times:
+            return np.array([], dtype='datetime64[ns]'), np.array([])
+        return np.concatenate(times), np.concatenate(values)
+
+def visualize_scenario(df, scenario, path=None, max_points=None):
+    """
+    Visualize sensor data for the scenario (saved to path, default <scenario>_sensor_data.png)
+
+    Traces are min/max-decimated to about two points per horizontal pixel
+    (max_points buckets, default the figure width in pixels), and contiguous
+    anomaly runs are drawn as spans, one collection per flag type and subplot,
+    so rendering cost no longer grows with the number of samples.
+    """
+    decimator = PlotDecimator(len(df), max_points or int(PLOT_FIGSIZE[0] * PLOT_DPI))
+    decimator.add(df)
+    plot_decimated(decimator, scenario, path)
+
+def plot_decimated(decimator, scenario, path=None):
+    """Render a PlotDecimator, as visualize_scenario does for a whole frame"""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-display backend
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
     try:
-        fig, axs = plt.subplots(5, 1, figsize=(15, 20), sharex=True)
+        fig, axs = plt.subplots(5, 1, figsize=PLOT_FIGSIZE, sharex=True)
         fig.suptitle(f'Sensor Data Simulation: {scenario} Scenario', fontsize=16)
         
-        # Light Sensor
-        axs[0].plot(df['timestamp'], df['light_v'], 'b-')
-        axs[0].set_ylabel('Light (V)')
-        axs[0].grid(True)
-        
-        # Temperature
-        axs[1].plot(df['timestamp'], df['temp_c'], 'r-')
-        axs[1].set_ylabel('Temp (°C)')
-        axs[1].grid(True)
-        
-        # Humidity
-        axs[2].plot(df['timestamp'], df['humidity_pct'], 'g-')
-        axs[2].set_ylabel('Humidity (%)')
-        axs[2].grid(True)
-        
-        # Air Quality
-        axs[3].plot(df['timestamp'], df['tvoc_ppb'], 'm-', label='TVOC')
-        axs[3].set_ylabel('TVOC (ppb)')
-        axs[3].grid(True)
-        
-        axs[4].plot(df['timestamp'], df['co2eq_ppm'], 'c-', label='CO2eq')
-        axs[4].set_ylabel('CO2eq (ppm)')
+        for ax, (column, style, label) in zip(axs, PLOT_TRACES):
+            t, values = decimator.trace(column)
+            ax.plot(mdates.date2num(t), values, style)
+            ax.set_ylabel(label)
+            ax.grid(True)
         axs[4].set_xlabel('Timestamp')
-        axs[4].grid(True)
+        axs[4].xaxis_date()
         
-        # Mark anomaly points
-        anomalies = df[df['anomaly_flag'] > 0]
-        for _, row in anomalies.iterrows():
-            color = {1: 'red', 2: 'orange', 3: 'purple'}.get(row['anomaly_flag'], 'gray')
-            for ax in axs:
-                ax.axvline(x=row['timestamp'], color=color, alpha=0.3)
+        # Mark anomaly runs as full-height spans; runs end one sample period after their last sample
+        if decimator.n:
+            first, last = mdates.date2num(np.array([decimator.first, decimator.last]))
+            period = (last - first) / max(decimator.n - 1, 1)
+            for flag, color in ANOMALY_COLORS.items():
+                runs = decimator.runs[flag]
+                if not runs:
+                    continue
+                starts, ends = mdates.date2num(np.array(runs).T)
+                xranges = np.column_stack((starts, ends - starts + period))
+                for ax in axs:
+                    ax.broken_barh(xranges, (0, 1), transform=ax.get_xaxis_transform(),
+                                   facecolors=color, edgecolors=color, linewidth=0.5, alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig(f'{scenario}_sensor_data.png', dpi=150)
+        plt.savefig(path or f'{scenario}_sensor_data.png', dpi=PLOT_DPI)
         plt.close()
     except Exception as e:
         print(f"Visualization error for {scenario}: {str(e)}")
 
 # =============================================================================
-# 6. MAIN EXECUTION & DATA EXPORT - STABLE VERSION
+# 6. MAIN EXECUTION & DATA EXPORT - STREAMING, BOUNDED MEMORY
 # =============================================================================
 
-def main():
-    scenarios = [
-        'normal', 
-        'high_temp', 
-        'high_humidity', 
-        'poor_air', 
-        'rapid_change'
-    ]
+class CsvChunkWriter:
+    """Append DataFrame chunks to one CSV file, header written once"""
     
-    full_dataset = pd.DataFrame()
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._file = open(path, 'w', newline='')
     
-    # Create output directory if it does not exist
-    os.makedirs('simulation_output', exist_ok=True)
+    def write(self, df):
+        df.to_csv(self._file, header=self.rows == 0, index=False)
+        self.rows += len(df)
+    
+    def append_file(self, path, rows):
+        """Copy a shard written by another CsvChunkWriter, byte for byte, without parsing it"""
+        with open(path, newline='') as shard:
+            header = shard.readline()
+            if self.rows == 0:
+                self._file.write(header)
+            shutil.copyfileobj(shard, self._file, 1 << 20)
+        self.rows += rows
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
     
-    for scenario in scenarios:
-        print(f"Generating {scenario} scenario data...")
+    def __exit__(self, *exc):
+        self.close()
+
+class ParquetChunkWriter:
+    """Append DataFrame chunks to one Parquet file, one row group per chunk (needs pyarrow)"""
+    
+    def __init__(self, path):
         try:
-            scenario_df = generate_scenario_data(scenario, duration_sec=300)  # Only 5 minutes/scenario
-            visualize_scenario(scenario_df, scenario)
-            
-            # Save image to output directory
-            if os.path.exists(f'{scenario}_sensor_data.png'):
-                os.rename(f'{scenario}_sensor_data.png', f'simulation_output/{scenario}_sensor_data.png')
-            
-            full_dataset = pd.concat([full_dataset, scenario_df])
-        except Exception as e:
-            print(f"Error generating {scenario} data: {str(e)}")
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow") from e
+        self._pa, self._pq = pa, pq
+        self.path = path
+        self.rows = 0
+        self._writer = None
+    
+    def write(self, df):
+        table = self._pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+        self.rows += len(df)
+    
+    def append_file(self, path, rows):
+        """Copy the row groups of a shard written by another ParquetChunkWriter"""
+        shard = self._pq.ParquetFile(path)
+        for i in range(shard.num_row_groups):
+            table = shard.read_row_group(i)
+            if self._writer is None:
+                self._writer = self._pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        self.rows += rows
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class ShardChunkWriter:
+    """
+    Write DataFrame chunks as a shard_dataset.py directory: the canonical schema
+    (ldr_v/hum_pct/eco2_ppm names, fixed dtypes) that train_model.py --shards
+    memory-maps. The replica column is not part of the schema and is dropped.
+    """
+    
+    def __init__(self, path):
+        from shard_dataset import ShardWriter
+        self.path = path
+        self.rows = 0
+        self._writer = ShardWriter(path, os.path.splitext(os.path.basename(path))[0], 'simulator')
+    
+    def write(self, df):
+        self._writer.write(df)
+        self.rows += len(df)
+    
+    def append_file(self, path, rows):
+        """Hard-link the shards written by another ShardChunkWriter, without copying them"""
+        self._writer.link(path)
+        self.rows += rows
+    
+    def close(self):
+        self._writer.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+CHUNK_WRITERS = {'csv': CsvChunkWriter, 'parquet': ParquetChunkWriter, 'shards': ShardChunkWriter}
+
+class RunningSummary:
+    """Per-scenario min/max/mean and anomaly count, updated chunk by chunk"""
+    
+    def __init__(self):
+        self.stats = {}
+    
+    def update(self, df):
+        scenario = df['scenario'].iat[0]
+        values = df[SENSOR_COLUMNS].to_numpy()
+        s = self.stats.setdefault(scenario, {
+            'min': np.full(len(SENSOR_COLUMNS), np.inf),
+            'max': np.full(len(SENSOR_COLUMNS), -np.inf),
+            'sum': np.zeros(len(SENSOR_COLUMNS)),
+            'count': 0,
+            'anomalies': 0
+        })
+        np.minimum(s['min'], values.min(axis=0), out=s['min'])
+        np.maximum(s['max'], values.max(axis=0), out=s['max'])
+        s['sum'] += values.sum(axis=0)
+        s['count'] += len(values)
+        s['anomalies'] += int((df['anomaly_flag'].to_numpy() > 0).sum())
+    
+    def merge(self, other):
+        """Fold in the aggregates of another RunningSummary (e.g. from a worker)"""
+        for scenario, o in other.stats.items():
+            s = self.stats.setdefault(scenario, {
+                'min': o['min'].copy(), 'max': o['max'].copy(), 'sum': np.zeros_like(o['sum']),
+                'count': 0, 'anomalies': 0
+            })
+            np.minimum(s['min'], o['min'], out=s['min'])
+            np.maximum(s['max'], o['max'], out=s['max'])
+            s['sum'] += o['sum']
+            s['count'] += o['count']
+            s['anomalies'] += o['anomalies']
+    
+    @property
+    def total_samples(self):
+        return sum(s['count'] for s in self.stats.values())
+    
+    def report(self):
+        """Same layout as the former groupby('scenario').agg(...) report"""
+        import pandas as pd
+        columns = pd.MultiIndex.from_tuples(
+            [(c, stat) for c in SENSOR_COLUMNS for stat in ('min', 'max', 'mean')]
+            + [('anomaly_flag', 'anomalies')]
+        )
+        rows = []
+        for s in self.stats.values():
+            mean = s['sum'] / max(s['count'], 1)
+            row = np.column_stack((s['min'], s['max'], mean)).ravel().tolist()
+            rows.append(row + [s['anomalies']])
+        return pd.DataFrame(rows, index=pd.Index(list(self.stats), name='scenario'), columns=columns)
+
+
+SCENARIOS = [
+    'normal', 
+    'high_temp', 
+    'high_humidity', 
+    'poor_air', 
+    'rapid_change'
+]
+
+def task_seed(entropy, scenario, replica):
+    """
+    Seed of one (scenario, replica) task, derived from the run entropy and the
+    task identity only, so output does not depend on worker count or scheduling.
+    """
+    return np.random.SeedSequence(entropy, spawn_key=(SCENARIOS.index(scenario), replica))
+
+def run_scenario_task(scenario, replica, entropy, duration_sec, sample_rate, chunk_size, fmt,
+                      start_time, shard_path, plot_path=None, with_replica=False):
+    """
+    Generate one scenario replica into its own shard file (runs in a worker
+    process). Only the small RunningSummary travels back to the parent.
+    """
+    print(f"Generating {scenario} scenario data (replica {replica})...")
+    rng = np.random.default_rng(task_seed(entropy, scenario, replica))
+    summary = RunningSummary()
+    # The plot is decimated chunk by chunk, so memory does not grow with the run
+    decimator = PlotDecimator(int(duration_sec * sample_rate), int(PLOT_FIGSIZE[0] * PLOT_DPI)) \
+        if plot_path else None
+    with CHUNK_WRITERS[fmt](shard_path) as writer:
+        for chunk in iter_scenario_chunks(scenario, duration_sec, sample_rate, chunk_size,
+                                          rng=rng, start_time=start_time):
+            if with_replica:
+                chunk.insert(2, 'replica', np.int32(replica))
+            writer.write(chunk)
+            summary.update(chunk)
+            if plot_path:
+                decimator.add(chunk)
+    if plot_path:
+        plot_decimated(decimator, scenario, plot_path)
+    return shard_path, writer.rows, summary
+
+def run_simulation(duration_sec=300, sample_rate=10, chunk_size=DEFAULT_CHUNK_SIZE, fmt='csv',
+                   seed=None, plot=True, output_dir='simulation_output', workers=1, replicas=1,
+                   start_time=None, keep_shards=False):
+    """
+    Generate every scenario (times `replicas` Monte-Carlo replicas) and merge them
+    into one output file.
+
+    Each (scenario, replica) task streams its chunks into a shard file, in a pool
+    of `workers` processes when workers > 1. The parent then appends the shards in
+    task order without loading them into DataFrames. Seeds come from task_seed, so
+    for a given seed and start_time the output is bit-identical for any worker
+    count. Only the current chunk is held in memory (plus the decimated plot
+    points when plot=True).
+    """
+    # Create output directory if it does not exist
+    os.makedirs(output_dir, exist_ok=True)
+    entropy = np.random.SeedSequence(seed).entropy
+    start_time = np.datetime64(start_time if start_time is not None else datetime.now(), 'ns')
+    summary = RunningSummary()
     
-    # Export data
     timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"simulation_output/ullai_sensor_data_{timestamp_str}.csv"
-    full_dataset.to_csv(filename, index=False)
+    filename = os.path.join(output_dir, f"ullai_sensor_data_{timestamp_str}.{fmt}")
+    shard_dir = os.path.join(output_dir, f"shards_{timestamp_str}")
+    os.makedirs(shard_dir, exist_ok=True)
+    
+    tasks = []
+    for scenario in SCENARIOS:
+        for replica in range(replicas):
+            suffix = f"{scenario}_{replica:04d}" if replicas > 1 else scenario
+            tasks.append(dict(
+                scenario=scenario, replica=replica, entropy=entropy,
+                duration_sec=duration_sec, sample_rate=sample_rate, chunk_size=chunk_size,
+                fmt=fmt, start_time=start_time,
+                shard_path=os.path.join(shard_dir, f"shard_{suffix}.{fmt}"),
+                plot_path=os.path.join(output_dir, f"{suffix}_sensor_data.png") if plot else None,
+                with_replica=replicas > 1
+            ))
+    
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        futures = [pool.submit(run_scenario_task, **task) for task in tasks]
+    else:
+        pool, futures = None, None
+    
+    # Merge shards in task order so the output does not depend on completion order
+    with CHUNK_WRITERS[fmt](filename) as writer:
+        for i, task in enumerate(tasks):
+            try:
+                result = futures[i].result() if futures else run_scenario_task(**task)
+            except Exception as e:
+                print(f"Error generating {task['scenario']} data: {str(e)}")
+                continue
+            shard_path, rows, task_summary = result
+            writer.append_file(shard_path, rows)
+            summary.merge(task_summary)
+            if not keep_shards:
+                if os.path.isdir(shard_path):
+                    shutil.rmtree(shard_path)
+                else:
+                    os.remove(shard_path)
+    if pool is not None:
+        pool.shutdown()
+    if not keep_shards:
+        shutil.rmtree(shard_dir, ignore_errors=True)
     
     print("\n" + "="*50)
     print(f"Dataset generated successfully: {filename}")
-    print(f"Total samples: {len(full_dataset)}")
-    print(f"Scenarios: {', '.join(scenarios)}")
+    print(f"Total samples: {summary.total_samples}")
+    print(f"Scenarios: {', '.join(SCENARIOS)} ({replicas} replica(s) each)")
+    print(f"Seed entropy: {entropy}")
     print("="*50)
     
     # Statistical report
     try:
-        report = full_dataset.groupby('scenario').agg({
-            'light_v': ['min', 'max', 'mean'],
-            'temp_c': ['min', 'max', 'mean'],
-            'humidity_pct': ['min', 'max', 'mean'],
-            'tvoc_ppb': ['min', 'max', 'mean'],
-            'co2eq_ppm': ['min', 'max', 'mean'],
-            'anomaly_flag': lambda x: (x > 0).sum()
-        })
+        report = summary.report()
         print("\nStatistical Summary:")
         print(report)
         
         # Save report
-        report.to_csv(f'simulation_output/summary_report_{timestamp_str}.csv')
+        report.to_csv(os.path.join(output_dir, f'summary_report_{timestamp_str}.csv'))
     except Exception as e:
         print(f"Error generating report: {str(e)}")
+    
+    return filename, summary
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Generate simulated ULLAI sensor data')
+    parser.add_argument('--duration', type=int, default=300, help='Seconds per scenario (default 5 minutes)')
+    parser.add_argument('--sample-rate', type=int, default=10, help='Samples per second (Hz)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Samples per streamed chunk')
+    parser.add_argument('--format', choices=list(CHUNK_WRITERS), default='csv', dest='fmt')
+    parser.add_argument('--seed', type=int, default=None, help='Run seed (printed when omitted)')
+    parser.add_argument('--start-time', default=None, help='First timestamp, e.g. 2025-01-01T00:00:00')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes')
+    parser.add_argument('--replicas', type=int, default=1, help='Monte-Carlo replicas per scenario')
+    parser.add_argument('--keep-shards', action='store_true', help='Keep per-task shard files')
+    parser.add_argument('--no-plot', action='store_false', dest='plot')
+    parser.add_argument('--output-dir', default='simulation_output')
+    args = parser.parse_args(argv)
+    run_simulation(args.duration, args.sample_rate, args.chunk_size, args.fmt, args.seed,
+                   args.plot, args.output_dir, args.workers, args.replicas, args.start_time,
+                   args.keep_shards)
 
 if __name__ == "__main__":
     main()
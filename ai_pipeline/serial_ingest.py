@@ -0,0 +1,311 @@
+import argparse
+import csv
+import os
+import threading
+import time
+
+import numpy as np
+import serial
+
+import telemetry
+
+LOG_HEADER = ['millis', 'ldr_voltage', 'temp', 'hum', 'tvoc', 'eco2',
+              'prob0', 'prob1', 'prob2', 'AI_latency_us']
+HEAP_HEADER = ['host_time', 'last_millis', 'free_heap_bytes']
+LATENCY_PREFIX = 'AI_latency_us:'
+HEAP_PREFIX = 'Free heap: '
+HEAP_SUFFIX = ' bytes'
+# Other lines main.cpp prints: neither data nor malformed
+TEXT_LINES = {
+    'dht_failure': ['Failed to read from DHT sensor!'],
+    'debug': ['Input int8:', 'Output logits:'],
+    'boot': ['Beginning setup', 'Init ', 'Model initialized', 'Setup done', 'Failed to initialize'],
+}
+TEXT_PREFIXES = tuple(prefix for prefixes in TEXT_LINES.values() for prefix in prefixes)
+# Rows per shard when also writing a shard dataset: about 18 hours at 1 Hz
+LOG_SHARD_ROWS = 1 << 16
+
+
+def parse_lines(text):
+    """
+    Parse a block of complete serial lines from main.cpp.
+    Returns (rows, heap_values, malformed) where rows are 10-field string lists.
+    Data lines with the wrong field count, heap lines that are not
+    "Free heap: <digits> bytes" and unknown non-blank lines count as malformed.
+    """
+    rows, heap, malformed = [], [], 0
+    for line in text.replace(LATENCY_PREFIX, '\x00').splitlines():
+        if '\x00' in line:
+            fields = line.replace('\x00', '').strip().split(',')
+            if len(fields) == len(LOG_HEADER):
+                rows.append(fields)
+            else:
+                malformed += 1
+        elif line.startswith('Free heap'):
+            line = line.rstrip()
+            value = line[len(HEAP_PREFIX):-len(HEAP_SUFFIX)]
+            if line.startswith(HEAP_PREFIX) and line.endswith(HEAP_SUFFIX) and value.isascii() and value.isdigit():
+                heap.append(value)
+            else:
+                malformed += 1
+        elif line.strip() and not line.startswith(TEXT_PREFIXES):
+            malformed += 1
+    return rows, heap, malformed
+
+
+class DeviceStats:
+    """Counters of one board; read by the reporter thread without locking"""
+
+    def __init__(self):
+        self.bytes = 0
+        self.rows = 0
+        self.heap_lines = 0
+        self.malformed = 0
+        self.dropped_bytes = 0  # partial line lost on disconnect
+        self.reconnects = 0
+        self.flushes = 0
+        self.errors = 0         # unexpected exceptions (parsing, writing, ...)
+        self.last_error = ''
+        self.connected = False
+        self.stopped = False    # gave up after max_errors errors
+
+
+class BoardReader(threading.Thread):
+    """
+    Reader thread for one serial port. Reads whatever bytes are waiting, parses
+    complete lines in batches, and buffers rows that are written in bulk every
+    flush_rows rows or flush_interval seconds. Reopens the port when the board
+    resets or is unplugged. With binary=True the port carries telemetry frames
+    (firmware built with ULLAI_BINARY_TELEMETRY) and the same CSV layout is
+    written from the decoded records. With shard_dir set, every flushed batch
+    also goes to a shard_dataset.py ShardWriter (unlabeled rows, device millis).
+    Any other exception is counted in stats.errors and printed, and the port is
+    reopened; after max_errors of them the reader stops (stats.stopped).
+    """
+
+    def __init__(self, port, log_path, heap_path, baud=115200, flush_rows=500,
+                 flush_interval=1.0, reconnect_delay=0.5, binary=False, shard_dir=None,
+                 shard_rows=LOG_SHARD_ROWS, max_errors=10):
+        super().__init__(name=f"reader-{os.path.basename(port)}", daemon=True)
+        self.port = port
+        self.baud = baud
+        self.log_path = log_path
+        self.heap_path = heap_path
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.reconnect_delay = reconnect_delay
+        self.binary = binary
+        self.shard_dir = shard_dir
+        self.shard_rows = shard_rows
+        self.max_errors = max_errors
+        self.stats = DeviceStats()
+        self.stop_event = threading.Event()
+        self._rows = []
+        self._heap = []
+        self._last_millis = ''
+        self._last_heap = np.uint32(0)
+
+    def run(self):
+        with open(self.log_path, 'w', newline='') as log_file, \
+                open(self.heap_path, 'w', newline='') as heap_file:
+            self._log = csv.writer(log_file)
+            self._heap_writer = csv.writer(heap_file)
+            self._log.writerow(LOG_HEADER)
+            self._heap_writer.writerow(HEAP_HEADER)
+            self._files = (log_file, heap_file)
+            self._shards = None
+            if self.shard_dir:
+                from shard_dataset import ShardWriter
+                device = os.path.basename(self.port)
+                self._shards = ShardWriter(self.shard_dir, f"{device}-{time.strftime('%Y%m%d_%H%M%S')}",
+                                           f"serial:{device}", 'device_ms', self.shard_rows)
+            try:
+                while not self.stop_event.is_set():
+                    try:
+                        self._read_port()
+                    except (serial.SerialException, OSError):
+                        self.stats.connected = False
+                        self.stats.reconnects += 1
+                        self.stop_event.wait(self.reconnect_delay)
+                    except Exception as e:
+                        self._error(e)
+                        if self.stats.stopped:
+                            break
+                        self.stats.reconnects += 1
+                        self.stop_event.wait(self.reconnect_delay)
+                try:
+                    self._flush()
+                except Exception as e:
+                    self._error(e)
+            finally:
+                if self._shards:
+                    self._shards.close()
+
+    def _error(self, e):
+        """Record an unexpected exception; the reader stops after max_errors of them"""
+        self.stats.connected = False
+        self.stats.errors += 1
+        self.stats.last_error = f"{type(e).__name__}: {e}"
+        self.stats.stopped = self.stats.errors >= self.max_errors
+        action = f"stopped after {self.stats.errors} errors" if self.stats.stopped else "reconnecting"
+        print(f"{self.port}: {self.stats.last_error} ({action})", flush=True)
+
+    def _read_port(self):
+        with serial.Serial(self.port, self.baud, timeout=0.1) as ser:
+            self.stats.connected = True
+            pending = b''
+            decoder = telemetry.FrameDecoder() if self.binary else None
+            last_flush = time.monotonic()
+            try:
+                while not self.stop_event.is_set():
+                    data = ser.read(ser.in_waiting or 1)
+                    if data:
+                        self.stats.bytes += len(data)
+                    if data and decoder:
+                        crc_errors = decoder.stats['crc_errors']
+                        self._add_records(decoder.feed(data))
+                        self.stats.malformed += decoder.stats['crc_errors'] - crc_errors
+                    elif data:
+                        pending += data
+                        cut = pending.rfind(b'\n') + 1
+                        if cut:
+                            self._parse(pending[:cut])
+                            pending = pending[cut:]
+                    if (len(self._rows) >= self.flush_rows
+                            or time.monotonic() - last_flush >= self.flush_interval):
+                        self._flush()
+                        last_flush = time.monotonic()
+            finally:
+                self.stats.dropped_bytes += len(decoder.pending if decoder else pending)
+                self._flush()
+
+    def _parse(self, block):
+        rows, heap, malformed = parse_lines(block.decode(errors='ignore'))
+        if rows:
+            self._rows.extend(rows)
+            self._last_millis = rows[-1][0]
+            self.stats.rows += len(rows)
+        if heap:
+            now = f"{time.time():.3f}"
+            self._heap.extend([now, self._last_millis, value] for value in heap)
+            self.stats.heap_lines += len(heap)
+        self.stats.malformed += malformed
+
+    def _add_records(self, records):
+        if not len(records):
+            return
+        self._rows.extend(telemetry.format_rows(records))
+        self._last_millis = str(records['millis'][-1])
+        self.stats.rows += len(records)
+        # Every frame carries the free heap; log it when it changes
+        heap = records['free_heap']
+        changed = np.flatnonzero(np.diff(heap, prepend=self._last_heap) != 0)
+        if len(changed):
+            now = f"{time.time():.3f}"
+            self._heap.extend([now, str(records['millis'][i]), str(heap[i])] for i in changed)
+            self.stats.heap_lines += len(changed)
+            self._last_heap = heap[-1]
+
+    def _flush(self):
+        if not (self._rows or self._heap):
+            return
+        self._log.writerows(self._rows)
+        self._heap_writer.writerows(self._heap)
+        if self._shards and self._rows:
+            self._shards.write(dict(zip(LOG_HEADER, np.array(self._rows).T)))
+        self._rows.clear()
+        self._heap.clear()
+        for f in self._files:
+            f.flush()
+        self.stats.flushes += 1
+
+
+class IngestionService:
+    """Run one BoardReader per port and report throughput and drop counters"""
+
+    def __init__(self, ports, out_dir='data', log_template='ai_log_{device}.csv',
+                 heap_template='heap_log_{device}.csv', **reader_kwargs):
+        os.makedirs(out_dir, exist_ok=True)
+        self.readers = []
+        for port in ports:
+            device = os.path.basename(port)
+            self.readers.append(BoardReader(
+                port,
+                os.path.join(out_dir, log_template.format(device=device)),
+                os.path.join(out_dir, heap_template.format(device=device)),
+                **reader_kwargs
+            ))
+
+    def start(self):
+        for reader in self.readers:
+            reader.start()
+
+    def stop(self):
+        for reader in self.readers:
+            reader.stop_event.set()
+        for reader in self.readers:
+            reader.join()
+
+    def report(self, previous=None, elapsed=1.0):
+        """One status line per board; previous is the row count snapshot of the last report"""
+        lines = []
+        for i, reader in enumerate(self.readers):
+            s = reader.stats
+            rate = (s.rows - previous[i]) / elapsed if previous else 0.0
+            state = 'STOPPED' if s.stopped else 'up' if s.connected else 'DOWN'
+            lines.append(
+                f"{reader.port}: {state} rows={s.rows} ({rate:.0f}/s) "
+                f"heap={s.heap_lines} malformed={s.malformed} dropped_bytes={s.dropped_bytes} "
+                f"reconnects={s.reconnects} errors={s.errors}"
+                + (f" last error: {s.last_error}" if s.errors else "")
+            )
+        return lines
+
+    def run_forever(self, report_interval=10.0):
+        self.start()
+        previous = [0] * len(self.readers)
+        try:
+            while True:
+                time.sleep(report_interval)
+                for line in self.report(previous, report_interval):
+                    print(line)
+                previous = [r.stats.rows for r in self.readers]
+        except KeyboardInterrupt:
+            print("Stopped logging")
+        finally:
+            self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Log several ULLAI boards over serial into CSV files')
+    parser.add_argument('ports', nargs='*', default=['/dev/ttyACM0'])
+    parser.add_argument('--baud', type=int, default=115200)
+    parser.add_argument('--out-dir', default='data')
+    parser.add_argument('--log-template', default=None,
+                        help="Per-board CSV name, {device} is the port name (default ai_log.csv for one port)")
+    parser.add_argument('--flush-rows', type=int, default=500)
+    parser.add_argument('--flush-interval', type=float, default=1.0, help='Seconds between bulk writes')
+    parser.add_argument('--report-interval', type=float, default=10.0)
+    parser.add_argument('--binary', action='store_true',
+                        help='Boards send binary telemetry frames (ULLAI_BINARY_TELEMETRY firmware)')
+    parser.add_argument('--shards', default=None, metavar='DIR',
+                        help='Also write the rows to this shard dataset (shard_dataset.py)')
+    parser.add_argument('--shard-rows', type=int, default=LOG_SHARD_ROWS)
+    parser.add_argument('--max-errors', type=int, default=10,
+                        help='Stop a board after this many unexpected errors (each one reopens the port)')
+    args = parser.parse_args(argv)
+
+    single = len(args.ports) == 1
+    service = IngestionService(
+        args.ports, args.out_dir,
+        log_template=args.log_template or ('ai_log.csv' if single else 'ai_log_{device}.csv'),
+        heap_template='heap_log.csv' if single and not args.log_template else 'heap_log_{device}.csv',
+        baud=args.baud, flush_rows=args.flush_rows, flush_interval=args.flush_interval,
+        binary=args.binary, shard_dir=args.shards, shard_rows=args.shard_rows,
+        max_errors=args.max_errors
+    )
+    service.run_forever(args.report_interval)
+
+
+if __name__ == '__main__':
+    main()
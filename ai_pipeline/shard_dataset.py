@@ -0,0 +1,382 @@
+import argparse
+import itertools
+import json
+import os
+import shutil
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from features import FEATURE_COLUMNS, VALID_SCENARIOS, normalize_features
+from scaler_stats import LOG_ALIASES
+
+# One canonical dataset format for the simulator, the serial logger and the
+# trainer. A dataset is a directory of shards; each shard is a directory with
+# one fixed-dtype .npy file per SCHEMA column plus shard.json (rows, source,
+# time base, scenario counts). manifest.json at the root lists the shards, so
+# a reader knows sizes and class mix without opening any array. Columns are
+# memory-mapped (np.load(mmap_mode='r')) and read block by block, so millions
+# of rows cost only the blocks in flight.
+
+SCHEMA = {
+    'timestamp': '<i8',         # ms: Unix time (simulator) or device millis() (logs), see time_base
+    'ldr_v': '<f4',
+    'temp_c': '<f4',
+    'hum_pct': '<f4',
+    'tvoc_ppb': '<f4',
+    'eco2_ppm': '<f4',
+    'scenario': 'u1',           # index into SCENARIOS
+    'anomaly_flag': 'i1',       # simulator anomaly kind, -1 when unknown
+}
+# Append-only: codes are stored in the shards
+SCENARIOS = ['unlabeled', 'normal', 'high_temp', 'high_humidity', 'low_light', 'anomaly',
+             'poor_air', 'rapid_change']
+SCENARIO_CODE = {name: code for code, name in enumerate(SCENARIOS)}
+# Simulator and serial log column names -> canonical names
+ALIASES = {**LOG_ALIASES, 'millis': 'timestamp',
+           'light_v': 'ldr_v', 'humidity_pct': 'hum_pct', 'co2eq_ppm': 'eco2_ppm'}
+MISSING = {'timestamp': -1, 'scenario': SCENARIO_CODE['unlabeled'], 'anomaly_flag': -1}
+
+MANIFEST = 'manifest.json'
+SHARD_META = 'shard.json'
+FORMAT_VERSION = 1
+SHARD_ROWS = 1 << 20
+BLOCK_ROWS = 8192
+SHUFFLE_BUFFER = 16384
+VALIDATION_SPLIT = 0.1
+
+_manifest_lock = threading.Lock()
+
+
+def scenario_codes(values):
+    """uint8 SCENARIOS codes; empty labels are 'unlabeled', unknown names raise ValueError"""
+    values = pd.Series(np.asarray(values, dtype=object))
+    codes = np.array(pd.Categorical(values, categories=SCENARIOS).codes)
+    empty = values.isna().to_numpy() | (values == '').to_numpy()
+    unknown = (codes < 0) & ~empty
+    if unknown.any():
+        raise ValueError(f"Unknown scenarios {sorted(set(values[unknown]))}: add them to SCENARIOS")
+    codes[empty] = SCENARIO_CODE['unlabeled']
+    return codes.astype(SCHEMA['scenario'])
+
+
+def timestamp_ms(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ms]').astype(np.int64)
+    numeric = pd.to_numeric(pd.Series(values), errors='coerce')
+    if values.dtype == object and numeric.isna().all():
+        numeric = pd.to_datetime(pd.Series(values), errors='coerce').astype('datetime64[ms]').astype('int64')
+        numeric[numeric == np.iinfo(np.int64).min] = MISSING['timestamp']
+    return numeric.fillna(MISSING['timestamp']).to_numpy(dtype=np.int64)
+
+
+def canonical_columns(frame):
+    """SCHEMA-typed column arrays of a simulator, log or dataset chunk (DataFrame or dict of arrays)"""
+    frame = {ALIASES.get(name, name): values for name, values in frame.items()}
+    n = len(next(iter(frame.values())))
+    columns = {}
+    for name, dtype in SCHEMA.items():
+        if name not in frame:
+            columns[name] = np.full(n, MISSING.get(name, np.nan), dtype=dtype)
+        elif name == 'timestamp':
+            columns[name] = timestamp_ms(frame[name])
+        elif name == 'scenario':
+            columns[name] = scenario_codes(frame[name])
+        else:
+            values = pd.to_numeric(pd.Series(np.asarray(frame[name])), errors='coerce')
+            if name in MISSING:
+                values = values.fillna(MISSING[name])
+            columns[name] = values.to_numpy(dtype=dtype)
+    return columns
+
+
+def write_shard(root, name, columns, source, time_base):
+    """Write one shard directory atomically (built under a temporary name, then renamed)"""
+    rows = len(columns['timestamp'])
+    tmp = os.path.join(root, f".{name}.tmp")
+    os.makedirs(tmp)
+    for column, dtype in SCHEMA.items():
+        np.save(os.path.join(tmp, f"{column}.npy"), np.ascontiguousarray(columns[column], dtype=dtype))
+    counts = np.bincount(columns['scenario'], minlength=len(SCENARIOS))
+    meta = {'name': name, 'rows': rows, 'source': source, 'time_base': time_base,
+            'scenarios': {SCENARIOS[c]: int(counts[c]) for c in np.flatnonzero(counts)}}
+    with open(os.path.join(tmp, SHARD_META), 'w') as f:
+        json.dump(meta, f)
+    os.rename(tmp, os.path.join(root, name))
+    return meta
+
+
+def write_manifest(root):
+    """Rebuild manifest.json from the shard directories present under root"""
+    with _manifest_lock:
+        shards = []
+        for name in sorted(os.listdir(root)):
+            meta_path = os.path.join(root, name, SHARD_META)
+            if not name.startswith('.') and os.path.exists(meta_path):
+                with open(meta_path) as f:
+                    shards.append(json.load(f))
+        manifest = {'version': FORMAT_VERSION, 'schema': SCHEMA, 'scenarios': SCENARIOS,
+                    'rows': sum(s['rows'] for s in shards), 'shards': shards}
+        tmp = os.path.join(root, f".{MANIFEST}.{os.getpid()}.{threading.get_ident()}")
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, os.path.join(root, MANIFEST))
+    return manifest
+
+
+def load_manifest(root):
+    path = os.path.join(root, MANIFEST)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found: not a shard dataset, or run "
+                                f"python shard_dataset.py {root} --rebuild-manifest")
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest['schema'] != SCHEMA or manifest['scenarios'] != SCENARIOS[:len(manifest['scenarios'])]:
+        raise ValueError(f"{root} was written with another schema (version {manifest['version']})")
+    return manifest
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class ShardWriter:
+    """
+    Buffer canonicalized chunks and write a shard every shard_rows rows; close()
+    writes the partial last shard and the manifest. Shard names are
+    prefix-00000, prefix-00001, ..., so writers with distinct prefixes can share
+    one dataset directory.
+    """
+
+    def __init__(self, root, prefix, source, time_base='unix_ms', shard_rows=SHARD_ROWS):
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.prefix = prefix
+        self.source = source
+        self.time_base = time_base
+        self.shard_rows = shard_rows
+        self.rows = 0
+        self.shards = []
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, frame):
+        columns = canonical_columns(frame)
+        n = len(columns['timestamp'])
+        if not n:
+            return
+        self._buffer.append(columns)
+        self._buffered += n
+        self.rows += n
+        while self._buffered >= self.shard_rows:
+            self._write_shard(self.shard_rows)
+
+    def flush(self):
+        if self._buffered:
+            self._write_shard(self._buffered)
+
+    def _write_shard(self, n):
+        columns = {c: np.concatenate([b[c] for b in self._buffer]) for c in SCHEMA}
+        rest = {c: values[n:] for c, values in columns.items()}
+        self._buffer = [rest] if len(rest['timestamp']) else []
+        self._buffered -= n
+        name = f"{self.prefix}-{len(self.shards):05d}"
+        write_shard(self.root, name, {c: values[:n] for c, values in columns.items()}, self.source, self.time_base)
+        self.shards.append(name)
+
+    def link(self, source_root):
+        """
+        Append the shards of another dataset as this writer's next shards, hard
+        linked (copied across filesystems), e.g. per-worker simulator output
+        """
+        self.flush()
+        for shard in load_manifest(source_root)['shards']:
+            name = f"{self.prefix}-{len(self.shards):05d}"
+            tmp = os.path.join(self.root, f".{name}.tmp")
+            os.makedirs(tmp)
+            for column in SCHEMA:
+                _link_or_copy(os.path.join(source_root, shard['name'], f"{column}.npy"),
+                              os.path.join(tmp, f"{column}.npy"))
+            with open(os.path.join(tmp, SHARD_META), 'w') as f:
+                json.dump({**shard, 'name': name}, f)
+            os.rename(tmp, os.path.join(self.root, name))
+            self.shards.append(name)
+            self.rows += shard['rows']
+
+    def close(self):
+        self.flush()
+        return write_manifest(self.root)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def validation_mask(shard_name, start, n, fraction):
+    """Rows start..start+n of a shard that belong to the validation split (fixed per row)"""
+    rng = np.random.default_rng([zlib.crc32(shard_name.encode()), start])
+    return rng.random(n) < fraction
+
+
+class ShardedDataset:
+    """Read-only view over one or more shard dataset directories"""
+
+    def __init__(self, roots):
+        roots = [roots] if isinstance(roots, str) else list(roots)
+        self.shards = []
+        for root in roots:
+            for shard in load_manifest(root)['shards']:
+                self.shards.append({**shard, 'path': os.path.join(root, shard['name'])})
+        self.offsets = np.cumsum([0] + [s['rows'] for s in self.shards])
+
+    @property
+    def rows(self):
+        return int(self.offsets[-1])
+
+    def scenario_counts(self):
+        counts = {}
+        for shard in self.shards:
+            for name, n in shard['scenarios'].items():
+                counts[name] = counts.get(name, 0) + n
+        return counts
+
+    def classes(self):
+        """Trained class names: the known scenarios present, sorted like encode_labels()"""
+        counts = self.scenario_counts()
+        return sorted(name for name in VALID_SCENARIOS if counts.get(name))
+
+    def open(self, i, columns=None):
+        """Memory-mapped columns of shard i"""
+        path = self.shards[i]['path']
+        return {c: np.load(os.path.join(path, f"{c}.npy"), mmap_mode='r') for c in (columns or SCHEMA)}
+
+    def iter_blocks(self, columns=None, block_rows=BLOCK_ROWS):
+        """Yield dicts of at most block_rows rows, shard by shard"""
+        for i, shard in enumerate(self.shards):
+            mapped = self.open(i, columns)
+            for start in range(0, shard['rows'], block_rows):
+                yield {c: np.asarray(v[start:start + block_rows]) for c, v in mapped.items()}
+
+    def sample_features(self, n, scaler, seed=0):
+        """Normalized feature rows drawn uniformly from all shards (e.g. a quantization calibration set)"""
+        rng = np.random.default_rng(seed)
+        picks = np.sort(rng.choice(self.rows, min(n, self.rows), replace=False))
+        shard_of = np.searchsorted(self.offsets, picks, side='right') - 1
+        parts = []
+        for i in np.unique(shard_of):
+            mapped = self.open(i, FEATURE_COLUMNS)
+            local = picks[shard_of == i] - self.offsets[i]
+            parts.append(normalize_features({c: mapped[c][local] for c in FEATURE_COLUMNS}, scaler))
+        x = np.concatenate(parts).astype(np.float32)
+        return x[np.isfinite(x).all(axis=1)]
+
+    def _blocks(self, i, lookup, scaler, split, validation_split, block_rows, rng):
+        shard = self.shards[i]
+        mapped = self.open(i, FEATURE_COLUMNS + ['scenario'])
+        starts = np.arange(0, shard['rows'], block_rows)
+        if rng is not None:
+            rng.shuffle(starts)
+        for start in starts:
+            part = {c: np.asarray(v[start:start + block_rows]) for c, v in mapped.items()}
+            y = lookup[part['scenario']]
+            x = normalize_features(part, scaler).astype(np.float32)
+            keep = (y >= 0) & np.isfinite(x).all(axis=1)
+            if split != 'all':
+                held_out = validation_mask(shard['name'], int(start), len(y), validation_split)
+                keep &= held_out if split == 'validation' else ~held_out
+            if keep.any():
+                yield x[keep], y[keep]
+
+    def tf_dataset(self, scaler, classes, batch_size=32, split='train', validation_split=VALIDATION_SPLIT,
+                   shuffle=None, shuffle_buffer=SHUFFLE_BUFFER, cycle_length=4, block_rows=BLOCK_ROWS, seed=None):
+        """
+        Batches of (normalized x, class index y) streamed from the memory-mapped
+        shards. Shard order is reshuffled every epoch, cycle_length shards are
+        read in an interleave, block order within a shard is shuffled, and a
+        shuffle buffer mixes rows across those shards. Only labelled rows of
+        `classes` are used; split is 'train', 'validation' or 'all' (a fixed
+        validation_split of each shard's rows is held out).
+        """
+        import tensorflow as tf
+
+        shuffle = split == 'train' if shuffle is None else shuffle
+        lookup = np.full(256, -1, dtype=np.int32)
+        for k, name in enumerate(classes):
+            lookup[SCENARIO_CODE[name]] = k
+        ids = [i for i, s in enumerate(self.shards) if any(s['scenarios'].get(c) for c in classes)]
+        if not ids:
+            raise ValueError(f"No shard has rows of {classes}")
+        entropy = np.random.SeedSequence(seed).entropy
+        epochs = itertools.count()
+
+        def blocks(i):
+            rng = np.random.default_rng([entropy, int(i), next(epochs)]) if shuffle else None
+            yield from self._blocks(int(i), lookup, scaler, split, validation_split, block_rows, rng)
+
+        signature = (tf.TensorSpec((None, len(FEATURE_COLUMNS)), tf.float32), tf.TensorSpec((None,), tf.int32))
+        ds = tf.data.Dataset.from_tensor_slices(np.array(ids, dtype=np.int64))
+        if shuffle:
+            ds = ds.shuffle(len(ids), seed=seed, reshuffle_each_iteration=True)
+        ds = ds.interleave(lambda i: tf.data.Dataset.from_generator(blocks, args=(i,), output_signature=signature),
+                           cycle_length=min(cycle_length, len(ids)), num_parallel_calls=tf.data.AUTOTUNE,
+                           deterministic=not shuffle)
+        ds = ds.unbatch()
+        if shuffle:
+            ds = ds.shuffle(shuffle_buffer, seed=seed, reshuffle_each_iteration=True)
+        return ds.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+
+def import_csv(path, root, source, time_base, shard_rows=SHARD_ROWS, chunk_rows=100_000):
+    """Convert a dataset, simulator or log CSV into shards of root"""
+    prefix = f"{source}-{os.path.splitext(os.path.basename(path))[0]}-{time.strftime('%Y%m%d_%H%M%S')}"
+    with ShardWriter(root, prefix, source, time_base, shard_rows) as writer:
+        for chunk in pd.read_csv(path, chunksize=chunk_rows):
+            writer.write(chunk)
+    return writer
+
+
+def print_summary(root):
+    manifest = load_manifest(root)
+    data = ShardedDataset(root)
+    sources = {}
+    for shard in manifest['shards']:
+        sources[shard['source']] = sources.get(shard['source'], 0) + shard['rows']
+    row_bytes = sum(np.dtype(d).itemsize for d in SCHEMA.values())
+    print(f"{root}: {manifest['rows']} rows in {len(manifest['shards'])} shards "
+          f"({manifest['rows'] * row_bytes / 1e6:.1f} MB)")
+    print("  sources: " + ', '.join(f"{s} {n}" for s, n in sources.items()))
+    print("  scenarios: " + ', '.join(f"{s} {n}" for s, n in sorted(data.scenario_counts().items())))
+    print(f"  trainable classes: {data.classes()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sharded, memory-mapped ULLAI datasets')
+    parser.add_argument('root', help='Dataset directory')
+    parser.add_argument('--import-csv', nargs='+', default=[], metavar='CSV',
+                        help='Add dataset, simulator or log CSVs as shards')
+    parser.add_argument('--source', default='real', help='Source recorded for imported shards')
+    parser.add_argument('--time-base', default='device_ms', choices=['device_ms', 'unix_ms'],
+                        help='What the imported timestamp/millis column counts')
+    parser.add_argument('--shard-rows', type=int, default=SHARD_ROWS)
+    parser.add_argument('--rebuild-manifest', action='store_true', help='Rescan the shard directories')
+    args = parser.parse_args(argv)
+
+    for path in args.import_csv:
+        writer = import_csv(path, args.root, args.source, args.time_base, args.shard_rows)
+        print(f"{path}: {writer.rows} rows -> {len(writer.shards)} shard(s)")
+    if args.rebuild_manifest:
+        write_manifest(args.root)
+    print_summary(args.root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,544 @@
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from latency_analyzer import INFERENCE_BUDGET_US, LatencyHistogram
+
+# Stability analysis of long runs against the README's "24 hours without
+# error" target, for one or more boards over one or more days. Per board:
+#   - a device clock turns printed millis into (boot, uptime): millis going
+#     backwards is a reset, unless it drops across 2^32 (the 49.7-day
+#     millis() wrap), where uptime carries on
+#   - records (latency, DHT failures, gaps between loops) and Free heap
+#     readings are rolled up at 1 min, 15 min and 1 h like an RRD: each
+#     coarser level is merged from finished buckets of the finer one, and
+#     finished buckets are appended to fixed-dtype .bin files
+#   - heap and latency trends are least-squares lines updated per batch,
+#     pooled over boots (a reset gives the heap back), plus a recent trend
+#     that forgets with a 6-hour half-life
+# Memory holds the open buckets, the trends, fixed-size latency histograms
+# and one entry per boot, so days of logs from many boards stream through.
+
+MILLIS_WRAP = 1 << 32           # millis() is a 32-bit unsigned long
+WRAP_MARGIN_MS = 600_000        # a wrap drops from the last 10 min before 2^32 into the first 10 min
+LEVELS_S = (60, 900, 3600)
+TREND_HALF_LIFE_H = 6.0
+DHT_FAILURE = -1.0
+CHUNK_ROWS = 1 << 18
+# Pass/fail limits
+MIN_HOURS = 24.0
+LEAK_LIMIT_BYTES_PER_HOUR = 100.0
+LEAK_T_STAT = 3.0               # the heap slope must also be this many standard errors below zero
+MIN_FREE_HEAP = 32768
+DHT_FAILURE_LIMIT = 0.01
+GAP_WARN_S = 10.0               # no record for longer: a stalled loop() or a logger that lost data
+
+# Rollup columns after (boot, start_s): dtype and how samples and buckets combine
+RECORD_FIELDS = {
+    'records': ('<u4', 'sum'),
+    'latency_sum': ('<u8', 'sum'),
+    'latency_min': ('<u4', 'min'),
+    'latency_max': ('<u4', 'max'),
+    'dht_failures': ('<u4', 'sum'),
+    'max_gap_ms': ('<u4', 'max'),
+}
+HEAP_FIELDS = {
+    'readings': ('<u4', 'sum'),
+    'heap_first': ('<u4', 'first'),
+    'heap_last': ('<u4', 'last'),
+    'heap_min': ('<u4', 'min'),
+    'heap_max': ('<u4', 'max'),
+}
+SERIES = {'records': RECORD_FIELDS, 'heap': HEAP_FIELDS}
+REDUCE = {'sum': np.add, 'min': np.minimum, 'max': np.maximum}
+
+
+def rollup_dtype(fields):
+    return np.dtype([('boot', '<u4'), ('start_s', '<i8')] + [(name, t) for name, (t, _) in fields.items()])
+
+
+def aggregate(boot, start_s, columns, fields):
+    """One rollup row per run of equal (boot, start_s) in a batch; columns hold the per-sample values"""
+    cuts = np.flatnonzero((np.diff(boot) != 0) | (np.diff(start_s) != 0)) + 1
+    starts = np.r_[0, cuts]
+    ends = np.r_[cuts, len(boot)]
+    rows = np.zeros(len(starts), dtype=rollup_dtype(fields))
+    rows['boot'], rows['start_s'] = boot[starts], start_s[starts]
+    for name, (_, how) in fields.items():
+        values = columns[name]
+        if how == 'first':
+            rows[name] = values[starts]
+        elif how == 'last':
+            rows[name] = values[ends - 1]
+        else:
+            rows[name] = REDUCE[how].reduceat(values, starts)
+    return rows
+
+
+class Rollups:
+    """
+    One series at several resolutions. The finest level takes partial
+    buckets from aggregate(); a level passes each bucket it finishes to the
+    next one and appends it to <name>_<seconds>s.bin. Only the open bucket
+    of each level is in memory.
+    """
+
+    def __init__(self, out_dir, name, fields, levels=LEVELS_S):
+        self.fields = fields
+        self.levels = levels
+        self.dtype = rollup_dtype(fields)
+        self.paths = [os.path.join(out_dir, f"{name}_{s}s.bin") for s in levels]
+        self._files = [open(path, 'wb') for path in self.paths]
+        self._open = [None] * len(levels)
+
+    def add(self, rows):
+        for row in rows:
+            self._add(0, row)
+
+    def _add(self, level, row):
+        start = row['start_s'] // self.levels[level] * self.levels[level]
+        bucket = self._open[level]
+        if bucket is not None and (bucket['boot'] != row['boot'] or bucket['start_s'] != start):
+            self._finish(level)
+            bucket = None
+        if bucket is None:
+            bucket = self._open[level] = np.array(row, dtype=self.dtype)
+            bucket['start_s'] = start
+            return
+        for name, (_, how) in self.fields.items():
+            if how == 'last':
+                bucket[name] = row[name]
+            elif how != 'first':
+                bucket[name] = REDUCE[how](bucket[name], row[name])
+
+    def _finish(self, level):
+        bucket, self._open[level] = self._open[level], None
+        self._files[level].write(bucket.tobytes())
+        if level + 1 < len(self.levels):
+            self._add(level + 1, bucket)
+
+    def close(self):
+        for level in range(len(self.levels)):
+            if self._open[level] is not None:
+                self._finish(level)
+            self._files[level].close()
+
+
+def load_rollup(board_dir, series, seconds):
+    """Memory-mapped rollup rows of one series and resolution"""
+    path = os.path.join(board_dir, f"{series}_{seconds}s.bin")
+    dtype = rollup_dtype(SERIES[series])
+    if not os.path.getsize(path):
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+class OnlineTrend:
+    """
+    Least-squares line through (t, y), updated one batch at a time. Sums are
+    kept relative to the first sample so days of uptime keep their precision.
+    With half_life the weights of older samples halve every half_life units
+    of t: the trend of the recent past.
+    """
+
+    def __init__(self, half_life=None):
+        self.half_life = half_life
+        self.t0 = self.y0 = self.t_last = None
+        self.sums = np.zeros(7)     # w, w^2, wt, wy, wtt, wty, wyy
+
+    def update(self, t, y):
+        t = np.asarray(t, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if not len(t):
+            return
+        if self.t0 is None:
+            self.t0, self.y0, self.t_last = t[0], y[0], t[0]
+        w = np.ones(len(t))
+        if self.half_life:
+            now = max(self.t_last, t.max())
+            self.sums[[0, 2, 3, 4, 5, 6]] *= 0.5 ** ((now - self.t_last) / self.half_life)
+            self.sums[1] *= 0.25 ** ((now - self.t_last) / self.half_life)
+            w = 0.5 ** ((now - t) / self.half_life)
+            self.t_last = now
+        dt, dy = t - self.t0, y - self.y0
+        self.sums += [w.sum(), (w * w).sum(), (w * dt).sum(), (w * dy).sum(),
+                      (w * dt * dt).sum(), (w * dt * dy).sum(), (w * dy * dy).sum()]
+
+    def moments(self):
+        """(weight, effective samples, centered Stt, Sty, Syy)"""
+        w, ww, st, sy, stt, sty, syy = self.sums
+        if not w:
+            return 0.0, 0.0, 0.0, 0.0, 0.0
+        return w, w * w / ww, stt - st * st / w, sty - st * sy / w, syy - sy * sy / w
+
+
+def fit_trend(moments):
+    """slope and its standard error from summed moments(), or None with too few points"""
+    w, n, stt, sty, syy = moments
+    if n < 3 or stt <= 0:
+        return None
+    slope = sty / stt
+    residual = max(syy - slope * sty, 0.0)
+    stderr = np.sqrt(residual / (w * (n - 2) / n) / stt)
+    return {'slope': float(slope), 'stderr': float(stderr)}
+
+
+def pooled(trends):
+    """Within-boot fit: the moments of every boot's trend added up"""
+    return fit_trend(np.sum([t.moments() for t in trends], axis=0)) if trends else None
+
+
+class DeviceClock:
+    """
+    Boot and uptime of the records from the millis they printed, and of the
+    heap readings from the millis of the record before them. Boot entries
+    keep the first and last uptime, the wraps and the records seen.
+    """
+
+    def __init__(self):
+        self.boots = []
+        self.last_millis = None
+        self._heap = {'boot': 0, 'wraps': 0, 'last': None}
+
+    def _new_boot(self, millis):
+        self.boots.append({'boot': len(self.boots), 'first_uptime_ms': int(millis), 'last_uptime_ms': int(millis),
+                           'wraps': 0, 'records': 0})
+
+    def place(self, millis):
+        """(boot, uptime_ms) of a batch of records, in order"""
+        millis = np.asarray(millis, dtype=np.int64)
+        previous = np.r_[millis[0] if self.last_millis is None else self.last_millis, millis[:-1]]
+        back = millis < previous
+        wrap = back & (previous >= MILLIS_WRAP - WRAP_MARGIN_MS) & (millis < WRAP_MARGIN_MS)
+        reset = back & ~wrap
+        boot = np.empty(len(millis), dtype=np.int64)
+        uptime = np.empty(len(millis), dtype=np.int64)
+        cuts = np.r_[0, np.flatnonzero(reset), len(millis)]
+        for lo, hi in zip(cuts[:-1], cuts[1:]):
+            if lo == hi:
+                continue
+            if reset[lo] or self.last_millis is None:
+                self._new_boot(millis[lo])
+            current = self.boots[-1]
+            epoch = current['wraps'] + np.cumsum(wrap[lo:hi])
+            uptime[lo:hi] = epoch * MILLIS_WRAP + millis[lo:hi]
+            boot[lo:hi] = current['boot']
+            current['wraps'] = int(epoch[-1])
+            current['records'] += int(hi - lo)
+            current['last_uptime_ms'] = int(uptime[hi - 1])
+        self.last_millis = int(millis[-1])
+        return boot, uptime
+
+    def place_heap(self, millis):
+        """
+        (boot, uptime_ms, placed) of heap readings, fed after the records:
+        each one goes to the first boot from the current one on whose uptime
+        range holds it, so boots too short to print a heap line are skipped.
+        """
+        millis = np.asarray(millis, dtype=np.int64)
+        boot = np.zeros(len(millis), dtype=np.int64)
+        uptime = np.zeros(len(millis), dtype=np.int64)
+        placed = np.zeros(len(millis), dtype=bool)
+        state = self._heap
+        i = 0
+        while i < len(millis) and self.boots:
+            current = self.boots[state['boot']]
+            rest = millis[i:]
+            up = state['wraps'] * MILLIS_WRAP + rest
+            previous = np.r_[rest[0] if state['last'] is None else state['last'], rest[:-1]]
+            inside = (rest >= previous) & (up >= current['first_uptime_ms']) & (up <= current['last_uptime_ms'])
+            run = len(rest) if inside.all() else int(np.argmin(inside))
+            if run:
+                boot[i:i + run], uptime[i:i + run], placed[i:i + run] = current['boot'], up[:run], True
+                state['last'] = int(rest[run - 1])
+                i += run
+                continue
+            m = int(millis[i])
+            if state['last'] is not None and state['last'] >= MILLIS_WRAP - WRAP_MARGIN_MS \
+                    and m < WRAP_MARGIN_MS and state['wraps'] < current['wraps']:
+                state['wraps'] += 1
+                state['last'] = m
+                continue
+            later = [b['boot'] for b in self.boots[state['boot'] + 1:]
+                     if b['first_uptime_ms'] <= m <= b['last_uptime_ms']]
+            if later:
+                state.update(boot=later[0], wraps=0, last=None)
+            else:
+                i += 1          # no record printed this millis: not placed
+        return boot, uptime, placed
+
+
+class SoakAnalyzer:
+    """
+    Streaming soak analysis of one board. Feed record batches with update()
+    first, then heap readings with update_heap(); finish() closes the
+    rollups and report() checks the run against the limits.
+    """
+
+    def __init__(self, board, out_dir, levels=LEVELS_S, half_life_h=TREND_HALF_LIFE_H):
+        self.board = board
+        self.out_dir = os.path.join(out_dir, board)
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.levels = levels
+        self.half_life_h = half_life_h
+        self.clock = DeviceClock()
+        self.rollups = {name: Rollups(self.out_dir, name, fields, levels) for name, fields in SERIES.items()}
+        self.warmup = LatencyHistogram()    # first loop() of every boot, as in latency_analyzer.py
+        self.steady = LatencyHistogram()
+        self.latency_trends = []
+        self.heap_trends = []
+        self.recent_heap = None
+        self.counts = {'records': 0, 'dht_failures': 0, 'heap_readings': 0, 'heap_unplaced': 0,
+                       'gaps': 0, 'longest_gap_s': 0.0}
+        self.heap_min = None
+        self.heap_last = None
+        self.sources = []
+        self._last = None                   # (boot, uptime_ms) of the last record
+
+    def update(self, millis, latency, dht_failed):
+        if not len(millis):
+            return
+        boot, uptime = self.clock.place(millis)
+        latency = np.asarray(latency, dtype=np.int64)
+        dht_failed = np.asarray(dht_failed, dtype=bool)
+        previous_boot = np.r_[-1 if self._last is None else self._last[0], boot[:-1]]
+        previous = np.r_[0 if self._last is None else self._last[1], uptime[:-1]]
+        first = boot != previous_boot
+        gap = np.where(first, 0, uptime - previous)
+        self._last = (int(boot[-1]), int(uptime[-1]))
+
+        self.warmup.record(latency[first])
+        self.steady.record(latency[~first])
+        long_gaps = gap[gap > GAP_WARN_S * 1000]
+        if len(long_gaps):
+            self.counts['gaps'] += len(long_gaps)
+            self.counts['longest_gap_s'] = max(self.counts['longest_gap_s'], float(long_gaps.max()) / 1000)
+        self.counts['records'] += len(millis)
+        self.counts['dht_failures'] += int(dht_failed.sum())
+
+        while len(self.latency_trends) < len(self.clock.boots):
+            self.latency_trends.append(OnlineTrend())
+        for b in np.unique(boot):
+            steady = (boot == b) & ~first
+            self.latency_trends[b].update(uptime[steady] / 3.6e6, latency[steady])
+        columns = {'records': np.ones(len(millis), dtype=np.int64), 'latency_sum': latency,
+                   'latency_min': latency, 'latency_max': latency, 'dht_failures': dht_failed.astype(np.int64),
+                   'max_gap_ms': gap}
+        self.rollups['records'].add(aggregate(boot, uptime // 1000 // self.levels[0] * self.levels[0], columns,
+                                              RECORD_FIELDS))
+
+    def update_heap(self, millis, free_heap):
+        if not len(millis):
+            return
+        boot, uptime, placed = self.clock.place_heap(millis)
+        free_heap = np.asarray(free_heap, dtype=np.int64)[placed]
+        boot, uptime = boot[placed], uptime[placed]
+        self.counts['heap_unplaced'] += int((~placed).sum())
+        if not len(boot):
+            return
+        self.counts['heap_readings'] += len(boot)
+        low = int(free_heap.min())
+        self.heap_min = low if self.heap_min is None else min(self.heap_min, low)
+        self.heap_last = int(free_heap[-1])
+        while len(self.heap_trends) < len(self.clock.boots):
+            self.heap_trends.append(OnlineTrend())
+        for b in np.unique(boot):
+            mask = boot == b
+            self.heap_trends[b].update(uptime[mask] / 3.6e6, free_heap[mask])
+        # The recent trend follows the last boot only
+        last = boot == boot[-1]
+        if self.recent_heap is None or self.recent_heap[0] != boot[-1]:
+            self.recent_heap = (boot[-1], OnlineTrend(self.half_life_h))
+        self.recent_heap[1].update(uptime[last] / 3.6e6, free_heap[last])
+        columns = {name: free_heap for name in HEAP_FIELDS}
+        columns['readings'] = np.ones(len(boot), dtype=np.int64)
+        self.rollups['heap'].add(aggregate(boot, uptime // 1000 // self.levels[0] * self.levels[0], columns, HEAP_FIELDS))
+
+    def finish(self):
+        for rollup in self.rollups.values():
+            rollup.close()
+
+    def report(self, min_hours=MIN_HOURS, leak_limit=LEAK_LIMIT_BYTES_PER_HOUR, min_heap=MIN_FREE_HEAP,
+               budget_us=INFERENCE_BUDGET_US, dht_limit=DHT_FAILURE_LIMIT):
+        boots = [dict(b, hours=(b['last_uptime_ms'] - b['first_uptime_ms']) / 3.6e6) for b in self.clock.boots]
+        longest = max((b['hours'] for b in boots), default=0.0)
+        heap = pooled(self.heap_trends)
+        recent = fit_trend(self.recent_heap[1].moments()) if self.recent_heap else None
+        latency = pooled(self.latency_trends)
+        leak = -heap['slope'] if heap else None
+        significant = heap is not None and -heap['slope'] > LEAK_T_STAT * heap['stderr']
+        dht_rate = self.counts['dht_failures'] / max(self.counts['records'], 1)
+        p99 = self.steady.percentile(99)
+
+        checks = [
+            ('uptime', longest >= min_hours, f"longest boot {longest:.2f} h (>= {min_hours:g} h)"),
+            ('resets', len(boots) <= 1, f"{max(len(boots) - 1, 0)} resets, "
+                                        f"{sum(b['wraps'] for b in boots)} millis wraps"),
+            ('heap_leak', heap is not None and not (significant and leak > leak_limit),
+             f"leak {leak:.1f} +- {heap['stderr']:.1f} B/h (limit {leak_limit:g} B/h)" if heap
+             else "no Free heap readings"),
+            ('heap_floor', self.heap_min is not None and self.heap_min >= min_heap,
+             f"min free heap {self.heap_min} B (>= {min_heap} B)"),
+            ('latency', p99 is not None and p99 <= budget_us, f"steady p99 {p99} us (<= {budget_us} us)"),
+            ('dht_failures', dht_rate <= dht_limit, f"DHT failures {dht_rate:.2%} (<= {dht_limit:.0%})"),
+        ]
+        warnings = []
+        if self.counts['gaps']:
+            warnings.append(f"{self.counts['gaps']} gaps over {GAP_WARN_S:g} s between records, "
+                            f"longest {self.counts['longest_gap_s']:.0f} s")
+        if self.counts['heap_unplaced']:
+            warnings.append(f"{self.counts['heap_unplaced']} heap readings with no matching record")
+        hours_left = self.heap_last / leak if heap and significant and leak > 0 and self.heap_last else None
+        return {
+            'board': self.board,
+            'verdict': 'PASS' if all(ok for _, ok, _ in checks) else 'FAIL',
+            'checks': [{'name': name, 'pass': bool(ok), 'detail': detail} for name, ok, detail in checks],
+            'warnings': warnings,
+            'boots': boots,
+            'counts': self.counts,
+            'heap': {'min': self.heap_min, 'last': self.heap_last, 'trend_bytes_per_hour': heap,
+                     'recent_trend_bytes_per_hour': recent, 'recent_half_life_h': self.half_life_h,
+                     'leak_bytes_per_hour': leak, 'leak_significant': bool(significant),
+                     'hours_to_exhaustion': hours_left},
+            'latency': {'warmup': self.warmup.summary(), 'steady': self.steady.summary(),
+                        'trend_us_per_hour': latency},
+            'dht_failure_rate': dht_rate,
+            'sources': self.sources,
+            'rollups': {name: [os.path.basename(p) for p in r.paths] for name, r in self.rollups.items()},
+        }
+
+
+def csv_batches(log_path, chunksize=CHUNK_ROWS):
+    """(millis, latency, DHT failed) batches of a logger CSV (serial_ingest.LOG_HEADER layout)"""
+    import pandas as pd
+    for chunk in pd.read_csv(log_path, usecols=['millis', 'temp', 'hum', 'AI_latency_us'], chunksize=chunksize):
+        chunk = chunk.apply(pd.to_numeric, errors='coerce').dropna()
+        failed = (chunk['temp'] == DHT_FAILURE) & (chunk['hum'] == DHT_FAILURE)
+        yield chunk['millis'].to_numpy(np.int64), chunk['AI_latency_us'].to_numpy(np.int64), failed.to_numpy()
+
+
+def heap_csv_batches(heap_path, chunksize=CHUNK_ROWS):
+    """(millis, free heap) batches of the logger's heap CSV (serial_ingest.HEAP_HEADER layout)"""
+    import pandas as pd
+    for chunk in pd.read_csv(heap_path, usecols=['last_millis', 'free_heap_bytes'], chunksize=chunksize):
+        chunk = chunk.apply(pd.to_numeric, errors='coerce').dropna()
+        yield chunk['last_millis'].to_numpy(np.int64), chunk['free_heap_bytes'].to_numpy(np.int64)
+
+
+def capture_batches(capture, chunksize=CHUNK_ROWS):
+    records = capture.records
+    for start in range(0, len(records['millis']), chunksize):
+        part = slice(start, start + chunksize)
+        failed = (records['temp_c'][part] == DHT_FAILURE) & (records['hum_pct'][part] == DHT_FAILURE)
+        yield records['millis'][part].astype(np.int64), records['latency_us'][part].astype(np.int64), failed
+
+
+def capture_heap_batches(capture, chunksize=CHUNK_ROWS):
+    heap = capture.heap
+    for start in range(0, len(heap['free_heap']), chunksize):
+        part = slice(start, start + chunksize)
+        millis = heap['last_millis'][part]
+        known = millis >= 0     # -1: printed before the first record
+        yield millis[known], heap['free_heap'][part][known].astype(np.int64)
+
+
+def open_source(path):
+    """
+    (board name, record batches, heap batches) of a logger CSV (its heap_log
+    CSV is picked up next to it), a capture_import.py directory or a raw
+    capture (imported to <capture>.d first).
+    """
+    if path.endswith('.csv'):
+        name = os.path.splitext(os.path.basename(path))[0]
+        heap_path = os.path.join(os.path.dirname(path), name.replace('ai_log', 'heap_log', 1) + '.csv')
+        board = name[len('ai_log_'):] if name.startswith('ai_log_') else name
+        heap = heap_csv_batches(heap_path) if os.path.exists(heap_path) and heap_path != path else iter(())
+        return board, csv_batches(path), heap
+    from capture_import import Capture, import_capture, print_summary
+    capture_dir = path
+    if not os.path.isdir(path):
+        capture_dir = path + '.d'
+        if not os.path.exists(os.path.join(capture_dir, 'summary.json')):
+            print_summary(import_capture(path, capture_dir))
+    capture = Capture(capture_dir)
+    board = os.path.basename(os.path.normpath(path)).split('.')[0]
+    return board, capture_batches(capture), capture_heap_batches(capture)
+
+
+def analyze(specs, out_dir):
+    """
+    Analyzers per board from [BOARD=]PATH specs; the paths of one board are
+    read in the order given (e.g. one log per day).
+    """
+    boards = {}
+    for spec in specs:
+        name, _, path = spec.partition('=') if '=' in spec and not os.path.exists(spec) else ('', '', spec)
+        board, records, heap = open_source(path)
+        boards.setdefault(name or board, []).append((path, records, heap))
+    analyzers = []
+    for board, sources in boards.items():
+        analyzer = SoakAnalyzer(board, out_dir)
+        for path, records, _ in sources:
+            analyzer.sources.append(path)
+            for batch in records:
+                analyzer.update(*batch)
+        for _, _, heap in sources:
+            for batch in heap:
+                analyzer.update_heap(*batch)
+        analyzer.finish()
+        analyzers.append(analyzer)
+    return analyzers
+
+
+def print_report(report, hourly=None):
+    print(f"{report['board']}: {report['verdict']} ({report['counts']['records']} records, "
+          f"{len(report['boots'])} boots)")
+    for check in report['checks']:
+        print(f"  {'ok  ' if check['pass'] else 'FAIL'} {check['name']:<13} {check['detail']}")
+    for warning in report['warnings']:
+        print(f"  warn {warning}")
+    recent = report['heap']['recent_trend_bytes_per_hour']
+    if recent:
+        print(f"  heap trend over the last ~{report['heap']['recent_half_life_h']:g} h: "
+              f"{recent['slope']:+.1f} +- {recent['stderr']:.1f} B/h")
+    if report['heap']['hours_to_exhaustion']:
+        print(f"  heap exhausted in ~{report['heap']['hours_to_exhaustion']:.0f} h at this leak rate")
+    if hourly is not None and len(hourly):
+        print(f"  {'boot':>4} {'hour':>6} {'heap_min':>9} {'heap_last':>9}")
+        for row in hourly:
+            print(f"  {row['boot']:>4} {row['start_s'] / 3600:>6.0f} {row['heap_min']:>9} {row['heap_last']:>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Soak-test stability report: heap leaks, resets, latency, sensors')
+    parser.add_argument('sources', nargs='*', default=['data/ai_log.csv'],
+                        help='[BOARD=]PATH: logger CSV (heap_log CSV next to it), capture_import.py directory '
+                             'or raw capture; repeat a board for several files')
+    parser.add_argument('--out', default='data/soak', help='Rollups and reports, one directory per board')
+    parser.add_argument('--min-hours', type=float, default=MIN_HOURS)
+    parser.add_argument('--leak-limit', type=float, default=LEAK_LIMIT_BYTES_PER_HOUR, help='Bytes per hour')
+    parser.add_argument('--min-heap', type=int, default=MIN_FREE_HEAP, help='Lowest acceptable free heap (bytes)')
+    parser.add_argument('--budget-us', type=int, default=INFERENCE_BUDGET_US, help='Steady-state p99 latency')
+    parser.add_argument('--dht-limit', type=float, default=DHT_FAILURE_LIMIT, help='Highest DHT failure rate')
+    parser.add_argument('--hourly', action='store_true', help='Print the hourly heap rollup')
+    args = parser.parse_args(argv)
+
+    reports = []
+    for analyzer in analyze(args.sources, args.out):
+        report = analyzer.report(args.min_hours, args.leak_limit, args.min_heap, args.budget_us, args.dht_limit)
+        with open(os.path.join(analyzer.out_dir, 'report.json'), 'w') as f:
+            json.dump(report, f, indent=1)
+        print_report(report, load_rollup(analyzer.out_dir, 'heap', 3600) if args.hourly else None)
+        reports.append(report)
+    verdict = 'PASS' if all(r['verdict'] == 'PASS' for r in reports) else 'FAIL'
+    with open(os.path.join(args.out, 'soak_report.json'), 'w') as f:
+        json.dump({'verdict': verdict, 'boards': {r['board']: r['verdict'] for r in reports}}, f, indent=1)
+    print(f"soak: {verdict}")
+    return verdict == 'PASS'
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
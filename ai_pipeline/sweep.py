@@ -0,0 +1,279 @@
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from features import load_dataset
+from int8_reference import ReferenceMLP
+from model_cost import DEFAULT_COST_TABLE, estimate
+from package_model import write_model_header
+from tflite_reader import TFLiteModel
+
+# Architecture/quantization sweep: trains candidate Dense MLPs in worker
+# processes (early stopping, cached tf.data input), converts each to int8 and
+# scores it with the NumPy reference on a held-out stratified split. Each width
+# is trained once and converted with every quantization setting (per-channel or
+# per-tensor weights x representative sample count). Prints the
+# Pareto front over accuracy, flatbuffer size and MACs, and writes the smallest
+# model that meets the README targets (latency from model_cost.py) as model.h +
+# model_params.h.
+
+ACCURACY_TARGET = 0.90          # README: accuracy > 90% on scenarios
+SIZE_BUDGET = 20 * 1024         # README: model size (quantized) < 20KB
+LATENCY_BUDGET_US = 1000.0      # README: inference < 1ms
+
+HIDDEN_LAYERS = [(8,), (16,), (32,), (8, 8), (16, 8), (16, 16), (32, 16), (32, 24), (16, 16, 8)]
+PER_CHANNEL = [True, False]
+REPRESENTATIVE_SAMPLES = [50, 200, 1000]
+
+
+def quantization_grid(per_channel=PER_CHANNEL, representative_samples=REPRESENTATIVE_SAMPLES):
+    return [{'per_channel': p, 'representative_samples': r}
+            for p, r in itertools.product(per_channel, representative_samples)]
+
+
+def candidate_grid(hidden_layers=HIDDEN_LAYERS, quantization=None):
+    quantization = quantization or quantization_grid()
+    return [{'hidden': list(h), **q} for h, q in itertools.product(hidden_layers, quantization)]
+
+
+def candidate_name(c):
+    return f"{'-'.join(map(str, c['hidden']))}{'' if c['per_channel'] else '-pt'}-r{c['representative_samples']}"
+
+
+def stratified_split(y, val_fraction=0.2, seed=0):
+    """Train/validation indices with the same class mix (train_model.py's validation_split
+    takes the last 10% of rows, which is one scenario only)"""
+    rng = np.random.default_rng(seed)
+    val = []
+    for label in np.unique(y):
+        idx = rng.permutation(np.flatnonzero(y == label))
+        val.append(idx[:max(1, int(round(len(idx) * val_fraction)))])
+    val = np.sort(np.concatenate(val))
+    return np.setdiff1d(np.arange(len(y)), val), val
+
+
+# ---------------------------------------------------------------------------
+# Worker side: TensorFlow is only imported in the worker processes
+# ---------------------------------------------------------------------------
+
+_worker = {}
+
+
+def init_worker(x, y, train_idx, val_idx, threads, batch_size):
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+    warnings.filterwarnings('ignore')
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(threads)
+    x = x.astype(np.float32)
+    train = tf.data.Dataset.from_tensor_slices((x[train_idx], y[train_idx])).cache()
+    val = tf.data.Dataset.from_tensor_slices((x[val_idx], y[val_idx])).cache()
+    _worker.update(
+        tf=tf, x=x, y=y, train_idx=train_idx, val_idx=val_idx,
+        train=train.shuffle(len(train_idx), seed=0, reshuffle_each_iteration=True)
+                   .batch(batch_size).prefetch(tf.data.AUTOTUNE),
+        val=val.batch(1024).prefetch(tf.data.AUTOTUNE),
+    )
+
+
+def convert(model, candidate, seed=0):
+    """int8 flatbuffer of a trained Keras model with the candidate's quantization settings"""
+    tf = _worker['tf']
+    x, train_idx = _worker['x'], _worker['train_idx']
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    if not candidate['per_channel']:
+        # Private converter switch: setting it on a TensorFlow without it would be silently ignored
+        if not hasattr(converter, '_experimental_disable_per_channel'):
+            raise ValueError(f"per_channel=False needs TFLiteConverter._experimental_disable_per_channel, which "
+                             f"TensorFlow {tf.__version__} does not have; sweep per-channel candidates only")
+        converter._experimental_disable_per_channel = True
+    rng = np.random.default_rng(seed)
+    samples = x[rng.choice(train_idx, min(candidate['representative_samples'], len(train_idx)), replace=False)]
+
+    def representative_dataset():
+        for row in samples:
+            yield [row[None, :]]
+
+    converter.representative_dataset = representative_dataset
+    with contextlib.redirect_stdout(io.StringIO()):  # SavedModel export chatter
+        flatbuffer = converter.convert()
+    model = TFLiteModel(flatbuffer)
+    per_channel = any(len(model.tensors[op.inputs[1]].scale) > 1 for op in model.operators)
+    if per_channel != candidate['per_channel']:
+        raise ValueError(f"{candidate_name(candidate)}: the converter produced "
+                         f"{'per-channel' if per_channel else 'per-tensor'} weights")
+    return flatbuffer
+
+
+def train_candidates(candidates, max_epochs=300, patience=15, dropout=0.2, seed=0):
+    """Train the width shared by `candidates` once, then convert it for each of them"""
+    tf = _worker['tf']
+    x, y = _worker['x'], _worker['y']
+    t0 = time.perf_counter()
+    tf.keras.utils.set_random_seed(seed)
+
+    layers = [tf.keras.layers.Input(shape=(x.shape[1],))]
+    for units in candidates[0]['hidden']:
+        layers += [tf.keras.layers.Dense(units, activation='relu'), tf.keras.layers.Dropout(dropout)]
+    layers.append(tf.keras.layers.Dense(int(y.max()) + 1))
+    model = tf.keras.Sequential(layers)
+    model.compile(optimizer='adam', metrics=['accuracy'],
+                  loss=tf.keras.losses.SparseCategoricalCrossentropy(from_logits=True))
+    stop = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=patience, restore_best_weights=True)
+    history = model.fit(_worker['train'], validation_data=_worker['val'], epochs=max_epochs,
+                        callbacks=[stop], shuffle=False, verbose=0)
+    train_seconds = time.perf_counter() - t0
+    return [{
+        'candidate': candidate,
+        'epochs': len(history.history['loss']),
+        'float_val_accuracy': float(max(history.history['val_accuracy'])),
+        'train_seconds': train_seconds,
+        'tflite': convert(model, candidate, seed),
+    } for candidate in candidates]
+
+
+# ---------------------------------------------------------------------------
+# Scoring, Pareto front and output
+# ---------------------------------------------------------------------------
+
+def score(result, x, y, val_idx, cost_table=DEFAULT_COST_TABLE):
+    model = TFLiteModel(result['tflite'])
+    reference = ReferenceMLP(model)
+    pred = reference.predict(x).argmax(axis=1)
+    cost = estimate(model, cost_table)
+    return {
+        'name': candidate_name(result['candidate']),
+        **{k: v for k, v in result.items() if k != 'tflite'},
+        'int8_val_accuracy': float((pred[val_idx] == y[val_idx]).mean()),
+        'int8_accuracy': float((pred == y).mean()),
+        'size_bytes': model.size,
+        'macs': cost['macs'],
+        'arena_bytes': cost['arena_bytes'],
+        'estimated_latency_us': cost['latency_us'],
+    }
+
+
+def pareto_front(scores):
+    """Candidates no other candidate beats on accuracy, size and MACs at once"""
+    def dominates(a, b):
+        better_or_equal = (a['int8_val_accuracy'] >= b['int8_val_accuracy'] and a['size_bytes'] <= b['size_bytes']
+                           and a['macs'] <= b['macs'])
+        strictly = (a['int8_val_accuracy'] > b['int8_val_accuracy'] or a['size_bytes'] < b['size_bytes']
+                    or a['macs'] < b['macs'])
+        return better_or_equal and strictly
+    return [s for s in scores if not any(dominates(o, s) for o in scores)]
+
+
+def pick_winner(scores, accuracy=ACCURACY_TARGET, size_budget=SIZE_BUDGET, latency_budget_us=LATENCY_BUDGET_US):
+    """Fewest MACs, then smallest, among candidates meeting every target; else the most accurate in budget"""
+    in_budget = [s for s in scores if s['size_bytes'] < size_budget and s['estimated_latency_us'] < latency_budget_us]
+    passing = [s for s in in_budget if s['int8_val_accuracy'] >= accuracy]
+    if passing:
+        return min(passing, key=lambda s: (s['macs'], s['size_bytes'], -s['int8_val_accuracy'])), True
+    if in_budget:
+        return max(in_budget, key=lambda s: (s['int8_val_accuracy'], -s['macs'], -s['size_bytes'])), False
+    return None, False
+
+
+def print_scores(scores, front):
+    on_front = {s['name'] for s in front}
+    print(f"{'candidate':>16} {'epochs':>6} {'float':>6} {'int8':>6} {'size B':>7} {'MACs':>6} {'est us':>7}  front")
+    for s in sorted(scores, key=lambda s: (s['macs'], s['size_bytes'])):
+        print(f"{s['name']:>16} {s['epochs']:>6} {s['float_val_accuracy']:>6.3f} {s['int8_val_accuracy']:>6.3f} "
+              f"{s['size_bytes']:>7} {s['macs']:>6} {s['estimated_latency_us']:>7.0f}  "
+              f"{'*' if s['name'] in on_front else ''}")
+
+
+def run_sweep(candidates, csv_path='data/dataset_real_clean.csv', scaler_path='scaler.json', workers=None,
+              threads=1, batch_size=32, max_epochs=300, patience=15, seed=0, cost_table=DEFAULT_COST_TABLE):
+    _, x, y, classes = load_dataset(csv_path, scaler_path)
+    train_idx, val_idx = stratified_split(y, seed=seed)
+    workers = workers or max(1, (os.cpu_count() or 1) // threads)
+    # spawn: TensorFlow does not survive fork
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=init_worker,
+                             initargs=(x, y, train_idx, val_idx, threads, batch_size)) as pool:
+        widths = {}
+        for c in candidates:
+            widths.setdefault(tuple(c['hidden']), []).append(c)
+        futures = [pool.submit(train_candidates, group, max_epochs, patience, seed=seed) for group in widths.values()]
+        results = []
+        for future in futures:
+            for result in future.result():
+                results.append((score(result, x, y, val_idx, cost_table), result['tflite']))
+                print(f"  {results[-1][0]['name']}: int8 val accuracy {results[-1][0]['int8_val_accuracy']:.3f} "
+                      f"after {result['epochs']} epochs ({result['train_seconds']:.1f} s)")
+    return results, classes
+
+
+def load_cost_table(path):
+    if not path:
+        return DEFAULT_COST_TABLE
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sweep Dense MLP widths/depths and int8 quantization settings')
+    parser.add_argument('--data', default='data/dataset_real_clean.csv')
+    parser.add_argument('--scaler', default='scaler.json')
+    parser.add_argument('--hidden', nargs='*', help='Hidden layer widths to try, e.g. 16 32-16 (default grid)')
+    parser.add_argument('--per-channel', choices=['both', 'on', 'off'], default='both',
+                        help='Per-channel weight quantization, per-tensor (off) or both')
+    parser.add_argument('--representative-samples', type=int, nargs='+', default=REPRESENTATIVE_SAMPLES,
+                        help='Calibration rows for the int8 conversion, one candidate per count')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: cores / threads)')
+    parser.add_argument('--threads', type=int, default=1, help='TensorFlow threads per worker')
+    parser.add_argument('--max-epochs', type=int, default=300)
+    parser.add_argument('--patience', type=int, default=15)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--accuracy', type=float, default=ACCURACY_TARGET)
+    parser.add_argument('--cost-table', help='model_cost.py cycle table (JSON) for the 1ms budget')
+    parser.add_argument('--out-dir', default='sweep')
+    args = parser.parse_args(argv)
+
+    hidden = [tuple(int(u) for u in h.split('-')) for h in args.hidden] if args.hidden else HIDDEN_LAYERS
+    per_channel = {'both': PER_CHANNEL, 'on': [True], 'off': [False]}[args.per_channel]
+    candidates = candidate_grid(hidden, quantization_grid(per_channel, args.representative_samples))
+    results, classes = run_sweep(candidates, args.data, args.scaler, args.workers, args.threads,
+                                 max_epochs=args.max_epochs, patience=args.patience, seed=args.seed,
+                                 cost_table=load_cost_table(args.cost_table))
+    scores = [s for s, _ in results]
+    front = pareto_front(scores)
+    print_scores(scores, front)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    winner, meets_target = pick_winner(scores, args.accuracy)
+    with open(os.path.join(args.out_dir, 'sweep_results.json'), 'w') as f:
+        json.dump({'scores': scores, 'pareto_front': [s['name'] for s in front],
+                   'winner': winner and winner['name'], 'meets_accuracy_target': meets_target}, f, indent=2)
+    if winner is None:
+        print(f"No candidate within {SIZE_BUDGET} bytes and {LATENCY_BUDGET_US:.0f} us")
+        return
+    flatbuffer = dict((s['name'], fb) for s, fb in results)[winner['name']]
+    tflite_path = os.path.join(args.out_dir, 'quantized_model.tflite')
+    with open(tflite_path, 'wb') as f:
+        f.write(flatbuffer)
+    write_model_header(os.path.join(args.out_dir, 'model.h'), flatbuffer, tflite_path)
+    from export_model_params import write_header
+    write_header(os.path.join(args.out_dir, 'model_params.h'), tflite_path, args.scaler, classes)
+    status = 'meets' if meets_target else 'MISSES'
+    print(f"Winner {winner['name']} ({status} the {args.accuracy:.0%} target): {winner['size_bytes']} bytes, "
+          f"{winner['macs']} MACs -> {args.out_dir}/model.h, model_params.h")
+
+
+if __name__ == '__main__':
+    main()
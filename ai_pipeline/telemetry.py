@@ -0,0 +1,155 @@
+import argparse
+import csv
+
+import numpy as np
+
+# Binary telemetry frame, mirror of firmware/include/telemetry.h:
+#   0xA5 0x5A | type | payload length | payload (35 bytes) | CRC-16/CCITT-FALSE (LE)
+SYNC = b'\xa5\x5a'
+TYPE_INFERENCE = 0x01
+RECORD_DTYPE = np.dtype([
+    ('millis', '<u4'),
+    ('ldr_v', '<f4'),
+    ('temp_c', '<f4'),
+    ('hum_pct', '<f4'),
+    ('tvoc_ppb', '<f4'),
+    ('eco2_ppm', '<f4'),
+    ('prob_pct', 'u1', (3,)),
+    ('latency_us', '<u4'),
+    ('free_heap', '<u4'),
+])
+PAYLOAD_LEN = RECORD_DTYPE.itemsize  # 35
+FRAME_LEN = 4 + PAYLOAD_LEN + 2
+
+LOG_HEADER = ['millis', 'ldr_voltage', 'temp', 'hum', 'tvoc', 'eco2',
+              'prob0', 'prob1', 'prob2', 'AI_latency_us']
+
+
+def _crc16_table():
+    table = np.zeros(256, dtype=np.uint16)
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table[byte] = crc & 0xFFFF
+    return table
+
+
+CRC16_TABLE = _crc16_table()
+
+
+def crc16_rows(data):
+    """CRC-16/CCITT-FALSE of every row of a 2-D uint8 array, one table lookup per column"""
+    crc = np.full(data.shape[0], 0xFFFF, dtype=np.uint16)
+    for column in data.T:
+        crc = (crc << 8) ^ CRC16_TABLE[(crc >> 8) ^ column]
+    return crc
+
+
+def encode_records(records):
+    """Frame a structured RECORD_DTYPE array; returns the concatenated frames as bytes"""
+    records = np.ascontiguousarray(records, dtype=RECORD_DTYPE)
+    frames = np.empty((len(records), FRAME_LEN), dtype=np.uint8)
+    frames[:, 0:2] = np.frombuffer(SYNC, dtype=np.uint8)
+    frames[:, 2] = TYPE_INFERENCE
+    frames[:, 3] = PAYLOAD_LEN
+    frames[:, 4:4 + PAYLOAD_LEN] = records.view(np.uint8).reshape(len(records), PAYLOAD_LEN)
+    crc = crc16_rows(frames[:, 2:4 + PAYLOAD_LEN])
+    frames[:, -2] = crc & 0xFF
+    frames[:, -1] = crc >> 8
+    return frames.tobytes()
+
+
+def decode_frames(data):
+    """
+    Decode every valid frame in a byte buffer into a RECORD_DTYPE array.
+
+    Sync positions are found with one vectorized comparison; type, length and
+    CRC are checked for all candidates at once, so text interleaved on the same
+    port (boot messages, debug prints) is skipped. Returns (records, consumed,
+    stats): bytes past `consumed` may hold the start of an incomplete frame and
+    should be prepended to the next buffer.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    n = len(buf)
+    cand = np.flatnonzero((buf[:-1] == SYNC[0]) & (buf[1:] == SYNC[1])) if n > 1 else np.zeros(0, np.int64)
+    complete = cand[cand + FRAME_LEN <= n]
+    frames = buf[complete[:, None] + np.arange(FRAME_LEN)]
+    header_ok = (frames[:, 2] == TYPE_INFERENCE) & (frames[:, 3] == PAYLOAD_LEN)
+    crc = crc16_rows(frames[:, 2:4 + PAYLOAD_LEN])
+    stored = frames[:, -2].astype(np.uint16) | (frames[:, -1].astype(np.uint16) << 8)
+    valid = header_ok & (crc == stored)
+
+    # Drop sync patterns that fall inside an accepted frame
+    starts = complete[valid]
+    if len(starts) > 1:
+        keep = np.ones(len(starts), dtype=bool)
+        keep[1:] = np.diff(starts) >= FRAME_LEN
+        starts, valid_frames = starts[keep], frames[valid][keep]
+    else:
+        valid_frames = frames[valid]
+
+    records = valid_frames[:, 4:4 + PAYLOAD_LEN].copy().view(RECORD_DTYPE).reshape(-1)
+    last_end = int(starts[-1]) + FRAME_LEN if len(starts) else 0
+    consumed = max(last_end, n - (FRAME_LEN - 1), 0)
+    stats = {
+        'frames': len(records),
+        'crc_errors': int((header_ok & ~valid).sum()),
+        'skipped_bytes': consumed - len(records) * FRAME_LEN,
+    }
+    return records, consumed, stats
+
+
+class FrameDecoder:
+    """Incremental decoder for a serial stream: feed() bytes, get records back"""
+
+    def __init__(self):
+        self.pending = b''
+        self.stats = {'frames': 0, 'crc_errors': 0, 'skipped_bytes': 0}
+
+    def feed(self, data):
+        self.pending += data
+        records, consumed, stats = decode_frames(self.pending)
+        self.pending = self.pending[consumed:]
+        for key, value in stats.items():
+            self.stats[key] += value
+        return records
+
+
+def format_rows(records):
+    """Rows in the log_serial_to_csv.py text layout (same rounding as main.cpp's printf)"""
+    sensors = np.column_stack([records[c] for c in ('ldr_v', 'temp_c', 'hum_pct', 'tvoc_ppb', 'eco2_ppm')])
+    text = np.char.mod('%.2f', sensors)
+    return [
+        [str(m), *t, *map(str, p), str(lat)]
+        for m, t, p, lat in zip(records['millis'].tolist(), text.tolist(),
+                                records['prob_pct'].tolist(), records['latency_us'].tolist())
+    ]
+
+
+def write_csv(records, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(LOG_HEADER)
+        writer.writerows(format_rows(records))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Decode a raw binary telemetry capture')
+    parser.add_argument('capture', help='Raw bytes captured from the serial port')
+    parser.add_argument('--csv', help='Write the log_serial_to_csv.py layout to this file')
+    parser.add_argument('--npy', help='Write the structured record array to this .npy file')
+    args = parser.parse_args(argv)
+
+    with open(args.capture, 'rb') as f:
+        records, _, stats = decode_frames(f.read())
+    print(f"Decoded {stats['frames']} frames, {stats['crc_errors']} CRC errors, "
+          f"{stats['skipped_bytes']} bytes skipped")
+    if args.csv:
+        write_csv(records, args.csv)
+    if args.npy:
+        np.save(args.npy, records)
+
+
+if __name__ == '__main__':
+    main()
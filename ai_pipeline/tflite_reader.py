@@ -0,0 +1,163 @@
+import struct
+
+import numpy as np
+
+# Minimal reader for the TFLite flatbuffer schema (tensorflow/lite/schema/schema.fbs),
+# enough for the ULLAI models without importing TensorFlow or flatbuffers.
+# Field ids below are the declaration order of each table in schema.fbs.
+
+TENSOR_TYPES = {
+    0: np.float32, 1: np.float16, 2: np.int32, 3: np.uint8, 4: np.int64,
+    6: np.bool_, 7: np.int16, 9: np.int8,
+}
+BUILTIN_OPS = {
+    0: 'ADD', 3: 'CONV_2D', 4: 'DEPTHWISE_CONV_2D', 6: 'DEQUANTIZE', 9: 'FULLY_CONNECTED',
+    14: 'LOGISTIC', 19: 'RELU', 21: 'RELU6', 22: 'RESHAPE', 25: 'SOFTMAX', 114: 'QUANTIZE',
+}
+ACTIVATIONS = {0: None, 1: 'RELU', 2: 'RELU_N1_TO_1', 3: 'RELU6'}
+
+
+class Table:
+    """A flatbuffer table at byte offset `pos` of `buf`"""
+
+    def __init__(self, buf, pos):
+        self.buf = buf
+        self.pos = pos
+        vtable = pos - struct.unpack_from('<i', buf, pos)[0]
+        self._vtable = vtable
+        self._vtable_len = struct.unpack_from('<H', buf, vtable)[0]
+
+    def _field(self, field_id):
+        entry = 4 + 2 * field_id
+        if entry >= self._vtable_len:
+            return 0
+        return struct.unpack_from('<H', self.buf, self._vtable + entry)[0]
+
+    def scalar(self, field_id, fmt, default=0):
+        off = self._field(field_id)
+        return struct.unpack_from('<' + fmt, self.buf, self.pos + off)[0] if off else default
+
+    def _indirect(self, field_id):
+        off = self._field(field_id)
+        if not off:
+            return None
+        at = self.pos + off
+        return at + struct.unpack_from('<I', self.buf, at)[0]
+
+    def table(self, field_id):
+        at = self._indirect(field_id)
+        return Table(self.buf, at) if at is not None else None
+
+    def vector(self, field_id, dtype):
+        """Vector of scalars as a numpy array (empty when absent)"""
+        at = self._indirect(field_id)
+        if at is None:
+            return np.zeros(0, dtype=dtype)
+        n = struct.unpack_from('<I', self.buf, at)[0]
+        return np.frombuffer(self.buf, dtype=np.dtype(dtype).newbyteorder('<'), count=n, offset=at + 4)
+
+    def tables(self, field_id):
+        at = self._indirect(field_id)
+        if at is None:
+            return []
+        n = struct.unpack_from('<I', self.buf, at)[0]
+        out = []
+        for i in range(n):
+            elem = at + 4 + 4 * i
+            out.append(Table(self.buf, elem + struct.unpack_from('<I', self.buf, elem)[0]))
+        return out
+
+    def string(self, field_id):
+        at = self._indirect(field_id)
+        if at is None:
+            return ''
+        n = struct.unpack_from('<I', self.buf, at)[0]
+        return bytes(self.buf[at + 4:at + 4 + n]).decode()
+
+
+class TensorInfo:
+    def __init__(self, index, name, shape, dtype, data, scale, zero_point, quantized_dimension):
+        self.index = index
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.data = data                  # None for activations
+        self.scale = scale                # float32 array, empty when not quantized
+        self.zero_point = zero_point      # int64 array
+        self.quantized_dimension = quantized_dimension
+
+    @property
+    def nbytes(self):
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def __repr__(self):
+        return f"TensorInfo({self.index}, {self.name!r}, {list(self.shape)}, {np.dtype(self.dtype).name})"
+
+
+class OperatorInfo:
+    def __init__(self, op, inputs, outputs, activation):
+        self.op = op
+        self.inputs = inputs
+        self.outputs = outputs
+        self.activation = activation
+
+    def __repr__(self):
+        return f"OperatorInfo({self.op}, in={self.inputs}, out={self.outputs}, act={self.activation})"
+
+
+class TFLiteModel:
+    """Tensors, operators and I/O of the first subgraph of a .tflite file"""
+
+    def __init__(self, data):
+        self.buf = bytes(data)
+        model = Table(self.buf, struct.unpack_from('<I', self.buf, 0)[0])
+        self.version = model.scalar(0, 'I')
+        self.description = model.string(3)
+        self.size = len(self.buf)
+
+        opcodes = []
+        for code in model.tables(1):
+            # builtin_code (int32) superseded deprecated_builtin_code (int8) from schema v3a
+            builtin = max(code.scalar(0, 'b'), code.scalar(3, 'i'))
+            opcodes.append(BUILTIN_OPS.get(builtin, f'BUILTIN_{builtin}'))
+
+        buffers = [b.vector(0, np.uint8) for b in model.tables(4)]
+        subgraph = model.tables(2)[0]
+
+        self.tensors = []
+        for i, t in enumerate(subgraph.tables(0)):
+            dtype = TENSOR_TYPES.get(t.scalar(1, 'b'), np.uint8)
+            shape = tuple(int(s) for s in t.vector(0, np.int32))
+            raw = buffers[t.scalar(2, 'I')] if t.scalar(2, 'I') < len(buffers) else np.zeros(0, np.uint8)
+            data = raw.view(np.dtype(dtype).newbyteorder('<')).reshape(shape) if len(raw) else None
+            q = t.table(4)
+            scale = q.vector(2, np.float32) if q else np.zeros(0, np.float32)
+            zero_point = q.vector(3, np.int64) if q else np.zeros(0, np.int64)
+            qdim = q.scalar(6, 'i') if q else 0
+            self.tensors.append(TensorInfo(i, t.string(3), shape, dtype, data, scale, zero_point, qdim))
+
+        self.operators = []
+        for o in subgraph.tables(3):
+            options = o.table(4)
+            op = opcodes[o.scalar(0, 'I')]
+            # fused_activation_function is field 0 of FullyConnected/Conv/Add options
+            activation = ACTIVATIONS.get(options.scalar(0, 'b')) if options and op in (
+                'FULLY_CONNECTED', 'CONV_2D', 'DEPTHWISE_CONV_2D', 'ADD') else None
+            self.operators.append(OperatorInfo(
+                op, [int(i) for i in o.vector(1, np.int32)], [int(i) for i in o.vector(2, np.int32)], activation))
+
+        self.inputs = [int(i) for i in subgraph.vector(1, np.int32)]
+        self.outputs = [int(i) for i in subgraph.vector(2, np.int32)]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    @property
+    def input(self):
+        return self.tensors[self.inputs[0]]
+
+    @property
+    def output(self):
+        return self.tensors[self.outputs[0]]
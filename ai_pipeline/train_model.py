@@ -1,68 +1,117 @@
-import tensorflow as tf
-import pandas as pd
+import argparse
+import sys
+
 import numpy as np
-import json
-
-df = pd.read_csv('data/dataset_real_clean.csv')
-with open('scaler.json') as f:
-    scaler = json.load(f)
-
-# (1) CLEAN scenario labels — replace empty/redundant values
-valid_scenarios = ['normal', 'high_temp', 'high_humidity', 'low_light', 'anomaly'] 
-df['scenario'] = df['scenario'].fillna('normal')
-df.loc[df['scenario'] == '', 'scenario'] = 'normal'
-df = df[df['scenario'].isin(valid_scenarios)] 
-
-# (2) INPUT STANDARDIZATION
-x = np.stack([
-    (df['ldr_v'] - scaler['ldr_min']) / (scaler['ldr_max'] - scaler['ldr_min'] + 1e-8),
-    (df['temp_c'] - scaler['temp_mean']) / (scaler['temp_std'] + 1e-8),
-    (df['hum_pct'] - scaler['hum_mean']) / (scaler['hum_std'] + 1e-8),
-    (df['tvoc_ppb'] - scaler['tvoc_min']) / (scaler['tvoc_max'] - scaler['tvoc_min'] + 1e-8),
-    (df['eco2_ppm'] - scaler['eco2_min']) / (scaler['eco2_max'] - scaler['eco2_min'] + 1e-8)
-], axis=1)
-
-# (3) CREATE OUTPUT LABEL (y) and check label encoding
-y = df['scenario'].astype('category').cat.codes
-print('Unique scenario codes:', np.unique(y))
-
-# (4) MODEL BUILDING AND TRAINING
-model = tf.keras.Sequential([
-    tf.keras.layers.InputLayer(input_shape=(5,)), # change input_shape to shape if using TF2.14+
-    tf.keras.layers.Dense(32, activation='relu'),
-    tf.keras.layers.Dropout(0.2), 
-    tf.keras.layers.Dense(24, activation='relu'),
-    tf.keras.layers.Dropout(0.2),
-    tf.keras.layers.Dense(len(np.unique(y))) # Number of scenario labels
-])
-model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
-model.fit(x, y, epochs=100, validation_split=0.1)
-
-preds = model.predict(x[:10])
-print("Sample output logits:\n", preds)
-print("Max of x:", np.max(x))
-print("Min of x:", np.min(x))
-print("Any NaN in x:", np.any(np.isnan(x)))
-print("Any Inf in x:", np.any(np.isinf(x)))
-
-# (5) Convert/yield quantized TFLite
-converter = tf.lite.TFLiteConverter.from_keras_model(model)
-converter.optimizations = [tf.lite.Optimize.DEFAULT]
-def representative_dataset():
-    import numpy as np
-    indices = np.random.choice(x.shape[0], min(100, x.shape[0]), replace=False)
-    for i in indices:
-        yield [x[i:i+1].astype(np.float32)]
-converter.representative_dataset = representative_dataset
-converter.inference_input_type = tf.int8
-converter.inference_output_type = tf.int8
-model.save('model_float.h5')
-
-tflite_model = converter.convert()
-with open('quantized_model.tflite', 'wb') as f:
-    f.write(tflite_model)
-import os
-os.system("xxd -i quantized_model.tflite > model.h")
-print("Model exported to quantized_model.tflite and model.h")
+
+from features import clean_scenarios, encode_labels, load_scaler, normalize_features
+
+
+def load_training_data(shards=None, csv_path='data/dataset_real_clean.csv', scaler_path='scaler.json'):
+    """(train_data, fit kwargs, x, classes): x is the normalized feature array (a sample of it with shards)"""
+    scaler = load_scaler(scaler_path)
+    if shards:
+        # (1)-(3) Memory-mapped shards through tf.data, shuffled across shards; the
+        # unlabeled and non-model scenarios are skipped and 10% of each shard is held out
+        from shard_dataset import ShardedDataset
+        data = ShardedDataset(shards)
+        classes = data.classes()
+        print(f"{data.rows} rows in {len(data.shards)} shards, scenarios: {data.scenario_counts()}")
+        train_data = data.tf_dataset(scaler, classes, split='train')
+        fit_kwargs = dict(validation_data=data.tf_dataset(scaler, classes, split='validation'))
+        # A sample stands in for the full array in the checks and quantization below
+        x = data.sample_features(10_000, scaler)
+        return train_data, fit_kwargs, x, classes
+
+    import pandas as pd
+    df = pd.read_csv(csv_path)
+
+    # (1) CLEAN scenario labels — replace empty/redundant values
+    df = clean_scenarios(df)
+
+    # (2) INPUT STANDARDIZATION
+    x = normalize_features(df, scaler)
+
+    # (3) CREATE OUTPUT LABEL (y) and check label encoding
+    y, classes = encode_labels(df['scenario'])
+    print('Unique scenario codes:', np.unique(y))
+    return x, dict(y=y, validation_split=0.1), x, classes
+
+
+def convert_int8(model, x):
+    """int8 TFLite flatbuffer of a Keras model, calibrated on up to 100 rows of x"""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    def representative_dataset():
+        indices = np.random.choice(x.shape[0], min(100, x.shape[0]), replace=False)
+        for i in indices:
+            yield [x[i:i+1].astype(np.float32)]
+    converter.representative_dataset = representative_dataset
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    return converter.convert()
+
+
+def train(shards=None, epochs=100, csv_path='data/dataset_real_clean.csv', scaler_path='scaler.json'):
+    """
+    Train the scenario model and export it for the firmware: model_float.h5,
+    quantized_model.tflite, model.h and model_params.h. Returns the budget
+    problems of model_cost.check_budgets (empty when the model fits).
+    """
+    import tensorflow as tf
+
+    train_data, fit_kwargs, x, classes = load_training_data(shards, csv_path, scaler_path)
+
+    # (4) MODEL BUILDING AND TRAINING
+    model = tf.keras.Sequential([
+        tf.keras.layers.InputLayer(input_shape=(5,)), # change input_shape to shape if using TF2.14+
+        tf.keras.layers.Dense(32, activation='relu'),
+        tf.keras.layers.Dropout(0.2),
+        tf.keras.layers.Dense(24, activation='relu'),
+        tf.keras.layers.Dropout(0.2),
+        tf.keras.layers.Dense(len(classes)) # Number of scenario labels
+    ])
+    model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    model.fit(train_data, epochs=epochs, **fit_kwargs)
+
+    preds = model.predict(x[:10])
+    print("Sample output logits:\n", preds)
+    print("Max of x:", np.max(x))
+    print("Min of x:", np.min(x))
+    print("Any NaN in x:", np.any(np.isnan(x)))
+    print("Any Inf in x:", np.any(np.isinf(x)))
+
+    # (5) Convert/yield quantized TFLite
+    model.save('model_float.h5')
+
+    tflite_model = convert_int8(model, x)
+    with open('quantized_model.tflite', 'wb') as f:
+        f.write(tflite_model)
+    from package_model import write_model_header
+    write_model_header('model.h', tflite_model)
+    from export_model_params import write_header
+    write_header('model_params.h', 'quantized_model.tflite', scaler_path, classes=classes)
+    print("Model exported to quantized_model.tflite, model.h and model_params.h")
+
+    # (6) Fail the export when the model goes over the README budgets
+    from model_cost import check_budgets, estimate, print_report
+    cost = estimate('quantized_model.tflite')
+    print_report(cost)
+    return check_budgets(cost)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Train the scenario model and export it for the firmware')
+    parser.add_argument('--shards', nargs='+', metavar='DIR',
+                        help='Stream shard_dataset.py directories (e.g. simulated + real) instead of the clean CSV')
+    parser.add_argument('--epochs', type=int, default=100)
+    args = parser.parse_args(argv)
+
+    problems = train(args.shards, args.epochs)
+    if problems:
+        sys.exit("Model over budget: " + "; ".join(problems))
 
 
+if __name__ == '__main__':
+    main()
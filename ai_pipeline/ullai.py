@@ -0,0 +1,82 @@
+import argparse
+import importlib
+import os
+import sys
+
+# One entry point for the pipeline scripts: `python ullai.py <command> [options]`,
+# `python ullai.py <command> --help` for the options of one command. Each
+# command runs the main(argv) of its module, imported only when the command is
+# chosen; the modules import TensorFlow, pandas and matplotlib inside the
+# functions that need them, so `inspect`, `ingest`, `cost` and every --help
+# start without them (bench_cli_startup.py times this).
+
+# command: (module, arguments put before the user's, help)
+COMMANDS = {
+    'simulate': ('sensor_simulator', [], 'Generate simulated scenario data (CSV, Parquet or shards)'),
+    'emulate': ('firmware_emulator', [], 'Play the firmware serial output on a pseudo-terminal'),
+    'ingest': ('serial_ingest', [], 'Log one or more boards to CSV'),
+    'import': ('capture_import', [], 'Import a raw serial capture into typed columns'),
+    'clean': ('pipeline', ['clean'], 'Merge and clean the scenario CSVs in data/'),
+    'scaler': ('pipeline', ['scaler'], 'Write scaler.json from the clean dataset'),
+    'pipeline': ('pipeline', [], 'Bring pipeline stages up to date (default: scaler, drift reference, report)'),
+    'shards': ('shard_dataset', [], 'Create, import into or inspect a shard dataset'),
+    'train': ('train_model', [], 'Train the scenario model and export it for the firmware'),
+    'export': (None, [], 'Write model.h and model_params.h for an existing .tflite model'),
+    'export-float': ('export_float_tflite', [], 'Export the float Keras model as an unquantized .tflite'),
+    'eval': ('evaluate_models', [], 'Evaluate the float and int8 models on the labelled dataset'),
+    'inspect': ('export_tflite', [], 'Print the I/O quantization of a .tflite model'),
+    'cost': ('model_cost', [], 'MACs, tensor arena and predicted latency of a .tflite model'),
+    'sweep': ('sweep', [], 'Search model sizes and quantization settings'),
+    'latency': ('latency_analyzer', [], 'Check a log against the latency targets'),
+    'drift': ('drift_monitor', [], 'Score logs for drift from the training data'),
+    'soak': ('soak_analyzer', [], 'Check soak runs against the 24-hour target'),
+}
+
+
+def export(argv=None):
+    """model.h and model_params.h from a .tflite model and scaler, without TensorFlow"""
+    from export_model_params import write_header
+    from package_model import model_sha256, write_model_header
+
+    parser = argparse.ArgumentParser(description=COMMANDS['export'][2])
+    parser.add_argument('--model', default='quantized_model.tflite')
+    parser.add_argument('--scaler', default='scaler.json')
+    parser.add_argument('--out-dir', default='.', help='e.g. ../firmware/src')
+    args = parser.parse_args(argv)
+
+    with open(args.model, 'rb') as f:
+        flatbuffer = f.read()
+    model_h = os.path.join(args.out_dir, 'model.h')
+    params_h = os.path.join(args.out_dir, 'model_params.h')
+    written = write_model_header(model_h, flatbuffer, args.model)
+    write_header(params_h, args.model, args.scaler)
+    print(f"{'Wrote' if written else 'Unchanged'} {model_h}: {len(flatbuffer)} B, sha256 {model_sha256(flatbuffer)}")
+    print(f"Wrote {params_h}")
+
+
+def run(command, argv):
+    """Run one command with its argument list; returns the exit status (a main() returning False failed)"""
+    module, prefix, _ = COMMANDS[command]
+    if module is None:
+        result = export(argv)
+    else:
+        result = importlib.import_module(module).main(prefix + list(argv))
+    return 0 if result in (None, True) else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='ULLAI pipeline tools', formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='commands:\n' + '\n'.join(f"  {name:<14}{help}" for name, (_, _, help) in COMMANDS.items()))
+    parser.add_argument('command', choices=COMMANDS, metavar='command', help='One of the commands below')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Options of the command (see <command> --help)')
+    args = parser.parse_args(argv)
+
+    if argv is None:
+        # Usage lines of the command's own parser read "ullai.py <command>"
+        sys.argv[0] = f"{os.path.basename(sys.argv[0])} {args.command}"
+    return run(args.command, args.args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
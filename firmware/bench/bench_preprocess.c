@@ -0,0 +1,148 @@
+// Host micro-benchmark of ai_preprocess.c (PlatformIO env:native):
+//   pio run -e native && .pio/build/native/program [iterations]
+// ai_pipeline/check_preprocess.py also builds and runs it with the host cc.
+#define _POSIX_C_SOURCE 199309L // clock_gettime
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "ai_preprocess.h"
+#include "model_params.h"
+
+#define N_SAMPLES 1024
+
+static float inputs[N_SAMPLES][AI_N_INPUTS];
+static int8_t logits[N_SAMPLES][AI_N_OUTPUTS];
+static volatile uint32_t sink;
+
+static uint32_t lcg_state = 12345;
+
+static uint32_t lcg(void)
+{
+    lcg_state = lcg_state * 1664525u + 1013904223u;
+    return lcg_state >> 8;
+}
+
+static float uniform(float lo, float hi)
+{
+    return lo + (hi - lo) * (float)lcg() / (float)(1u << 24);
+}
+
+static double now_ns(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1e9 + ts.tv_nsec;
+}
+
+// The previous on-device path, for comparison: a divide per feature to
+// normalize, another to quantize, and an expf() softmax over float logits
+static void baseline_quantize(const float *input, int8_t *quantized)
+{
+    for (int i = 0; i < AI_N_INPUTS; i++)
+    {
+        float normalized = (input[i] - AI_INPUT_CENTER[i]) / (1.0f / (AI_INPUT_GAIN[i] * AI_INPUT_SCALE));
+        int q = (int)(normalized / AI_INPUT_SCALE) + AI_INPUT_ZERO_POINT;
+        quantized[i] = (int8_t)(q > 127 ? 127 : (q < -128 ? -128 : q));
+    }
+}
+
+static void baseline_softmax(const int8_t *q, float *probabilities, int n)
+{
+    float x[AI_N_OUTPUTS];
+    ai_dequantize(q, x, n);
+    float max_val = x[0];
+    for (int i = 1; i < n; i++)
+        if (x[i] > max_val)
+            max_val = x[i];
+    float sum = 0.0f;
+    for (int i = 0; i < n; i++)
+    {
+        probabilities[i] = expf(x[i] - max_val);
+        sum += probabilities[i];
+    }
+    for (int i = 0; i < n; i++)
+        probabilities[i] /= sum;
+}
+
+static void report(const char *name, double start, long iterations)
+{
+    printf("%-22s %8.1f ns/call\n", name, (now_ns() - start) / iterations);
+}
+
+int main(int argc, char **argv)
+{
+    long iterations = argc > 1 ? atol(argv[1]) : 2000000;
+    for (int s = 0; s < N_SAMPLES; s++)
+    {
+        inputs[s][0] = uniform(0.0f, 3.3f);
+        inputs[s][1] = uniform(-20.0f, 60.0f);
+        inputs[s][2] = uniform(0.0f, 100.0f);
+        inputs[s][3] = uniform(0.0f, 1000.0f);
+        inputs[s][4] = uniform(400.0f, 2000.0f);
+        for (int i = 0; i < AI_N_OUTPUTS; i++)
+            logits[s][i] = (int8_t)(lcg() & 0xff);
+    }
+
+    int8_t q[AI_N_INPUTS];
+    float f[AI_N_OUTPUTS];
+    uint16_t p15[AI_N_OUTPUTS];
+    double t;
+
+    t = now_ns();
+    for (long k = 0; k < iterations; k++)
+    {
+        baseline_quantize(inputs[k % N_SAMPLES], q);
+        sink += (uint8_t)q[0];
+    }
+    report("baseline_quantize", t, iterations);
+
+    t = now_ns();
+    for (long k = 0; k < iterations; k++)
+    {
+        ai_quantize_inputs(inputs[k % N_SAMPLES], q);
+        sink += (uint8_t)q[0];
+    }
+    report("ai_quantize_inputs", t, iterations);
+
+    t = now_ns();
+    for (long k = 0; k < iterations; k++)
+    {
+        ai_dequantize(logits[k % N_SAMPLES], f, AI_N_OUTPUTS);
+        sink += (uint32_t)f[0];
+    }
+    report("ai_dequantize", t, iterations);
+
+    t = now_ns();
+    for (long k = 0; k < iterations; k++)
+    {
+        baseline_softmax(logits[k % N_SAMPLES], f, AI_N_OUTPUTS);
+        sink += (uint32_t)(f[0] * 100);
+    }
+    report("baseline_softmax_expf", t, iterations);
+
+    t = now_ns();
+    for (long k = 0; k < iterations; k++)
+    {
+        ai_softmax_int8(logits[k % N_SAMPLES], f, AI_N_OUTPUTS);
+        sink += (uint32_t)(f[0] * 100);
+    }
+    report("ai_softmax_int8", t, iterations);
+
+    t = now_ns();
+    for (long k = 0; k < iterations; k++)
+    {
+        ai_softmax_q15(logits[k % N_SAMPLES], p15, AI_N_OUTPUTS);
+        sink += p15[0];
+    }
+    report("ai_softmax_q15", t, iterations);
+
+    t = now_ns();
+    for (long k = 0; k < iterations; k++)
+        sink += ai_argmax_int8(logits[k % N_SAMPLES], AI_N_OUTPUTS);
+    report("ai_argmax_int8", t, iterations);
+
+    printf("(checksum %u)\n", (unsigned)sink);
+    return 0;
+}
@@ -5,7 +5,7 @@
 
 void ai_init();
 void ai_predict(float *input, float *output, int input_len, int output_len);
-void softmax(const float *input, float *output, int length);
-int8_t quantize_float_to_int8(float value, float scale, int zero_point);
+// Softmax probabilities of the first output_len classes
+void ai_predict_proba(float *input, float *probabilities, int output_len);
 
 #endif
@@ -0,0 +1,33 @@
+#ifndef AI_PREPROCESS_H
+#define AI_PREPROCESS_H
+
+#include <stdint.h>
+
+// Pre/post-processing around the model, plain C with no Arduino dependency so
+// it also builds for the host (PlatformIO env:native, ai_pipeline/check_preprocess.py).
+// Constants come from the generated model_params.h.
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// Raw sensor values (ldr_v, temp_c, hum_pct, tvoc_ppb, eco2_ppm) -> int8 model input
+void ai_quantize_inputs(const float *input, int8_t *quantized);
+
+// int8 logits -> float logits
+void ai_dequantize(const int8_t *quantized, float *output, int n);
+
+// Softmax of n int8 logits through the AI_SOFTMAX_EXP table, no expf()
+void ai_softmax_int8(const int8_t *logits, float *probabilities, int n);
+
+// Integer-only softmax: probabilities in Q15 (32768 = 1.0), no float at all
+void ai_softmax_q15(const int8_t *logits, uint16_t *probabilities, int n);
+
+// Index of the largest logit, first one on ties (softmax does not change it)
+int ai_argmax_int8(const int8_t *logits, int n);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
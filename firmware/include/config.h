@@ -8,4 +8,15 @@
 #define LED_BUILTIN 48
 #define BUTTON_PIN 0
 
+// 1: log inferences as binary frames (telemetry.h) instead of text lines
+#ifndef ULLAI_BINARY_TELEMETRY
+#define ULLAI_BINARY_TELEMETRY 0
+#endif
+
+// 1: print the int8 inputs and logits of every inference (inside the timed
+// region of loop(), so AI_latency_us includes them)
+#ifndef ULLAI_INFERENCE_DEBUG
+#define ULLAI_INFERENCE_DEBUG (!ULLAI_BINARY_TELEMETRY)
+#endif
+
 #endif
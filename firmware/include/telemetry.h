@@ -0,0 +1,44 @@
+#ifndef TELEMETRY_H
+#define TELEMETRY_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+// Binary telemetry frame (all fields little-endian):
+//   0xA5 0x5A | type (1) | payload length (1) | payload (35) | CRC-16/CCITT (2)
+// The CRC covers type, length and payload. Payload layout:
+//   uint32 millis | float32 ldr_v, temp_c, hum_pct, tvoc_ppb, eco2_ppm
+//   | uint8 prob_pct[3] | uint32 latency_us | uint32 free_heap
+#define TELEMETRY_SYNC0 0xA5
+#define TELEMETRY_SYNC1 0x5A
+#define TELEMETRY_TYPE_INFERENCE 0x01
+#define TELEMETRY_PAYLOAD_LEN 35
+#define TELEMETRY_FRAME_LEN (4 + TELEMETRY_PAYLOAD_LEN + 2)
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct
+{
+    uint32_t millis;
+    float ldr_v;
+    float temp_c;
+    float hum_pct;
+    float tvoc_ppb;
+    float eco2_ppm;
+    uint8_t prob_pct[3];
+    uint32_t latency_us;
+    uint32_t free_heap;
+} telemetry_record_t;
+
+uint16_t telemetry_crc16(const uint8_t *data, size_t len);
+
+// Write one frame to out (TELEMETRY_FRAME_LEN bytes), return its length
+size_t telemetry_encode(const telemetry_record_t *record, uint8_t *out);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -1,113 +1,90 @@
 #include "ai_inference.h"
+#include "config.h"
 #include "model.h" // Model .h export from Python
+#include "model_params.h" // Quantization + scaler, generated with model.h
+#include "ai_preprocess.h"
 #include <EloquentTinyML.h>
 #include <Arduino.h>
-#include <math.h>
 
-// Define input/output sizes & Tensor arena size consistent with model
-#define N_INPUTS 5
-#define N_OUTPUTS 3
-#define TENSOR_ARENA_SIZE (16 * 1024)
+// I/O sizes and the tensor arena come from model_params.h; build with
+// -D TENSOR_ARENA_SIZE=... to override the arena
+#ifndef TENSOR_ARENA_SIZE
+#define TENSOR_ARENA_SIZE AI_TENSOR_ARENA_SIZE
+#endif
 
-#define AI_INPUT_SCALE 0.0166197363f
-#define AI_INPUT_ZERO_POINT 52
-#define AI_OUTPUT_SCALE 0.0105614792f
-#define AI_OUTPUT_ZERO_POINT 24
+#if AI_PARAMS_MODEL_ID != AI_MODEL_ID
+#error "model_params.h was generated for another model than model.h: rerun train_model.py"
+#endif
 
-static Eloquent::TinyML::TfLite<N_INPUTS, N_OUTPUTS, TENSOR_ARENA_SIZE> ml;
+static Eloquent::TinyML::TfLite<AI_N_INPUTS, AI_N_OUTPUTS, TENSOR_ARENA_SIZE> ml;
 
-// Sensor scaler parameters (before quantizing)
-const float adc_min = 0.0f, adc_max = 3.3f;
-const float temp_mean = 25.0f, temp_std = 5.0f;
-const float hum_mean = 50.0f, hum_std = 10.0f;
-const float tvoc_min = 0.0f, tvoc_max = 1000.0f;
-const float eco2_min = 400.0f, eco2_max = 2000.0f;
-
-// Quantization parameters taken from export_tflite.py
-const float input_scale = 0.0039136889f;
-const int input_zero_point = -128;
-const float output_scale = 0.0022567196f;
-const int output_zero_point = -128;
-
-// Convert normalized float to int8 using scale/zero_point
-int8_t quantize_float_to_int8(float value, float scale, int zero_point)
+// FNV-1a over the model array, compared with the hash package_model.py recorded
+static uint32_t model_fnv1a(const unsigned char *data, unsigned int len)
 {
-    int quantized = (int)(value / scale) + zero_point;
-    if (quantized > 127)
-        quantized = 127;
-    if (quantized < -128)
-        quantized = -128;
-    return (int8_t)quantized;
+    uint32_t h = 0x811c9dc5UL;
+    for (unsigned int i = 0; i < len; i++)
+        h = (h ^ data[i]) * 0x01000193UL;
+    return h;
 }
 
-// Softmax for logits float
-void softmax(const float *input, float *output, int length)
+void ai_init()
 {
-    float max_val = input[0];
-    for (int i = 1; i < length; i++)
-        if (input[i] > max_val)
-            max_val = input[i];
-
-    float sum = 0.0f;
-    for (int i = 0; i < length; i++)
+    if (model_fnv1a(model_tflite, model_tflite_len) != AI_MODEL_FNV1A)
     {
-        output[i] = expf(input[i] - max_val);
-        sum += output[i];
+        Serial.printf("Model image corrupt (expected id %08lx)!\n", (unsigned long)AI_MODEL_ID);
+        while (1)
+            ;
     }
-    for (int i = 0; i < length; i++)
-        output[i] /= sum;
-}
-
-void ai_init()
-{
     if (!ml.begin(model_tflite))
     {
         Serial.println("Model initialization failed!");
         while (1)
             ;
     }
-    Serial.println("Model initialized OK");
+    Serial.printf("Model initialized OK (id %08lx, %u bytes)\n", (unsigned long)AI_MODEL_ID, model_tflite_len);
 }
 
-void ai_predict(float *input, float *output_float, int input_len, int output_len)
+// Fused normalize + quantize, inference, int8 logits in output_int8
+static void run_model(const float *input, int8_t *output_int8)
 {
-    // 1, Normalize sensor data (like pipeline train)
-    float normalized[N_INPUTS];
-    normalized[0] = (input[0] - adc_min) / (adc_max - adc_min);
-    normalized[1] = (input[1] - temp_mean) / temp_std;
-    normalized[2] = (input[2] - hum_mean) / hum_std;
-    normalized[3] = (input[3] - tvoc_min) / (tvoc_max - tvoc_min);
-    normalized[4] = (input[4] - eco2_min) / (eco2_max - eco2_min);
-
-    // 2, Quantize to int8
-    int8_t input_quantized[N_INPUTS];
-    for (int i = 0; i < input_len; i++)
-    {
-        input_quantized[i] = quantize_float_to_int8(normalized[i], input_scale, input_zero_point);
-    }
-
-    // 3, Predict (int8 in → int8 out)
-    int8_t output_int8[N_OUTPUTS];
+    int8_t input_quantized[AI_N_INPUTS];
+    ai_quantize_inputs(input, input_quantized);
     ml.predict(input_quantized, output_int8);
 
-    // 4, Dequantize output to float logits
-    for (int i = 0; i < output_len; i++)
-    {
-        output_float[i] = (output_int8[i] - output_zero_point) * output_scale;
-    }
-
+#if ULLAI_INFERENCE_DEBUG
     // Debug: In input quantized & output logits
     Serial.print("Input int8: ");
-    for (int i = 0; i < input_len; i++)
+    for (int i = 0; i < AI_N_INPUTS; i++)
     {
         Serial.printf("%d ", input_quantized[i]);
     }
     Serial.println();
 
     Serial.print("Output logits: ");
-    for (int i = 0; i < output_len; i++)
+    for (int i = 0; i < AI_N_OUTPUTS; i++)
     {
-        Serial.printf("%.5f ", output_float[i]);
+        Serial.printf("%.5f ", (output_int8[i] - AI_OUTPUT_ZERO_POINT) * AI_OUTPUT_SCALE);
     }
     Serial.println();
+#endif
+}
+
+void ai_predict(float *input, float *output_float, int input_len, int output_len)
+{
+    int8_t output_int8[AI_N_OUTPUTS];
+    run_model(input, output_int8);
+
+    // Dequantize output to float logits
+    ai_dequantize(output_int8, output_float, output_len < AI_N_OUTPUTS ? output_len : AI_N_OUTPUTS);
+}
+
+void ai_predict_proba(float *input, float *probabilities, int output_len)
+{
+    int8_t output_int8[AI_N_OUTPUTS];
+    run_model(input, output_int8);
+    if (output_len > AI_N_OUTPUTS)
+        output_len = AI_N_OUTPUTS;
+
+    // Softmax of the first output_len logits straight from int8, no expf()
+    ai_softmax_int8(output_int8, probabilities, output_len);
 }
@@ -0,0 +1,58 @@
+#include "ai_preprocess.h"
+
+#include "model_params.h"
+
+void ai_quantize_inputs(const float *input, int8_t *quantized)
+{
+    for (int i = 0; i < AI_N_INPUTS; i++)
+        quantized[i] = ai_quantize_feature(i, input[i]);
+}
+
+void ai_dequantize(const int8_t *quantized, float *output, int n)
+{
+    for (int i = 0; i < n; i++)
+        output[i] = (quantized[i] - AI_OUTPUT_ZERO_POINT) * AI_OUTPUT_SCALE;
+}
+
+static int8_t max_int8(const int8_t *values, int n)
+{
+    int8_t max_q = values[0];
+    for (int i = 1; i < n; i++)
+        if (values[i] > max_q)
+            max_q = values[i];
+    return max_q;
+}
+
+// exp(logit[i] - logit_max) = AI_SOFTMAX_EXP[q_max - q[i]]
+void ai_softmax_int8(const int8_t *logits, float *probabilities, int n)
+{
+    int8_t max_q = max_int8(logits, n);
+    float sum = 0.0f;
+    for (int i = 0; i < n; i++)
+    {
+        probabilities[i] = AI_SOFTMAX_EXP[max_q - logits[i]];
+        sum += probabilities[i];
+    }
+    for (int i = 0; i < n; i++)
+        probabilities[i] /= sum;
+}
+
+void ai_softmax_q15(const int8_t *logits, uint16_t *probabilities, int n)
+{
+    int8_t max_q = max_int8(logits, n);
+    uint32_t sum = 0;
+    for (int i = 0; i < n; i++)
+        sum += AI_SOFTMAX_EXP_Q15[max_q - logits[i]];
+    // The largest term is 32768, so sum >= 32768 and e * 32768 fits in 32 bits
+    for (int i = 0; i < n; i++)
+        probabilities[i] = (uint16_t)(((uint32_t)AI_SOFTMAX_EXP_Q15[max_q - logits[i]] * 32768u + sum / 2) / sum);
+}
+
+int ai_argmax_int8(const int8_t *logits, int n)
+{
+    int best = 0;
+    for (int i = 1; i < n; i++)
+        if (logits[i] > logits[best])
+            best = i;
+    return best;
+}
@@ -1,6 +1,8 @@
 #include <Arduino.h>
 #include "sensor_driver.h"
 #include "ai_inference.h"
+#include "config.h"
+#include "telemetry.h"
 
 #define N_OUTPUTS 3
 float probabilities[N_OUTPUTS];
@@ -32,13 +34,26 @@ void loop()
     eco2 = 450.0f;
   // Create array input for AI model
   float input[5] = {ldr_voltage, temp, hum, tvoc, eco2};
-  float output[N_OUTPUTS];
-  ai_predict(input, output, 5, N_OUTPUTS); // AI inference
-
-  softmax(output, probabilities, N_OUTPUTS);
+  ai_predict_proba(input, probabilities, N_OUTPUTS); // AI inference + softmax
 
   t_end = micros(); // Time after AI
 
+#if ULLAI_BINARY_TELEMETRY
+  // Binary frame with latency and free heap (decode with ai_pipeline/telemetry.py)
+  telemetry_record_t record;
+  record.millis = millis();
+  record.ldr_v = ldr_voltage;
+  record.temp_c = temp;
+  record.hum_pct = hum;
+  record.tvoc_ppb = tvoc;
+  record.eco2_ppm = eco2;
+  for (int i = 0; i < N_OUTPUTS; i++)
+    record.prob_pct[i] = (uint8_t)lroundf(probabilities[i] * 100);
+  record.latency_us = t_end - t_start;
+  record.free_heap = ESP.getFreeHeap();
+  uint8_t frame[TELEMETRY_FRAME_LEN];
+  Serial.write(frame, telemetry_encode(&record, frame));
+#else
   // Log line with latency
   Serial.printf("%lu,%.2f,%.2f,%.2f,%.2f,%.2f,%.0f,%.0f,%.0f,AI_latency_us:%lu\n",
                 millis(),
@@ -54,5 +69,6 @@ void loop()
     Serial.printf("Free heap: %u bytes\n", ESP.getFreeHeap());
     lastMemLog = now;
   }
+#endif
   delay(1000);
 }
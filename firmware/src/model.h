@@ -1,4 +1,34 @@
-unsigned char model_tflite[] = {
+// Generated by ai_pipeline/package_model.py from quantized_model.tflite.
+// Do not edit: rerun train_model.py or package_model.py instead.
+#ifndef MODEL_H
+#define MODEL_H
+
+#include <stdint.h>
+
+#define AI_MODEL_SIZE 4872
+#define AI_MODEL_SHA256 "18b564da18a0a34897ad8f637b78f803358b467686f7dd045b134b8d2b07ab21"
+// First 4 bytes of the SHA-256; model_params.h records the id it was generated for
+#define AI_MODEL_ID 0x18b564daUL
+// FNV-1a of the array, cheap enough for ai_init() to check the flash copy
+#define AI_MODEL_FNV1A 0x44399ddeUL
+
+// Tensors: index name type shape [scale zero_point]
+//     0 serving_default_keras_tensor:0: int8 [1, 5] [0.0166197363 52]
+//     1 tfl.pseudo_qconst: int32 [5] [per-channel x5 on dim 0]
+//     2 tfl.pseudo_qconst1: int8 [5, 24] [per-channel x5 on dim 0]
+//     3 tfl.pseudo_qconst2: int32 [24] [per-channel x24 on dim 0]
+//     4 tfl.pseudo_qconst3: int8 [24, 32] [per-channel x24 on dim 0]
+//     5 tfl.pseudo_qconst4: int32 [32] [per-channel x32 on dim 0]
+//     6 tfl.pseudo_qconst5: int8 [32, 5] [per-channel x32 on dim 0]
+//     7 sequential_1/dense_1/MatMul;sequential_1/dense_1/Relu;sequential_1/dense_1/BiasAdd: int8 [1, 32] [0.00539167132 -128]
+//     8 sequential_1/dense_1_2/MatMul;sequential_1/dense_1_2/Relu;sequential_1/dense_1_2/BiasAdd: int8 [1, 24] [0.00600287551 -128]
+//     9 StatefulPartitionedCall_1:0: int8 [1, 5] [0.0105614793 24]
+
+#define AI_MODEL_INPUT_SHAPE {1, 5}
+#define AI_MODEL_OUTPUT_SHAPE {1, 5}
+
+// const: stays in flash; aligned for TFLM
+const unsigned char model_tflite[AI_MODEL_SIZE] __attribute__((aligned(16))) = {
     0x20, 0x00, 0x00, 0x00, 0x54, 0x46, 0x4c, 0x33, 0x00, 0x00, 0x00, 0x00,
     0x14, 0x00, 0x20, 0x00, 0x1c, 0x00, 0x18, 0x00, 0x14, 0x00, 0x10, 0x00,
     0x0c, 0x00, 0x00, 0x00, 0x08, 0x00, 0x04, 0x00, 0x14, 0x00, 0x00, 0x00,
@@ -404,5 +434,8 @@ unsigned char model_tflite[] = {
     0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00,
     0x01, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x10, 0x00,
     0x0f, 0x00, 0x00, 0x00, 0x08, 0x00, 0x04, 0x00, 0x0c, 0x00, 0x00, 0x00,
-    0x09, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09};
-unsigned int model_tflite_len = 4872;
+    0x09, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09,
+};
+const unsigned int model_tflite_len = AI_MODEL_SIZE;
+
+#endif
@@ -1,406 +0,0 @@
-unsigned char model_tflite[] = {
-    0x20, 0x00, 0x00, 0x00, 0x54, 0x46, 0x4c, 0x33, 0x00, 0x00, 0x00, 0x00,
-    0x14, 0x00, 0x20, 0x00, 0x1c, 0x00, 0x18, 0x00, 0x14, 0x00, 0x10, 0x00,
-    0x0c, 0x00, 0x00, 0x00, 0x08, 0x00, 0x04, 0x00, 0x14, 0x00, 0x00, 0x00,
-    0x1c, 0x00, 0x00, 0x00, 0x98, 0x00, 0x00, 0x00, 0x18, 0x01, 0x00, 0x00,
-    0x2c, 0x07, 0x00, 0x00, 0x3c, 0x07, 0x00, 0x00, 0x8c, 0x12, 0x00, 0x00,
-    0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x0a, 0x00, 0x10, 0x00, 0x0c, 0x00, 0x08, 0x00, 0x04, 0x00,
-    0x0a, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00,
-    0x3c, 0x00, 0x00, 0x00, 0x0f, 0x00, 0x00, 0x00, 0x73, 0x65, 0x72, 0x76,
-    0x69, 0x6e, 0x67, 0x5f, 0x64, 0x65, 0x66, 0x61, 0x75, 0x6c, 0x74, 0x00,
-    0x01, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x68, 0xff, 0xff, 0xff,
-    0x09, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00,
-    0x6f, 0x75, 0x74, 0x70, 0x75, 0x74, 0x5f, 0x30, 0x00, 0x00, 0x00, 0x00,
-    0x01, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x6e, 0xf9, 0xff, 0xff,
-    0x04, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x6b, 0x65, 0x72, 0x61,
-    0x73, 0x5f, 0x74, 0x65, 0x6e, 0x73, 0x6f, 0x72, 0x00, 0x00, 0x00, 0x00,
-    0x03, 0x00, 0x00, 0x00, 0x5c, 0x00, 0x00, 0x00, 0x2c, 0x00, 0x00, 0x00,
-    0x04, 0x00, 0x00, 0x00, 0xb8, 0xff, 0xff, 0xff, 0x0d, 0x00, 0x00, 0x00,
-    0x04, 0x00, 0x00, 0x00, 0x13, 0x00, 0x00, 0x00, 0x43, 0x4f, 0x4e, 0x56,
-    0x45, 0x52, 0x53, 0x49, 0x4f, 0x4e, 0x5f, 0x4d, 0x45, 0x54, 0x41, 0x44,
-    0x41, 0x54, 0x41, 0x00, 0xdc, 0xff, 0xff, 0xff, 0x0c, 0x00, 0x00, 0x00,
-    0x04, 0x00, 0x00, 0x00, 0x13, 0x00, 0x00, 0x00, 0x6d, 0x69, 0x6e, 0x5f,
-    0x72, 0x75, 0x6e, 0x74, 0x69, 0x6d, 0x65, 0x5f, 0x76, 0x65, 0x72, 0x73,
-    0x69, 0x6f, 0x6e, 0x00, 0x08, 0x00, 0x0c, 0x00, 0x08, 0x00, 0x04, 0x00,
-    0x08, 0x00, 0x00, 0x00, 0x0b, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x13, 0x00, 0x00, 0x00, 0x6d, 0x69, 0x6e, 0x5f, 0x72, 0x75, 0x6e, 0x74,
-    0x69, 0x6d, 0x65, 0x5f, 0x76, 0x65, 0x72, 0x73, 0x69, 0x6f, 0x6e, 0x00,
-    0x0e, 0x00, 0x00, 0x00, 0x10, 0x06, 0x00, 0x00, 0x08, 0x06, 0x00, 0x00,
-    0xec, 0x05, 0x00, 0x00, 0x8c, 0x05, 0x00, 0x00, 0x1c, 0x05, 0x00, 0x00,
-    0x0c, 0x02, 0x00, 0x00, 0x7c, 0x01, 0x00, 0x00, 0xcc, 0x00, 0x00, 0x00,
-    0xc4, 0x00, 0x00, 0x00, 0xbc, 0x00, 0x00, 0x00, 0xb4, 0x00, 0x00, 0x00,
-    0x94, 0x00, 0x00, 0x00, 0x74, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x4a, 0xfa, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00,
-    0x0c, 0x00, 0x00, 0x00, 0x08, 0x00, 0x0e, 0x00, 0x08, 0x00, 0x04, 0x00,
-    0x08, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x28, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x06, 0x00, 0x08, 0x00, 0x04, 0x00, 0x06, 0x00, 0x00, 0x00,
-    0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0xeb, 0x03, 0x00, 0x00,
-    0x0c, 0x00, 0x18, 0x00, 0x14, 0x00, 0x10, 0x00, 0x0c, 0x00, 0x04, 0x00,
-    0x0c, 0x00, 0x00, 0x00, 0xc1, 0xce, 0x36, 0xf2, 0x76, 0xa5, 0x75, 0x16,
-    0x02, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x06, 0x00, 0x00, 0x00, 0x32, 0x2e, 0x31, 0x39, 0x2e, 0x30, 0x00, 0x00,
-    0xb6, 0xfa, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0xd2, 0xfa, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00,
-    0x10, 0x00, 0x00, 0x00, 0x31, 0x2e, 0x31, 0x34, 0x2e, 0x30, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x54, 0xfa, 0xff, 0xff,
-    0x58, 0xfa, 0xff, 0xff, 0x5c, 0xfa, 0xff, 0xff, 0xfa, 0xfa, 0xff, 0xff,
-    0x04, 0x00, 0x00, 0x00, 0xa0, 0x00, 0x00, 0x00, 0x7d, 0x7f, 0x61, 0x9f,
-    0x32, 0x3a, 0xeb, 0x81, 0x0c, 0x07, 0x96, 0xf8, 0x81, 0xc3, 0xdd, 0x50,
-    0x81, 0x5c, 0x4b, 0x96, 0x81, 0xa6, 0xe9, 0x46, 0x30, 0x4b, 0x0e, 0x69,
-    0x92, 0x81, 0xb4, 0x81, 0x9d, 0xdb, 0xfa, 0xce, 0xde, 0x3d, 0xef, 0x81,
-    0x89, 0x81, 0x99, 0x0c, 0x42, 0x7f, 0xb3, 0x1c, 0xea, 0xd2, 0x97, 0x30,
-    0x81, 0xeb, 0x88, 0xd9, 0x00, 0xcb, 0x81, 0x3d, 0x7f, 0x8d, 0xbf, 0x1f,
-    0x25, 0x1b, 0x0b, 0xe3, 0x7f, 0xb9, 0x26, 0x7b, 0x7f, 0x64, 0x78, 0x33,
-    0xac, 0x0e, 0x81, 0xf1, 0x7f, 0x09, 0x65, 0xe1, 0xee, 0x10, 0x7f, 0x15,
-    0x88, 0x88, 0xba, 0x81, 0xd4, 0x39, 0x66, 0x0e, 0x38, 0x7f, 0xb2, 0xb8,
-    0x5b, 0x78, 0xdb, 0x7f, 0xe4, 0xdf, 0x7f, 0x2e, 0x7d, 0x5f, 0xf6, 0xd2,
-    0x3d, 0x7f, 0xa3, 0x09, 0x7f, 0xf7, 0xc3, 0x4f, 0x8d, 0x11, 0x50, 0xf7,
-    0x7f, 0x81, 0xc5, 0x99, 0xb4, 0x36, 0x22, 0x0f, 0xef, 0x82, 0x7f, 0xf7,
-    0xb0, 0x7f, 0x47, 0x38, 0xce, 0x0c, 0x78, 0x81, 0xb0, 0x7f, 0xab, 0xc7,
-    0xc5, 0x1c, 0xb0, 0x7f, 0x2e, 0x66, 0xdc, 0x6c, 0x5a, 0x15, 0x72, 0x7f,
-    0xa6, 0xfb, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x80, 0x00, 0x00, 0x00,
-    0x2d, 0x06, 0x00, 0x00, 0xa9, 0xfa, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00,
-    0xce, 0xf8, 0xff, 0xff, 0x17, 0xfd, 0xff, 0xff, 0x73, 0xfe, 0xff, 0xff,
-    0x00, 0x00, 0x00, 0x00, 0x3a, 0x02, 0x00, 0x00, 0x50, 0xfe, 0xff, 0xff,
-    0x1d, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xd6, 0xfe, 0xff, 0xff,
-    0x57, 0x05, 0x00, 0x00, 0x32, 0x05, 0x00, 0x00, 0x79, 0xfa, 0xff, 0xff,
-    0x86, 0xfc, 0xff, 0xff, 0x1f, 0x02, 0x00, 0x00, 0xf6, 0x1f, 0x00, 0x00,
-    0x09, 0xf8, 0xff, 0xff, 0x1b, 0x06, 0x00, 0x00, 0x90, 0x06, 0x00, 0x00,
-    0xb2, 0x02, 0x00, 0x00, 0x83, 0xfe, 0xff, 0xff, 0x67, 0xfc, 0xff, 0xff,
-    0x80, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x5f, 0x09, 0x00, 0x00,
-    0x2f, 0xfe, 0xff, 0xff, 0x48, 0x04, 0x00, 0x00, 0x20, 0x06, 0x00, 0x00,
-    0x34, 0x04, 0x00, 0x00, 0x12, 0x07, 0x00, 0x00, 0x32, 0xfc, 0xff, 0xff,
-    0x04, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0xfd, 0xf6, 0x5c, 0x54,
-    0x7e, 0x47, 0x28, 0xa6, 0x26, 0x94, 0x99, 0x5a, 0xe7, 0xf5, 0xc3, 0x65,
-    0xb5, 0xa5, 0xfe, 0xff, 0x57, 0x7f, 0x97, 0x87, 0x47, 0xed, 0x97, 0x07,
-    0xd9, 0xd0, 0x58, 0xa3, 0x1b, 0x3e, 0xee, 0xa7, 0x0e, 0xac, 0xa3, 0x98,
-    0x04, 0x40, 0xa6, 0x61, 0xe1, 0xc4, 0xca, 0xea, 0x7f, 0xf9, 0x02, 0xfa,
-    0xac, 0x3e, 0x42, 0x12, 0x6b, 0x5f, 0xf4, 0xf7, 0x1f, 0x9e, 0x64, 0x52,
-    0xdc, 0xbe, 0x76, 0x38, 0x72, 0xb0, 0x54, 0xfb, 0x1d, 0x50, 0x8f, 0x9f,
-    0x64, 0xc0, 0xce, 0x91, 0x6e, 0x81, 0xec, 0x4d, 0x42, 0x15, 0x68, 0xcb,
-    0xba, 0xdb, 0xef, 0xb5, 0x64, 0x70, 0x44, 0x22, 0x37, 0xbf, 0x50, 0xb3,
-    0x37, 0x23, 0x02, 0xca, 0x68, 0x4a, 0xd8, 0xce, 0x58, 0xcd, 0xf7, 0x81,
-    0x74, 0x70, 0x38, 0xd1, 0xcc, 0x47, 0x75, 0x88, 0x22, 0xe1, 0x0a, 0xbc,
-    0x5a, 0xa0, 0xc2, 0x9f, 0xe1, 0xf2, 0x5e, 0x33, 0x37, 0x58, 0x50, 0x25,
-    0xae, 0xcb, 0x6d, 0x7f, 0x87, 0xee, 0xc3, 0x66, 0xe6, 0x6e, 0xaa, 0xe3,
-    0xb4, 0x3c, 0x2e, 0x83, 0x3e, 0x55, 0x47, 0xb3, 0x61, 0x66, 0xdc, 0xcf,
-    0xdd, 0xf0, 0xe5, 0xf8, 0x69, 0x5e, 0xa3, 0x0f, 0xa8, 0x10, 0x57, 0x21,
-    0x02, 0x5f, 0x3d, 0x20, 0x2d, 0x19, 0xbc, 0xe5, 0x81, 0x4e, 0x10, 0x2f,
-    0x54, 0xa5, 0x34, 0xd4, 0xc2, 0xd0, 0xea, 0xfc, 0x9b, 0x9d, 0x2c, 0xd6,
-    0x16, 0xce, 0x1d, 0xd6, 0xa1, 0x24, 0x5d, 0x68, 0xf9, 0x22, 0x4a, 0x7f,
-    0x2f, 0xf3, 0xdf, 0x4d, 0x0b, 0xa1, 0x93, 0x4b, 0x55, 0x7c, 0xfe, 0x15,
-    0xa3, 0x4e, 0xb8, 0x25, 0x64, 0x97, 0xde, 0xc1, 0x01, 0x4d, 0x55, 0xc7,
-    0x50, 0xe4, 0xeb, 0x45, 0xe1, 0x21, 0xf6, 0xe7, 0x74, 0x7f, 0x25, 0xd8,
-    0xee, 0x68, 0xea, 0xdc, 0xf8, 0xc5, 0x0a, 0x24, 0x1d, 0x5b, 0xa4, 0x11,
-    0xe1, 0x52, 0xd6, 0x3d, 0x01, 0x30, 0xb0, 0x02, 0x9d, 0x70, 0x82, 0x5d,
-    0xa8, 0x9c, 0xab, 0x1c, 0x81, 0x84, 0xc4, 0xc3, 0x2a, 0x5b, 0xa0, 0x61,
-    0xde, 0x65, 0xbc, 0x46, 0x4d, 0xd2, 0xff, 0x21, 0xa6, 0x1d, 0x7b, 0xe9,
-    0xce, 0x7c, 0xe2, 0x5f, 0xec, 0x44, 0x15, 0x10, 0x20, 0x5e, 0xc7, 0xa1,
-    0x59, 0xe3, 0x28, 0x40, 0xcb, 0x7f, 0x29, 0x1f, 0x4b, 0x41, 0x01, 0x8e,
-    0x1c, 0xee, 0x0a, 0x3b, 0x73, 0x17, 0xc3, 0x28, 0x7f, 0x73, 0x62, 0x67,
-    0x16, 0x9c, 0x4f, 0xbf, 0x36, 0x18, 0xee, 0x3d, 0xa3, 0xb1, 0xd2, 0x19,
-    0x78, 0xd6, 0xec, 0xc6, 0x9d, 0x49, 0xa6, 0x4b, 0x03, 0xbe, 0xe1, 0x4e,
-    0xbd, 0x16, 0xc1, 0xb6, 0x7d, 0x66, 0x98, 0xdc, 0xfb, 0xf8, 0xcb, 0xa0,
-    0xbf, 0xe5, 0x9a, 0x7f, 0xcc, 0x86, 0x67, 0x3b, 0xe3, 0xf5, 0xc4, 0x64,
-    0x0d, 0x5b, 0x22, 0xa5, 0x8b, 0xd7, 0x44, 0x59, 0x65, 0xdd, 0x79, 0x75,
-    0x73, 0xee, 0x1f, 0x2b, 0x56, 0xbc, 0x9f, 0x1e, 0xd3, 0xbb, 0xa6, 0x2e,
-    0x9a, 0x6d, 0xed, 0x0a, 0x3c, 0x22, 0x72, 0xc0, 0x81, 0x62, 0x72, 0x09,
-    0x5e, 0xab, 0x70, 0x2c, 0x52, 0x73, 0x0e, 0x2a, 0xb7, 0x59, 0x66, 0xa2,
-    0x1e, 0xd2, 0x31, 0x6f, 0x63, 0x74, 0xc2, 0x98, 0xc6, 0x0a, 0xb6, 0x17,
-    0x3b, 0x77, 0xdc, 0x5d, 0xe3, 0x0c, 0xaf, 0x3d, 0xd9, 0xbc, 0x7f, 0x2d,
-    0x59, 0xde, 0x58, 0x17, 0x9d, 0x75, 0x5c, 0xda, 0x68, 0x78, 0x09, 0xe5,
-    0x73, 0x20, 0x92, 0xc5, 0x83, 0xe8, 0x0c, 0xdf, 0x9c, 0xea, 0x1c, 0x82,
-    0xd8, 0x00, 0xaa, 0x51, 0x43, 0x90, 0x81, 0xae, 0x8a, 0x04, 0xe1, 0xdc,
-    0x59, 0xe2, 0x7f, 0xce, 0x91, 0xc0, 0x59, 0x30, 0xaa, 0x88, 0x10, 0xdf,
-    0x20, 0xb4, 0xd9, 0x2a, 0x7d, 0xe9, 0x6d, 0x77, 0xed, 0x7c, 0x13, 0x2d,
-    0x69, 0x39, 0xa7, 0x8b, 0x48, 0x0c, 0xc2, 0xac, 0x94, 0xee, 0xbf, 0xef,
-    0xd1, 0xce, 0xd7, 0x1e, 0x6a, 0xc0, 0x94, 0xe8, 0x0a, 0xe5, 0xcd, 0x6e,
-    0x0b, 0x0f, 0xc1, 0x10, 0x7f, 0x0e, 0x75, 0x6e, 0xad, 0xd0, 0x56, 0x61,
-    0xc9, 0xe5, 0xb8, 0x25, 0x7f, 0xb4, 0x1f, 0x51, 0x97, 0x32, 0xb9, 0x10,
-    0xea, 0xc7, 0x0b, 0xb1, 0xa6, 0x26, 0xb0, 0x82, 0x8f, 0x22, 0x06, 0x47,
-    0xc6, 0x74, 0xac, 0x6c, 0x79, 0x33, 0xf9, 0xd3, 0xd2, 0xed, 0xf7, 0x3d,
-    0x4d, 0xb4, 0xf3, 0x6d, 0xf1, 0x7f, 0xa4, 0x13, 0x5f, 0x61, 0xa9, 0x38,
-    0xba, 0x18, 0xe1, 0xe6, 0xaa, 0x46, 0xc1, 0x01, 0x81, 0x47, 0x0b, 0xd2,
-    0x26, 0xbe, 0xbf, 0xda, 0x36, 0x93, 0xc2, 0x42, 0x07, 0xe4, 0x8b, 0x1b,
-    0xfc, 0x09, 0x2a, 0xe0, 0xce, 0x58, 0xc8, 0x41, 0x3d, 0xd2, 0xb4, 0x26,
-    0x02, 0x12, 0x08, 0xd5, 0x55, 0x02, 0xd7, 0x47, 0xf9, 0x35, 0x1e, 0x7f,
-    0x5c, 0x74, 0x19, 0x44, 0xfd, 0x81, 0xb2, 0xd5, 0x32, 0xed, 0x48, 0x07,
-    0x85, 0x8f, 0xfb, 0x34, 0xfc, 0xdc, 0x78, 0x9a, 0x32, 0xd3, 0xc6, 0x10,
-    0x1b, 0x23, 0x8a, 0x60, 0xe4, 0x8f, 0x97, 0x2e, 0xf5, 0xc5, 0x24, 0x66,
-    0xeb, 0x3c, 0xf1, 0xe0, 0x7f, 0xdb, 0x3b, 0x99, 0x2c, 0xcc, 0x74, 0x0b,
-    0x68, 0x55, 0xe6, 0x02, 0xfe, 0x27, 0x8e, 0x87, 0xe7, 0x6b, 0x1d, 0x74,
-    0x58, 0xce, 0xfa, 0xbf, 0x06, 0x60, 0x46, 0xde, 0x81, 0xc6, 0x0d, 0x0e,
-    0x1a, 0xf7, 0xe4, 0x62, 0x05, 0xb1, 0x0e, 0x35, 0x37, 0x9f, 0x56, 0x70,
-    0xa2, 0x44, 0x49, 0xd6, 0xa7, 0x55, 0xfb, 0x07, 0xc4, 0x20, 0xaf, 0x5d,
-    0x64, 0xd4, 0x5e, 0xa6, 0x7c, 0xf1, 0x3d, 0x27, 0x95, 0xd7, 0xd4, 0xf8,
-    0x3a, 0x3f, 0x1d, 0x0d, 0x6f, 0x81, 0x16, 0x70, 0xa1, 0xa0, 0x1d, 0x68,
-    0x1f, 0xaf, 0x89, 0xe1, 0xad, 0xc3, 0x03, 0x0e, 0x3e, 0xff, 0xff, 0xff,
-    0x04, 0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00, 0xa2, 0x03, 0x00, 0x00,
-    0x54, 0x01, 0x00, 0x00, 0xf1, 0x02, 0x00, 0x00, 0x5f, 0xfd, 0xff, 0xff,
-    0x4b, 0xf9, 0xff, 0xff, 0x05, 0xfa, 0xff, 0xff, 0x88, 0x00, 0x00, 0x00,
-    0xd0, 0x03, 0x00, 0x00, 0x91, 0xfe, 0xff, 0xff, 0xb2, 0x05, 0x00, 0x00,
-    0xde, 0xff, 0xff, 0xff, 0x04, 0xfc, 0xff, 0xff, 0x83, 0xfa, 0xff, 0xff,
-    0x44, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0xb7, 0x06, 0x00, 0x00, 0x1b, 0xfc, 0xff, 0xff, 0x9f, 0xfd, 0xff, 0xff,
-    0x1a, 0x06, 0x00, 0x00, 0x4a, 0xf9, 0xff, 0xff, 0x78, 0xfb, 0xff, 0xff,
-    0x00, 0xfa, 0xff, 0xff, 0x66, 0xfe, 0xff, 0xff, 0xaa, 0xff, 0xff, 0xff,
-    0x04, 0x00, 0x00, 0x00, 0x48, 0x00, 0x00, 0x00, 0x34, 0x37, 0x72, 0x89,
-    0x0e, 0x87, 0xf6, 0x33, 0xe7, 0x39, 0xf7, 0xec, 0x13, 0x05, 0x39, 0x75,
-    0x7f, 0xa2, 0x36, 0x63, 0xce, 0xbb, 0xbc, 0xd0, 0x10, 0xa3, 0xf5, 0xde,
-    0x8b, 0x7c, 0x81, 0x70, 0xa2, 0xf3, 0xc2, 0xed, 0xd5, 0x15, 0x75, 0xbe,
-    0x3a, 0x9b, 0xd8, 0x73, 0x59, 0x4f, 0x3c, 0xe3, 0x12, 0xb7, 0xc6, 0x6e,
-    0xc8, 0xbe, 0x36, 0x17, 0x52, 0x23, 0x4f, 0x8d, 0x98, 0x10, 0x56, 0x67,
-    0x7a, 0xb4, 0xe4, 0x7f, 0x24, 0x27, 0xe8, 0x74, 0x00, 0x00, 0x06, 0x00,
-    0x08, 0x00, 0x04, 0x00, 0x06, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x0c, 0x00, 0x00, 0x00, 0xd6, 0x04, 0x00, 0x00, 0x6e, 0x04, 0x00, 0x00,
-    0x02, 0x0c, 0x00, 0x00, 0x84, 0xff, 0xff, 0xff, 0x88, 0xff, 0xff, 0xff,
-    0x0f, 0x00, 0x00, 0x00, 0x4d, 0x4c, 0x49, 0x52, 0x20, 0x43, 0x6f, 0x6e,
-    0x76, 0x65, 0x72, 0x74, 0x65, 0x64, 0x2e, 0x00, 0x01, 0x00, 0x00, 0x00,
-    0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0e, 0x00, 0x18, 0x00, 0x14, 0x00,
-    0x10, 0x00, 0x0c, 0x00, 0x08, 0x00, 0x04, 0x00, 0x0e, 0x00, 0x00, 0x00,
-    0x14, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0xdc, 0x00, 0x00, 0x00,
-    0xe0, 0x00, 0x00, 0x00, 0xe4, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x6d, 0x61, 0x69, 0x6e, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00,
-    0x84, 0x00, 0x00, 0x00, 0x3c, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x96, 0xff, 0xff, 0xff, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08,
-    0x10, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x04, 0x00, 0x04, 0x00,
-    0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00,
-    0x03, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00,
-    0x01, 0x00, 0x00, 0x00, 0xca, 0xff, 0xff, 0xff, 0x10, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x10, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00,
-    0xba, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00,
-    0x08, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00,
-    0x04, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0e, 0x00,
-    0x16, 0x00, 0x00, 0x00, 0x10, 0x00, 0x0c, 0x00, 0x0b, 0x00, 0x04, 0x00,
-    0x0e, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08,
-    0x18, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00,
-    0x08, 0x00, 0x07, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01,
-    0x01, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00,
-    0x01, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x00, 0x00, 0xb4, 0x09, 0x00, 0x00,
-    0x24, 0x09, 0x00, 0x00, 0x90, 0x08, 0x00, 0x00, 0x1c, 0x07, 0x00, 0x00,
-    0xa0, 0x05, 0x00, 0x00, 0xcc, 0x03, 0x00, 0x00, 0xf0, 0x01, 0x00, 0x00,
-    0x3c, 0x01, 0x00, 0x00, 0x80, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x8a, 0xf6, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x18, 0x00, 0x00, 0x00,
-    0x20, 0x00, 0x00, 0x00, 0x3c, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x09, 0x50, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00,
-    0xff, 0xff, 0xff, 0xff, 0x03, 0x00, 0x00, 0x00, 0x74, 0xf6, 0xff, 0xff,
-    0x08, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00,
-    0x80, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0x01, 0x00, 0x00, 0x00,
-    0x79, 0xe5, 0x13, 0x3b, 0x1b, 0x00, 0x00, 0x00, 0x53, 0x74, 0x61, 0x74,
-    0x65, 0x66, 0x75, 0x6c, 0x50, 0x61, 0x72, 0x74, 0x69, 0x74, 0x69, 0x6f,
-    0x6e, 0x65, 0x64, 0x43, 0x61, 0x6c, 0x6c, 0x5f, 0x31, 0x3a, 0x30, 0x00,
-    0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00,
-    0x02, 0xf7, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x18, 0x00, 0x00, 0x00,
-    0x20, 0x00, 0x00, 0x00, 0x3c, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x09, 0x90, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00,
-    0xff, 0xff, 0xff, 0xff, 0x18, 0x00, 0x00, 0x00, 0xec, 0xf6, 0xff, 0xff,
-    0x08, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00,
-    0x80, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0x01, 0x00, 0x00, 0x00,
-    0x10, 0x12, 0x46, 0x3b, 0x58, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75,
-    0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e,
-    0x73, 0x65, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x4d, 0x61, 0x74, 0x4d, 0x75,
-    0x6c, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c,
-    0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x5f, 0x32,
-    0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e,
-    0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65,
-    0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 0x64, 0x64,
-    0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00,
-    0x18, 0x00, 0x00, 0x00, 0xba, 0xf7, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01,
-    0x18, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x3c, 0x00, 0x00, 0x00,
-    0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x88, 0x00, 0x00, 0x00,
-    0x02, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0x20, 0x00, 0x00, 0x00,
-    0xa4, 0xf7, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00,
-    0x01, 0x00, 0x00, 0x00, 0x80, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-    0x01, 0x00, 0x00, 0x00, 0xda, 0x7f, 0x94, 0x3b, 0x52, 0x00, 0x00, 0x00,
-    0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31,
-    0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x2f, 0x4d, 0x61, 0x74,
-    0x4d, 0x75, 0x6c, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69,
-    0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31,
-    0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e,
-    0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65,
-    0x5f, 0x31, 0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 0x64, 0x64, 0x00, 0x00,
-    0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00,
-    0xf6, 0xf8, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00,
-    0xa8, 0x01, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09,
-    0xb4, 0x01, 0x00, 0x00, 0x44, 0xf8, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00,
-    0x0c, 0x01, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x53, 0xb7, 0x17, 0x3b,
-    0xba, 0xe8, 0x47, 0x3b, 0x9b, 0x9e, 0x30, 0x3b, 0xd0, 0x8c, 0x48, 0x3b,
-    0xe3, 0x67, 0x4b, 0x3b, 0x24, 0x6e, 0x13, 0x3b, 0x7c, 0x6b, 0x2a, 0x3b,
-    0xe9, 0x3e, 0x2b, 0x3b, 0xc2, 0x4e, 0x2a, 0x3b, 0x03, 0xdd, 0x40, 0x3b,
-    0xae, 0x0d, 0x37, 0x3b, 0x8a, 0x40, 0x4c, 0x3b, 0xee, 0x47, 0x52, 0x3b,
-    0x6e, 0x51, 0x55, 0x3b, 0xe9, 0x34, 0x41, 0x3b, 0xa8, 0x78, 0x3e, 0x3b,
-    0x11, 0x05, 0x27, 0x3b, 0x8b, 0xfc, 0x0b, 0x3b, 0x11, 0x43, 0x29, 0x3b,
-    0xe4, 0x65, 0x48, 0x3b, 0x8e, 0xce, 0x22, 0x3b, 0xd1, 0x63, 0x3c, 0x3b,
-    0x73, 0xb7, 0x2b, 0x3b, 0xbe, 0x10, 0x26, 0x3b, 0x2d, 0xff, 0x24, 0x3b,
-    0xbd, 0x2b, 0x43, 0x3b, 0xf7, 0xf0, 0x16, 0x3b, 0xa8, 0xfd, 0x4a, 0x3b,
-    0xc7, 0x56, 0x33, 0x3b, 0xac, 0x25, 0x35, 0x3b, 0x9f, 0x30, 0x4e, 0x3b,
-    0xf6, 0x85, 0x28, 0x3b, 0x12, 0x00, 0x00, 0x00, 0x74, 0x66, 0x6c, 0x2e,
-    0x70, 0x73, 0x65, 0x75, 0x64, 0x6f, 0x5f, 0x71, 0x63, 0x6f, 0x6e, 0x73,
-    0x74, 0x35, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00,
-    0x05, 0x00, 0x00, 0x00, 0xce, 0xfa, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01,
-    0x14, 0x00, 0x00, 0x00, 0xa4, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x02, 0xb0, 0x01, 0x00, 0x00, 0x1c, 0xfa, 0xff, 0xff,
-    0x08, 0x00, 0x00, 0x00, 0x08, 0x01, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x4a, 0x01, 0x18, 0x37,
-    0x30, 0x4a, 0x48, 0x37, 0xb6, 0xf4, 0x30, 0x37, 0x96, 0xee, 0x48, 0x37,
-    0x0d, 0xcb, 0x4b, 0x37, 0x04, 0xb6, 0x13, 0x37, 0x91, 0xbe, 0x2a, 0x37,
-    0x65, 0x92, 0x2b, 0x37, 0xc9, 0xa1, 0x2a, 0x37, 0x09, 0x3b, 0x41, 0x37,
-    0xec, 0x66, 0x37, 0x37, 0x1e, 0xa4, 0x4c, 0x37, 0x72, 0xae, 0x52, 0x37,
-    0x6d, 0xb9, 0x55, 0x37, 0x1a, 0x93, 0x41, 0x37, 0x84, 0xd5, 0x3e, 0x37,
-    0x7e, 0x56, 0x27, 0x37, 0xca, 0x40, 0x0c, 0x37, 0x96, 0x95, 0x29, 0x37,
-    0x97, 0xc7, 0x48, 0x37, 0xed, 0x1d, 0x23, 0x37, 0xa9, 0xbf, 0x3c, 0x37,
-    0x2a, 0x0b, 0x2c, 0x37, 0xb4, 0x61, 0x26, 0x37, 0x9d, 0x4f, 0x25, 0x37,
-    0xe3, 0x8a, 0x43, 0x37, 0x8d, 0x3a, 0x17, 0x37, 0x9e, 0x60, 0x4b, 0x37,
-    0x35, 0xae, 0x33, 0x37, 0xfc, 0x7d, 0x35, 0x37, 0x24, 0x95, 0x4e, 0x37,
-    0x1e, 0xd8, 0x28, 0x37, 0x12, 0x00, 0x00, 0x00, 0x74, 0x66, 0x6c, 0x2e,
-    0x70, 0x73, 0x65, 0x75, 0x64, 0x6f, 0x5f, 0x71, 0x63, 0x6f, 0x6e, 0x73,
-    0x74, 0x34, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00,
-    0x9e, 0xfc, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00,
-    0x48, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09,
-    0x54, 0x01, 0x00, 0x00, 0xec, 0xfb, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00,
-    0xcc, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x18, 0x00, 0x00, 0x00, 0xa5, 0x64, 0x2a, 0x3b, 0xa6, 0xc3, 0x2f, 0x3b,
-    0x9b, 0x2f, 0x2d, 0x3b, 0x77, 0xc6, 0x2e, 0x3b, 0xfc, 0x05, 0x1b, 0x3b,
-    0xb2, 0x6e, 0x24, 0x3b, 0xe2, 0x07, 0x10, 0x3b, 0xa4, 0xb6, 0x3a, 0x3b,
-    0x48, 0xa5, 0x1e, 0x3b, 0x93, 0x26, 0x2e, 0x3b, 0xe2, 0x01, 0x23, 0x3b,
-    0xcc, 0x11, 0x24, 0x3b, 0x9f, 0x93, 0x2b, 0x3b, 0x2d, 0x48, 0x35, 0x3b,
-    0x56, 0xf2, 0x27, 0x3b, 0x04, 0x3a, 0x23, 0x3b, 0x8a, 0xdd, 0x35, 0x3b,
-    0x1a, 0xc7, 0x1c, 0x3b, 0xf1, 0x88, 0x20, 0x3b, 0x51, 0xe3, 0x2b, 0x3b,
-    0x28, 0x56, 0x21, 0x3b, 0x77, 0xb8, 0x2a, 0x3b, 0xd1, 0xfa, 0x2e, 0x3b,
-    0xc6, 0x35, 0x2d, 0x3b, 0x12, 0x00, 0x00, 0x00, 0x74, 0x66, 0x6c, 0x2e,
-    0x70, 0x73, 0x65, 0x75, 0x64, 0x6f, 0x5f, 0x71, 0x63, 0x6f, 0x6e, 0x73,
-    0x74, 0x33, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00,
-    0x20, 0x00, 0x00, 0x00, 0x16, 0xfe, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01,
-    0x14, 0x00, 0x00, 0x00, 0x44, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x02, 0x50, 0x01, 0x00, 0x00, 0x64, 0xfd, 0xff, 0xff,
-    0x08, 0x00, 0x00, 0x00, 0xc8, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x18, 0x00, 0x00, 0x00, 0x91, 0xae, 0x45, 0x37, 0xc7, 0xe9, 0x4b, 0x37,
-    0x07, 0xec, 0x48, 0x37, 0x0c, 0xc4, 0x4a, 0x37, 0xc3, 0xd9, 0x33, 0x37,
-    0x3c, 0xc4, 0x3e, 0x37, 0xfa, 0x18, 0x27, 0x37, 0xad, 0x9d, 0x58, 0x37,
-    0x91, 0x0d, 0x38, 0x37, 0x8d, 0x0a, 0x4a, 0x37, 0xff, 0x1c, 0x3d, 0x37,
-    0x75, 0x58, 0x3e, 0x37, 0x11, 0x0e, 0x47, 0x37, 0x86, 0x50, 0x52, 0x37,
-    0xf4, 0xd7, 0x42, 0x37, 0x1e, 0x5e, 0x3d, 0x37, 0xcf, 0xfd, 0x52, 0x37,
-    0xcf, 0xe2, 0x35, 0x37, 0xb0, 0x3e, 0x3a, 0x37, 0x86, 0x6a, 0x47, 0x37,
-    0xc5, 0x2c, 0x3b, 0x37, 0xcf, 0x0f, 0x46, 0x37, 0xc9, 0x00, 0x4b, 0x37,
-    0x2f, 0xf3, 0x48, 0x37, 0x12, 0x00, 0x00, 0x00, 0x74, 0x66, 0x6c, 0x2e,
-    0x70, 0x73, 0x65, 0x75, 0x64, 0x6f, 0x5f, 0x71, 0x63, 0x6f, 0x6e, 0x73,
-    0x74, 0x32, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00,
-    0x86, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00,
-    0x48, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09,
-    0x54, 0x00, 0x00, 0x00, 0xd4, 0xfe, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00,
-    0x20, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00,
-    0xff, 0x8c, 0x6c, 0x3b, 0x94, 0xae, 0x61, 0x3b, 0x32, 0x86, 0x59, 0x3b,
-    0x12, 0x00, 0x00, 0x00, 0x74, 0x66, 0x6c, 0x2e, 0x70, 0x73, 0x65, 0x75,
-    0x64, 0x6f, 0x5f, 0x71, 0x63, 0x6f, 0x6e, 0x73, 0x74, 0x31, 0x00, 0x00,
-    0x02, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x16, 0x00, 0x1c, 0x00, 0x18, 0x00, 0x17, 0x00, 0x10, 0x00,
-    0x0c, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00,
-    0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00,
-    0x48, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02,
-    0x54, 0x00, 0x00, 0x00, 0x64, 0xff, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00,
-    0x20, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00,
-    0xbe, 0x05, 0x37, 0x37, 0xf3, 0x9c, 0x2e, 0x37, 0x24, 0x4d, 0x28, 0x37,
-    0x11, 0x00, 0x00, 0x00, 0x74, 0x66, 0x6c, 0x2e, 0x70, 0x73, 0x65, 0x75,
-    0x64, 0x6f, 0x5f, 0x71, 0x63, 0x6f, 0x6e, 0x73, 0x74, 0x00, 0x00, 0x00,
-    0x01, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x16, 0x00,
-    0x20, 0x00, 0x1c, 0x00, 0x1b, 0x00, 0x14, 0x00, 0x10, 0x00, 0x0c, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x07, 0x00, 0x16, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x01, 0x18, 0x00, 0x00, 0x00, 0x2c, 0x00, 0x00, 0x00,
-    0x4c, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09,
-    0x64, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff,
-    0x05, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x08, 0x00, 0x04, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00,
-    0x14, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x80, 0xff, 0xff, 0xff,
-    0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00,
-    0x67, 0x3e, 0x80, 0x3b, 0x1e, 0x00, 0x00, 0x00, 0x73, 0x65, 0x72, 0x76,
-    0x69, 0x6e, 0x67, 0x5f, 0x64, 0x65, 0x66, 0x61, 0x75, 0x6c, 0x74, 0x5f,
-    0x6b, 0x65, 0x72, 0x61, 0x73, 0x5f, 0x74, 0x65, 0x6e, 0x73, 0x6f, 0x72,
-    0x3a, 0x30, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00,
-    0x05, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00,
-    0x0c, 0x00, 0x10, 0x00, 0x0f, 0x00, 0x00, 0x00, 0x08, 0x00, 0x04, 0x00,
-    0x0c, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x09};
-unsigned int model_tflite_len = 4840;
@@ -0,0 +1,111 @@
+// Generated by ai_pipeline/export_model_params.py from scaler.json and quantized_model.tflite.
+// Do not edit: rerun train_model.py or export_model_params.py instead.
+#ifndef MODEL_PARAMS_H
+#define MODEL_PARAMS_H
+
+#include <stdint.h>
+
+#define AI_N_INPUTS 5
+#define AI_N_OUTPUTS 5
+#define AI_INPUT_SCALE 0.016619736f
+#define AI_INPUT_ZERO_POINT 52
+#define AI_OUTPUT_SCALE 0.010561479f
+#define AI_OUTPUT_ZERO_POINT 24
+// AI_MODEL_ID of the model.h these parameters belong to
+#define AI_PARAMS_MODEL_ID 0x18b564daUL
+// TFLM tensor arena from model_cost.py (planned activations + persistent data + headroom, at least ARENA_FLOOR)
+#define AI_TENSOR_ARENA_SIZE 16384
+
+// Class order of the model outputs
+static const char *const AI_CLASS_NAMES[AI_N_OUTPUTS] = {"anomaly", "high_humidity", "high_temp", "low_light", "normal"};
+
+// Normalize + quantize folded per feature (ldr_v, temp_c, hum_pct, tvoc_ppb, eco2_ppm):
+// q = clamp(round((x - AI_INPUT_CENTER[i]) * AI_INPUT_GAIN[i]) + AI_INPUT_ZERO_POINT)
+static const float AI_INPUT_CENTER[AI_N_INPUTS] = {0.0f, 18.01656f, 56.257988f, 60.0f, 450.0f};
+static const float AI_INPUT_GAIN[AI_N_INPUTS] = {316.68118f, 6.135974f, 2.1558561f, 6.0169426e+09f, 6.0169426e+09f};
+
+static inline int8_t ai_quantize_feature(int i, float x)
+{
+    float v = (x - AI_INPUT_CENTER[i]) * AI_INPUT_GAIN[i];
+    if (v > 256.0f)
+        v = 256.0f;
+    if (v < -256.0f)
+        v = -256.0f;
+    // Round half away from zero, like the TFLite quantizer
+    int q = (v >= 0.0f ? (int)(v + 0.5f) : (int)(v - 0.5f)) + AI_INPUT_ZERO_POINT;
+    return (int8_t)(q > 127 ? 127 : (q < -128 ? -128 : q));
+}
+
+// Softmax over int8 logits q: exp(logit[i] - logit_max) = AI_SOFTMAX_EXP[q_max - q[i]]
+static const float AI_SOFTMAX_EXP[256] = {
+    1.0f, 0.9894941f, 0.97909856f, 0.9688122f, 0.958634f, 0.9485627f,
+    0.9385972f, 0.9287364f, 0.91897917f, 0.90932447f, 0.89977115f, 0.8903183f,
+    0.8809647f, 0.87170935f, 0.8625513f, 0.8534894f, 0.8445227f, 0.8356502f,
+    0.826871f, 0.81818396f, 0.8095882f, 0.80108273f, 0.7926666f, 0.78433895f,
+    0.7760987f, 0.7679451f, 0.7598772f, 0.751894f, 0.74399465f, 0.73617834f,
+    0.7284441f, 0.72079116f, 0.71321857f, 0.70572555f, 0.69831127f, 0.6909749f,
+    0.6837156f, 0.67653257f, 0.66942495f, 0.662392f, 0.655433f, 0.6485471f,
+    0.6417335f, 0.6349915f, 0.6283204f, 0.6217193f, 0.6151876f, 0.6087245f,
+    0.60232925f, 0.59600127f, 0.58973974f, 0.583544f, 0.5774133f, 0.57134706f,
+    0.5653446f, 0.5594051f, 0.5535281f, 0.54771274f, 0.5419585f, 0.5362648f,
+    0.5306308f, 0.52505606f, 0.5195399f, 0.51408166f, 0.50868076f, 0.5033366f,
+    0.4980486f, 0.49281615f, 0.48763865f, 0.48251557f, 0.47744632f, 0.47243032f,
+    0.467467f, 0.46255586f, 0.4576963f, 0.45288777f, 0.44812977f, 0.44342175f,
+    0.43876323f, 0.43415362f, 0.42959243f, 0.42507917f, 0.42061335f, 0.4161944f,
+    0.41182193f, 0.40749535f, 0.40321425f, 0.3989781f, 0.3947865f, 0.39063892f,
+    0.3865349f, 0.382474f, 0.37845576f, 0.37447974f, 0.3705455f, 0.36665258f,
+    0.36280057f, 0.35898903f, 0.35521752f, 0.35148564f, 0.34779295f, 0.34413907f,
+    0.3405236f, 0.33694607f, 0.33340615f, 0.32990342f, 0.3264375f, 0.32300797f,
+    0.31961447f, 0.31625664f, 0.31293407f, 0.30964643f, 0.3063933f, 0.30317438f,
+    0.29998925f, 0.2968376f, 0.29371905f, 0.29063326f, 0.2875799f, 0.28455862f,
+    0.28156906f, 0.27861091f, 0.27568388f, 0.27278757f, 0.2699217f, 0.2670859f,
+    0.26427993f, 0.26150343f, 0.2587561f, 0.25603762f, 0.25334772f, 0.25068608f,
+    0.2480524f, 0.24544638f, 0.24286775f, 0.24031621f, 0.23779146f, 0.23529325f,
+    0.23282129f, 0.23037529f, 0.22795498f, 0.22556011f, 0.2231904f, 0.22084558f,
+    0.21852541f, 0.2162296f, 0.2139579f, 0.21171008f, 0.20948589f, 0.20728505f,
+    0.20510733f, 0.20295249f, 0.2008203f, 0.19871049f, 0.19662286f, 0.19455716f,
+    0.19251315f, 0.19049063f, 0.18848936f, 0.1865091f, 0.18454966f, 0.1826108f,
+    0.18069232f, 0.17879397f, 0.17691559f, 0.17505692f, 0.17321779f, 0.17139798f,
+    0.1695973f, 0.16781552f, 0.16605246f, 0.16430794f, 0.16258173f, 0.16087367f,
+    0.15918355f, 0.15751117f, 0.15585637f, 0.15421897f, 0.15259875f, 0.15099557f,
+    0.14940922f, 0.14783955f, 0.14628635f, 0.14474949f, 0.14322877f, 0.14172402f,
+    0.14023508f, 0.13876177f, 0.13730396f, 0.13586146f, 0.13443412f, 0.13302176f,
+    0.13162425f, 0.13024142f, 0.12887311f, 0.12751919f, 0.12617949f, 0.12485385f,
+    0.12354215f, 0.122244224f, 0.120959945f, 0.11968915f, 0.1184317f, 0.11718747f,
+    0.115956314f, 0.114738084f, 0.11353266f, 0.1123399f, 0.11115967f, 0.10999183f,
+    0.10883627f, 0.107692845f, 0.10656144f, 0.10544191f, 0.104334146f, 0.103238024f,
+    0.10215341f, 0.1010802f, 0.10001826f, 0.09896748f, 0.09792774f, 0.09689892f,
+    0.09588091f, 0.09487359f, 0.09387686f, 0.0928906f, 0.0919147f, 0.09094905f,
+    0.08999355f, 0.08904809f, 0.088112555f, 0.08718686f, 0.086270876f, 0.08536453f,
+    0.084467694f, 0.083580285f, 0.0827022f, 0.08183333f, 0.0809736f, 0.0801229f,
+    0.07928114f, 0.07844822f, 0.07762405f, 0.07680854f, 0.0760016f, 0.07520313f,
+    0.07441305f, 0.07363128f, 0.072857715f, 0.07209228f, 0.07133488f, 0.070585445f,
+    0.06984388f, 0.06911011f, 0.068384044f, 0.06766561f,
+};
+// Same table in Q15 (32768 = 1.0) for the integer-only softmax of ai_preprocess.c
+static const uint16_t AI_SOFTMAX_EXP_Q15[256] = {
+    32768, 32424, 32083, 31746, 31413, 31083, 30756, 30433, 30113, 29797, 29484, 29174,
+    28867, 28564, 28264, 27967, 27673, 27383, 27095, 26810, 26529, 26250, 25974, 25701,
+    25431, 25164, 24900, 24638, 24379, 24123, 23870, 23619, 23371, 23125, 22882, 22642,
+    22404, 22169, 21936, 21705, 21477, 21252, 21028, 20807, 20589, 20372, 20158, 19947,
+    19737, 19530, 19325, 19122, 18921, 18722, 18525, 18331, 18138, 17947, 17759, 17572,
+    17388, 17205, 17024, 16845, 16668, 16493, 16320, 16149, 15979, 15811, 15645, 15481,
+    15318, 15157, 14998, 14840, 14684, 14530, 14377, 14226, 14077, 13929, 13783, 13638,
+    13495, 13353, 13213, 13074, 12936, 12800, 12666, 12533, 12401, 12271, 12142, 12014,
+    11888, 11763, 11640, 11517, 11396, 11277, 11158, 11041, 10925, 10810, 10697, 10584,
+    10473, 10363, 10254, 10146, 10040, 9934, 9830, 9727, 9625, 9523, 9423, 9324,
+    9226, 9130, 9034, 8939, 8845, 8752, 8660, 8569, 8479, 8390, 8302, 8214,
+    8128, 8043, 7958, 7875, 7792, 7710, 7629, 7549, 7470, 7391, 7314, 7237,
+    7161, 7085, 7011, 6937, 6864, 6792, 6721, 6650, 6580, 6511, 6443, 6375,
+    6308, 6242, 6176, 6112, 6047, 5984, 5921, 5859, 5797, 5736, 5676, 5616,
+    5557, 5499, 5441, 5384, 5327, 5272, 5216, 5161, 5107, 5053, 5000, 4948,
+    4896, 4844, 4794, 4743, 4693, 4644, 4595, 4547, 4499, 4452, 4405, 4359,
+    4313, 4268, 4223, 4179, 4135, 4091, 4048, 4006, 3964, 3922, 3881, 3840,
+    3800, 3760, 3720, 3681, 3642, 3604, 3566, 3529, 3492, 3455, 3419, 3383,
+    3347, 3312, 3277, 3243, 3209, 3175, 3142, 3109, 3076, 3044, 3012, 2980,
+    2949, 2918, 2887, 2857, 2827, 2797, 2768, 2739, 2710, 2682, 2653, 2625,
+    2598, 2571, 2544, 2517, 2490, 2464, 2438, 2413, 2387, 2362, 2338, 2313,
+    2289, 2265, 2241, 2217,
+};
+
+#endif
@@ -0,0 +1,57 @@
+#include "telemetry.h"
+
+#include <string.h>
+
+// CRC-16/CCITT-FALSE: poly 0x1021, init 0xFFFF, no reflection
+uint16_t telemetry_crc16(const uint8_t *data, size_t len)
+{
+    uint16_t crc = 0xFFFF;
+    for (size_t i = 0; i < len; i++)
+    {
+        crc ^= (uint16_t)data[i] << 8;
+        for (int bit = 0; bit < 8; bit++)
+            crc = (crc & 0x8000) ? (uint16_t)((crc << 1) ^ 0x1021) : (uint16_t)(crc << 1);
+    }
+    return crc;
+}
+
+static uint8_t *put_u32(uint8_t *p, uint32_t v)
+{
+    p[0] = (uint8_t)v;
+    p[1] = (uint8_t)(v >> 8);
+    p[2] = (uint8_t)(v >> 16);
+    p[3] = (uint8_t)(v >> 24);
+    return p + 4;
+}
+
+static uint8_t *put_f32(uint8_t *p, float v)
+{
+    uint32_t bits;
+    memcpy(&bits, &v, sizeof bits);
+    return put_u32(p, bits);
+}
+
+size_t telemetry_encode(const telemetry_record_t *record, uint8_t *out)
+{
+    uint8_t *p = out;
+    *p++ = TELEMETRY_SYNC0;
+    *p++ = TELEMETRY_SYNC1;
+    *p++ = TELEMETRY_TYPE_INFERENCE;
+    *p++ = TELEMETRY_PAYLOAD_LEN;
+    p = put_u32(p, record->millis);
+    p = put_f32(p, record->ldr_v);
+    p = put_f32(p, record->temp_c);
+    p = put_f32(p, record->hum_pct);
+    p = put_f32(p, record->tvoc_ppb);
+    p = put_f32(p, record->eco2_ppm);
+    *p++ = record->prob_pct[0];
+    *p++ = record->prob_pct[1];
+    *p++ = record->prob_pct[2];
+    p = put_u32(p, record->latency_us);
+    p = put_u32(p, record->free_heap);
+
+    uint16_t crc = telemetry_crc16(out + 2, 2 + TELEMETRY_PAYLOAD_LEN);
+    *p++ = (uint8_t)crc;
+    *p++ = (uint8_t)(crc >> 8);
+    return (size_t)(p - out);
+}